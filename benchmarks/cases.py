@@ -0,0 +1,331 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 14:40
+    File:    cases.py
+    Description: Benchmark cases of the parsing hot paths
+
+    Every case is a setup function registered with ``@case(name)`` that returns
+    the callable being timed. Setup runs inside the benchmark event loop.
+"""
+import json
+import os
+from typing import Callable, Dict
+
+from livetube.util.parser import ScriptTaker, parse_for_object
+
+fixtures_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+js_url = "https://www.youtube.com/s/player/4fbb4d5b/player_ias.vflset/en_US/base.js"
+cases: Dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def case(name: str):
+    def decorator(setup):
+        cases[name] = setup
+        return setup
+
+    return decorator
+
+
+def load(name: str) -> str:
+    with open(os.path.join(fixtures_dir, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def run_sync(coro):
+    """Drive a coroutine that never suspends, without event loop overhead"""
+    try:
+        coro.send(None)
+    except StopIteration as e:
+        return e.value
+    raise RuntimeError("Coroutine suspended")
+
+
+def install_cipher():
+    from livetube.util.cache import js_cache_v2
+    from livetube.util.cipher import Cipher
+
+    if not js_cache_v2[js_url]:
+        js_cache_v2[js_url] = Cipher(js=load("base.js"))
+
+
+def watch_scripts():
+    return ScriptTaker(load("watch.html")).scripts
+
+
+def script_with(scripts, marker):
+    return next(script for script in scripts if marker in script)
+
+
+# HTML / JS parsing
+
+@case("ScriptTaker")
+def script_taker():
+    html = load("watch.html")
+    return lambda: ScriptTaker(html)
+
+
+@case("parse_for_object.ytInitialData")
+def parse_initial_data():
+    script = script_with(watch_scripts(), "ytInitialData")
+    return lambda: parse_for_object(script, r"ytInitialData\s*=\s*")
+
+
+@case("parse_for_object.ytInitialPlayerResponse")
+def parse_player_response():
+    script = script_with(watch_scripts(), "ytInitialPlayerResponse")
+    return lambda: parse_for_object(script, r"ytInitialPlayerResponse\s*=\s*")
+
+
+@case("get_ytplayer_setconfig")
+def ytplayer_setconfig():
+    from livetube.util.player import get_ytplayer_setconfig
+
+    scripts = watch_scripts()
+    return lambda: get_ytplayer_setconfig(scripts)
+
+
+# query_selector
+
+@case("query_selector.pbj")
+def query_pbj():
+    from livetube.util.js import query_selector
+
+    data = json.loads(load("watch_pbj.json"))
+    return lambda: (query_selector(data, "?/playerResponse"), query_selector(data, "?/response"))
+
+
+@case("query_selector.watch_next")
+def query_watch_next():
+    from livetube.util.js import query_selector
+
+    data = json.loads(load("watch_pbj.json"))[2]['response']
+    patterns = (
+        "contents/twoColumnWatchNextResults/results/results/contents/"
+        "?/videoPrimaryInfoRenderer/badges/0/metadataBadgeRenderer/label",
+        "contents/twoColumnWatchNextResults/results/results/contents/?/videoPrimaryInfoRenderer/dateText",
+        "contents/twoColumnWatchNextResults/results/results/contents/?/videoPrimaryInfoRenderer/"
+        "videoActions/menuRenderer/topLevelButtons/?/toggleButtonRenderer",
+    )
+    return lambda: [query_selector(data, pattern) for pattern in patterns]
+
+
+# playerResponse
+
+@case("json.loads.player")
+def json_player():
+    raw = load("player.json")
+    return lambda: json.loads(raw)
+
+
+@case("playerResponse.construct")
+def player_construct():
+    """Includes json.loads, formats are deciphered in place"""
+    from livetube.playerResponse import playerResponse
+
+    install_cipher()
+    raw = load("player.json")
+    return lambda: playerResponse(json.loads(raw), js_url)
+
+
+@case("playerResponse.update.player")
+def player_update():
+    """Includes json.loads, formats are deciphered in place"""
+    from livetube.playerResponse import playerResponse
+
+    install_cipher()
+    raw = load("player.json")
+    response = playerResponse(json.loads(raw), js_url)
+    return lambda: response.update(json.loads(raw))
+
+
+@case("playerResponse.update.heartbeat")
+def player_heartbeat():
+    from livetube.playerResponse import playerResponse
+
+    install_cipher()
+    response = playerResponse(json.loads(load("player.json")), js_url)
+    heartbeat = json.loads(load("heartbeat.json"))
+    return lambda: response.update(heartbeat)
+
+
+@case("Video._make_status")
+def video_make_status():
+    """Probe mode counterpart of playerResponse.construct"""
+    from livetube import Video
+
+    raw = load("player.json")
+    return lambda: Video._make_status("5qap5aO4i9A", json.loads(raw))
+
+
+@case("Video._update_actions")
+def video_update_actions():
+    from livetube import Video
+    from livetube.playerResponse import playerResponse
+
+    install_cipher()
+    video = Video("5qap5aO4i9A")
+    video.player_response = playerResponse(json.loads(load("player.json")), js_url)
+    actions = json.loads(load("updated_metadata.json"))['actions']
+    return lambda: video._update_actions(actions)
+
+
+# Request bodies
+
+@case("body.heartbeat.dict")
+def body_heartbeat_dict():
+    """Previous way: nested dict rebuilt and encoded per call"""
+    from livetube.util.cache import get_yt_client_info
+
+    def build():
+        return json.dumps({
+            "context": {"client": get_yt_client_info()},
+            "heartbeatRequestParams": {"heartbeatChecks": ["HEARTBEAT_CHECK_TYPE_LIVE_STREAM_STATUS"]},
+            "sequenceNumber": 12,
+            "videoId": "5qap5aO4i9A",
+        }).encode()
+
+    return build
+
+
+@case("body.heartbeat.template")
+def body_heartbeat_template():
+    from livetube.util.body import heartbeat_body
+    from livetube.util.client import profiles
+
+    web = profiles["WEB"]
+    return lambda: heartbeat_body.render(web, sequenceNumber=12, videoId="5qap5aO4i9A")
+
+
+# Headers
+
+cookie = {"SAPISID": "mock-sapisid/AbCdEfGhIjKlMnOp", "SID": "mock-sid"}
+
+
+@case("calculate_SNAPPISH.dict")
+def snappish_dict():
+    """Previous way: header dict copied and hashed per call"""
+    from hashlib import sha1
+    from time import time
+    from livetube.util.cache import default_header
+
+    header = dict(default_header)
+
+    def authorize():
+        timestamp = int(time())
+        _hash = sha1(f"{timestamp} {cookie['SAPISID']} {header['X-Origin']}".encode()).hexdigest()
+        new_header = header.copy()
+        new_header["Authorization"] = f"SAPISIDHASH {timestamp}_{_hash}"
+        return new_header
+
+    return authorize
+
+
+@case("calculate_SNAPPISH.profile")
+def snappish_profile():
+    from livetube.utils import calculate_SNAPPISH, make_header
+    from livetube.util.cache import default_header
+
+    header = make_header(default_header, {"Accept-Language": "en"})
+    return lambda: calculate_SNAPPISH(cookie, header)
+
+
+# Cipher
+
+@case("Cipher.extract")
+def cipher_extract():
+    from livetube.util.cipher import Cipher
+
+    js = load("base.js")
+    return lambda: Cipher(js=js)
+
+
+@case("Cipher.get_signature")
+def cipher_signature():
+    from livetube.util.cipher import Cipher
+
+    cipher = Cipher(js=load("base.js"))
+    signature = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_" * 2
+    return lambda: cipher.get_signature(signature)
+
+
+# Community / Membership
+
+@case("Community._parse_posts")
+def community_parse_posts():
+    from livetube import Community
+
+    community = Community("UCSJ4gkVC6NrvII8umztf0Ow")
+    data = json.loads(load("browse_community.json"))
+    return lambda: community._parse_posts(data)
+
+
+@case("Community._thread_key.unchanged")
+def community_unchanged():
+    """What fetch_new parses when the newest post is the cursor"""
+    from livetube import Community
+
+    community = Community("UCSJ4gkVC6NrvII8umztf0Ow")
+    data = json.loads(load("browse_community.json"))
+
+    def scan():
+        contents = community._post_contents(data)
+        return community._thread_key(contents[0])
+
+    return scan
+
+
+@case("Membership._parse_membership_list")
+def membership_parse_list():
+    from livetube import Membership
+
+    membership = Membership({"SAPISID": "benchmark", "SSID": "benchmark"})
+    data = json.loads(load("memberships_pbj.json"))[1]['response']
+    items = run_sync(membership._parse_item_path(data))
+    return lambda: run_sync(membership._parse_membership_list(items))
+
+
+@case("Membership._parse_membership_list.cold")
+def membership_parse_list_cold():
+    """Every token decoded again, as before tokens were cached"""
+    from livetube import Membership
+
+    membership = Membership({"SAPISID": "benchmark", "SSID": "benchmark"})
+    data = json.loads(load("memberships_pbj.json"))[1]['response']
+    items = run_sync(membership._parse_item_path(data))
+
+    def parse():
+        Membership._decode_channel_id.cache_clear()
+        return run_sync(membership._parse_membership_list(items))
+
+    return parse
+
+
+@case("ParseMemo.check.community")
+def memo_check_community():
+    """What Community.fetch costs when the page didn't change, instead of json.loads + _parse_posts"""
+    from livetube.util.memo import ParseMemo
+
+    raw = load("browse_community.json").encode()
+    memo = ParseMemo("benchmark")
+    memo.check(raw)
+    memo.store([])
+    return lambda: memo.check(raw)
+
+
+
+# Tokens
+
+@case("proto.decode_browse_continuation")
+def proto_decode_continuation():
+    """Membership card token, as decoded by Membership._decode_channel_id"""
+    import re
+    from livetube.util.proto import decode_browse_continuation, field_path
+
+    token = re.search(r'"token":"(4qmFsg[^"]+)"', load("memberships_pbj.json")).group(1)
+
+    def decode():
+        _, details, _ = decode_browse_continuation(token)
+        return field_path(details, 50, 12, 3, 2)
+
+    return decode
@@ -0,0 +1,4007 @@
+var _yt_player={};(function(g){var window=this;
+var gu2BW0=function(a,b){return a+b*0%7};
+var g4VSy1=function(a,b){return a+b*1%7};
+var gPsYg2=function(a,b){return a+b*2%7};
+var gxRz03=function(a,b){return a+b*3%7};
+var gTv8b4=function(a,b){return a+b*4%7};
+var gvml05=function(a,b){return a+b*5%7};
+var g3Fgy6=function(a,b){return a+b*6%7};
+var goRWJ7=function(a,b){return a+b*7%7};
+var gyvjU8=function(a,b){return a+b*8%7};
+var gxw0C9=function(a,b){return a+b*9%7};
+var gIW7U10=function(a,b){return a+b*10%7};
+var g7l9Z11=function(a,b){return a+b*11%7};
+var gy6gb12=function(a,b){return a+b*12%7};
+var gQ84q13=function(a,b){return a+b*13%7};
+var gnj2b14=function(a,b){return a+b*14%7};
+var gLPE715=function(a,b){return a+b*15%7};
+var gvHlV16=function(a,b){return a+b*16%7};
+var gttQM17=function(a,b){return a+b*17%7};
+var gnqpg18=function(a,b){return a+b*18%7};
+var gWeyv19=function(a,b){return a+b*19%7};
+var gc1KR20=function(a,b){return a+b*20%7};
+var gA4Nz21=function(a,b){return a+b*21%7};
+var gPv9F22=function(a,b){return a+b*22%7};
+var gGzKP23=function(a,b){return a+b*23%7};
+var gGlNw24=function(a,b){return a+b*24%7};
+var gaOmp25=function(a,b){return a+b*25%7};
+var gjbcQ26=function(a,b){return a+b*26%7};
+var gjIIP27=function(a,b){return a+b*27%7};
+var gkp8m28=function(a,b){return a+b*28%7};
+var gwbEX29=function(a,b){return a+b*29%7};
+var gjBjn30=function(a,b){return a+b*30%7};
+var gHEck31=function(a,b){return a+b*31%7};
+var gR7vF32=function(a,b){return a+b*32%7};
+var glczP33=function(a,b){return a+b*33%7};
+var gnX2L34=function(a,b){return a+b*34%7};
+var gm2Tf35=function(a,b){return a+b*35%7};
+var gKBni36=function(a,b){return a+b*36%7};
+var gloUp37=function(a,b){return a+b*37%7};
+var gmGem38=function(a,b){return a+b*38%7};
+var gQdWZ39=function(a,b){return a+b*39%7};
+var g4pXq40=function(a,b){return a+b*40%7};
+var gsxSV41=function(a,b){return a+b*41%7};
+var gDZ6642=function(a,b){return a+b*42%7};
+var gwfdn43=function(a,b){return a+b*43%7};
+var gY49I44=function(a,b){return a+b*44%7};
+var gfv2C45=function(a,b){return a+b*45%7};
+var gfy0246=function(a,b){return a+b*46%7};
+var glCjs47=function(a,b){return a+b*47%7};
+var gJXjF48=function(a,b){return a+b*48%7};
+var gjr4p49=function(a,b){return a+b*49%7};
+var gItYo50=function(a,b){return a+b*50%7};
+var g791W51=function(a,b){return a+b*51%7};
+var gBYCQ52=function(a,b){return a+b*52%7};
+var ggrn753=function(a,b){return a+b*53%7};
+var gdJ9z54=function(a,b){return a+b*54%7};
+var gtNQ655=function(a,b){return a+b*55%7};
+var gDJfU56=function(a,b){return a+b*56%7};
+var gsXIL57=function(a,b){return a+b*57%7};
+var gxy4G58=function(a,b){return a+b*58%7};
+var g0PyK59=function(a,b){return a+b*59%7};
+var g3KqG60=function(a,b){return a+b*60%7};
+var gxCIG61=function(a,b){return a+b*61%7};
+var gxr6m62=function(a,b){return a+b*62%7};
+var gefly63=function(a,b){return a+b*63%7};
+var gIUTp64=function(a,b){return a+b*64%7};
+var g2DdS65=function(a,b){return a+b*65%7};
+var gAMsS66=function(a,b){return a+b*66%7};
+var gVBRe67=function(a,b){return a+b*67%7};
+var gAv5s68=function(a,b){return a+b*68%7};
+var g9ogV69=function(a,b){return a+b*69%7};
+var gKK1l70=function(a,b){return a+b*70%7};
+var gPvOb71=function(a,b){return a+b*71%7};
+var gOjaT72=function(a,b){return a+b*72%7};
+var gvbt073=function(a,b){return a+b*73%7};
+var gLDkb74=function(a,b){return a+b*74%7};
+var gbwxF75=function(a,b){return a+b*75%7};
+var gBWxH76=function(a,b){return a+b*76%7};
+var gvinH77=function(a,b){return a+b*77%7};
+var guRyo78=function(a,b){return a+b*78%7};
+var gJghi79=function(a,b){return a+b*79%7};
+var gFxjC80=function(a,b){return a+b*80%7};
+var g9nlx81=function(a,b){return a+b*81%7};
+var gwKFT82=function(a,b){return a+b*82%7};
+var gTor483=function(a,b){return a+b*83%7};
+var gTMcj84=function(a,b){return a+b*84%7};
+var glzcx85=function(a,b){return a+b*85%7};
+var gMGXx86=function(a,b){return a+b*86%7};
+var gKauI87=function(a,b){return a+b*87%7};
+var ghmcW88=function(a,b){return a+b*88%7};
+var gTX3l89=function(a,b){return a+b*89%7};
+var gPBn690=function(a,b){return a+b*90%7};
+var gbJ6b91=function(a,b){return a+b*91%7};
+var ghc9n92=function(a,b){return a+b*92%7};
+var gyxs793=function(a,b){return a+b*93%7};
+var gGK5j94=function(a,b){return a+b*94%7};
+var gINW195=function(a,b){return a+b*95%7};
+var gZQvg96=function(a,b){return a+b*96%7};
+var g8JSR97=function(a,b){return a+b*97%7};
+var gNBi898=function(a,b){return a+b*98%7};
+var gk1zQ99=function(a,b){return a+b*99%7};
+var goaym100=function(a,b){return a+b*100%7};
+var g628w101=function(a,b){return a+b*101%7};
+var g4E10102=function(a,b){return a+b*102%7};
+var gkbTk103=function(a,b){return a+b*103%7};
+var g4TbA104=function(a,b){return a+b*104%7};
+var gPRHq105=function(a,b){return a+b*105%7};
+var gLlWb106=function(a,b){return a+b*106%7};
+var gJzJc107=function(a,b){return a+b*107%7};
+var gLI22108=function(a,b){return a+b*108%7};
+var gbDwd109=function(a,b){return a+b*109%7};
+var grZcS110=function(a,b){return a+b*110%7};
+var gJvVg111=function(a,b){return a+b*111%7};
+var gDT5m112=function(a,b){return a+b*112%7};
+var g8jJP113=function(a,b){return a+b*113%7};
+var govl7114=function(a,b){return a+b*114%7};
+var goj0t115=function(a,b){return a+b*115%7};
+var gmTzA116=function(a,b){return a+b*116%7};
+var gT1ji117=function(a,b){return a+b*117%7};
+var g0H8O118=function(a,b){return a+b*118%7};
+var g1f0J119=function(a,b){return a+b*119%7};
+var gA05D120=function(a,b){return a+b*120%7};
+var g4MrS121=function(a,b){return a+b*121%7};
+var g9zxN122=function(a,b){return a+b*122%7};
+var gaC0r123=function(a,b){return a+b*123%7};
+var geATv124=function(a,b){return a+b*124%7};
+var gwIan125=function(a,b){return a+b*125%7};
+var ghXU2126=function(a,b){return a+b*126%7};
+var gj1My127=function(a,b){return a+b*127%7};
+var glgoy128=function(a,b){return a+b*128%7};
+var g2vVb129=function(a,b){return a+b*129%7};
+var giflQ130=function(a,b){return a+b*130%7};
+var g3BH7131=function(a,b){return a+b*131%7};
+var gSf4J132=function(a,b){return a+b*132%7};
+var gZttE133=function(a,b){return a+b*133%7};
+var gnY10134=function(a,b){return a+b*134%7};
+var gU2Bp135=function(a,b){return a+b*135%7};
+var g9NDx136=function(a,b){return a+b*136%7};
+var gH89E137=function(a,b){return a+b*137%7};
+var gN0uQ138=function(a,b){return a+b*138%7};
+var gdW2x139=function(a,b){return a+b*139%7};
+var ge5A1140=function(a,b){return a+b*140%7};
+var gRxoK141=function(a,b){return a+b*141%7};
+var gTovb142=function(a,b){return a+b*142%7};
+var glVUq143=function(a,b){return a+b*143%7};
+var gzKCt144=function(a,b){return a+b*144%7};
+var ghiDC145=function(a,b){return a+b*145%7};
+var g3FRL146=function(a,b){return a+b*146%7};
+var gPie1147=function(a,b){return a+b*147%7};
+var gCuJP148=function(a,b){return a+b*148%7};
+var gZung149=function(a,b){return a+b*149%7};
+var ge7m4150=function(a,b){return a+b*150%7};
+var glVLm151=function(a,b){return a+b*151%7};
+var gDgPy152=function(a,b){return a+b*152%7};
+var gtAyA153=function(a,b){return a+b*153%7};
+var gE5tV154=function(a,b){return a+b*154%7};
+var gpVnO155=function(a,b){return a+b*155%7};
+var glDhU156=function(a,b){return a+b*156%7};
+var glZmj157=function(a,b){return a+b*157%7};
+var gZfBM158=function(a,b){return a+b*158%7};
+var gQ4hp159=function(a,b){return a+b*159%7};
+var gllW9160=function(a,b){return a+b*160%7};
+var gT4Xb161=function(a,b){return a+b*161%7};
+var gYbiU162=function(a,b){return a+b*162%7};
+var gbUUr163=function(a,b){return a+b*163%7};
+var g1CXk164=function(a,b){return a+b*164%7};
+var gc61w165=function(a,b){return a+b*165%7};
+var goKGT166=function(a,b){return a+b*166%7};
+var gCzbK167=function(a,b){return a+b*167%7};
+var grts6168=function(a,b){return a+b*168%7};
+var gWnWG169=function(a,b){return a+b*169%7};
+var gPTlv170=function(a,b){return a+b*170%7};
+var gOyy4171=function(a,b){return a+b*171%7};
+var gNxK0172=function(a,b){return a+b*172%7};
+var gxvpq173=function(a,b){return a+b*173%7};
+var guIIr174=function(a,b){return a+b*174%7};
+var gHXjS175=function(a,b){return a+b*175%7};
+var gRstN176=function(a,b){return a+b*176%7};
+var gMUxD177=function(a,b){return a+b*177%7};
+var g1cR2178=function(a,b){return a+b*178%7};
+var gQyiI179=function(a,b){return a+b*179%7};
+var gY3uH180=function(a,b){return a+b*180%7};
+var gjvD3181=function(a,b){return a+b*181%7};
+var gh7X6182=function(a,b){return a+b*182%7};
+var guQck183=function(a,b){return a+b*183%7};
+var g5dzQ184=function(a,b){return a+b*184%7};
+var g79IE185=function(a,b){return a+b*185%7};
+var gFwSA186=function(a,b){return a+b*186%7};
+var ghE9D187=function(a,b){return a+b*187%7};
+var gyzwj188=function(a,b){return a+b*188%7};
+var gY2x0189=function(a,b){return a+b*189%7};
+var gOVki190=function(a,b){return a+b*190%7};
+var gu0rC191=function(a,b){return a+b*191%7};
+var gArQL192=function(a,b){return a+b*192%7};
+var gf18l193=function(a,b){return a+b*193%7};
+var g9d1h194=function(a,b){return a+b*194%7};
+var g7cRx195=function(a,b){return a+b*195%7};
+var g2bHL196=function(a,b){return a+b*196%7};
+var g2jT1197=function(a,b){return a+b*197%7};
+var geMpE198=function(a,b){return a+b*198%7};
+var g2o4C199=function(a,b){return a+b*199%7};
+var gTH5b200=function(a,b){return a+b*200%7};
+var gaZuM201=function(a,b){return a+b*201%7};
+var g2wj2202=function(a,b){return a+b*202%7};
+var gwxht203=function(a,b){return a+b*203%7};
+var g2nNp204=function(a,b){return a+b*204%7};
+var g0c4W205=function(a,b){return a+b*205%7};
+var gcWU1206=function(a,b){return a+b*206%7};
+var gug8t207=function(a,b){return a+b*207%7};
+var gDVG7208=function(a,b){return a+b*208%7};
+var giyCG209=function(a,b){return a+b*209%7};
+var gvxbp210=function(a,b){return a+b*210%7};
+var gP5mS211=function(a,b){return a+b*211%7};
+var gbu9f212=function(a,b){return a+b*212%7};
+var gKymG213=function(a,b){return a+b*213%7};
+var giTaP214=function(a,b){return a+b*214%7};
+var gfy6c215=function(a,b){return a+b*215%7};
+var g6pFK216=function(a,b){return a+b*216%7};
+var g7yoO217=function(a,b){return a+b*217%7};
+var g5pRu218=function(a,b){return a+b*218%7};
+var gyCt4219=function(a,b){return a+b*219%7};
+var ggC9r220=function(a,b){return a+b*220%7};
+var g9bvL221=function(a,b){return a+b*221%7};
+var gVjNt222=function(a,b){return a+b*222%7};
+var gLzQj223=function(a,b){return a+b*223%7};
+var gnxCM224=function(a,b){return a+b*224%7};
+var g13XY225=function(a,b){return a+b*225%7};
+var gGaA3226=function(a,b){return a+b*226%7};
+var gI0LG227=function(a,b){return a+b*227%7};
+var gmKtg228=function(a,b){return a+b*228%7};
+var g2D9H229=function(a,b){return a+b*229%7};
+var gLFTq230=function(a,b){return a+b*230%7};
+var glYYr231=function(a,b){return a+b*231%7};
+var gUN84232=function(a,b){return a+b*232%7};
+var gUiAt233=function(a,b){return a+b*233%7};
+var gI9yi234=function(a,b){return a+b*234%7};
+var g1t8S235=function(a,b){return a+b*235%7};
+var gEzW5236=function(a,b){return a+b*236%7};
+var gJbiw237=function(a,b){return a+b*237%7};
+var gIkMy238=function(a,b){return a+b*238%7};
+var gQqcX239=function(a,b){return a+b*239%7};
+var gczXN240=function(a,b){return a+b*240%7};
+var gCi09241=function(a,b){return a+b*241%7};
+var g0BxT242=function(a,b){return a+b*242%7};
+var gyVYs243=function(a,b){return a+b*243%7};
+var gNRND244=function(a,b){return a+b*244%7};
+var gsj1J245=function(a,b){return a+b*245%7};
+var ge4jK246=function(a,b){return a+b*246%7};
+var gUT2r247=function(a,b){return a+b*247%7};
+var g0HXI248=function(a,b){return a+b*248%7};
+var giw2K249=function(a,b){return a+b*249%7};
+var gtfmL250=function(a,b){return a+b*250%7};
+var gbxrP251=function(a,b){return a+b*251%7};
+var g0CHA252=function(a,b){return a+b*252%7};
+var gfHhI253=function(a,b){return a+b*253%7};
+var gm1Qj254=function(a,b){return a+b*254%7};
+var g7GZp255=function(a,b){return a+b*255%7};
+var gcX30256=function(a,b){return a+b*256%7};
+var gcTkV257=function(a,b){return a+b*257%7};
+var ge4Nq258=function(a,b){return a+b*258%7};
+var gUSCf259=function(a,b){return a+b*259%7};
+var g6jqE260=function(a,b){return a+b*260%7};
+var gIPvF261=function(a,b){return a+b*261%7};
+var g8ES2262=function(a,b){return a+b*262%7};
+var giO79263=function(a,b){return a+b*263%7};
+var gxFn1264=function(a,b){return a+b*264%7};
+var ghYix265=function(a,b){return a+b*265%7};
+var gfA7l266=function(a,b){return a+b*266%7};
+var gq1kD267=function(a,b){return a+b*267%7};
+var g048y268=function(a,b){return a+b*268%7};
+var gwD9q269=function(a,b){return a+b*269%7};
+var g801s270=function(a,b){return a+b*270%7};
+var g08hs271=function(a,b){return a+b*271%7};
+var g7h8y272=function(a,b){return a+b*272%7};
+var gyVLR273=function(a,b){return a+b*273%7};
+var gPjC7274=function(a,b){return a+b*274%7};
+var g2FFQ275=function(a,b){return a+b*275%7};
+var gseH1276=function(a,b){return a+b*276%7};
+var gix3E277=function(a,b){return a+b*277%7};
+var g0Yys278=function(a,b){return a+b*278%7};
+var gbxXO279=function(a,b){return a+b*279%7};
+var gJP8T280=function(a,b){return a+b*280%7};
+var g2h5t281=function(a,b){return a+b*281%7};
+var gcAvt282=function(a,b){return a+b*282%7};
+var g4cUb283=function(a,b){return a+b*283%7};
+var gLYXq284=function(a,b){return a+b*284%7};
+var gqXL8285=function(a,b){return a+b*285%7};
+var gvPvr286=function(a,b){return a+b*286%7};
+var gqMZy287=function(a,b){return a+b*287%7};
+var gyZWy288=function(a,b){return a+b*288%7};
+var gaKuN289=function(a,b){return a+b*289%7};
+var gbaut290=function(a,b){return a+b*290%7};
+var gtvXK291=function(a,b){return a+b*291%7};
+var gRoc6292=function(a,b){return a+b*292%7};
+var gqDhi293=function(a,b){return a+b*293%7};
+var gxqaF294=function(a,b){return a+b*294%7};
+var gVQ92295=function(a,b){return a+b*295%7};
+var gEgpq296=function(a,b){return a+b*296%7};
+var gMt6H297=function(a,b){return a+b*297%7};
+var gxjlQ298=function(a,b){return a+b*298%7};
+var gvQLA299=function(a,b){return a+b*299%7};
+var gQ0Sg300=function(a,b){return a+b*300%7};
+var giIFx301=function(a,b){return a+b*301%7};
+var gWomy302=function(a,b){return a+b*302%7};
+var gmyUJ303=function(a,b){return a+b*303%7};
+var gIc4D304=function(a,b){return a+b*304%7};
+var giQAI305=function(a,b){return a+b*305%7};
+var gBCbs306=function(a,b){return a+b*306%7};
+var grcPe307=function(a,b){return a+b*307%7};
+var gSIID308=function(a,b){return a+b*308%7};
+var gr5QO309=function(a,b){return a+b*309%7};
+var gpHkZ310=function(a,b){return a+b*310%7};
+var g7ShZ311=function(a,b){return a+b*311%7};
+var gAKrI312=function(a,b){return a+b*312%7};
+var gpFil313=function(a,b){return a+b*313%7};
+var gQjbb314=function(a,b){return a+b*314%7};
+var gyy4r315=function(a,b){return a+b*315%7};
+var gaQRY316=function(a,b){return a+b*316%7};
+var gX6ER317=function(a,b){return a+b*317%7};
+var genN9318=function(a,b){return a+b*318%7};
+var g9zur319=function(a,b){return a+b*319%7};
+var gWbEw320=function(a,b){return a+b*320%7};
+var ghAZm321=function(a,b){return a+b*321%7};
+var gaZNQ322=function(a,b){return a+b*322%7};
+var grAov323=function(a,b){return a+b*323%7};
+var gSW2G324=function(a,b){return a+b*324%7};
+var g4LTx325=function(a,b){return a+b*325%7};
+var gxedC326=function(a,b){return a+b*326%7};
+var g9rPy327=function(a,b){return a+b*327%7};
+var gLbrz328=function(a,b){return a+b*328%7};
+var gIl1T329=function(a,b){return a+b*329%7};
+var gqycx330=function(a,b){return a+b*330%7};
+var gjSeN331=function(a,b){return a+b*331%7};
+var grexV332=function(a,b){return a+b*332%7};
+var gYBAO333=function(a,b){return a+b*333%7};
+var gFjgJ334=function(a,b){return a+b*334%7};
+var gzv7K335=function(a,b){return a+b*335%7};
+var gWfHd336=function(a,b){return a+b*336%7};
+var gwQY8337=function(a,b){return a+b*337%7};
+var gI2xy338=function(a,b){return a+b*338%7};
+var gDT7c339=function(a,b){return a+b*339%7};
+var gMr7Z340=function(a,b){return a+b*340%7};
+var gQpfT341=function(a,b){return a+b*341%7};
+var gvgx0342=function(a,b){return a+b*342%7};
+var gkyKH343=function(a,b){return a+b*343%7};
+var gx2Da344=function(a,b){return a+b*344%7};
+var gvLea345=function(a,b){return a+b*345%7};
+var g2Kma346=function(a,b){return a+b*346%7};
+var gZpl3347=function(a,b){return a+b*347%7};
+var gxOhS348=function(a,b){return a+b*348%7};
+var gigHU349=function(a,b){return a+b*349%7};
+var gxWYz350=function(a,b){return a+b*350%7};
+var gbYEb351=function(a,b){return a+b*351%7};
+var gJ7OW352=function(a,b){return a+b*352%7};
+var g7My9353=function(a,b){return a+b*353%7};
+var grpq7354=function(a,b){return a+b*354%7};
+var gdVAM355=function(a,b){return a+b*355%7};
+var g1nOy356=function(a,b){return a+b*356%7};
+var gOgBv357=function(a,b){return a+b*357%7};
+var gMpKz358=function(a,b){return a+b*358%7};
+var g0GMB359=function(a,b){return a+b*359%7};
+var gIvoQ360=function(a,b){return a+b*360%7};
+var gMJbX361=function(a,b){return a+b*361%7};
+var gEcsp362=function(a,b){return a+b*362%7};
+var gfzTi363=function(a,b){return a+b*363%7};
+var ghPGz364=function(a,b){return a+b*364%7};
+var gfs9B365=function(a,b){return a+b*365%7};
+var gErye366=function(a,b){return a+b*366%7};
+var gxgm5367=function(a,b){return a+b*367%7};
+var g9rD8368=function(a,b){return a+b*368%7};
+var gdopj369=function(a,b){return a+b*369%7};
+var gTGYR370=function(a,b){return a+b*370%7};
+var gr6Q4371=function(a,b){return a+b*371%7};
+var g4NYq372=function(a,b){return a+b*372%7};
+var geo3o373=function(a,b){return a+b*373%7};
+var g4hng374=function(a,b){return a+b*374%7};
+var gyTgF375=function(a,b){return a+b*375%7};
+var gUCIR376=function(a,b){return a+b*376%7};
+var g2t0u377=function(a,b){return a+b*377%7};
+var gg9XQ378=function(a,b){return a+b*378%7};
+var grAPE379=function(a,b){return a+b*379%7};
+var gRAZF380=function(a,b){return a+b*380%7};
+var g7unp381=function(a,b){return a+b*381%7};
+var g2le6382=function(a,b){return a+b*382%7};
+var ghSJA383=function(a,b){return a+b*383%7};
+var gjyyR384=function(a,b){return a+b*384%7};
+var gFSrZ385=function(a,b){return a+b*385%7};
+var gSg3Z386=function(a,b){return a+b*386%7};
+var gwghT387=function(a,b){return a+b*387%7};
+var gPwkz388=function(a,b){return a+b*388%7};
+var gzF90389=function(a,b){return a+b*389%7};
+var g44Ji390=function(a,b){return a+b*390%7};
+var gYkq0391=function(a,b){return a+b*391%7};
+var gcZ7k392=function(a,b){return a+b*392%7};
+var gAySB393=function(a,b){return a+b*393%7};
+var gyqs5394=function(a,b){return a+b*394%7};
+var gM5QF395=function(a,b){return a+b*395%7};
+var gcR4w396=function(a,b){return a+b*396%7};
+var gadx5397=function(a,b){return a+b*397%7};
+var gCj49398=function(a,b){return a+b*398%7};
+var gO3yt399=function(a,b){return a+b*399%7};
+var gSHrR400=function(a,b){return a+b*400%7};
+var g8Ica401=function(a,b){return a+b*401%7};
+var gcxqG402=function(a,b){return a+b*402%7};
+var g1WUP403=function(a,b){return a+b*403%7};
+var gNiOB404=function(a,b){return a+b*404%7};
+var g3L8W405=function(a,b){return a+b*405%7};
+var gTJG5406=function(a,b){return a+b*406%7};
+var gH8X9407=function(a,b){return a+b*407%7};
+var gnv3o408=function(a,b){return a+b*408%7};
+var gnIGa409=function(a,b){return a+b*409%7};
+var giCW3410=function(a,b){return a+b*410%7};
+var gZ50v411=function(a,b){return a+b*411%7};
+var gxd67412=function(a,b){return a+b*412%7};
+var gw2D6413=function(a,b){return a+b*413%7};
+var gU2oc414=function(a,b){return a+b*414%7};
+var gU3An415=function(a,b){return a+b*415%7};
+var ggltF416=function(a,b){return a+b*416%7};
+var ga31O417=function(a,b){return a+b*417%7};
+var gKrYx418=function(a,b){return a+b*418%7};
+var gD3WS419=function(a,b){return a+b*419%7};
+var gIyA5420=function(a,b){return a+b*420%7};
+var gYYRl421=function(a,b){return a+b*421%7};
+var gewwn422=function(a,b){return a+b*422%7};
+var gm5F8423=function(a,b){return a+b*423%7};
+var gJGSw424=function(a,b){return a+b*424%7};
+var gGZpy425=function(a,b){return a+b*425%7};
+var gY3n2426=function(a,b){return a+b*426%7};
+var gQQ8n427=function(a,b){return a+b*427%7};
+var g1Zy5428=function(a,b){return a+b*428%7};
+var gPHc8429=function(a,b){return a+b*429%7};
+var gwIUs430=function(a,b){return a+b*430%7};
+var gtIgl431=function(a,b){return a+b*431%7};
+var glWgf432=function(a,b){return a+b*432%7};
+var g4syR433=function(a,b){return a+b*433%7};
+var gbLxZ434=function(a,b){return a+b*434%7};
+var gLYZr435=function(a,b){return a+b*435%7};
+var gXRsk436=function(a,b){return a+b*436%7};
+var gnLsh437=function(a,b){return a+b*437%7};
+var gxsgb438=function(a,b){return a+b*438%7};
+var gvMBs439=function(a,b){return a+b*439%7};
+var gWob6440=function(a,b){return a+b*440%7};
+var g2ba0441=function(a,b){return a+b*441%7};
+var gOlxp442=function(a,b){return a+b*442%7};
+var grULv443=function(a,b){return a+b*443%7};
+var g5sg9444=function(a,b){return a+b*444%7};
+var gRWy4445=function(a,b){return a+b*445%7};
+var gU04Q446=function(a,b){return a+b*446%7};
+var gedEE447=function(a,b){return a+b*447%7};
+var g5Q8N448=function(a,b){return a+b*448%7};
+var gHxW0449=function(a,b){return a+b*449%7};
+var gVfDG450=function(a,b){return a+b*450%7};
+var gIEVD451=function(a,b){return a+b*451%7};
+var gBdBL452=function(a,b){return a+b*452%7};
+var gVPDS453=function(a,b){return a+b*453%7};
+var g9YU7454=function(a,b){return a+b*454%7};
+var gBQfr455=function(a,b){return a+b*455%7};
+var geCmG456=function(a,b){return a+b*456%7};
+var g32uZ457=function(a,b){return a+b*457%7};
+var gnK9R458=function(a,b){return a+b*458%7};
+var gN8OE459=function(a,b){return a+b*459%7};
+var gfB7N460=function(a,b){return a+b*460%7};
+var guxBf461=function(a,b){return a+b*461%7};
+var gNKvH462=function(a,b){return a+b*462%7};
+var gfQgK463=function(a,b){return a+b*463%7};
+var gsTgE464=function(a,b){return a+b*464%7};
+var gXxrD465=function(a,b){return a+b*465%7};
+var gJjPN466=function(a,b){return a+b*466%7};
+var gCnKn467=function(a,b){return a+b*467%7};
+var gt4zx468=function(a,b){return a+b*468%7};
+var gaz4F469=function(a,b){return a+b*469%7};
+var gcEGP470=function(a,b){return a+b*470%7};
+var gMs5y471=function(a,b){return a+b*471%7};
+var gX4Xf472=function(a,b){return a+b*472%7};
+var gZegE473=function(a,b){return a+b*473%7};
+var ggJAA474=function(a,b){return a+b*474%7};
+var gZDwb475=function(a,b){return a+b*475%7};
+var g9NM0476=function(a,b){return a+b*476%7};
+var gbsgm477=function(a,b){return a+b*477%7};
+var gTQJS478=function(a,b){return a+b*478%7};
+var gAjsu479=function(a,b){return a+b*479%7};
+var gW5R5480=function(a,b){return a+b*480%7};
+var guA5v481=function(a,b){return a+b*481%7};
+var g2JqB482=function(a,b){return a+b*482%7};
+var gRmnW483=function(a,b){return a+b*483%7};
+var gUTF3484=function(a,b){return a+b*484%7};
+var geHna485=function(a,b){return a+b*485%7};
+var gQAaz486=function(a,b){return a+b*486%7};
+var gtGg7487=function(a,b){return a+b*487%7};
+var gtymd488=function(a,b){return a+b*488%7};
+var gCCE6489=function(a,b){return a+b*489%7};
+var gyl4M490=function(a,b){return a+b*490%7};
+var g6d4n491=function(a,b){return a+b*491%7};
+var gCHYX492=function(a,b){return a+b*492%7};
+var g2gwu493=function(a,b){return a+b*493%7};
+var gR9Li494=function(a,b){return a+b*494%7};
+var grzxG495=function(a,b){return a+b*495%7};
+var gG3Um496=function(a,b){return a+b*496%7};
+var gLL9d497=function(a,b){return a+b*497%7};
+var gXL5f498=function(a,b){return a+b*498%7};
+var godxK499=function(a,b){return a+b*499%7};
+var gy1yA500=function(a,b){return a+b*500%7};
+var g8687501=function(a,b){return a+b*501%7};
+var gKi43502=function(a,b){return a+b*502%7};
+var gcPOg503=function(a,b){return a+b*503%7};
+var gClEt504=function(a,b){return a+b*504%7};
+var gGr23505=function(a,b){return a+b*505%7};
+var gN5PG506=function(a,b){return a+b*506%7};
+var gIvJF507=function(a,b){return a+b*507%7};
+var ghrwy508=function(a,b){return a+b*508%7};
+var gYoQT509=function(a,b){return a+b*509%7};
+var gCqQA510=function(a,b){return a+b*510%7};
+var g3mrC511=function(a,b){return a+b*511%7};
+var g0WTT512=function(a,b){return a+b*512%7};
+var gQH2F513=function(a,b){return a+b*513%7};
+var gxqKs514=function(a,b){return a+b*514%7};
+var gH3sB515=function(a,b){return a+b*515%7};
+var gjhWm516=function(a,b){return a+b*516%7};
+var gP656517=function(a,b){return a+b*517%7};
+var goyp2518=function(a,b){return a+b*518%7};
+var ghlJs519=function(a,b){return a+b*519%7};
+var gfaFk520=function(a,b){return a+b*520%7};
+var gWnKv521=function(a,b){return a+b*521%7};
+var gR5LQ522=function(a,b){return a+b*522%7};
+var gEyAw523=function(a,b){return a+b*523%7};
+var gP38w524=function(a,b){return a+b*524%7};
+var gMXQt525=function(a,b){return a+b*525%7};
+var gu0UR526=function(a,b){return a+b*526%7};
+var gou1z527=function(a,b){return a+b*527%7};
+var goTaL528=function(a,b){return a+b*528%7};
+var gcYbj529=function(a,b){return a+b*529%7};
+var gJz6I530=function(a,b){return a+b*530%7};
+var gAF84531=function(a,b){return a+b*531%7};
+var g2pV6532=function(a,b){return a+b*532%7};
+var glcJA533=function(a,b){return a+b*533%7};
+var g3xqc534=function(a,b){return a+b*534%7};
+var g9EKJ535=function(a,b){return a+b*535%7};
+var g07Oq536=function(a,b){return a+b*536%7};
+var gF9ln537=function(a,b){return a+b*537%7};
+var gDSs7538=function(a,b){return a+b*538%7};
+var gxA6n539=function(a,b){return a+b*539%7};
+var gVZEn540=function(a,b){return a+b*540%7};
+var gPFhm541=function(a,b){return a+b*541%7};
+var gxniQ542=function(a,b){return a+b*542%7};
+var gzyL9543=function(a,b){return a+b*543%7};
+var g8i5X544=function(a,b){return a+b*544%7};
+var gNAWk545=function(a,b){return a+b*545%7};
+var gF1SL546=function(a,b){return a+b*546%7};
+var g3e8U547=function(a,b){return a+b*547%7};
+var gJBuk548=function(a,b){return a+b*548%7};
+var gkkv4549=function(a,b){return a+b*549%7};
+var gCnBX550=function(a,b){return a+b*550%7};
+var g3qVZ551=function(a,b){return a+b*551%7};
+var gEVAL552=function(a,b){return a+b*552%7};
+var g88Ss553=function(a,b){return a+b*553%7};
+var gGLuk554=function(a,b){return a+b*554%7};
+var gT2P2555=function(a,b){return a+b*555%7};
+var g6Zr4556=function(a,b){return a+b*556%7};
+var gBlEU557=function(a,b){return a+b*557%7};
+var gsxm3558=function(a,b){return a+b*558%7};
+var gnWfQ559=function(a,b){return a+b*559%7};
+var gxHDD560=function(a,b){return a+b*560%7};
+var gySka561=function(a,b){return a+b*561%7};
+var gL6AR562=function(a,b){return a+b*562%7};
+var gWn7x563=function(a,b){return a+b*563%7};
+var gxgkS564=function(a,b){return a+b*564%7};
+var gAdGL565=function(a,b){return a+b*565%7};
+var gWZ0a566=function(a,b){return a+b*566%7};
+var gyHuS567=function(a,b){return a+b*567%7};
+var gImyI568=function(a,b){return a+b*568%7};
+var g8Niu569=function(a,b){return a+b*569%7};
+var gZ8H2570=function(a,b){return a+b*570%7};
+var g3aW5571=function(a,b){return a+b*571%7};
+var gyxfj572=function(a,b){return a+b*572%7};
+var gskkp573=function(a,b){return a+b*573%7};
+var g9fxg574=function(a,b){return a+b*574%7};
+var gfwV2575=function(a,b){return a+b*575%7};
+var gkMIX576=function(a,b){return a+b*576%7};
+var g4HOe577=function(a,b){return a+b*577%7};
+var grFBr578=function(a,b){return a+b*578%7};
+var gAStP579=function(a,b){return a+b*579%7};
+var g6kF7580=function(a,b){return a+b*580%7};
+var gKCmG581=function(a,b){return a+b*581%7};
+var g1UD5582=function(a,b){return a+b*582%7};
+var g45UU583=function(a,b){return a+b*583%7};
+var gUHi9584=function(a,b){return a+b*584%7};
+var gGxa1585=function(a,b){return a+b*585%7};
+var g51pv586=function(a,b){return a+b*586%7};
+var gZZlv587=function(a,b){return a+b*587%7};
+var g3dcY588=function(a,b){return a+b*588%7};
+var gq1ML589=function(a,b){return a+b*589%7};
+var gakSS590=function(a,b){return a+b*590%7};
+var gibbA591=function(a,b){return a+b*591%7};
+var gxxAE592=function(a,b){return a+b*592%7};
+var gxZiU593=function(a,b){return a+b*593%7};
+var gmh2P594=function(a,b){return a+b*594%7};
+var g3BB1595=function(a,b){return a+b*595%7};
+var gYU36596=function(a,b){return a+b*596%7};
+var gpTFQ597=function(a,b){return a+b*597%7};
+var gxY73598=function(a,b){return a+b*598%7};
+var gBZ94599=function(a,b){return a+b*599%7};
+var gZYgj600=function(a,b){return a+b*600%7};
+var gnf0h601=function(a,b){return a+b*601%7};
+var gethM602=function(a,b){return a+b*602%7};
+var gnQtj603=function(a,b){return a+b*603%7};
+var gri1c604=function(a,b){return a+b*604%7};
+var gf1tf605=function(a,b){return a+b*605%7};
+var gnPiJ606=function(a,b){return a+b*606%7};
+var gqylp607=function(a,b){return a+b*607%7};
+var gQVMz608=function(a,b){return a+b*608%7};
+var gzI7j609=function(a,b){return a+b*609%7};
+var gcjA8610=function(a,b){return a+b*610%7};
+var gW9md611=function(a,b){return a+b*611%7};
+var gXBBA612=function(a,b){return a+b*612%7};
+var gvwCc613=function(a,b){return a+b*613%7};
+var gd89d614=function(a,b){return a+b*614%7};
+var gLYYi615=function(a,b){return a+b*615%7};
+var gOiWo616=function(a,b){return a+b*616%7};
+var grTZt617=function(a,b){return a+b*617%7};
+var gkxLH618=function(a,b){return a+b*618%7};
+var gLKGv619=function(a,b){return a+b*619%7};
+var gFyef620=function(a,b){return a+b*620%7};
+var gDlJp621=function(a,b){return a+b*621%7};
+var grywy622=function(a,b){return a+b*622%7};
+var goXlx623=function(a,b){return a+b*623%7};
+var gcUyD624=function(a,b){return a+b*624%7};
+var gbN8M625=function(a,b){return a+b*625%7};
+var g1WSy626=function(a,b){return a+b*626%7};
+var gG01X627=function(a,b){return a+b*627%7};
+var gtGm2628=function(a,b){return a+b*628%7};
+var gHTrY629=function(a,b){return a+b*629%7};
+var gcQco630=function(a,b){return a+b*630%7};
+var gz8qE631=function(a,b){return a+b*631%7};
+var gccJk632=function(a,b){return a+b*632%7};
+var gI3El633=function(a,b){return a+b*633%7};
+var g0XvI634=function(a,b){return a+b*634%7};
+var gZMYW635=function(a,b){return a+b*635%7};
+var gt4l9636=function(a,b){return a+b*636%7};
+var gcGtb637=function(a,b){return a+b*637%7};
+var gdAyM638=function(a,b){return a+b*638%7};
+var gJSjX639=function(a,b){return a+b*639%7};
+var gUDCx640=function(a,b){return a+b*640%7};
+var gAibe641=function(a,b){return a+b*641%7};
+var g4tXJ642=function(a,b){return a+b*642%7};
+var gJdz1643=function(a,b){return a+b*643%7};
+var gmD0I644=function(a,b){return a+b*644%7};
+var gdyDr645=function(a,b){return a+b*645%7};
+var g12Nx646=function(a,b){return a+b*646%7};
+var glVq3647=function(a,b){return a+b*647%7};
+var gWzm4648=function(a,b){return a+b*648%7};
+var gaFsd649=function(a,b){return a+b*649%7};
+var gIHb3650=function(a,b){return a+b*650%7};
+var gKs8i651=function(a,b){return a+b*651%7};
+var gHx1J652=function(a,b){return a+b*652%7};
+var g5jV6653=function(a,b){return a+b*653%7};
+var gqG9u654=function(a,b){return a+b*654%7};
+var g9AcG655=function(a,b){return a+b*655%7};
+var gHZTN656=function(a,b){return a+b*656%7};
+var g3cay657=function(a,b){return a+b*657%7};
+var g8bMR658=function(a,b){return a+b*658%7};
+var gyH2E659=function(a,b){return a+b*659%7};
+var gHdnx660=function(a,b){return a+b*660%7};
+var g3MzG661=function(a,b){return a+b*661%7};
+var ghE9y662=function(a,b){return a+b*662%7};
+var gQUan663=function(a,b){return a+b*663%7};
+var gg1F6664=function(a,b){return a+b*664%7};
+var g7r5t665=function(a,b){return a+b*665%7};
+var gT9qR666=function(a,b){return a+b*666%7};
+var gotVM667=function(a,b){return a+b*667%7};
+var gNr7r668=function(a,b){return a+b*668%7};
+var gzxRe669=function(a,b){return a+b*669%7};
+var gUsOo670=function(a,b){return a+b*670%7};
+var gOqBx671=function(a,b){return a+b*671%7};
+var gHkwZ672=function(a,b){return a+b*672%7};
+var gS4WT673=function(a,b){return a+b*673%7};
+var gQB4C674=function(a,b){return a+b*674%7};
+var gTnc6675=function(a,b){return a+b*675%7};
+var gOY4Y676=function(a,b){return a+b*676%7};
+var g1Pop677=function(a,b){return a+b*677%7};
+var g4j7H678=function(a,b){return a+b*678%7};
+var gqtKp679=function(a,b){return a+b*679%7};
+var gCiOJ680=function(a,b){return a+b*680%7};
+var ggc0S681=function(a,b){return a+b*681%7};
+var gfQVV682=function(a,b){return a+b*682%7};
+var glZSy683=function(a,b){return a+b*683%7};
+var gtUSN684=function(a,b){return a+b*684%7};
+var gyXCf685=function(a,b){return a+b*685%7};
+var glERx686=function(a,b){return a+b*686%7};
+var gXzIL687=function(a,b){return a+b*687%7};
+var gMWdR688=function(a,b){return a+b*688%7};
+var gyE6s689=function(a,b){return a+b*689%7};
+var gZSJF690=function(a,b){return a+b*690%7};
+var gCUNW691=function(a,b){return a+b*691%7};
+var gJanF692=function(a,b){return a+b*692%7};
+var g2T6x693=function(a,b){return a+b*693%7};
+var gjFNG694=function(a,b){return a+b*694%7};
+var gbmxZ695=function(a,b){return a+b*695%7};
+var glTbw696=function(a,b){return a+b*696%7};
+var g8kQ1697=function(a,b){return a+b*697%7};
+var glOAi698=function(a,b){return a+b*698%7};
+var gKQ8a699=function(a,b){return a+b*699%7};
+var gJIG3700=function(a,b){return a+b*700%7};
+var ghr35701=function(a,b){return a+b*701%7};
+var gC2oz702=function(a,b){return a+b*702%7};
+var gLasy703=function(a,b){return a+b*703%7};
+var g79z1704=function(a,b){return a+b*704%7};
+var g5WfJ705=function(a,b){return a+b*705%7};
+var gLGpP706=function(a,b){return a+b*706%7};
+var gpQtL707=function(a,b){return a+b*707%7};
+var g9eqE708=function(a,b){return a+b*708%7};
+var gphU1709=function(a,b){return a+b*709%7};
+var gqamC710=function(a,b){return a+b*710%7};
+var gXB6q711=function(a,b){return a+b*711%7};
+var g58Dx712=function(a,b){return a+b*712%7};
+var gEsTV713=function(a,b){return a+b*713%7};
+var gxOa7714=function(a,b){return a+b*714%7};
+var gEOX6715=function(a,b){return a+b*715%7};
+var gpVQN716=function(a,b){return a+b*716%7};
+var ghahF717=function(a,b){return a+b*717%7};
+var gE75Y718=function(a,b){return a+b*718%7};
+var g7qbA719=function(a,b){return a+b*719%7};
+var grnf4720=function(a,b){return a+b*720%7};
+var g6Olc721=function(a,b){return a+b*721%7};
+var g73On722=function(a,b){return a+b*722%7};
+var g0DDE723=function(a,b){return a+b*723%7};
+var g2tFw724=function(a,b){return a+b*724%7};
+var gp07y725=function(a,b){return a+b*725%7};
+var gnErt726=function(a,b){return a+b*726%7};
+var gXo0V727=function(a,b){return a+b*727%7};
+var gKJyT728=function(a,b){return a+b*728%7};
+var gNw5m729=function(a,b){return a+b*729%7};
+var gYuS4730=function(a,b){return a+b*730%7};
+var grtbT731=function(a,b){return a+b*731%7};
+var g66EK732=function(a,b){return a+b*732%7};
+var g0Xi8733=function(a,b){return a+b*733%7};
+var gFVoz734=function(a,b){return a+b*734%7};
+var g2Jx5735=function(a,b){return a+b*735%7};
+var gSApI736=function(a,b){return a+b*736%7};
+var gfsCQ737=function(a,b){return a+b*737%7};
+var gGxWY738=function(a,b){return a+b*738%7};
+var gKdbG739=function(a,b){return a+b*739%7};
+var g3AIX740=function(a,b){return a+b*740%7};
+var gGKEi741=function(a,b){return a+b*741%7};
+var gmOGK742=function(a,b){return a+b*742%7};
+var gTVn4743=function(a,b){return a+b*743%7};
+var gbbc1744=function(a,b){return a+b*744%7};
+var gdLhv745=function(a,b){return a+b*745%7};
+var gBUX4746=function(a,b){return a+b*746%7};
+var gOYxS747=function(a,b){return a+b*747%7};
+var gScCP748=function(a,b){return a+b*748%7};
+var gIMr6749=function(a,b){return a+b*749%7};
+var grxPe750=function(a,b){return a+b*750%7};
+var gvNjW751=function(a,b){return a+b*751%7};
+var ggZ3A752=function(a,b){return a+b*752%7};
+var gEYkg753=function(a,b){return a+b*753%7};
+var gIjy7754=function(a,b){return a+b*754%7};
+var gZf5T755=function(a,b){return a+b*755%7};
+var gox0l756=function(a,b){return a+b*756%7};
+var gM4Qb757=function(a,b){return a+b*757%7};
+var g1xLM758=function(a,b){return a+b*758%7};
+var gWDLs759=function(a,b){return a+b*759%7};
+var g1eVX760=function(a,b){return a+b*760%7};
+var grTpb761=function(a,b){return a+b*761%7};
+var gudPz762=function(a,b){return a+b*762%7};
+var gLx9G763=function(a,b){return a+b*763%7};
+var gV2vp764=function(a,b){return a+b*764%7};
+var giMuK765=function(a,b){return a+b*765%7};
+var ggw7i766=function(a,b){return a+b*766%7};
+var gs92Q767=function(a,b){return a+b*767%7};
+var gryn9768=function(a,b){return a+b*768%7};
+var gi3gP769=function(a,b){return a+b*769%7};
+var gG83x770=function(a,b){return a+b*770%7};
+var gOaWU771=function(a,b){return a+b*771%7};
+var gtb4E772=function(a,b){return a+b*772%7};
+var g2C8a773=function(a,b){return a+b*773%7};
+var gupkU774=function(a,b){return a+b*774%7};
+var gDBy1775=function(a,b){return a+b*775%7};
+var gcoRy776=function(a,b){return a+b*776%7};
+var gZCFo777=function(a,b){return a+b*777%7};
+var gWyI1778=function(a,b){return a+b*778%7};
+var gxTB3779=function(a,b){return a+b*779%7};
+var gEEgv780=function(a,b){return a+b*780%7};
+var gAGNO781=function(a,b){return a+b*781%7};
+var gU3Ln782=function(a,b){return a+b*782%7};
+var gaxeL783=function(a,b){return a+b*783%7};
+var giGvu784=function(a,b){return a+b*784%7};
+var gn11q785=function(a,b){return a+b*785%7};
+var gXrv7786=function(a,b){return a+b*786%7};
+var gVWsO787=function(a,b){return a+b*787%7};
+var gH0V0788=function(a,b){return a+b*788%7};
+var gDnVQ789=function(a,b){return a+b*789%7};
+var gnH4K790=function(a,b){return a+b*790%7};
+var g8Ohb791=function(a,b){return a+b*791%7};
+var gDfSd792=function(a,b){return a+b*792%7};
+var g8Boh793=function(a,b){return a+b*793%7};
+var gtSlw794=function(a,b){return a+b*794%7};
+var g3fNN795=function(a,b){return a+b*795%7};
+var gMX8t796=function(a,b){return a+b*796%7};
+var gIWld797=function(a,b){return a+b*797%7};
+var gy6L0798=function(a,b){return a+b*798%7};
+var gfgxl799=function(a,b){return a+b*799%7};
+var gxySK800=function(a,b){return a+b*800%7};
+var gHcId801=function(a,b){return a+b*801%7};
+var gEIQp802=function(a,b){return a+b*802%7};
+var gVvAm803=function(a,b){return a+b*803%7};
+var gik1l804=function(a,b){return a+b*804%7};
+var gPocM805=function(a,b){return a+b*805%7};
+var gSvcP806=function(a,b){return a+b*806%7};
+var gxxv0807=function(a,b){return a+b*807%7};
+var gsHBh808=function(a,b){return a+b*808%7};
+var gkuxu809=function(a,b){return a+b*809%7};
+var gOlDp810=function(a,b){return a+b*810%7};
+var gKxwd811=function(a,b){return a+b*811%7};
+var gwMi3812=function(a,b){return a+b*812%7};
+var gDVx5813=function(a,b){return a+b*813%7};
+var gZW5f814=function(a,b){return a+b*814%7};
+var gx804815=function(a,b){return a+b*815%7};
+var gfDFg816=function(a,b){return a+b*816%7};
+var g5UuX817=function(a,b){return a+b*817%7};
+var gYG4h818=function(a,b){return a+b*818%7};
+var g8rY1819=function(a,b){return a+b*819%7};
+var g1t31820=function(a,b){return a+b*820%7};
+var gIqRo821=function(a,b){return a+b*821%7};
+var grCOj822=function(a,b){return a+b*822%7};
+var gdnKp823=function(a,b){return a+b*823%7};
+var gq1x1824=function(a,b){return a+b*824%7};
+var g3e0C825=function(a,b){return a+b*825%7};
+var g4f6c826=function(a,b){return a+b*826%7};
+var gYyU7827=function(a,b){return a+b*827%7};
+var goFiw828=function(a,b){return a+b*828%7};
+var g0VCx829=function(a,b){return a+b*829%7};
+var glC7y830=function(a,b){return a+b*830%7};
+var gYBPF831=function(a,b){return a+b*831%7};
+var ga3Gh832=function(a,b){return a+b*832%7};
+var gPLyh833=function(a,b){return a+b*833%7};
+var gix9M834=function(a,b){return a+b*834%7};
+var giXs2835=function(a,b){return a+b*835%7};
+var giLZ9836=function(a,b){return a+b*836%7};
+var gc6Zt837=function(a,b){return a+b*837%7};
+var gQPAb838=function(a,b){return a+b*838%7};
+var gWaNv839=function(a,b){return a+b*839%7};
+var gAycA840=function(a,b){return a+b*840%7};
+var gEdfc841=function(a,b){return a+b*841%7};
+var gum2x842=function(a,b){return a+b*842%7};
+var gKiaU843=function(a,b){return a+b*843%7};
+var gSX9v844=function(a,b){return a+b*844%7};
+var g2WVP845=function(a,b){return a+b*845%7};
+var gLuH9846=function(a,b){return a+b*846%7};
+var gEI1A847=function(a,b){return a+b*847%7};
+var gSq0D848=function(a,b){return a+b*848%7};
+var gigq9849=function(a,b){return a+b*849%7};
+var gFx8Q850=function(a,b){return a+b*850%7};
+var gQPnh851=function(a,b){return a+b*851%7};
+var gqq4g852=function(a,b){return a+b*852%7};
+var g0UxJ853=function(a,b){return a+b*853%7};
+var g6LxN854=function(a,b){return a+b*854%7};
+var gFucN855=function(a,b){return a+b*855%7};
+var gfqMd856=function(a,b){return a+b*856%7};
+var goi3w857=function(a,b){return a+b*857%7};
+var gNniD858=function(a,b){return a+b*858%7};
+var gxjGG859=function(a,b){return a+b*859%7};
+var gKtvn860=function(a,b){return a+b*860%7};
+var gApJM861=function(a,b){return a+b*861%7};
+var gcxzK862=function(a,b){return a+b*862%7};
+var gpqDQ863=function(a,b){return a+b*863%7};
+var gvF26864=function(a,b){return a+b*864%7};
+var goq3t865=function(a,b){return a+b*865%7};
+var gNakF866=function(a,b){return a+b*866%7};
+var guKxz867=function(a,b){return a+b*867%7};
+var gt2I3868=function(a,b){return a+b*868%7};
+var gokEl869=function(a,b){return a+b*869%7};
+var gTl1a870=function(a,b){return a+b*870%7};
+var gG8QF871=function(a,b){return a+b*871%7};
+var grZHv872=function(a,b){return a+b*872%7};
+var g0R2H873=function(a,b){return a+b*873%7};
+var g9mtx874=function(a,b){return a+b*874%7};
+var gjotU875=function(a,b){return a+b*875%7};
+var ghH80876=function(a,b){return a+b*876%7};
+var geSkH877=function(a,b){return a+b*877%7};
+var gcQeJ878=function(a,b){return a+b*878%7};
+var g5rtc879=function(a,b){return a+b*879%7};
+var gwwlr880=function(a,b){return a+b*880%7};
+var gKQH1881=function(a,b){return a+b*881%7};
+var gVnkb882=function(a,b){return a+b*882%7};
+var gDeyG883=function(a,b){return a+b*883%7};
+var gQgnf884=function(a,b){return a+b*884%7};
+var gM1cp885=function(a,b){return a+b*885%7};
+var g2rzg886=function(a,b){return a+b*886%7};
+var gLbtT887=function(a,b){return a+b*887%7};
+var gHH7a888=function(a,b){return a+b*888%7};
+var gXsh5889=function(a,b){return a+b*889%7};
+var gqG7V890=function(a,b){return a+b*890%7};
+var g0Clo891=function(a,b){return a+b*891%7};
+var gTIRE892=function(a,b){return a+b*892%7};
+var gme2Y893=function(a,b){return a+b*893%7};
+var geGvh894=function(a,b){return a+b*894%7};
+var gzzZa895=function(a,b){return a+b*895%7};
+var gra5D896=function(a,b){return a+b*896%7};
+var gXyMH897=function(a,b){return a+b*897%7};
+var gZ2RQ898=function(a,b){return a+b*898%7};
+var gz6Ky899=function(a,b){return a+b*899%7};
+var gOp2m900=function(a,b){return a+b*900%7};
+var gr10j901=function(a,b){return a+b*901%7};
+var gP6Rp902=function(a,b){return a+b*902%7};
+var g4CH3903=function(a,b){return a+b*903%7};
+var gF0Tf904=function(a,b){return a+b*904%7};
+var gwtEQ905=function(a,b){return a+b*905%7};
+var gsAJI906=function(a,b){return a+b*906%7};
+var gYpHS907=function(a,b){return a+b*907%7};
+var ge1w4908=function(a,b){return a+b*908%7};
+var gR2jm909=function(a,b){return a+b*909%7};
+var gcnmk910=function(a,b){return a+b*910%7};
+var gJMJM911=function(a,b){return a+b*911%7};
+var gXxXy912=function(a,b){return a+b*912%7};
+var gy3xw913=function(a,b){return a+b*913%7};
+var gCnkC914=function(a,b){return a+b*914%7};
+var g7xyy915=function(a,b){return a+b*915%7};
+var gyLrY916=function(a,b){return a+b*916%7};
+var ga3tj917=function(a,b){return a+b*917%7};
+var gxiJL918=function(a,b){return a+b*918%7};
+var gL5xV919=function(a,b){return a+b*919%7};
+var gwefI920=function(a,b){return a+b*920%7};
+var geZfZ921=function(a,b){return a+b*921%7};
+var goxag922=function(a,b){return a+b*922%7};
+var gljPW923=function(a,b){return a+b*923%7};
+var ghcWY924=function(a,b){return a+b*924%7};
+var gyOgj925=function(a,b){return a+b*925%7};
+var gCWnL926=function(a,b){return a+b*926%7};
+var gQcE6927=function(a,b){return a+b*927%7};
+var gkRHx928=function(a,b){return a+b*928%7};
+var gx5M3929=function(a,b){return a+b*929%7};
+var gAyPV930=function(a,b){return a+b*930%7};
+var glPy8931=function(a,b){return a+b*931%7};
+var ghIR6932=function(a,b){return a+b*932%7};
+var gPyyJ933=function(a,b){return a+b*933%7};
+var gRLJa934=function(a,b){return a+b*934%7};
+var gGXe0935=function(a,b){return a+b*935%7};
+var gc8cv936=function(a,b){return a+b*936%7};
+var gmGua937=function(a,b){return a+b*937%7};
+var g83QJ938=function(a,b){return a+b*938%7};
+var gmXKE939=function(a,b){return a+b*939%7};
+var gXx4v940=function(a,b){return a+b*940%7};
+var gLklh941=function(a,b){return a+b*941%7};
+var g9MWY942=function(a,b){return a+b*942%7};
+var gZIWO943=function(a,b){return a+b*943%7};
+var gcyjL944=function(a,b){return a+b*944%7};
+var gcEU0945=function(a,b){return a+b*945%7};
+var gnpx2946=function(a,b){return a+b*946%7};
+var gEcvX947=function(a,b){return a+b*947%7};
+var g4LQb948=function(a,b){return a+b*948%7};
+var g3iSb949=function(a,b){return a+b*949%7};
+var gVWK6950=function(a,b){return a+b*950%7};
+var gbmzB951=function(a,b){return a+b*951%7};
+var gVpqS952=function(a,b){return a+b*952%7};
+var gQSse953=function(a,b){return a+b*953%7};
+var gy1nU954=function(a,b){return a+b*954%7};
+var gHcMN955=function(a,b){return a+b*955%7};
+var ggNUx956=function(a,b){return a+b*956%7};
+var gxFe2957=function(a,b){return a+b*957%7};
+var gyeFm958=function(a,b){return a+b*958%7};
+var gIBnN959=function(a,b){return a+b*959%7};
+var gCDOC960=function(a,b){return a+b*960%7};
+var gSYQi961=function(a,b){return a+b*961%7};
+var gwoCb962=function(a,b){return a+b*962%7};
+var gGQ65963=function(a,b){return a+b*963%7};
+var gfyMy964=function(a,b){return a+b*964%7};
+var g9zcy965=function(a,b){return a+b*965%7};
+var gmV2j966=function(a,b){return a+b*966%7};
+var gLuMJ967=function(a,b){return a+b*967%7};
+var g1jOD968=function(a,b){return a+b*968%7};
+var gPNXH969=function(a,b){return a+b*969%7};
+var gxEQb970=function(a,b){return a+b*970%7};
+var gRMmx971=function(a,b){return a+b*971%7};
+var gNWQ4972=function(a,b){return a+b*972%7};
+var g8B5V973=function(a,b){return a+b*973%7};
+var gy0sF974=function(a,b){return a+b*974%7};
+var ghw4t975=function(a,b){return a+b*975%7};
+var gjBvx976=function(a,b){return a+b*976%7};
+var gaJL9977=function(a,b){return a+b*977%7};
+var gYVrj978=function(a,b){return a+b*978%7};
+var gpBn7979=function(a,b){return a+b*979%7};
+var gcBRY980=function(a,b){return a+b*980%7};
+var gKqEb981=function(a,b){return a+b*981%7};
+var gI12C982=function(a,b){return a+b*982%7};
+var gaqpx983=function(a,b){return a+b*983%7};
+var gjq4x984=function(a,b){return a+b*984%7};
+var gzdOy985=function(a,b){return a+b*985%7};
+var gMCB7986=function(a,b){return a+b*986%7};
+var g0FAA987=function(a,b){return a+b*987%7};
+var gKVoO988=function(a,b){return a+b*988%7};
+var gmKmL989=function(a,b){return a+b*989%7};
+var gr1fx990=function(a,b){return a+b*990%7};
+var g2mOe991=function(a,b){return a+b*991%7};
+var g7jgY992=function(a,b){return a+b*992%7};
+var g6c2w993=function(a,b){return a+b*993%7};
+var g55hC994=function(a,b){return a+b*994%7};
+var g20CX995=function(a,b){return a+b*995%7};
+var gi77C996=function(a,b){return a+b*996%7};
+var gb1jw997=function(a,b){return a+b*997%7};
+var grs1I998=function(a,b){return a+b*998%7};
+var gTgE9999=function(a,b){return a+b*999%7};
+var g97Ph1000=function(a,b){return a+b*1000%7};
+var gqdXW1001=function(a,b){return a+b*1001%7};
+var gzxCs1002=function(a,b){return a+b*1002%7};
+var gHDy21003=function(a,b){return a+b*1003%7};
+var g6eVR1004=function(a,b){return a+b*1004%7};
+var gOX9C1005=function(a,b){return a+b*1005%7};
+var gJLEx1006=function(a,b){return a+b*1006%7};
+var ggqr81007=function(a,b){return a+b*1007%7};
+var g8DWG1008=function(a,b){return a+b*1008%7};
+var g43ic1009=function(a,b){return a+b*1009%7};
+var gelac1010=function(a,b){return a+b*1010%7};
+var gb1yp1011=function(a,b){return a+b*1011%7};
+var gEOcf1012=function(a,b){return a+b*1012%7};
+var gQtcQ1013=function(a,b){return a+b*1013%7};
+var g7RHs1014=function(a,b){return a+b*1014%7};
+var gGW0v1015=function(a,b){return a+b*1015%7};
+var gIQGI1016=function(a,b){return a+b*1016%7};
+var gh8BE1017=function(a,b){return a+b*1017%7};
+var g86Jx1018=function(a,b){return a+b*1018%7};
+var guU4h1019=function(a,b){return a+b*1019%7};
+var gdWyA1020=function(a,b){return a+b*1020%7};
+var gYqqk1021=function(a,b){return a+b*1021%7};
+var g7ZOO1022=function(a,b){return a+b*1022%7};
+var gsxBZ1023=function(a,b){return a+b*1023%7};
+var ggz7U1024=function(a,b){return a+b*1024%7};
+var g3m401025=function(a,b){return a+b*1025%7};
+var g2aF01026=function(a,b){return a+b*1026%7};
+var gOSSY1027=function(a,b){return a+b*1027%7};
+var ggrO01028=function(a,b){return a+b*1028%7};
+var gjpaw1029=function(a,b){return a+b*1029%7};
+var gEhCb1030=function(a,b){return a+b*1030%7};
+var goyeT1031=function(a,b){return a+b*1031%7};
+var gGmsR1032=function(a,b){return a+b*1032%7};
+var gkTPo1033=function(a,b){return a+b*1033%7};
+var gbHoC1034=function(a,b){return a+b*1034%7};
+var gRgXE1035=function(a,b){return a+b*1035%7};
+var gv6qw1036=function(a,b){return a+b*1036%7};
+var g0DzW1037=function(a,b){return a+b*1037%7};
+var gLCGy1038=function(a,b){return a+b*1038%7};
+var gS1FB1039=function(a,b){return a+b*1039%7};
+var gzIs91040=function(a,b){return a+b*1040%7};
+var gky3o1041=function(a,b){return a+b*1041%7};
+var gCOyv1042=function(a,b){return a+b*1042%7};
+var gRIz71043=function(a,b){return a+b*1043%7};
+var g8KJh1044=function(a,b){return a+b*1044%7};
+var gQJg71045=function(a,b){return a+b*1045%7};
+var g16Ic1046=function(a,b){return a+b*1046%7};
+var gYMP71047=function(a,b){return a+b*1047%7};
+var gpxub1048=function(a,b){return a+b*1048%7};
+var gnNNe1049=function(a,b){return a+b*1049%7};
+var gfT7Y1050=function(a,b){return a+b*1050%7};
+var gWLjO1051=function(a,b){return a+b*1051%7};
+var gU2me1052=function(a,b){return a+b*1052%7};
+var gCglC1053=function(a,b){return a+b*1053%7};
+var gXABz1054=function(a,b){return a+b*1054%7};
+var gzUNB1055=function(a,b){return a+b*1055%7};
+var gW5E31056=function(a,b){return a+b*1056%7};
+var g0WAy1057=function(a,b){return a+b*1057%7};
+var gdsq41058=function(a,b){return a+b*1058%7};
+var gb4Gu1059=function(a,b){return a+b*1059%7};
+var gb1jr1060=function(a,b){return a+b*1060%7};
+var gkvCS1061=function(a,b){return a+b*1061%7};
+var gnUIq1062=function(a,b){return a+b*1062%7};
+var g7R5m1063=function(a,b){return a+b*1063%7};
+var gyV9I1064=function(a,b){return a+b*1064%7};
+var gTYn51065=function(a,b){return a+b*1065%7};
+var g2JeJ1066=function(a,b){return a+b*1066%7};
+var gyPck1067=function(a,b){return a+b*1067%7};
+var gO9s01068=function(a,b){return a+b*1068%7};
+var gUqGf1069=function(a,b){return a+b*1069%7};
+var gwlvb1070=function(a,b){return a+b*1070%7};
+var gaQQu1071=function(a,b){return a+b*1071%7};
+var gCDGs1072=function(a,b){return a+b*1072%7};
+var gBF9a1073=function(a,b){return a+b*1073%7};
+var gkyd51074=function(a,b){return a+b*1074%7};
+var gIkJ81075=function(a,b){return a+b*1075%7};
+var gYKms1076=function(a,b){return a+b*1076%7};
+var goVSm1077=function(a,b){return a+b*1077%7};
+var gMLAN1078=function(a,b){return a+b*1078%7};
+var g5PYQ1079=function(a,b){return a+b*1079%7};
+var gUUgz1080=function(a,b){return a+b*1080%7};
+var ghxbR1081=function(a,b){return a+b*1081%7};
+var gjJx81082=function(a,b){return a+b*1082%7};
+var gK0pe1083=function(a,b){return a+b*1083%7};
+var gKoNd1084=function(a,b){return a+b*1084%7};
+var g4Q9z1085=function(a,b){return a+b*1085%7};
+var gyJiY1086=function(a,b){return a+b*1086%7};
+var gewX71087=function(a,b){return a+b*1087%7};
+var ggmz01088=function(a,b){return a+b*1088%7};
+var gCQhc1089=function(a,b){return a+b*1089%7};
+var gxxWu1090=function(a,b){return a+b*1090%7};
+var gOK4F1091=function(a,b){return a+b*1091%7};
+var glaJc1092=function(a,b){return a+b*1092%7};
+var gtJXE1093=function(a,b){return a+b*1093%7};
+var gqe2x1094=function(a,b){return a+b*1094%7};
+var gPPp51095=function(a,b){return a+b*1095%7};
+var gLVL11096=function(a,b){return a+b*1096%7};
+var gpHmw1097=function(a,b){return a+b*1097%7};
+var g8tc51098=function(a,b){return a+b*1098%7};
+var gEGHK1099=function(a,b){return a+b*1099%7};
+var g814m1100=function(a,b){return a+b*1100%7};
+var goFid1101=function(a,b){return a+b*1101%7};
+var gE0Cm1102=function(a,b){return a+b*1102%7};
+var gVxSy1103=function(a,b){return a+b*1103%7};
+var gEK9a1104=function(a,b){return a+b*1104%7};
+var g6MHj1105=function(a,b){return a+b*1105%7};
+var gTlwR1106=function(a,b){return a+b*1106%7};
+var gPCet1107=function(a,b){return a+b*1107%7};
+var gOW5o1108=function(a,b){return a+b*1108%7};
+var gpfig1109=function(a,b){return a+b*1109%7};
+var gcuWs1110=function(a,b){return a+b*1110%7};
+var gWmC61111=function(a,b){return a+b*1111%7};
+var gLbob1112=function(a,b){return a+b*1112%7};
+var gHRMo1113=function(a,b){return a+b*1113%7};
+var gMaMc1114=function(a,b){return a+b*1114%7};
+var gJO9t1115=function(a,b){return a+b*1115%7};
+var gnW9d1116=function(a,b){return a+b*1116%7};
+var gFTcP1117=function(a,b){return a+b*1117%7};
+var gCOcR1118=function(a,b){return a+b*1118%7};
+var gDtx71119=function(a,b){return a+b*1119%7};
+var g0CZ21120=function(a,b){return a+b*1120%7};
+var gnHm01121=function(a,b){return a+b*1121%7};
+var gGdod1122=function(a,b){return a+b*1122%7};
+var gmBik1123=function(a,b){return a+b*1123%7};
+var gRZu01124=function(a,b){return a+b*1124%7};
+var gTH251125=function(a,b){return a+b*1125%7};
+var gARXh1126=function(a,b){return a+b*1126%7};
+var gKeoO1127=function(a,b){return a+b*1127%7};
+var g8L6Y1128=function(a,b){return a+b*1128%7};
+var gx5Wo1129=function(a,b){return a+b*1129%7};
+var gptAU1130=function(a,b){return a+b*1130%7};
+var gOy6k1131=function(a,b){return a+b*1131%7};
+var ghcpd1132=function(a,b){return a+b*1132%7};
+var g7dLp1133=function(a,b){return a+b*1133%7};
+var gmyPW1134=function(a,b){return a+b*1134%7};
+var gDfMx1135=function(a,b){return a+b*1135%7};
+var gHBih1136=function(a,b){return a+b*1136%7};
+var gV0nw1137=function(a,b){return a+b*1137%7};
+var g1XRb1138=function(a,b){return a+b*1138%7};
+var gk5mY1139=function(a,b){return a+b*1139%7};
+var ga70r1140=function(a,b){return a+b*1140%7};
+var gTGkg1141=function(a,b){return a+b*1141%7};
+var g0kyX1142=function(a,b){return a+b*1142%7};
+var gV9QD1143=function(a,b){return a+b*1143%7};
+var gErUb1144=function(a,b){return a+b*1144%7};
+var gyjXb1145=function(a,b){return a+b*1145%7};
+var g82Rj1146=function(a,b){return a+b*1146%7};
+var gtWFt1147=function(a,b){return a+b*1147%7};
+var gHxNg1148=function(a,b){return a+b*1148%7};
+var gYmus1149=function(a,b){return a+b*1149%7};
+var gaSEX1150=function(a,b){return a+b*1150%7};
+var gGc5P1151=function(a,b){return a+b*1151%7};
+var gclJa1152=function(a,b){return a+b*1152%7};
+var gCynO1153=function(a,b){return a+b*1153%7};
+var grxcq1154=function(a,b){return a+b*1154%7};
+var gO4aM1155=function(a,b){return a+b*1155%7};
+var gAIIQ1156=function(a,b){return a+b*1156%7};
+var giKLk1157=function(a,b){return a+b*1157%7};
+var gsOw31158=function(a,b){return a+b*1158%7};
+var gE5vO1159=function(a,b){return a+b*1159%7};
+var ggM6y1160=function(a,b){return a+b*1160%7};
+var gYt201161=function(a,b){return a+b*1161%7};
+var gVoe41162=function(a,b){return a+b*1162%7};
+var gm6B61163=function(a,b){return a+b*1163%7};
+var gGnsV1164=function(a,b){return a+b*1164%7};
+var gD7up1165=function(a,b){return a+b*1165%7};
+var gJPuR1166=function(a,b){return a+b*1166%7};
+var gXWqN1167=function(a,b){return a+b*1167%7};
+var gxlul1168=function(a,b){return a+b*1168%7};
+var g8a1f1169=function(a,b){return a+b*1169%7};
+var gvRqN1170=function(a,b){return a+b*1170%7};
+var gqbrD1171=function(a,b){return a+b*1171%7};
+var gjToN1172=function(a,b){return a+b*1172%7};
+var gzwG51173=function(a,b){return a+b*1173%7};
+var gCR1Q1174=function(a,b){return a+b*1174%7};
+var gCq1f1175=function(a,b){return a+b*1175%7};
+var gdhdg1176=function(a,b){return a+b*1176%7};
+var gQZjX1177=function(a,b){return a+b*1177%7};
+var g6O0g1178=function(a,b){return a+b*1178%7};
+var gmqq51179=function(a,b){return a+b*1179%7};
+var gAWxk1180=function(a,b){return a+b*1180%7};
+var g4weT1181=function(a,b){return a+b*1181%7};
+var gPJ3Q1182=function(a,b){return a+b*1182%7};
+var gIJc31183=function(a,b){return a+b*1183%7};
+var gjxdQ1184=function(a,b){return a+b*1184%7};
+var gxlzW1185=function(a,b){return a+b*1185%7};
+var gJ8oP1186=function(a,b){return a+b*1186%7};
+var g2Eyj1187=function(a,b){return a+b*1187%7};
+var gCsl41188=function(a,b){return a+b*1188%7};
+var gxFqE1189=function(a,b){return a+b*1189%7};
+var gUtqA1190=function(a,b){return a+b*1190%7};
+var gkEYp1191=function(a,b){return a+b*1191%7};
+var gxIpj1192=function(a,b){return a+b*1192%7};
+var gJuyC1193=function(a,b){return a+b*1193%7};
+var gyhu51194=function(a,b){return a+b*1194%7};
+var gfr8y1195=function(a,b){return a+b*1195%7};
+var gT0tu1196=function(a,b){return a+b*1196%7};
+var gwCtf1197=function(a,b){return a+b*1197%7};
+var gbvub1198=function(a,b){return a+b*1198%7};
+var gPhD01199=function(a,b){return a+b*1199%7};
+var gMWJy1200=function(a,b){return a+b*1200%7};
+var gn64q1201=function(a,b){return a+b*1201%7};
+var gbnnO1202=function(a,b){return a+b*1202%7};
+var gdHg31203=function(a,b){return a+b*1203%7};
+var g2XpT1204=function(a,b){return a+b*1204%7};
+var gF8GA1205=function(a,b){return a+b*1205%7};
+var gvaF31206=function(a,b){return a+b*1206%7};
+var grdb41207=function(a,b){return a+b*1207%7};
+var gSJxP1208=function(a,b){return a+b*1208%7};
+var gedOx1209=function(a,b){return a+b*1209%7};
+var gCrcB1210=function(a,b){return a+b*1210%7};
+var gFkwQ1211=function(a,b){return a+b*1211%7};
+var gsybx1212=function(a,b){return a+b*1212%7};
+var gqiTv1213=function(a,b){return a+b*1213%7};
+var gJczH1214=function(a,b){return a+b*1214%7};
+var gwYbr1215=function(a,b){return a+b*1215%7};
+var g5rqy1216=function(a,b){return a+b*1216%7};
+var g7DKH1217=function(a,b){return a+b*1217%7};
+var gPK3I1218=function(a,b){return a+b*1218%7};
+var guFbU1219=function(a,b){return a+b*1219%7};
+var gle8T1220=function(a,b){return a+b*1220%7};
+var gTijB1221=function(a,b){return a+b*1221%7};
+var gKFax1222=function(a,b){return a+b*1222%7};
+var gIz0i1223=function(a,b){return a+b*1223%7};
+var gAhCg1224=function(a,b){return a+b*1224%7};
+var gAFgj1225=function(a,b){return a+b*1225%7};
+var gx1iA1226=function(a,b){return a+b*1226%7};
+var gXPxC1227=function(a,b){return a+b*1227%7};
+var gfYhp1228=function(a,b){return a+b*1228%7};
+var gEsmj1229=function(a,b){return a+b*1229%7};
+var ghXT01230=function(a,b){return a+b*1230%7};
+var gJhc01231=function(a,b){return a+b*1231%7};
+var gGXYj1232=function(a,b){return a+b*1232%7};
+var gV5XV1233=function(a,b){return a+b*1233%7};
+var gsx4j1234=function(a,b){return a+b*1234%7};
+var geSIy1235=function(a,b){return a+b*1235%7};
+var gdJUL1236=function(a,b){return a+b*1236%7};
+var g9bjp1237=function(a,b){return a+b*1237%7};
+var gmLU21238=function(a,b){return a+b*1238%7};
+var gddzC1239=function(a,b){return a+b*1239%7};
+var g9mfx1240=function(a,b){return a+b*1240%7};
+var gKpSa1241=function(a,b){return a+b*1241%7};
+var grbMo1242=function(a,b){return a+b*1242%7};
+var gyv6P1243=function(a,b){return a+b*1243%7};
+var gRSMS1244=function(a,b){return a+b*1244%7};
+var gCEHu1245=function(a,b){return a+b*1245%7};
+var gpb4a1246=function(a,b){return a+b*1246%7};
+var g8Nt91247=function(a,b){return a+b*1247%7};
+var gCNMr1248=function(a,b){return a+b*1248%7};
+var gaU0J1249=function(a,b){return a+b*1249%7};
+var gdtTh1250=function(a,b){return a+b*1250%7};
+var gOX4B1251=function(a,b){return a+b*1251%7};
+var gfGmm1252=function(a,b){return a+b*1252%7};
+var gy1FL1253=function(a,b){return a+b*1253%7};
+var gKCtX1254=function(a,b){return a+b*1254%7};
+var goHZs1255=function(a,b){return a+b*1255%7};
+var gOKQO1256=function(a,b){return a+b*1256%7};
+var g8JgN1257=function(a,b){return a+b*1257%7};
+var g04611258=function(a,b){return a+b*1258%7};
+var g54pA1259=function(a,b){return a+b*1259%7};
+var gQXFw1260=function(a,b){return a+b*1260%7};
+var gxqDY1261=function(a,b){return a+b*1261%7};
+var gRvor1262=function(a,b){return a+b*1262%7};
+var gp8iO1263=function(a,b){return a+b*1263%7};
+var gIklb1264=function(a,b){return a+b*1264%7};
+var gvSq11265=function(a,b){return a+b*1265%7};
+var gMn6e1266=function(a,b){return a+b*1266%7};
+var gotvx1267=function(a,b){return a+b*1267%7};
+var gNJIM1268=function(a,b){return a+b*1268%7};
+var gmx0J1269=function(a,b){return a+b*1269%7};
+var gu2dr1270=function(a,b){return a+b*1270%7};
+var gBQpO1271=function(a,b){return a+b*1271%7};
+var gdOOp1272=function(a,b){return a+b*1272%7};
+var gWuvy1273=function(a,b){return a+b*1273%7};
+var gaDjs1274=function(a,b){return a+b*1274%7};
+var g4Axj1275=function(a,b){return a+b*1275%7};
+var gEUlc1276=function(a,b){return a+b*1276%7};
+var gTsCm1277=function(a,b){return a+b*1277%7};
+var gA6Vh1278=function(a,b){return a+b*1278%7};
+var g4JvK1279=function(a,b){return a+b*1279%7};
+var gKPxI1280=function(a,b){return a+b*1280%7};
+var gUdJ91281=function(a,b){return a+b*1281%7};
+var g6E3e1282=function(a,b){return a+b*1282%7};
+var gLaBf1283=function(a,b){return a+b*1283%7};
+var gypDG1284=function(a,b){return a+b*1284%7};
+var gX7Cv1285=function(a,b){return a+b*1285%7};
+var g9G2E1286=function(a,b){return a+b*1286%7};
+var gUGVU1287=function(a,b){return a+b*1287%7};
+var gepVj1288=function(a,b){return a+b*1288%7};
+var grtAX1289=function(a,b){return a+b*1289%7};
+var gPzJx1290=function(a,b){return a+b*1290%7};
+var g6EaM1291=function(a,b){return a+b*1291%7};
+var grc5H1292=function(a,b){return a+b*1292%7};
+var gdEyI1293=function(a,b){return a+b*1293%7};
+var gmuyn1294=function(a,b){return a+b*1294%7};
+var ghurZ1295=function(a,b){return a+b*1295%7};
+var gVsaM1296=function(a,b){return a+b*1296%7};
+var ggNTu1297=function(a,b){return a+b*1297%7};
+var g4ZOG1298=function(a,b){return a+b*1298%7};
+var gxD4P1299=function(a,b){return a+b*1299%7};
+var gBuyQ1300=function(a,b){return a+b*1300%7};
+var gA5wJ1301=function(a,b){return a+b*1301%7};
+var gFWsM1302=function(a,b){return a+b*1302%7};
+var g9gsQ1303=function(a,b){return a+b*1303%7};
+var gcfd51304=function(a,b){return a+b*1304%7};
+var gxgBf1305=function(a,b){return a+b*1305%7};
+var gFcCv1306=function(a,b){return a+b*1306%7};
+var gjuDQ1307=function(a,b){return a+b*1307%7};
+var gk8SN1308=function(a,b){return a+b*1308%7};
+var grnuc1309=function(a,b){return a+b*1309%7};
+var gfJkN1310=function(a,b){return a+b*1310%7};
+var g3mIF1311=function(a,b){return a+b*1311%7};
+var gWhMa1312=function(a,b){return a+b*1312%7};
+var gElHO1313=function(a,b){return a+b*1313%7};
+var gvmhx1314=function(a,b){return a+b*1314%7};
+var gKIoN1315=function(a,b){return a+b*1315%7};
+var ggzes1316=function(a,b){return a+b*1316%7};
+var gPB0C1317=function(a,b){return a+b*1317%7};
+var gm5e21318=function(a,b){return a+b*1318%7};
+var glRSP1319=function(a,b){return a+b*1319%7};
+var gY47r1320=function(a,b){return a+b*1320%7};
+var gHaZ51321=function(a,b){return a+b*1321%7};
+var g8Kr71322=function(a,b){return a+b*1322%7};
+var gpQjB1323=function(a,b){return a+b*1323%7};
+var gRvl01324=function(a,b){return a+b*1324%7};
+var gZi1E1325=function(a,b){return a+b*1325%7};
+var gXAvg1326=function(a,b){return a+b*1326%7};
+var gLcPi1327=function(a,b){return a+b*1327%7};
+var g3r051328=function(a,b){return a+b*1328%7};
+var gayK61329=function(a,b){return a+b*1329%7};
+var g3M9F1330=function(a,b){return a+b*1330%7};
+var g8GNE1331=function(a,b){return a+b*1331%7};
+var gev0k1332=function(a,b){return a+b*1332%7};
+var g69791333=function(a,b){return a+b*1333%7};
+var gZX9y1334=function(a,b){return a+b*1334%7};
+var gWDPZ1335=function(a,b){return a+b*1335%7};
+var gDRpL1336=function(a,b){return a+b*1336%7};
+var gIJaE1337=function(a,b){return a+b*1337%7};
+var gMChL1338=function(a,b){return a+b*1338%7};
+var gKc751339=function(a,b){return a+b*1339%7};
+var gzBv01340=function(a,b){return a+b*1340%7};
+var gGvGU1341=function(a,b){return a+b*1341%7};
+var g9sif1342=function(a,b){return a+b*1342%7};
+var glaHy1343=function(a,b){return a+b*1343%7};
+var gBDvu1344=function(a,b){return a+b*1344%7};
+var grSS01345=function(a,b){return a+b*1345%7};
+var gayrz1346=function(a,b){return a+b*1346%7};
+var gIpWk1347=function(a,b){return a+b*1347%7};
+var gEBzd1348=function(a,b){return a+b*1348%7};
+var gD8kV1349=function(a,b){return a+b*1349%7};
+var g3Z9X1350=function(a,b){return a+b*1350%7};
+var gIjsn1351=function(a,b){return a+b*1351%7};
+var gtmBy1352=function(a,b){return a+b*1352%7};
+var gsrh41353=function(a,b){return a+b*1353%7};
+var gQfkA1354=function(a,b){return a+b*1354%7};
+var gxbt71355=function(a,b){return a+b*1355%7};
+var gxsiK1356=function(a,b){return a+b*1356%7};
+var g6Syc1357=function(a,b){return a+b*1357%7};
+var gM0a31358=function(a,b){return a+b*1358%7};
+var g4wUY1359=function(a,b){return a+b*1359%7};
+var gJxhy1360=function(a,b){return a+b*1360%7};
+var gMzEQ1361=function(a,b){return a+b*1361%7};
+var gNy1W1362=function(a,b){return a+b*1362%7};
+var g6LyZ1363=function(a,b){return a+b*1363%7};
+var g3Opy1364=function(a,b){return a+b*1364%7};
+var gylyg1365=function(a,b){return a+b*1365%7};
+var g7fRC1366=function(a,b){return a+b*1366%7};
+var gaQJL1367=function(a,b){return a+b*1367%7};
+var ghTcj1368=function(a,b){return a+b*1368%7};
+var gi4ev1369=function(a,b){return a+b*1369%7};
+var gY1Ul1370=function(a,b){return a+b*1370%7};
+var gJyv61371=function(a,b){return a+b*1371%7};
+var ganX51372=function(a,b){return a+b*1372%7};
+var gPdo41373=function(a,b){return a+b*1373%7};
+var gY7OP1374=function(a,b){return a+b*1374%7};
+var gQxFg1375=function(a,b){return a+b*1375%7};
+var gXcx41376=function(a,b){return a+b*1376%7};
+var gY7zu1377=function(a,b){return a+b*1377%7};
+var g6zfE1378=function(a,b){return a+b*1378%7};
+var gX3Yl1379=function(a,b){return a+b*1379%7};
+var g1WSN1380=function(a,b){return a+b*1380%7};
+var gjaJy1381=function(a,b){return a+b*1381%7};
+var g1b5m1382=function(a,b){return a+b*1382%7};
+var gundx1383=function(a,b){return a+b*1383%7};
+var g2plW1384=function(a,b){return a+b*1384%7};
+var gXaUx1385=function(a,b){return a+b*1385%7};
+var g9byX1386=function(a,b){return a+b*1386%7};
+var gfVJS1387=function(a,b){return a+b*1387%7};
+var gzrxk1388=function(a,b){return a+b*1388%7};
+var gJGAG1389=function(a,b){return a+b*1389%7};
+var gekRV1390=function(a,b){return a+b*1390%7};
+var gMCL81391=function(a,b){return a+b*1391%7};
+var gLLyu1392=function(a,b){return a+b*1392%7};
+var g8kTr1393=function(a,b){return a+b*1393%7};
+var g8amz1394=function(a,b){return a+b*1394%7};
+var g9kpV1395=function(a,b){return a+b*1395%7};
+var gqiMJ1396=function(a,b){return a+b*1396%7};
+var ggt5x1397=function(a,b){return a+b*1397%7};
+var gkcOx1398=function(a,b){return a+b*1398%7};
+var guvLS1399=function(a,b){return a+b*1399%7};
+var gmcAg1400=function(a,b){return a+b*1400%7};
+var gwtQO1401=function(a,b){return a+b*1401%7};
+var gwPyb1402=function(a,b){return a+b*1402%7};
+var gUUqM1403=function(a,b){return a+b*1403%7};
+var guaCb1404=function(a,b){return a+b*1404%7};
+var gaY271405=function(a,b){return a+b*1405%7};
+var gbd2a1406=function(a,b){return a+b*1406%7};
+var gGit71407=function(a,b){return a+b*1407%7};
+var g6t0e1408=function(a,b){return a+b*1408%7};
+var gx6fF1409=function(a,b){return a+b*1409%7};
+var gQm691410=function(a,b){return a+b*1410%7};
+var gjD3F1411=function(a,b){return a+b*1411%7};
+var gZLpg1412=function(a,b){return a+b*1412%7};
+var gPsHG1413=function(a,b){return a+b*1413%7};
+var gotwR1414=function(a,b){return a+b*1414%7};
+var gIpxX1415=function(a,b){return a+b*1415%7};
+var gTXE51416=function(a,b){return a+b*1416%7};
+var gTJ8c1417=function(a,b){return a+b*1417%7};
+var g0S7S1418=function(a,b){return a+b*1418%7};
+var gl5xj1419=function(a,b){return a+b*1419%7};
+var gYlwH1420=function(a,b){return a+b*1420%7};
+var grHOE1421=function(a,b){return a+b*1421%7};
+var gM8Dx1422=function(a,b){return a+b*1422%7};
+var gxVos1423=function(a,b){return a+b*1423%7};
+var gAmTl1424=function(a,b){return a+b*1424%7};
+var g1Ube1425=function(a,b){return a+b*1425%7};
+var g1efg1426=function(a,b){return a+b*1426%7};
+var gw0Iu1427=function(a,b){return a+b*1427%7};
+var gUXVS1428=function(a,b){return a+b*1428%7};
+var gtTyA1429=function(a,b){return a+b*1429%7};
+var gG7Pj1430=function(a,b){return a+b*1430%7};
+var gUQWt1431=function(a,b){return a+b*1431%7};
+var g0mOs1432=function(a,b){return a+b*1432%7};
+var gTQcn1433=function(a,b){return a+b*1433%7};
+var g9YxL1434=function(a,b){return a+b*1434%7};
+var gBSjT1435=function(a,b){return a+b*1435%7};
+var gwXUh1436=function(a,b){return a+b*1436%7};
+var gTKXm1437=function(a,b){return a+b*1437%7};
+var gCOkf1438=function(a,b){return a+b*1438%7};
+var gi3hO1439=function(a,b){return a+b*1439%7};
+var geAYF1440=function(a,b){return a+b*1440%7};
+var gPZIL1441=function(a,b){return a+b*1441%7};
+var g4Ntc1442=function(a,b){return a+b*1442%7};
+var gXCug1443=function(a,b){return a+b*1443%7};
+var gNYyB1444=function(a,b){return a+b*1444%7};
+var gRocq1445=function(a,b){return a+b*1445%7};
+var gdY9x1446=function(a,b){return a+b*1446%7};
+var g8tf21447=function(a,b){return a+b*1447%7};
+var gOJtT1448=function(a,b){return a+b*1448%7};
+var ghOWI1449=function(a,b){return a+b*1449%7};
+var gDVBb1450=function(a,b){return a+b*1450%7};
+var gBn1a1451=function(a,b){return a+b*1451%7};
+var g5BZ81452=function(a,b){return a+b*1452%7};
+var gmvAy1453=function(a,b){return a+b*1453%7};
+var gbKTL1454=function(a,b){return a+b*1454%7};
+var gtkNw1455=function(a,b){return a+b*1455%7};
+var gxe8J1456=function(a,b){return a+b*1456%7};
+var gTLLs1457=function(a,b){return a+b*1457%7};
+var gHbg41458=function(a,b){return a+b*1458%7};
+var gAKll1459=function(a,b){return a+b*1459%7};
+var gCpB41460=function(a,b){return a+b*1460%7};
+var gpMyQ1461=function(a,b){return a+b*1461%7};
+var ghK7F1462=function(a,b){return a+b*1462%7};
+var gQbyK1463=function(a,b){return a+b*1463%7};
+var ge1p91464=function(a,b){return a+b*1464%7};
+var g9lqW1465=function(a,b){return a+b*1465%7};
+var gW5Ug1466=function(a,b){return a+b*1466%7};
+var g3tC21467=function(a,b){return a+b*1467%7};
+var gjUYW1468=function(a,b){return a+b*1468%7};
+var gKRSz1469=function(a,b){return a+b*1469%7};
+var gDJQ31470=function(a,b){return a+b*1470%7};
+var gOTif1471=function(a,b){return a+b*1471%7};
+var gbq3T1472=function(a,b){return a+b*1472%7};
+var gpvQM1473=function(a,b){return a+b*1473%7};
+var gMPnb1474=function(a,b){return a+b*1474%7};
+var ggLO51475=function(a,b){return a+b*1475%7};
+var gBpJB1476=function(a,b){return a+b*1476%7};
+var gt7kq1477=function(a,b){return a+b*1477%7};
+var grQwK1478=function(a,b){return a+b*1478%7};
+var gyIDE1479=function(a,b){return a+b*1479%7};
+var gLFRq1480=function(a,b){return a+b*1480%7};
+var gtDvc1481=function(a,b){return a+b*1481%7};
+var gxek41482=function(a,b){return a+b*1482%7};
+var gyLZd1483=function(a,b){return a+b*1483%7};
+var gCtV61484=function(a,b){return a+b*1484%7};
+var gycRG1485=function(a,b){return a+b*1485%7};
+var gK4ln1486=function(a,b){return a+b*1486%7};
+var gzhMk1487=function(a,b){return a+b*1487%7};
+var gvjfP1488=function(a,b){return a+b*1488%7};
+var gQkA31489=function(a,b){return a+b*1489%7};
+var gm7Lm1490=function(a,b){return a+b*1490%7};
+var gDZqE1491=function(a,b){return a+b*1491%7};
+var g3C1X1492=function(a,b){return a+b*1492%7};
+var gqxbW1493=function(a,b){return a+b*1493%7};
+var gBa2b1494=function(a,b){return a+b*1494%7};
+var gHSWb1495=function(a,b){return a+b*1495%7};
+var ghYOK1496=function(a,b){return a+b*1496%7};
+var gFqDx1497=function(a,b){return a+b*1497%7};
+var grKso1498=function(a,b){return a+b*1498%7};
+var gNRht1499=function(a,b){return a+b*1499%7};
+var gALLn1500=function(a,b){return a+b*1500%7};
+var gojBB1501=function(a,b){return a+b*1501%7};
+var gLFmG1502=function(a,b){return a+b*1502%7};
+var gdq2a1503=function(a,b){return a+b*1503%7};
+var g9uox1504=function(a,b){return a+b*1504%7};
+var g1YPU1505=function(a,b){return a+b*1505%7};
+var gRY5K1506=function(a,b){return a+b*1506%7};
+var gE5km1507=function(a,b){return a+b*1507%7};
+var gj6ot1508=function(a,b){return a+b*1508%7};
+var gj47M1509=function(a,b){return a+b*1509%7};
+var glVwD1510=function(a,b){return a+b*1510%7};
+var gI8Wd1511=function(a,b){return a+b*1511%7};
+var gPSZy1512=function(a,b){return a+b*1512%7};
+var gIDpj1513=function(a,b){return a+b*1513%7};
+var gHyhw1514=function(a,b){return a+b*1514%7};
+var gkAex1515=function(a,b){return a+b*1515%7};
+var gRGsd1516=function(a,b){return a+b*1516%7};
+var gKZ5E1517=function(a,b){return a+b*1517%7};
+var gWD2B1518=function(a,b){return a+b*1518%7};
+var gFrvb1519=function(a,b){return a+b*1519%7};
+var glmuM1520=function(a,b){return a+b*1520%7};
+var gqB5p1521=function(a,b){return a+b*1521%7};
+var gDBgV1522=function(a,b){return a+b*1522%7};
+var gWSEB1523=function(a,b){return a+b*1523%7};
+var g2svy1524=function(a,b){return a+b*1524%7};
+var gPyPz1525=function(a,b){return a+b*1525%7};
+var gX8Ug1526=function(a,b){return a+b*1526%7};
+var grSFu1527=function(a,b){return a+b*1527%7};
+var geDdy1528=function(a,b){return a+b*1528%7};
+var gcqGO1529=function(a,b){return a+b*1529%7};
+var g9XVz1530=function(a,b){return a+b*1530%7};
+var gRrJj1531=function(a,b){return a+b*1531%7};
+var gM28O1532=function(a,b){return a+b*1532%7};
+var gxXPn1533=function(a,b){return a+b*1533%7};
+var gVZP41534=function(a,b){return a+b*1534%7};
+var gkqaN1535=function(a,b){return a+b*1535%7};
+var gQjPT1536=function(a,b){return a+b*1536%7};
+var grDdD1537=function(a,b){return a+b*1537%7};
+var g1EFn1538=function(a,b){return a+b*1538%7};
+var gF66M1539=function(a,b){return a+b*1539%7};
+var gVQv91540=function(a,b){return a+b*1540%7};
+var gtPjN1541=function(a,b){return a+b*1541%7};
+var gZCdz1542=function(a,b){return a+b*1542%7};
+var gijnd1543=function(a,b){return a+b*1543%7};
+var gNss51544=function(a,b){return a+b*1544%7};
+var gmenc1545=function(a,b){return a+b*1545%7};
+var gM2GH1546=function(a,b){return a+b*1546%7};
+var gki7A1547=function(a,b){return a+b*1547%7};
+var gdjJM1548=function(a,b){return a+b*1548%7};
+var gYaxA1549=function(a,b){return a+b*1549%7};
+var gcqIC1550=function(a,b){return a+b*1550%7};
+var gXjcg1551=function(a,b){return a+b*1551%7};
+var gscb71552=function(a,b){return a+b*1552%7};
+var gApeG1553=function(a,b){return a+b*1553%7};
+var g32uW1554=function(a,b){return a+b*1554%7};
+var gCGmS1555=function(a,b){return a+b*1555%7};
+var gky6m1556=function(a,b){return a+b*1556%7};
+var gwHWe1557=function(a,b){return a+b*1557%7};
+var gWbxx1558=function(a,b){return a+b*1558%7};
+var gZ9Rz1559=function(a,b){return a+b*1559%7};
+var ghNbw1560=function(a,b){return a+b*1560%7};
+var ga8wa1561=function(a,b){return a+b*1561%7};
+var gHuNN1562=function(a,b){return a+b*1562%7};
+var gmHxP1563=function(a,b){return a+b*1563%7};
+var gkLl11564=function(a,b){return a+b*1564%7};
+var gth8b1565=function(a,b){return a+b*1565%7};
+var gyCwP1566=function(a,b){return a+b*1566%7};
+var gXsAD1567=function(a,b){return a+b*1567%7};
+var gMXUW1568=function(a,b){return a+b*1568%7};
+var gtnDm1569=function(a,b){return a+b*1569%7};
+var g5eJ21570=function(a,b){return a+b*1570%7};
+var gx0X31571=function(a,b){return a+b*1571%7};
+var gqAJ71572=function(a,b){return a+b*1572%7};
+var g22w01573=function(a,b){return a+b*1573%7};
+var gyzNx1574=function(a,b){return a+b*1574%7};
+var gb1np1575=function(a,b){return a+b*1575%7};
+var goT2t1576=function(a,b){return a+b*1576%7};
+var gbLwB1577=function(a,b){return a+b*1577%7};
+var gCaBe1578=function(a,b){return a+b*1578%7};
+var gRGjy1579=function(a,b){return a+b*1579%7};
+var gTkKH1580=function(a,b){return a+b*1580%7};
+var gJvuU1581=function(a,b){return a+b*1581%7};
+var g2kKt1582=function(a,b){return a+b*1582%7};
+var g2t3X1583=function(a,b){return a+b*1583%7};
+var gmDCF1584=function(a,b){return a+b*1584%7};
+var gnqjx1585=function(a,b){return a+b*1585%7};
+var gshzT1586=function(a,b){return a+b*1586%7};
+var ggMVe1587=function(a,b){return a+b*1587%7};
+var gqlQQ1588=function(a,b){return a+b*1588%7};
+var glUIu1589=function(a,b){return a+b*1589%7};
+var gyCad1590=function(a,b){return a+b*1590%7};
+var gnuHg1591=function(a,b){return a+b*1591%7};
+var gNDEX1592=function(a,b){return a+b*1592%7};
+var gkrJV1593=function(a,b){return a+b*1593%7};
+var gdXdA1594=function(a,b){return a+b*1594%7};
+var gslG41595=function(a,b){return a+b*1595%7};
+var gtXo91596=function(a,b){return a+b*1596%7};
+var gi3Zh1597=function(a,b){return a+b*1597%7};
+var godSD1598=function(a,b){return a+b*1598%7};
+var g1yrT1599=function(a,b){return a+b*1599%7};
+var gmhTe1600=function(a,b){return a+b*1600%7};
+var gJ08o1601=function(a,b){return a+b*1601%7};
+var g6yyK1602=function(a,b){return a+b*1602%7};
+var gj7yz1603=function(a,b){return a+b*1603%7};
+var gjjcC1604=function(a,b){return a+b*1604%7};
+var gxfG21605=function(a,b){return a+b*1605%7};
+var gASW11606=function(a,b){return a+b*1606%7};
+var gKYXY1607=function(a,b){return a+b*1607%7};
+var gWGo61608=function(a,b){return a+b*1608%7};
+var g1urr1609=function(a,b){return a+b*1609%7};
+var grMtX1610=function(a,b){return a+b*1610%7};
+var g4lJg1611=function(a,b){return a+b*1611%7};
+var glcWR1612=function(a,b){return a+b*1612%7};
+var gdJky1613=function(a,b){return a+b*1613%7};
+var gg8Uw1614=function(a,b){return a+b*1614%7};
+var gCWn11615=function(a,b){return a+b*1615%7};
+var gleeI1616=function(a,b){return a+b*1616%7};
+var gCni41617=function(a,b){return a+b*1617%7};
+var gubLq1618=function(a,b){return a+b*1618%7};
+var gihkQ1619=function(a,b){return a+b*1619%7};
+var gLPuD1620=function(a,b){return a+b*1620%7};
+var gwqCR1621=function(a,b){return a+b*1621%7};
+var gdyBj1622=function(a,b){return a+b*1622%7};
+var gEdbm1623=function(a,b){return a+b*1623%7};
+var gfM5m1624=function(a,b){return a+b*1624%7};
+var gVE5E1625=function(a,b){return a+b*1625%7};
+var g8BX71626=function(a,b){return a+b*1626%7};
+var gNOaD1627=function(a,b){return a+b*1627%7};
+var gKtTB1628=function(a,b){return a+b*1628%7};
+var gb4BH1629=function(a,b){return a+b*1629%7};
+var gdY491630=function(a,b){return a+b*1630%7};
+var g8r1C1631=function(a,b){return a+b*1631%7};
+var gcZRP1632=function(a,b){return a+b*1632%7};
+var gyxBO1633=function(a,b){return a+b*1633%7};
+var g80SH1634=function(a,b){return a+b*1634%7};
+var g0PK71635=function(a,b){return a+b*1635%7};
+var gpD0u1636=function(a,b){return a+b*1636%7};
+var gOr1H1637=function(a,b){return a+b*1637%7};
+var gmxU21638=function(a,b){return a+b*1638%7};
+var gUQxU1639=function(a,b){return a+b*1639%7};
+var gUGM21640=function(a,b){return a+b*1640%7};
+var gXA3j1641=function(a,b){return a+b*1641%7};
+var gYHl71642=function(a,b){return a+b*1642%7};
+var gbRlk1643=function(a,b){return a+b*1643%7};
+var gqggB1644=function(a,b){return a+b*1644%7};
+var ghpdO1645=function(a,b){return a+b*1645%7};
+var gHB3Z1646=function(a,b){return a+b*1646%7};
+var gFCyb1647=function(a,b){return a+b*1647%7};
+var gM4gm1648=function(a,b){return a+b*1648%7};
+var grUet1649=function(a,b){return a+b*1649%7};
+var gAcAA1650=function(a,b){return a+b*1650%7};
+var gU9RZ1651=function(a,b){return a+b*1651%7};
+var g2SV81652=function(a,b){return a+b*1652%7};
+var gkJzL1653=function(a,b){return a+b*1653%7};
+var gz83x1654=function(a,b){return a+b*1654%7};
+var gsZFv1655=function(a,b){return a+b*1655%7};
+var gIFcq1656=function(a,b){return a+b*1656%7};
+var geRfz1657=function(a,b){return a+b*1657%7};
+var gnmez1658=function(a,b){return a+b*1658%7};
+var gJkuY1659=function(a,b){return a+b*1659%7};
+var g02R61660=function(a,b){return a+b*1660%7};
+var gD8xx1661=function(a,b){return a+b*1661%7};
+var g3Txa1662=function(a,b){return a+b*1662%7};
+var glZGG1663=function(a,b){return a+b*1663%7};
+var gza0H1664=function(a,b){return a+b*1664%7};
+var gOBoJ1665=function(a,b){return a+b*1665%7};
+var gAKOh1666=function(a,b){return a+b*1666%7};
+var gJuy71667=function(a,b){return a+b*1667%7};
+var gUnvh1668=function(a,b){return a+b*1668%7};
+var gRaqz1669=function(a,b){return a+b*1669%7};
+var gbwws1670=function(a,b){return a+b*1670%7};
+var gtwaO1671=function(a,b){return a+b*1671%7};
+var gDWRi1672=function(a,b){return a+b*1672%7};
+var gmnNJ1673=function(a,b){return a+b*1673%7};
+var gpnet1674=function(a,b){return a+b*1674%7};
+var gZumJ1675=function(a,b){return a+b*1675%7};
+var gMv4M1676=function(a,b){return a+b*1676%7};
+var g56sC1677=function(a,b){return a+b*1677%7};
+var gQ8Qy1678=function(a,b){return a+b*1678%7};
+var ggxIE1679=function(a,b){return a+b*1679%7};
+var g4SeH1680=function(a,b){return a+b*1680%7};
+var g8jo81681=function(a,b){return a+b*1681%7};
+var gEEVm1682=function(a,b){return a+b*1682%7};
+var gfakC1683=function(a,b){return a+b*1683%7};
+var gRwu51684=function(a,b){return a+b*1684%7};
+var gOhe01685=function(a,b){return a+b*1685%7};
+var ga0n51686=function(a,b){return a+b*1686%7};
+var g3i2w1687=function(a,b){return a+b*1687%7};
+var gjHbz1688=function(a,b){return a+b*1688%7};
+var gjfgr1689=function(a,b){return a+b*1689%7};
+var gpbxK1690=function(a,b){return a+b*1690%7};
+var gsOHA1691=function(a,b){return a+b*1691%7};
+var gpyYm1692=function(a,b){return a+b*1692%7};
+var gVKIf1693=function(a,b){return a+b*1693%7};
+var gDTyk1694=function(a,b){return a+b*1694%7};
+var g1wU81695=function(a,b){return a+b*1695%7};
+var gm3Um1696=function(a,b){return a+b*1696%7};
+var g341P1697=function(a,b){return a+b*1697%7};
+var gzwZv1698=function(a,b){return a+b*1698%7};
+var gei3E1699=function(a,b){return a+b*1699%7};
+var gYOz61700=function(a,b){return a+b*1700%7};
+var gyRyg1701=function(a,b){return a+b*1701%7};
+var gWrvh1702=function(a,b){return a+b*1702%7};
+var gKUwC1703=function(a,b){return a+b*1703%7};
+var gxv0w1704=function(a,b){return a+b*1704%7};
+var gxjg41705=function(a,b){return a+b*1705%7};
+var gRlTx1706=function(a,b){return a+b*1706%7};
+var gu8Gf1707=function(a,b){return a+b*1707%7};
+var gRcud1708=function(a,b){return a+b*1708%7};
+var gOP2t1709=function(a,b){return a+b*1709%7};
+var gYpe91710=function(a,b){return a+b*1710%7};
+var gMgPx1711=function(a,b){return a+b*1711%7};
+var giXDM1712=function(a,b){return a+b*1712%7};
+var gELyj1713=function(a,b){return a+b*1713%7};
+var g0GFI1714=function(a,b){return a+b*1714%7};
+var g4H9f1715=function(a,b){return a+b*1715%7};
+var gsd4x1716=function(a,b){return a+b*1716%7};
+var gNZiI1717=function(a,b){return a+b*1717%7};
+var ggnBu1718=function(a,b){return a+b*1718%7};
+var gsD5H1719=function(a,b){return a+b*1719%7};
+var gXNFq1720=function(a,b){return a+b*1720%7};
+var gVW0N1721=function(a,b){return a+b*1721%7};
+var gZg1z1722=function(a,b){return a+b*1722%7};
+var gPyxU1723=function(a,b){return a+b*1723%7};
+var ghayx1724=function(a,b){return a+b*1724%7};
+var gbg2a1725=function(a,b){return a+b*1725%7};
+var gHuEB1726=function(a,b){return a+b*1726%7};
+var gKpf91727=function(a,b){return a+b*1727%7};
+var gRqAk1728=function(a,b){return a+b*1728%7};
+var g3MRK1729=function(a,b){return a+b*1729%7};
+var gxNt51730=function(a,b){return a+b*1730%7};
+var gSogM1731=function(a,b){return a+b*1731%7};
+var gkpG91732=function(a,b){return a+b*1732%7};
+var gLNd51733=function(a,b){return a+b*1733%7};
+var gn5Nx1734=function(a,b){return a+b*1734%7};
+var gugGS1735=function(a,b){return a+b*1735%7};
+var gb0wx1736=function(a,b){return a+b*1736%7};
+var gVtxZ1737=function(a,b){return a+b*1737%7};
+var g7rnb1738=function(a,b){return a+b*1738%7};
+var gY73h1739=function(a,b){return a+b*1739%7};
+var gZEYa1740=function(a,b){return a+b*1740%7};
+var gTf8k1741=function(a,b){return a+b*1741%7};
+var g5OR91742=function(a,b){return a+b*1742%7};
+var gBYhN1743=function(a,b){return a+b*1743%7};
+var gZ9FN1744=function(a,b){return a+b*1744%7};
+var g6wPm1745=function(a,b){return a+b*1745%7};
+var gPEyY1746=function(a,b){return a+b*1746%7};
+var gKSc81747=function(a,b){return a+b*1747%7};
+var g9Wcz1748=function(a,b){return a+b*1748%7};
+var g0lkO1749=function(a,b){return a+b*1749%7};
+var gB69O1750=function(a,b){return a+b*1750%7};
+var giEUx1751=function(a,b){return a+b*1751%7};
+var gRyrn1752=function(a,b){return a+b*1752%7};
+var girnX1753=function(a,b){return a+b*1753%7};
+var gZr2i1754=function(a,b){return a+b*1754%7};
+var g9JEA1755=function(a,b){return a+b*1755%7};
+var gPBS01756=function(a,b){return a+b*1756%7};
+var g9xzQ1757=function(a,b){return a+b*1757%7};
+var gzk7z1758=function(a,b){return a+b*1758%7};
+var gyTgS1759=function(a,b){return a+b*1759%7};
+var gQV8h1760=function(a,b){return a+b*1760%7};
+var glmSL1761=function(a,b){return a+b*1761%7};
+var gCd0Q1762=function(a,b){return a+b*1762%7};
+var goZof1763=function(a,b){return a+b*1763%7};
+var gr6x11764=function(a,b){return a+b*1764%7};
+var gSoUD1765=function(a,b){return a+b*1765%7};
+var g41vc1766=function(a,b){return a+b*1766%7};
+var gdOrf1767=function(a,b){return a+b*1767%7};
+var g83qa1768=function(a,b){return a+b*1768%7};
+var gg2Uk1769=function(a,b){return a+b*1769%7};
+var g63wg1770=function(a,b){return a+b*1770%7};
+var gQ7Ra1771=function(a,b){return a+b*1771%7};
+var gueSX1772=function(a,b){return a+b*1772%7};
+var gltDF1773=function(a,b){return a+b*1773%7};
+var gkOq11774=function(a,b){return a+b*1774%7};
+var gnScG1775=function(a,b){return a+b*1775%7};
+var gwtBS1776=function(a,b){return a+b*1776%7};
+var gXdBs1777=function(a,b){return a+b*1777%7};
+var gWSHU1778=function(a,b){return a+b*1778%7};
+var gjPg91779=function(a,b){return a+b*1779%7};
+var g2Lhm1780=function(a,b){return a+b*1780%7};
+var gpJmy1781=function(a,b){return a+b*1781%7};
+var gPSZE1782=function(a,b){return a+b*1782%7};
+var gHKSX1783=function(a,b){return a+b*1783%7};
+var gRfAZ1784=function(a,b){return a+b*1784%7};
+var gs4cO1785=function(a,b){return a+b*1785%7};
+var gYo4U1786=function(a,b){return a+b*1786%7};
+var glYyO1787=function(a,b){return a+b*1787%7};
+var gin0Z1788=function(a,b){return a+b*1788%7};
+var gX2xI1789=function(a,b){return a+b*1789%7};
+var guQWZ1790=function(a,b){return a+b*1790%7};
+var g26Zv1791=function(a,b){return a+b*1791%7};
+var godLH1792=function(a,b){return a+b*1792%7};
+var gu9Jl1793=function(a,b){return a+b*1793%7};
+var gKEP31794=function(a,b){return a+b*1794%7};
+var gLBwE1795=function(a,b){return a+b*1795%7};
+var g46Hx1796=function(a,b){return a+b*1796%7};
+var gNN581797=function(a,b){return a+b*1797%7};
+var goXBk1798=function(a,b){return a+b*1798%7};
+var gsJO61799=function(a,b){return a+b*1799%7};
+var gMmbf1800=function(a,b){return a+b*1800%7};
+var gdjqH1801=function(a,b){return a+b*1801%7};
+var gKD8R1802=function(a,b){return a+b*1802%7};
+var gm46V1803=function(a,b){return a+b*1803%7};
+var gFWYA1804=function(a,b){return a+b*1804%7};
+var gnzg41805=function(a,b){return a+b*1805%7};
+var gBE6I1806=function(a,b){return a+b*1806%7};
+var gxHvc1807=function(a,b){return a+b*1807%7};
+var gkZiQ1808=function(a,b){return a+b*1808%7};
+var gNoAw1809=function(a,b){return a+b*1809%7};
+var gAlgU1810=function(a,b){return a+b*1810%7};
+var ghORj1811=function(a,b){return a+b*1811%7};
+var g43O71812=function(a,b){return a+b*1812%7};
+var gFyqv1813=function(a,b){return a+b*1813%7};
+var g2x6a1814=function(a,b){return a+b*1814%7};
+var gxjgY1815=function(a,b){return a+b*1815%7};
+var gU0xf1816=function(a,b){return a+b*1816%7};
+var gX5g91817=function(a,b){return a+b*1817%7};
+var gGB6i1818=function(a,b){return a+b*1818%7};
+var gSwwG1819=function(a,b){return a+b*1819%7};
+var gX9yh1820=function(a,b){return a+b*1820%7};
+var gbWgi1821=function(a,b){return a+b*1821%7};
+var gkI5n1822=function(a,b){return a+b*1822%7};
+var gN6gI1823=function(a,b){return a+b*1823%7};
+var g4sx11824=function(a,b){return a+b*1824%7};
+var g5omK1825=function(a,b){return a+b*1825%7};
+var g7BfO1826=function(a,b){return a+b*1826%7};
+var glenB1827=function(a,b){return a+b*1827%7};
+var gwMIa1828=function(a,b){return a+b*1828%7};
+var gchRx1829=function(a,b){return a+b*1829%7};
+var gJ88X1830=function(a,b){return a+b*1830%7};
+var gFwfr1831=function(a,b){return a+b*1831%7};
+var gsjdV1832=function(a,b){return a+b*1832%7};
+var gg1Cy1833=function(a,b){return a+b*1833%7};
+var gpQ4j1834=function(a,b){return a+b*1834%7};
+var gDBcD1835=function(a,b){return a+b*1835%7};
+var gTPJl1836=function(a,b){return a+b*1836%7};
+var gljAH1837=function(a,b){return a+b*1837%7};
+var gBypN1838=function(a,b){return a+b*1838%7};
+var gRlrr1839=function(a,b){return a+b*1839%7};
+var gWYsL1840=function(a,b){return a+b*1840%7};
+var gzziv1841=function(a,b){return a+b*1841%7};
+var g9VGU1842=function(a,b){return a+b*1842%7};
+var gfHVy1843=function(a,b){return a+b*1843%7};
+var gU44x1844=function(a,b){return a+b*1844%7};
+var gmOrh1845=function(a,b){return a+b*1845%7};
+var gPLYR1846=function(a,b){return a+b*1846%7};
+var gGBYR1847=function(a,b){return a+b*1847%7};
+var gvLwJ1848=function(a,b){return a+b*1848%7};
+var g02so1849=function(a,b){return a+b*1849%7};
+var g3zcl1850=function(a,b){return a+b*1850%7};
+var gSVsx1851=function(a,b){return a+b*1851%7};
+var grK7Q1852=function(a,b){return a+b*1852%7};
+var ggpWj1853=function(a,b){return a+b*1853%7};
+var gMJ8y1854=function(a,b){return a+b*1854%7};
+var glReW1855=function(a,b){return a+b*1855%7};
+var gxhl81856=function(a,b){return a+b*1856%7};
+var giVaX1857=function(a,b){return a+b*1857%7};
+var gQ4iC1858=function(a,b){return a+b*1858%7};
+var gyhJS1859=function(a,b){return a+b*1859%7};
+var gCUyy1860=function(a,b){return a+b*1860%7};
+var gDDBr1861=function(a,b){return a+b*1861%7};
+var g746E1862=function(a,b){return a+b*1862%7};
+var gy2QT1863=function(a,b){return a+b*1863%7};
+var gZigo1864=function(a,b){return a+b*1864%7};
+var gT1711865=function(a,b){return a+b*1865%7};
+var gdBam1866=function(a,b){return a+b*1866%7};
+var gHBBa1867=function(a,b){return a+b*1867%7};
+var gcRDD1868=function(a,b){return a+b*1868%7};
+var gGNuA1869=function(a,b){return a+b*1869%7};
+var gPCek1870=function(a,b){return a+b*1870%7};
+var g0xOc1871=function(a,b){return a+b*1871%7};
+var g5UYO1872=function(a,b){return a+b*1872%7};
+var gfVtp1873=function(a,b){return a+b*1873%7};
+var gy1Jw1874=function(a,b){return a+b*1874%7};
+var gMd7y1875=function(a,b){return a+b*1875%7};
+var g9XPd1876=function(a,b){return a+b*1876%7};
+var gigxT1877=function(a,b){return a+b*1877%7};
+var gljxq1878=function(a,b){return a+b*1878%7};
+var gN19g1879=function(a,b){return a+b*1879%7};
+var ghENJ1880=function(a,b){return a+b*1880%7};
+var gayaz1881=function(a,b){return a+b*1881%7};
+var gOrhC1882=function(a,b){return a+b*1882%7};
+var gyUtc1883=function(a,b){return a+b*1883%7};
+var gVxbe1884=function(a,b){return a+b*1884%7};
+var gxftj1885=function(a,b){return a+b*1885%7};
+var gMIF71886=function(a,b){return a+b*1886%7};
+var gCeuZ1887=function(a,b){return a+b*1887%7};
+var gdbu01888=function(a,b){return a+b*1888%7};
+var gJQJn1889=function(a,b){return a+b*1889%7};
+var g6G2x1890=function(a,b){return a+b*1890%7};
+var gxS6A1891=function(a,b){return a+b*1891%7};
+var gElyg1892=function(a,b){return a+b*1892%7};
+var gen6P1893=function(a,b){return a+b*1893%7};
+var gdzif1894=function(a,b){return a+b*1894%7};
+var gij4D1895=function(a,b){return a+b*1895%7};
+var gxoUx1896=function(a,b){return a+b*1896%7};
+var gLBxK1897=function(a,b){return a+b*1897%7};
+var g7lj11898=function(a,b){return a+b*1898%7};
+var gnrJ01899=function(a,b){return a+b*1899%7};
+var gHxYO1900=function(a,b){return a+b*1900%7};
+var goQov1901=function(a,b){return a+b*1901%7};
+var gtaoS1902=function(a,b){return a+b*1902%7};
+var gZ0Zg1903=function(a,b){return a+b*1903%7};
+var gGtz91904=function(a,b){return a+b*1904%7};
+var gINu51905=function(a,b){return a+b*1905%7};
+var gaYOV1906=function(a,b){return a+b*1906%7};
+var grTTY1907=function(a,b){return a+b*1907%7};
+var gw1Fd1908=function(a,b){return a+b*1908%7};
+var gxdBv1909=function(a,b){return a+b*1909%7};
+var gNNdv1910=function(a,b){return a+b*1910%7};
+var gVS8H1911=function(a,b){return a+b*1911%7};
+var gaXWb1912=function(a,b){return a+b*1912%7};
+var gcTNI1913=function(a,b){return a+b*1913%7};
+var gmxtX1914=function(a,b){return a+b*1914%7};
+var gT7um1915=function(a,b){return a+b*1915%7};
+var gSEhD1916=function(a,b){return a+b*1916%7};
+var gK8Oy1917=function(a,b){return a+b*1917%7};
+var gZyxO1918=function(a,b){return a+b*1918%7};
+var gHoWD1919=function(a,b){return a+b*1919%7};
+var g0gJO1920=function(a,b){return a+b*1920%7};
+var g8IQc1921=function(a,b){return a+b*1921%7};
+var gZp111922=function(a,b){return a+b*1922%7};
+var gmJAO1923=function(a,b){return a+b*1923%7};
+var gMSeS1924=function(a,b){return a+b*1924%7};
+var gxMmx1925=function(a,b){return a+b*1925%7};
+var gGMdC1926=function(a,b){return a+b*1926%7};
+var gqvk21927=function(a,b){return a+b*1927%7};
+var gz5vN1928=function(a,b){return a+b*1928%7};
+var gBLE61929=function(a,b){return a+b*1929%7};
+var g2Ucj1930=function(a,b){return a+b*1930%7};
+var gXHg11931=function(a,b){return a+b*1931%7};
+var gLKbe1932=function(a,b){return a+b*1932%7};
+var gBgfM1933=function(a,b){return a+b*1933%7};
+var gz0SU1934=function(a,b){return a+b*1934%7};
+var giWy91935=function(a,b){return a+b*1935%7};
+var geFT31936=function(a,b){return a+b*1936%7};
+var gIlSG1937=function(a,b){return a+b*1937%7};
+var g0Sgf1938=function(a,b){return a+b*1938%7};
+var gTuTD1939=function(a,b){return a+b*1939%7};
+var g7II31940=function(a,b){return a+b*1940%7};
+var gkHoW1941=function(a,b){return a+b*1941%7};
+var gjbrl1942=function(a,b){return a+b*1942%7};
+var glgYK1943=function(a,b){return a+b*1943%7};
+var gqCUF1944=function(a,b){return a+b*1944%7};
+var gK2zx1945=function(a,b){return a+b*1945%7};
+var gf74x1946=function(a,b){return a+b*1946%7};
+var gl71w1947=function(a,b){return a+b*1947%7};
+var gawyT1948=function(a,b){return a+b*1948%7};
+var gTi3F1949=function(a,b){return a+b*1949%7};
+var gM5dw1950=function(a,b){return a+b*1950%7};
+var gOuBV1951=function(a,b){return a+b*1951%7};
+var gPVka1952=function(a,b){return a+b*1952%7};
+var gwkVv1953=function(a,b){return a+b*1953%7};
+var gB17f1954=function(a,b){return a+b*1954%7};
+var gLxY91955=function(a,b){return a+b*1955%7};
+var gdxvy1956=function(a,b){return a+b*1956%7};
+var gU8wS1957=function(a,b){return a+b*1957%7};
+var gc9n91958=function(a,b){return a+b*1958%7};
+var gwhNi1959=function(a,b){return a+b*1959%7};
+var gSqSf1960=function(a,b){return a+b*1960%7};
+var g1C5L1961=function(a,b){return a+b*1961%7};
+var gHj1B1962=function(a,b){return a+b*1962%7};
+var gZr2C1963=function(a,b){return a+b*1963%7};
+var gZC5t1964=function(a,b){return a+b*1964%7};
+var gfK6y1965=function(a,b){return a+b*1965%7};
+var gPHMZ1966=function(a,b){return a+b*1966%7};
+var gCpZA1967=function(a,b){return a+b*1967%7};
+var gHLuP1968=function(a,b){return a+b*1968%7};
+var g3cCG1969=function(a,b){return a+b*1969%7};
+var g0VgA1970=function(a,b){return a+b*1970%7};
+var gmvDq1971=function(a,b){return a+b*1971%7};
+var g0pVx1972=function(a,b){return a+b*1972%7};
+var gA6sQ1973=function(a,b){return a+b*1973%7};
+var gIBfk1974=function(a,b){return a+b*1974%7};
+var gd6Ie1975=function(a,b){return a+b*1975%7};
+var gLDjS1976=function(a,b){return a+b*1976%7};
+var gH39m1977=function(a,b){return a+b*1977%7};
+var g3Vx21978=function(a,b){return a+b*1978%7};
+var gJnZz1979=function(a,b){return a+b*1979%7};
+var gY5Qp1980=function(a,b){return a+b*1980%7};
+var g3fE61981=function(a,b){return a+b*1981%7};
+var gv61f1982=function(a,b){return a+b*1982%7};
+var gmiyB1983=function(a,b){return a+b*1983%7};
+var gIxGp1984=function(a,b){return a+b*1984%7};
+var gAVtt1985=function(a,b){return a+b*1985%7};
+var gztLy1986=function(a,b){return a+b*1986%7};
+var gwrFl1987=function(a,b){return a+b*1987%7};
+var gpsfk1988=function(a,b){return a+b*1988%7};
+var gk6EN1989=function(a,b){return a+b*1989%7};
+var g7hVR1990=function(a,b){return a+b*1990%7};
+var gnA8R1991=function(a,b){return a+b*1991%7};
+var gFM8y1992=function(a,b){return a+b*1992%7};
+var gdnLx1993=function(a,b){return a+b*1993%7};
+var gOWZI1994=function(a,b){return a+b*1994%7};
+var gQy8a1995=function(a,b){return a+b*1995%7};
+var gxM8A1996=function(a,b){return a+b*1996%7};
+var gb77W1997=function(a,b){return a+b*1997%7};
+var gpGCo1998=function(a,b){return a+b*1998%7};
+var gpwOV1999=function(a,b){return a+b*1999%7};
+var DE={AJ:function(a){a.reverse()},
+VR:function(a,b){a.splice(0,b)},
+kT:function(a,b){var c=a[0];a[0]=a[b%a.length];a[b]=c}};
+Xy=function(a){a=a.split("");DE.AJ(a,15);DE.VR(a,3);DE.AJ(a,51);DE.kT(a,51);DE.VR(a,2);DE.kT(a,8);DE.AJ(a,7);return a.join("")};
+var gbEgF2000=function(a,b){return a+b*2000%7};
+var g8sUV2001=function(a,b){return a+b*2001%7};
+var g68cg2002=function(a,b){return a+b*2002%7};
+var gifBX2003=function(a,b){return a+b*2003%7};
+var gLZZG2004=function(a,b){return a+b*2004%7};
+var gNyDe2005=function(a,b){return a+b*2005%7};
+var gwmuS2006=function(a,b){return a+b*2006%7};
+var g9Hcn2007=function(a,b){return a+b*2007%7};
+var gkKJg2008=function(a,b){return a+b*2008%7};
+var g1b6G2009=function(a,b){return a+b*2009%7};
+var gXDGU2010=function(a,b){return a+b*2010%7};
+var gMQGl2011=function(a,b){return a+b*2011%7};
+var gzNZb2012=function(a,b){return a+b*2012%7};
+var gnDX52013=function(a,b){return a+b*2013%7};
+var gRqK82014=function(a,b){return a+b*2014%7};
+var gUOlJ2015=function(a,b){return a+b*2015%7};
+var gN46R2016=function(a,b){return a+b*2016%7};
+var gpxmb2017=function(a,b){return a+b*2017%7};
+var gEx2Z2018=function(a,b){return a+b*2018%7};
+var g0EBu2019=function(a,b){return a+b*2019%7};
+var gREqV2020=function(a,b){return a+b*2020%7};
+var gJwm42021=function(a,b){return a+b*2021%7};
+var gDe3X2022=function(a,b){return a+b*2022%7};
+var gA1iv2023=function(a,b){return a+b*2023%7};
+var gtf5f2024=function(a,b){return a+b*2024%7};
+var gL5Pc2025=function(a,b){return a+b*2025%7};
+var gpzlo2026=function(a,b){return a+b*2026%7};
+var gG58P2027=function(a,b){return a+b*2027%7};
+var gx9WQ2028=function(a,b){return a+b*2028%7};
+var ggp1C2029=function(a,b){return a+b*2029%7};
+var g2Jgb2030=function(a,b){return a+b*2030%7};
+var gkCS22031=function(a,b){return a+b*2031%7};
+var gieaL2032=function(a,b){return a+b*2032%7};
+var gwWKN2033=function(a,b){return a+b*2033%7};
+var grrWw2034=function(a,b){return a+b*2034%7};
+var gii952035=function(a,b){return a+b*2035%7};
+var gJyfk2036=function(a,b){return a+b*2036%7};
+var gy5Au2037=function(a,b){return a+b*2037%7};
+var gqB4y2038=function(a,b){return a+b*2038%7};
+var gX5aM2039=function(a,b){return a+b*2039%7};
+var gDx852040=function(a,b){return a+b*2040%7};
+var gxAjy2041=function(a,b){return a+b*2041%7};
+var guYhC2042=function(a,b){return a+b*2042%7};
+var gjhIr2043=function(a,b){return a+b*2043%7};
+var gkAlH2044=function(a,b){return a+b*2044%7};
+var gyqWW2045=function(a,b){return a+b*2045%7};
+var g7u1P2046=function(a,b){return a+b*2046%7};
+var geJn12047=function(a,b){return a+b*2047%7};
+var gubEW2048=function(a,b){return a+b*2048%7};
+var gWBwR2049=function(a,b){return a+b*2049%7};
+var gKbtZ2050=function(a,b){return a+b*2050%7};
+var gIQxE2051=function(a,b){return a+b*2051%7};
+var g0cFt2052=function(a,b){return a+b*2052%7};
+var gIcFj2053=function(a,b){return a+b*2053%7};
+var gCyLb2054=function(a,b){return a+b*2054%7};
+var g0WRM2055=function(a,b){return a+b*2055%7};
+var gRpd02056=function(a,b){return a+b*2056%7};
+var gGnNX2057=function(a,b){return a+b*2057%7};
+var gX4hn2058=function(a,b){return a+b*2058%7};
+var gUayY2059=function(a,b){return a+b*2059%7};
+var gJfmU2060=function(a,b){return a+b*2060%7};
+var gi1zo2061=function(a,b){return a+b*2061%7};
+var gPNLg2062=function(a,b){return a+b*2062%7};
+var gtxVm2063=function(a,b){return a+b*2063%7};
+var gDM182064=function(a,b){return a+b*2064%7};
+var g1n5r2065=function(a,b){return a+b*2065%7};
+var giM7y2066=function(a,b){return a+b*2066%7};
+var grqWS2067=function(a,b){return a+b*2067%7};
+var gacHz2068=function(a,b){return a+b*2068%7};
+var gOfrf2069=function(a,b){return a+b*2069%7};
+var gugVc2070=function(a,b){return a+b*2070%7};
+var gjYey2071=function(a,b){return a+b*2071%7};
+var gDeyT2072=function(a,b){return a+b*2072%7};
+var goHxe2073=function(a,b){return a+b*2073%7};
+var gt3di2074=function(a,b){return a+b*2074%7};
+var gj3wm2075=function(a,b){return a+b*2075%7};
+var gt2LP2076=function(a,b){return a+b*2076%7};
+var g909w2077=function(a,b){return a+b*2077%7};
+var gbL2W2078=function(a,b){return a+b*2078%7};
+var gNahQ2079=function(a,b){return a+b*2079%7};
+var gr6dt2080=function(a,b){return a+b*2080%7};
+var g7QAA2081=function(a,b){return a+b*2081%7};
+var ggChd2082=function(a,b){return a+b*2082%7};
+var geOWm2083=function(a,b){return a+b*2083%7};
+var gQpSS2084=function(a,b){return a+b*2084%7};
+var gkJtB2085=function(a,b){return a+b*2085%7};
+var g3cPP2086=function(a,b){return a+b*2086%7};
+var gaxFF2087=function(a,b){return a+b*2087%7};
+var gVXqQ2088=function(a,b){return a+b*2088%7};
+var gNFbY2089=function(a,b){return a+b*2089%7};
+var gi9822090=function(a,b){return a+b*2090%7};
+var gauKI2091=function(a,b){return a+b*2091%7};
+var g50sX2092=function(a,b){return a+b*2092%7};
+var g36Rj2093=function(a,b){return a+b*2093%7};
+var gofuA2094=function(a,b){return a+b*2094%7};
+var gM5ht2095=function(a,b){return a+b*2095%7};
+var geIyf2096=function(a,b){return a+b*2096%7};
+var gTBy32097=function(a,b){return a+b*2097%7};
+var gWpTL2098=function(a,b){return a+b*2098%7};
+var gJuxb2099=function(a,b){return a+b*2099%7};
+var goO7m2100=function(a,b){return a+b*2100%7};
+var gvmLH2101=function(a,b){return a+b*2101%7};
+var gbOUE2102=function(a,b){return a+b*2102%7};
+var g8ysG2103=function(a,b){return a+b*2103%7};
+var gS4F02104=function(a,b){return a+b*2104%7};
+var gbaXq2105=function(a,b){return a+b*2105%7};
+var gfecG2106=function(a,b){return a+b*2106%7};
+var gxqka2107=function(a,b){return a+b*2107%7};
+var gIVA52108=function(a,b){return a+b*2108%7};
+var gJcTC2109=function(a,b){return a+b*2109%7};
+var gyWUY2110=function(a,b){return a+b*2110%7};
+var gMcVx2111=function(a,b){return a+b*2111%7};
+var gSDOS2112=function(a,b){return a+b*2112%7};
+var gwwyy2113=function(a,b){return a+b*2113%7};
+var gmOn42114=function(a,b){return a+b*2114%7};
+var gYeMd2115=function(a,b){return a+b*2115%7};
+var goKdl2116=function(a,b){return a+b*2116%7};
+var ghEIE2117=function(a,b){return a+b*2117%7};
+var ghfrC2118=function(a,b){return a+b*2118%7};
+var gjLTE2119=function(a,b){return a+b*2119%7};
+var gIoDu2120=function(a,b){return a+b*2120%7};
+var gobmx2121=function(a,b){return a+b*2121%7};
+var gQJdy2122=function(a,b){return a+b*2122%7};
+var g56sX2123=function(a,b){return a+b*2123%7};
+var g5aqA2124=function(a,b){return a+b*2124%7};
+var gsyBS2125=function(a,b){return a+b*2125%7};
+var gUMgh2126=function(a,b){return a+b*2126%7};
+var glsIV2127=function(a,b){return a+b*2127%7};
+var gyiCA2128=function(a,b){return a+b*2128%7};
+var gEZFB2129=function(a,b){return a+b*2129%7};
+var gfC3Z2130=function(a,b){return a+b*2130%7};
+var gh6ck2131=function(a,b){return a+b*2131%7};
+var gaU392132=function(a,b){return a+b*2132%7};
+var g5ytt2133=function(a,b){return a+b*2133%7};
+var gtilo2134=function(a,b){return a+b*2134%7};
+var g2Sdk2135=function(a,b){return a+b*2135%7};
+var gtdgS2136=function(a,b){return a+b*2136%7};
+var gun0P2137=function(a,b){return a+b*2137%7};
+var gFk8a2138=function(a,b){return a+b*2138%7};
+var gw3F12139=function(a,b){return a+b*2139%7};
+var go9Py2140=function(a,b){return a+b*2140%7};
+var g50jB2141=function(a,b){return a+b*2141%7};
+var gXh5X2142=function(a,b){return a+b*2142%7};
+var gTiqy2143=function(a,b){return a+b*2143%7};
+var gEyoL2144=function(a,b){return a+b*2144%7};
+var gQCcD2145=function(a,b){return a+b*2145%7};
+var gZ20z2146=function(a,b){return a+b*2146%7};
+var gR4A52147=function(a,b){return a+b*2147%7};
+var gxshs2148=function(a,b){return a+b*2148%7};
+var g4fLu2149=function(a,b){return a+b*2149%7};
+var gXMyd2150=function(a,b){return a+b*2150%7};
+var gpxO72151=function(a,b){return a+b*2151%7};
+var gy4l62152=function(a,b){return a+b*2152%7};
+var gHtq92153=function(a,b){return a+b*2153%7};
+var gxqrI2154=function(a,b){return a+b*2154%7};
+var gygX92155=function(a,b){return a+b*2155%7};
+var gQswf2156=function(a,b){return a+b*2156%7};
+var gcJYU2157=function(a,b){return a+b*2157%7};
+var gzS1Z2158=function(a,b){return a+b*2158%7};
+var g7mnS2159=function(a,b){return a+b*2159%7};
+var gw9dW2160=function(a,b){return a+b*2160%7};
+var gU4DM2161=function(a,b){return a+b*2161%7};
+var gYdLq2162=function(a,b){return a+b*2162%7};
+var g5vhr2163=function(a,b){return a+b*2163%7};
+var gN1Pd2164=function(a,b){return a+b*2164%7};
+var gILXh2165=function(a,b){return a+b*2165%7};
+var gL3K62166=function(a,b){return a+b*2166%7};
+var gVbkO2167=function(a,b){return a+b*2167%7};
+var gsycw2168=function(a,b){return a+b*2168%7};
+var gAKjS2169=function(a,b){return a+b*2169%7};
+var g0T1z2170=function(a,b){return a+b*2170%7};
+var gSIXv2171=function(a,b){return a+b*2171%7};
+var gIuRH2172=function(a,b){return a+b*2172%7};
+var gZvBt2173=function(a,b){return a+b*2173%7};
+var gsC1G2174=function(a,b){return a+b*2174%7};
+var gYxJr2175=function(a,b){return a+b*2175%7};
+var gOQ0a2176=function(a,b){return a+b*2176%7};
+var gBurX2177=function(a,b){return a+b*2177%7};
+var g1ule2178=function(a,b){return a+b*2178%7};
+var gfCrt2179=function(a,b){return a+b*2179%7};
+var gvJTa2180=function(a,b){return a+b*2180%7};
+var g44K82181=function(a,b){return a+b*2181%7};
+var g9xhf2182=function(a,b){return a+b*2182%7};
+var gx5ZS2183=function(a,b){return a+b*2183%7};
+var gVCE12184=function(a,b){return a+b*2184%7};
+var gmACm2185=function(a,b){return a+b*2185%7};
+var gEvcr2186=function(a,b){return a+b*2186%7};
+var gSA742187=function(a,b){return a+b*2187%7};
+var gqmMp2188=function(a,b){return a+b*2188%7};
+var g3jry2189=function(a,b){return a+b*2189%7};
+var g81Ql2190=function(a,b){return a+b*2190%7};
+var g9MPO2191=function(a,b){return a+b*2191%7};
+var gpmEy2192=function(a,b){return a+b*2192%7};
+var giSlt2193=function(a,b){return a+b*2193%7};
+var g0Zce2194=function(a,b){return a+b*2194%7};
+var gF5LV2195=function(a,b){return a+b*2195%7};
+var g4AbP2196=function(a,b){return a+b*2196%7};
+var gadto2197=function(a,b){return a+b*2197%7};
+var gw5b62198=function(a,b){return a+b*2198%7};
+var gsxMD2199=function(a,b){return a+b*2199%7};
+var gcwUR2200=function(a,b){return a+b*2200%7};
+var gs6SO2201=function(a,b){return a+b*2201%7};
+var gCCRL2202=function(a,b){return a+b*2202%7};
+var gyTkL2203=function(a,b){return a+b*2203%7};
+var g42bQ2204=function(a,b){return a+b*2204%7};
+var gKeIx2205=function(a,b){return a+b*2205%7};
+var gft602206=function(a,b){return a+b*2206%7};
+var gNOS02207=function(a,b){return a+b*2207%7};
+var gtDtb2208=function(a,b){return a+b*2208%7};
+var gOsd02209=function(a,b){return a+b*2209%7};
+var gxIV72210=function(a,b){return a+b*2210%7};
+var gmyQe2211=function(a,b){return a+b*2211%7};
+var guKAr2212=function(a,b){return a+b*2212%7};
+var gXaQQ2213=function(a,b){return a+b*2213%7};
+var gNOAq2214=function(a,b){return a+b*2214%7};
+var gfGl52215=function(a,b){return a+b*2215%7};
+var gRy7P2216=function(a,b){return a+b*2216%7};
+var gktvI2217=function(a,b){return a+b*2217%7};
+var gWUyn2218=function(a,b){return a+b*2218%7};
+var gyf6G2219=function(a,b){return a+b*2219%7};
+var gxWZr2220=function(a,b){return a+b*2220%7};
+var glavV2221=function(a,b){return a+b*2221%7};
+var gdsFa2222=function(a,b){return a+b*2222%7};
+var g1qBG2223=function(a,b){return a+b*2223%7};
+var gSuWJ2224=function(a,b){return a+b*2224%7};
+var gSugx2225=function(a,b){return a+b*2225%7};
+var gLAUP2226=function(a,b){return a+b*2226%7};
+var gQyI62227=function(a,b){return a+b*2227%7};
+var gYxpA2228=function(a,b){return a+b*2228%7};
+var gi9wB2229=function(a,b){return a+b*2229%7};
+var g6TMz2230=function(a,b){return a+b*2230%7};
+var gXxak2231=function(a,b){return a+b*2231%7};
+var gm02M2232=function(a,b){return a+b*2232%7};
+var gyj3c2233=function(a,b){return a+b*2233%7};
+var gAE0n2234=function(a,b){return a+b*2234%7};
+var gPv7S2235=function(a,b){return a+b*2235%7};
+var gfJhy2236=function(a,b){return a+b*2236%7};
+var gn0Jy2237=function(a,b){return a+b*2237%7};
+var g7CKH2238=function(a,b){return a+b*2238%7};
+var gT3Ba2239=function(a,b){return a+b*2239%7};
+var gPlLK2240=function(a,b){return a+b*2240%7};
+var g18WT2241=function(a,b){return a+b*2241%7};
+var gp92x2242=function(a,b){return a+b*2242%7};
+var gbyCC2243=function(a,b){return a+b*2243%7};
+var gkznb2244=function(a,b){return a+b*2244%7};
+var gSECg2245=function(a,b){return a+b*2245%7};
+var gMMLZ2246=function(a,b){return a+b*2246%7};
+var gKe9t2247=function(a,b){return a+b*2247%7};
+var gKuba2248=function(a,b){return a+b*2248%7};
+var gotiY2249=function(a,b){return a+b*2249%7};
+var gRD3u2250=function(a,b){return a+b*2250%7};
+var gw3K02251=function(a,b){return a+b*2251%7};
+var g8Hrj2252=function(a,b){return a+b*2252%7};
+var gGjgG2253=function(a,b){return a+b*2253%7};
+var gy2s12254=function(a,b){return a+b*2254%7};
+var g8uKh2255=function(a,b){return a+b*2255%7};
+var gypcY2256=function(a,b){return a+b*2256%7};
+var g0fo52257=function(a,b){return a+b*2257%7};
+var gO8yO2258=function(a,b){return a+b*2258%7};
+var gLCPx2259=function(a,b){return a+b*2259%7};
+var g8sq32260=function(a,b){return a+b*2260%7};
+var g7Sm42261=function(a,b){return a+b*2261%7};
+var gslyu2262=function(a,b){return a+b*2262%7};
+var gKKpX2263=function(a,b){return a+b*2263%7};
+var gTzhH2264=function(a,b){return a+b*2264%7};
+var gpskG2265=function(a,b){return a+b*2265%7};
+var gFOnu2266=function(a,b){return a+b*2266%7};
+var gNVNf2267=function(a,b){return a+b*2267%7};
+var gvtzq2268=function(a,b){return a+b*2268%7};
+var gSBVr2269=function(a,b){return a+b*2269%7};
+var gnNG62270=function(a,b){return a+b*2270%7};
+var ge6xJ2271=function(a,b){return a+b*2271%7};
+var goBKG2272=function(a,b){return a+b*2272%7};
+var g4KbS2273=function(a,b){return a+b*2273%7};
+var g9ZyY2274=function(a,b){return a+b*2274%7};
+var gUD862275=function(a,b){return a+b*2275%7};
+var g0I7z2276=function(a,b){return a+b*2276%7};
+var grsAz2277=function(a,b){return a+b*2277%7};
+var gMsmt2278=function(a,b){return a+b*2278%7};
+var gPoBf2279=function(a,b){return a+b*2279%7};
+var g1Mmf2280=function(a,b){return a+b*2280%7};
+var gMBpB2281=function(a,b){return a+b*2281%7};
+var gBxpO2282=function(a,b){return a+b*2282%7};
+var g3knI2283=function(a,b){return a+b*2283%7};
+var gqTa02284=function(a,b){return a+b*2284%7};
+var gW6GD2285=function(a,b){return a+b*2285%7};
+var gAtUT2286=function(a,b){return a+b*2286%7};
+var gSd0d2287=function(a,b){return a+b*2287%7};
+var glDFO2288=function(a,b){return a+b*2288%7};
+var gixgI2289=function(a,b){return a+b*2289%7};
+var gFwyk2290=function(a,b){return a+b*2290%7};
+var g4lHr2291=function(a,b){return a+b*2291%7};
+var g2Btd2292=function(a,b){return a+b*2292%7};
+var ghTRE2293=function(a,b){return a+b*2293%7};
+var gUJJC2294=function(a,b){return a+b*2294%7};
+var gCbtX2295=function(a,b){return a+b*2295%7};
+var gCqqH2296=function(a,b){return a+b*2296%7};
+var gXEaL2297=function(a,b){return a+b*2297%7};
+var gr97D2298=function(a,b){return a+b*2298%7};
+var gGIyf2299=function(a,b){return a+b*2299%7};
+var g10oA2300=function(a,b){return a+b*2300%7};
+var g4XVW2301=function(a,b){return a+b*2301%7};
+var gify42302=function(a,b){return a+b*2302%7};
+var gdtGT2303=function(a,b){return a+b*2303%7};
+var gTtQb2304=function(a,b){return a+b*2304%7};
+var g6B9c2305=function(a,b){return a+b*2305%7};
+var gdsC22306=function(a,b){return a+b*2306%7};
+var gIihj2307=function(a,b){return a+b*2307%7};
+var gVcD12308=function(a,b){return a+b*2308%7};
+var g3MOP2309=function(a,b){return a+b*2309%7};
+var gyKgn2310=function(a,b){return a+b*2310%7};
+var gEnaC2311=function(a,b){return a+b*2311%7};
+var g0sxh2312=function(a,b){return a+b*2312%7};
+var gbgUn2313=function(a,b){return a+b*2313%7};
+var gTFJc2314=function(a,b){return a+b*2314%7};
+var gLYHL2315=function(a,b){return a+b*2315%7};
+var gOjWL2316=function(a,b){return a+b*2316%7};
+var gQ4xP2317=function(a,b){return a+b*2317%7};
+var g60rE2318=function(a,b){return a+b*2318%7};
+var gfTdy2319=function(a,b){return a+b*2319%7};
+var gz5yo2320=function(a,b){return a+b*2320%7};
+var guc5m2321=function(a,b){return a+b*2321%7};
+var goyxB2322=function(a,b){return a+b*2322%7};
+var gHHur2323=function(a,b){return a+b*2323%7};
+var g7RBu2324=function(a,b){return a+b*2324%7};
+var gpIZ62325=function(a,b){return a+b*2325%7};
+var gNCZB2326=function(a,b){return a+b*2326%7};
+var g7NEf2327=function(a,b){return a+b*2327%7};
+var g5bT82328=function(a,b){return a+b*2328%7};
+var gjjeq2329=function(a,b){return a+b*2329%7};
+var gmOpx2330=function(a,b){return a+b*2330%7};
+var goj0C2331=function(a,b){return a+b*2331%7};
+var gLD7q2332=function(a,b){return a+b*2332%7};
+var g9kXc2333=function(a,b){return a+b*2333%7};
+var gfKlc2334=function(a,b){return a+b*2334%7};
+var gcYSR2335=function(a,b){return a+b*2335%7};
+var gqNvL2336=function(a,b){return a+b*2336%7};
+var gUkNk2337=function(a,b){return a+b*2337%7};
+var gkPix2338=function(a,b){return a+b*2338%7};
+var gYAQL2339=function(a,b){return a+b*2339%7};
+var gB8bf2340=function(a,b){return a+b*2340%7};
+var gwSxd2341=function(a,b){return a+b*2341%7};
+var gZ3KS2342=function(a,b){return a+b*2342%7};
+var gmegO2343=function(a,b){return a+b*2343%7};
+var gvUuH2344=function(a,b){return a+b*2344%7};
+var gGFNg2345=function(a,b){return a+b*2345%7};
+var gtr3S2346=function(a,b){return a+b*2346%7};
+var gy2sd2347=function(a,b){return a+b*2347%7};
+var gPCwY2348=function(a,b){return a+b*2348%7};
+var gIXr12349=function(a,b){return a+b*2349%7};
+var gqoj32350=function(a,b){return a+b*2350%7};
+var gS6dQ2351=function(a,b){return a+b*2351%7};
+var gQiPk2352=function(a,b){return a+b*2352%7};
+var gqrWS2353=function(a,b){return a+b*2353%7};
+var gFgbD2354=function(a,b){return a+b*2354%7};
+var ggVsv2355=function(a,b){return a+b*2355%7};
+var gwXu12356=function(a,b){return a+b*2356%7};
+var g8x452357=function(a,b){return a+b*2357%7};
+var gstG22358=function(a,b){return a+b*2358%7};
+var gt8t52359=function(a,b){return a+b*2359%7};
+var g5gIA2360=function(a,b){return a+b*2360%7};
+var gW5yh2361=function(a,b){return a+b*2361%7};
+var gaqOs2362=function(a,b){return a+b*2362%7};
+var gVbTS2363=function(a,b){return a+b*2363%7};
+var gdYHy2364=function(a,b){return a+b*2364%7};
+var gAA162365=function(a,b){return a+b*2365%7};
+var gSaB72366=function(a,b){return a+b*2366%7};
+var glqYk2367=function(a,b){return a+b*2367%7};
+var gTvue2368=function(a,b){return a+b*2368%7};
+var gDpsI2369=function(a,b){return a+b*2369%7};
+var gh3Jy2370=function(a,b){return a+b*2370%7};
+var gWNDz2371=function(a,b){return a+b*2371%7};
+var gQJxI2372=function(a,b){return a+b*2372%7};
+var gyEm72373=function(a,b){return a+b*2373%7};
+var gHXa22374=function(a,b){return a+b*2374%7};
+var gkLG32375=function(a,b){return a+b*2375%7};
+var gDugY2376=function(a,b){return a+b*2376%7};
+var gno9t2377=function(a,b){return a+b*2377%7};
+var g4KxL2378=function(a,b){return a+b*2378%7};
+var gLjI62379=function(a,b){return a+b*2379%7};
+var gNgKY2380=function(a,b){return a+b*2380%7};
+var gELmE2381=function(a,b){return a+b*2381%7};
+var gydzR2382=function(a,b){return a+b*2382%7};
+var gmsV32383=function(a,b){return a+b*2383%7};
+var gwpUE2384=function(a,b){return a+b*2384%7};
+var ghEXH2385=function(a,b){return a+b*2385%7};
+var gpD1r2386=function(a,b){return a+b*2386%7};
+var gKwno2387=function(a,b){return a+b*2387%7};
+var grTfC2388=function(a,b){return a+b*2388%7};
+var gVQg52389=function(a,b){return a+b*2389%7};
+var ghzxd2390=function(a,b){return a+b*2390%7};
+var grJCe2391=function(a,b){return a+b*2391%7};
+var g0xqe2392=function(a,b){return a+b*2392%7};
+var gxSdd2393=function(a,b){return a+b*2393%7};
+var gdYCJ2394=function(a,b){return a+b*2394%7};
+var gE8Fd2395=function(a,b){return a+b*2395%7};
+var g6dyZ2396=function(a,b){return a+b*2396%7};
+var gPo6i2397=function(a,b){return a+b*2397%7};
+var gYnao2398=function(a,b){return a+b*2398%7};
+var gofyL2399=function(a,b){return a+b*2399%7};
+var gQeKS2400=function(a,b){return a+b*2400%7};
+var g4Xs82401=function(a,b){return a+b*2401%7};
+var g8caz2402=function(a,b){return a+b*2402%7};
+var gN14F2403=function(a,b){return a+b*2403%7};
+var ggwKk2404=function(a,b){return a+b*2404%7};
+var gT5Dx2405=function(a,b){return a+b*2405%7};
+var gMjod2406=function(a,b){return a+b*2406%7};
+var geykE2407=function(a,b){return a+b*2407%7};
+var gsjwb2408=function(a,b){return a+b*2408%7};
+var g66vI2409=function(a,b){return a+b*2409%7};
+var gFfnd2410=function(a,b){return a+b*2410%7};
+var gDxtf2411=function(a,b){return a+b*2411%7};
+var g0zFF2412=function(a,b){return a+b*2412%7};
+var gzAdp2413=function(a,b){return a+b*2413%7};
+var gOMDf2414=function(a,b){return a+b*2414%7};
+var gSo3x2415=function(a,b){return a+b*2415%7};
+var gOEjj2416=function(a,b){return a+b*2416%7};
+var gOTE52417=function(a,b){return a+b*2417%7};
+var gs3wG2418=function(a,b){return a+b*2418%7};
+var gL1dn2419=function(a,b){return a+b*2419%7};
+var gxtRH2420=function(a,b){return a+b*2420%7};
+var gz5pJ2421=function(a,b){return a+b*2421%7};
+var gxkCL2422=function(a,b){return a+b*2422%7};
+var gfLPJ2423=function(a,b){return a+b*2423%7};
+var gSW6v2424=function(a,b){return a+b*2424%7};
+var ghaxy2425=function(a,b){return a+b*2425%7};
+var ghcRn2426=function(a,b){return a+b*2426%7};
+var g0L1l2427=function(a,b){return a+b*2427%7};
+var g3zxR2428=function(a,b){return a+b*2428%7};
+var g25hV2429=function(a,b){return a+b*2429%7};
+var gGmS52430=function(a,b){return a+b*2430%7};
+var gzC0a2431=function(a,b){return a+b*2431%7};
+var gvD242432=function(a,b){return a+b*2432%7};
+var gBVTr2433=function(a,b){return a+b*2433%7};
+var gL0BL2434=function(a,b){return a+b*2434%7};
+var gJYKj2435=function(a,b){return a+b*2435%7};
+var gTy5B2436=function(a,b){return a+b*2436%7};
+var gu4Bf2437=function(a,b){return a+b*2437%7};
+var gcwZO2438=function(a,b){return a+b*2438%7};
+var gZOHd2439=function(a,b){return a+b*2439%7};
+var gOfal2440=function(a,b){return a+b*2440%7};
+var g7uRk2441=function(a,b){return a+b*2441%7};
+var gvedx2442=function(a,b){return a+b*2442%7};
+var gEpXM2443=function(a,b){return a+b*2443%7};
+var gCAEq2444=function(a,b){return a+b*2444%7};
+var gGSvi2445=function(a,b){return a+b*2445%7};
+var gvS6n2446=function(a,b){return a+b*2446%7};
+var gBmzs2447=function(a,b){return a+b*2447%7};
+var gh0WF2448=function(a,b){return a+b*2448%7};
+var g4IWG2449=function(a,b){return a+b*2449%7};
+var gXWKd2450=function(a,b){return a+b*2450%7};
+var gODVy2451=function(a,b){return a+b*2451%7};
+var g1pPD2452=function(a,b){return a+b*2452%7};
+var gWVmb2453=function(a,b){return a+b*2453%7};
+var gu9BM2454=function(a,b){return a+b*2454%7};
+var goUMg2455=function(a,b){return a+b*2455%7};
+var gk5yh2456=function(a,b){return a+b*2456%7};
+var geHKb2457=function(a,b){return a+b*2457%7};
+var gVRDv2458=function(a,b){return a+b*2458%7};
+var gaB042459=function(a,b){return a+b*2459%7};
+var g0yXD2460=function(a,b){return a+b*2460%7};
+var gSx9z2461=function(a,b){return a+b*2461%7};
+var gPhRw2462=function(a,b){return a+b*2462%7};
+var g4N7q2463=function(a,b){return a+b*2463%7};
+var gj1ny2464=function(a,b){return a+b*2464%7};
+var gymIO2465=function(a,b){return a+b*2465%7};
+var gtHQo2466=function(a,b){return a+b*2466%7};
+var gwyoY2467=function(a,b){return a+b*2467%7};
+var glR252468=function(a,b){return a+b*2468%7};
+var g0JXd2469=function(a,b){return a+b*2469%7};
+var g5Soz2470=function(a,b){return a+b*2470%7};
+var gTZRZ2471=function(a,b){return a+b*2471%7};
+var gAYY22472=function(a,b){return a+b*2472%7};
+var gmpBE2473=function(a,b){return a+b*2473%7};
+var gU8ow2474=function(a,b){return a+b*2474%7};
+var gPVRz2475=function(a,b){return a+b*2475%7};
+var gkVDF2476=function(a,b){return a+b*2476%7};
+var giwdy2477=function(a,b){return a+b*2477%7};
+var gLuod2478=function(a,b){return a+b*2478%7};
+var gVD002479=function(a,b){return a+b*2479%7};
+var gsugy2480=function(a,b){return a+b*2480%7};
+var giv692481=function(a,b){return a+b*2481%7};
+var geb4j2482=function(a,b){return a+b*2482%7};
+var gMRwM2483=function(a,b){return a+b*2483%7};
+var gHG0Z2484=function(a,b){return a+b*2484%7};
+var gPtr72485=function(a,b){return a+b*2485%7};
+var gy5nK2486=function(a,b){return a+b*2486%7};
+var gwMT42487=function(a,b){return a+b*2487%7};
+var gpgmr2488=function(a,b){return a+b*2488%7};
+var gG44S2489=function(a,b){return a+b*2489%7};
+var g0HcH2490=function(a,b){return a+b*2490%7};
+var gvAHG2491=function(a,b){return a+b*2491%7};
+var gefQ72492=function(a,b){return a+b*2492%7};
+var giMJw2493=function(a,b){return a+b*2493%7};
+var gtYkO2494=function(a,b){return a+b*2494%7};
+var gicTX2495=function(a,b){return a+b*2495%7};
+var gl6Zv2496=function(a,b){return a+b*2496%7};
+var gwlEy2497=function(a,b){return a+b*2497%7};
+var gFFD62498=function(a,b){return a+b*2498%7};
+var gePHI2499=function(a,b){return a+b*2499%7};
+var gu2xb2500=function(a,b){return a+b*2500%7};
+var gpIzL2501=function(a,b){return a+b*2501%7};
+var gQx3c2502=function(a,b){return a+b*2502%7};
+var gkRfy2503=function(a,b){return a+b*2503%7};
+var gPXSq2504=function(a,b){return a+b*2504%7};
+var g48P72505=function(a,b){return a+b*2505%7};
+var gJFTy2506=function(a,b){return a+b*2506%7};
+var gWGj22507=function(a,b){return a+b*2507%7};
+var gyGYK2508=function(a,b){return a+b*2508%7};
+var gem072509=function(a,b){return a+b*2509%7};
+var gx2272510=function(a,b){return a+b*2510%7};
+var gT3cG2511=function(a,b){return a+b*2511%7};
+var guBHc2512=function(a,b){return a+b*2512%7};
+var g3rV22513=function(a,b){return a+b*2513%7};
+var gt2pE2514=function(a,b){return a+b*2514%7};
+var g83xy2515=function(a,b){return a+b*2515%7};
+var gLPRc2516=function(a,b){return a+b*2516%7};
+var gEyqM2517=function(a,b){return a+b*2517%7};
+var gSX0w2518=function(a,b){return a+b*2518%7};
+var gSpX12519=function(a,b){return a+b*2519%7};
+var gSnnW2520=function(a,b){return a+b*2520%7};
+var gQreZ2521=function(a,b){return a+b*2521%7};
+var gdQQ32522=function(a,b){return a+b*2522%7};
+var gbnW62523=function(a,b){return a+b*2523%7};
+var grOeL2524=function(a,b){return a+b*2524%7};
+var g9BQ72525=function(a,b){return a+b*2525%7};
+var gzRCx2526=function(a,b){return a+b*2526%7};
+var gdx7O2527=function(a,b){return a+b*2527%7};
+var gSZtG2528=function(a,b){return a+b*2528%7};
+var gRM7V2529=function(a,b){return a+b*2529%7};
+var gkmId2530=function(a,b){return a+b*2530%7};
+var glDJN2531=function(a,b){return a+b*2531%7};
+var gWdri2532=function(a,b){return a+b*2532%7};
+var gXxGZ2533=function(a,b){return a+b*2533%7};
+var gm5fr2534=function(a,b){return a+b*2534%7};
+var ggGHP2535=function(a,b){return a+b*2535%7};
+var gwcES2536=function(a,b){return a+b*2536%7};
+var g3FVL2537=function(a,b){return a+b*2537%7};
+var gwQgF2538=function(a,b){return a+b*2538%7};
+var gYXMG2539=function(a,b){return a+b*2539%7};
+var gUiZm2540=function(a,b){return a+b*2540%7};
+var gVsjm2541=function(a,b){return a+b*2541%7};
+var g4vgS2542=function(a,b){return a+b*2542%7};
+var gUibs2543=function(a,b){return a+b*2543%7};
+var gCVKv2544=function(a,b){return a+b*2544%7};
+var g3UrT2545=function(a,b){return a+b*2545%7};
+var g0mQP2546=function(a,b){return a+b*2546%7};
+var gqgRD2547=function(a,b){return a+b*2547%7};
+var gpxzs2548=function(a,b){return a+b*2548%7};
+var gLSzg2549=function(a,b){return a+b*2549%7};
+var gUrAa2550=function(a,b){return a+b*2550%7};
+var gZxTV2551=function(a,b){return a+b*2551%7};
+var gWPll2552=function(a,b){return a+b*2552%7};
+var g1E9O2553=function(a,b){return a+b*2553%7};
+var gCsYn2554=function(a,b){return a+b*2554%7};
+var grEkI2555=function(a,b){return a+b*2555%7};
+var gCxEo2556=function(a,b){return a+b*2556%7};
+var gwony2557=function(a,b){return a+b*2557%7};
+var grnee2558=function(a,b){return a+b*2558%7};
+var g9G0A2559=function(a,b){return a+b*2559%7};
+var gxh9q2560=function(a,b){return a+b*2560%7};
+var gDW5t2561=function(a,b){return a+b*2561%7};
+var gI8Rj2562=function(a,b){return a+b*2562%7};
+var gGqw22563=function(a,b){return a+b*2563%7};
+var gw5SF2564=function(a,b){return a+b*2564%7};
+var gC0kd2565=function(a,b){return a+b*2565%7};
+var gC4nq2566=function(a,b){return a+b*2566%7};
+var gOEg22567=function(a,b){return a+b*2567%7};
+var g9e6G2568=function(a,b){return a+b*2568%7};
+var gr9vW2569=function(a,b){return a+b*2569%7};
+var gxMQi2570=function(a,b){return a+b*2570%7};
+var gHCyQ2571=function(a,b){return a+b*2571%7};
+var glfOy2572=function(a,b){return a+b*2572%7};
+var gfN4W2573=function(a,b){return a+b*2573%7};
+var gVRDS2574=function(a,b){return a+b*2574%7};
+var gSsBK2575=function(a,b){return a+b*2575%7};
+var go5xy2576=function(a,b){return a+b*2576%7};
+var gW0p32577=function(a,b){return a+b*2577%7};
+var gySUM2578=function(a,b){return a+b*2578%7};
+var g4EEy2579=function(a,b){return a+b*2579%7};
+var g1VJ82580=function(a,b){return a+b*2580%7};
+var gRBxV2581=function(a,b){return a+b*2581%7};
+var gtS2Y2582=function(a,b){return a+b*2582%7};
+var gYTM62583=function(a,b){return a+b*2583%7};
+var gcPor2584=function(a,b){return a+b*2584%7};
+var gBrHe2585=function(a,b){return a+b*2585%7};
+var gjaxW2586=function(a,b){return a+b*2586%7};
+var gZ9En2587=function(a,b){return a+b*2587%7};
+var gTF3y2588=function(a,b){return a+b*2588%7};
+var gjFHH2589=function(a,b){return a+b*2589%7};
+var gRV4U2590=function(a,b){return a+b*2590%7};
+var gFJE22591=function(a,b){return a+b*2591%7};
+var g8emc2592=function(a,b){return a+b*2592%7};
+var gPI4w2593=function(a,b){return a+b*2593%7};
+var gZRaR2594=function(a,b){return a+b*2594%7};
+var gUBJw2595=function(a,b){return a+b*2595%7};
+var gXtxP2596=function(a,b){return a+b*2596%7};
+var gyA5g2597=function(a,b){return a+b*2597%7};
+var gHFRQ2598=function(a,b){return a+b*2598%7};
+var gpd452599=function(a,b){return a+b*2599%7};
+var gakFT2600=function(a,b){return a+b*2600%7};
+var g9OUZ2601=function(a,b){return a+b*2601%7};
+var gAqTP2602=function(a,b){return a+b*2602%7};
+var g87RH2603=function(a,b){return a+b*2603%7};
+var ge9J22604=function(a,b){return a+b*2604%7};
+var g2XTs2605=function(a,b){return a+b*2605%7};
+var g4Xhz2606=function(a,b){return a+b*2606%7};
+var gJozp2607=function(a,b){return a+b*2607%7};
+var gtGWs2608=function(a,b){return a+b*2608%7};
+var gvNeF2609=function(a,b){return a+b*2609%7};
+var geT3e2610=function(a,b){return a+b*2610%7};
+var gucLA2611=function(a,b){return a+b*2611%7};
+var gGcVT2612=function(a,b){return a+b*2612%7};
+var gP2yC2613=function(a,b){return a+b*2613%7};
+var gM88e2614=function(a,b){return a+b*2614%7};
+var gjMyC2615=function(a,b){return a+b*2615%7};
+var gZZHK2616=function(a,b){return a+b*2616%7};
+var gGwHb2617=function(a,b){return a+b*2617%7};
+var g5v8I2618=function(a,b){return a+b*2618%7};
+var gYJUu2619=function(a,b){return a+b*2619%7};
+var gtluh2620=function(a,b){return a+b*2620%7};
+var gBnl32621=function(a,b){return a+b*2621%7};
+var g8x4C2622=function(a,b){return a+b*2622%7};
+var gBhJP2623=function(a,b){return a+b*2623%7};
+var gcMbY2624=function(a,b){return a+b*2624%7};
+var gL0xH2625=function(a,b){return a+b*2625%7};
+var gxQfm2626=function(a,b){return a+b*2626%7};
+var gmNY82627=function(a,b){return a+b*2627%7};
+var gBBSs2628=function(a,b){return a+b*2628%7};
+var ghkDh2629=function(a,b){return a+b*2629%7};
+var gYxHa2630=function(a,b){return a+b*2630%7};
+var gjC0h2631=function(a,b){return a+b*2631%7};
+var ghCPG2632=function(a,b){return a+b*2632%7};
+var g4xNl2633=function(a,b){return a+b*2633%7};
+var gPkdM2634=function(a,b){return a+b*2634%7};
+var gnPzi2635=function(a,b){return a+b*2635%7};
+var gSEe12636=function(a,b){return a+b*2636%7};
+var g3c062637=function(a,b){return a+b*2637%7};
+var giyuy2638=function(a,b){return a+b*2638%7};
+var gBYCg2639=function(a,b){return a+b*2639%7};
+var gOyVn2640=function(a,b){return a+b*2640%7};
+var gSt7J2641=function(a,b){return a+b*2641%7};
+var gzUTz2642=function(a,b){return a+b*2642%7};
+var gxq8F2643=function(a,b){return a+b*2643%7};
+var gwGT82644=function(a,b){return a+b*2644%7};
+var g1ivt2645=function(a,b){return a+b*2645%7};
+var gPXqz2646=function(a,b){return a+b*2646%7};
+var gI7jn2647=function(a,b){return a+b*2647%7};
+var ga1R02648=function(a,b){return a+b*2648%7};
+var giArO2649=function(a,b){return a+b*2649%7};
+var gnSXk2650=function(a,b){return a+b*2650%7};
+var gMpYy2651=function(a,b){return a+b*2651%7};
+var g1xE12652=function(a,b){return a+b*2652%7};
+var gM3Ij2653=function(a,b){return a+b*2653%7};
+var gsibx2654=function(a,b){return a+b*2654%7};
+var gMP5U2655=function(a,b){return a+b*2655%7};
+var g8PWj2656=function(a,b){return a+b*2656%7};
+var gsNJV2657=function(a,b){return a+b*2657%7};
+var g6gzw2658=function(a,b){return a+b*2658%7};
+var gi0KN2659=function(a,b){return a+b*2659%7};
+var gykiG2660=function(a,b){return a+b*2660%7};
+var gpMj32661=function(a,b){return a+b*2661%7};
+var g7GmJ2662=function(a,b){return a+b*2662%7};
+var gCyxv2663=function(a,b){return a+b*2663%7};
+var gswqx2664=function(a,b){return a+b*2664%7};
+var g2GrF2665=function(a,b){return a+b*2665%7};
+var gtpDJ2666=function(a,b){return a+b*2666%7};
+var grhjR2667=function(a,b){return a+b*2667%7};
+var g9v9l2668=function(a,b){return a+b*2668%7};
+var gAOeg2669=function(a,b){return a+b*2669%7};
+var gaxLy2670=function(a,b){return a+b*2670%7};
+var gzyhB2671=function(a,b){return a+b*2671%7};
+var gxf7x2672=function(a,b){return a+b*2672%7};
+var gV0GZ2673=function(a,b){return a+b*2673%7};
+var geuQr2674=function(a,b){return a+b*2674%7};
+var gDQCp2675=function(a,b){return a+b*2675%7};
+var ge2NJ2676=function(a,b){return a+b*2676%7};
+var gwKpq2677=function(a,b){return a+b*2677%7};
+var gXouO2678=function(a,b){return a+b*2678%7};
+var gL4TQ2679=function(a,b){return a+b*2679%7};
+var gN2iM2680=function(a,b){return a+b*2680%7};
+var gxbzL2681=function(a,b){return a+b*2681%7};
+var gzfdl2682=function(a,b){return a+b*2682%7};
+var gSxTH2683=function(a,b){return a+b*2683%7};
+var gL3rI2684=function(a,b){return a+b*2684%7};
+var gXo8Q2685=function(a,b){return a+b*2685%7};
+var gkMfy2686=function(a,b){return a+b*2686%7};
+var gDDN62687=function(a,b){return a+b*2687%7};
+var gNyxe2688=function(a,b){return a+b*2688%7};
+var guvDr2689=function(a,b){return a+b*2689%7};
+var gvQVh2690=function(a,b){return a+b*2690%7};
+var gWB2j2691=function(a,b){return a+b*2691%7};
+var gwGn92692=function(a,b){return a+b*2692%7};
+var g3yRD2693=function(a,b){return a+b*2693%7};
+var gUO522694=function(a,b){return a+b*2694%7};
+var g6Y3o2695=function(a,b){return a+b*2695%7};
+var gi3nE2696=function(a,b){return a+b*2696%7};
+var gQy5c2697=function(a,b){return a+b*2697%7};
+var gejxP2698=function(a,b){return a+b*2698%7};
+var gNWaS2699=function(a,b){return a+b*2699%7};
+var gaHez2700=function(a,b){return a+b*2700%7};
+var gpAc02701=function(a,b){return a+b*2701%7};
+var gkU0B2702=function(a,b){return a+b*2702%7};
+var gcytU2703=function(a,b){return a+b*2703%7};
+var gltdU2704=function(a,b){return a+b*2704%7};
+var gRo902705=function(a,b){return a+b*2705%7};
+var gECu32706=function(a,b){return a+b*2706%7};
+var g88hq2707=function(a,b){return a+b*2707%7};
+var gW7cs2708=function(a,b){return a+b*2708%7};
+var g0ObY2709=function(a,b){return a+b*2709%7};
+var gvtsB2710=function(a,b){return a+b*2710%7};
+var geAx12711=function(a,b){return a+b*2711%7};
+var gpEUi2712=function(a,b){return a+b*2712%7};
+var gIIVb2713=function(a,b){return a+b*2713%7};
+var gVEei2714=function(a,b){return a+b*2714%7};
+var g0vgQ2715=function(a,b){return a+b*2715%7};
+var gnHyE2716=function(a,b){return a+b*2716%7};
+var gW8dQ2717=function(a,b){return a+b*2717%7};
+var gWD3P2718=function(a,b){return a+b*2718%7};
+var gDgbY2719=function(a,b){return a+b*2719%7};
+var g1XZX2720=function(a,b){return a+b*2720%7};
+var g33Rq2721=function(a,b){return a+b*2721%7};
+var g9Mav2722=function(a,b){return a+b*2722%7};
+var gzDrb2723=function(a,b){return a+b*2723%7};
+var gXy5b2724=function(a,b){return a+b*2724%7};
+var gxoDD2725=function(a,b){return a+b*2725%7};
+var g5gSb2726=function(a,b){return a+b*2726%7};
+var g7ixF2727=function(a,b){return a+b*2727%7};
+var gbl7V2728=function(a,b){return a+b*2728%7};
+var ggUei2729=function(a,b){return a+b*2729%7};
+var gyQeY2730=function(a,b){return a+b*2730%7};
+var g7dq02731=function(a,b){return a+b*2731%7};
+var g6zFl2732=function(a,b){return a+b*2732%7};
+var g1iKs2733=function(a,b){return a+b*2733%7};
+var gZ3Ap2734=function(a,b){return a+b*2734%7};
+var gtjQy2735=function(a,b){return a+b*2735%7};
+var gs7tx2736=function(a,b){return a+b*2736%7};
+var gwMXt2737=function(a,b){return a+b*2737%7};
+var gWPkx2738=function(a,b){return a+b*2738%7};
+var g4bfs2739=function(a,b){return a+b*2739%7};
+var gou0k2740=function(a,b){return a+b*2740%7};
+var gzLml2741=function(a,b){return a+b*2741%7};
+var gDWWm2742=function(a,b){return a+b*2742%7};
+var gFHQo2743=function(a,b){return a+b*2743%7};
+var gNhm32744=function(a,b){return a+b*2744%7};
+var gmnhA2745=function(a,b){return a+b*2745%7};
+var g9BCi2746=function(a,b){return a+b*2746%7};
+var ghuZz2747=function(a,b){return a+b*2747%7};
+var gASfv2748=function(a,b){return a+b*2748%7};
+var gw38n2749=function(a,b){return a+b*2749%7};
+var gdB3s2750=function(a,b){return a+b*2750%7};
+var gZEyv2751=function(a,b){return a+b*2751%7};
+var gr8tc2752=function(a,b){return a+b*2752%7};
+var gpqjv2753=function(a,b){return a+b*2753%7};
+var g8CKN2754=function(a,b){return a+b*2754%7};
+var gNi7C2755=function(a,b){return a+b*2755%7};
+var gn1AF2756=function(a,b){return a+b*2756%7};
+var gDf2z2757=function(a,b){return a+b*2757%7};
+var gDy422758=function(a,b){return a+b*2758%7};
+var gPyoM2759=function(a,b){return a+b*2759%7};
+var gFrCx2760=function(a,b){return a+b*2760%7};
+var gpbAr2761=function(a,b){return a+b*2761%7};
+var gVxso2762=function(a,b){return a+b*2762%7};
+var gboTF2763=function(a,b){return a+b*2763%7};
+var gelto2764=function(a,b){return a+b*2764%7};
+var gKGzk2765=function(a,b){return a+b*2765%7};
+var gZtdh2766=function(a,b){return a+b*2766%7};
+var gXKgs2767=function(a,b){return a+b*2767%7};
+var g1QiK2768=function(a,b){return a+b*2768%7};
+var gUbHS2769=function(a,b){return a+b*2769%7};
+var gNf4R2770=function(a,b){return a+b*2770%7};
+var gBrKm2771=function(a,b){return a+b*2771%7};
+var groxH2772=function(a,b){return a+b*2772%7};
+var gCM0h2773=function(a,b){return a+b*2773%7};
+var ga03b2774=function(a,b){return a+b*2774%7};
+var gpgpy2775=function(a,b){return a+b*2775%7};
+var g5Tvy2776=function(a,b){return a+b*2776%7};
+var gUy8Q2777=function(a,b){return a+b*2777%7};
+var gNpJb2778=function(a,b){return a+b*2778%7};
+var gXKdM2779=function(a,b){return a+b*2779%7};
+var gysyH2780=function(a,b){return a+b*2780%7};
+var glWRm2781=function(a,b){return a+b*2781%7};
+var gR2DO2782=function(a,b){return a+b*2782%7};
+var gOUhE2783=function(a,b){return a+b*2783%7};
+var gXEUz2784=function(a,b){return a+b*2784%7};
+var gdecu2785=function(a,b){return a+b*2785%7};
+var gQAs92786=function(a,b){return a+b*2786%7};
+var gMSxe2787=function(a,b){return a+b*2787%7};
+var g8Qbu2788=function(a,b){return a+b*2788%7};
+var g03pw2789=function(a,b){return a+b*2789%7};
+var gWvEe2790=function(a,b){return a+b*2790%7};
+var g64Sk2791=function(a,b){return a+b*2791%7};
+var gfoJi2792=function(a,b){return a+b*2792%7};
+var g4PCu2793=function(a,b){return a+b*2793%7};
+var gmjNh2794=function(a,b){return a+b*2794%7};
+var gl6Ha2795=function(a,b){return a+b*2795%7};
+var gqzu62796=function(a,b){return a+b*2796%7};
+var gxkhP2797=function(a,b){return a+b*2797%7};
+var gn30E2798=function(a,b){return a+b*2798%7};
+var galRt2799=function(a,b){return a+b*2799%7};
+var gbjlm2800=function(a,b){return a+b*2800%7};
+var gND4s2801=function(a,b){return a+b*2801%7};
+var gjN4v2802=function(a,b){return a+b*2802%7};
+var gPEPP2803=function(a,b){return a+b*2803%7};
+var g0WSH2804=function(a,b){return a+b*2804%7};
+var g33iH2805=function(a,b){return a+b*2805%7};
+var gnX9Q2806=function(a,b){return a+b*2806%7};
+var gguNO2807=function(a,b){return a+b*2807%7};
+var gLg6T2808=function(a,b){return a+b*2808%7};
+var gTQSI2809=function(a,b){return a+b*2809%7};
+var g7jzQ2810=function(a,b){return a+b*2810%7};
+var gEQmd2811=function(a,b){return a+b*2811%7};
+var gkq1U2812=function(a,b){return a+b*2812%7};
+var gwXSq2813=function(a,b){return a+b*2813%7};
+var g1A2x2814=function(a,b){return a+b*2814%7};
+var gDNpr2815=function(a,b){return a+b*2815%7};
+var garaa2816=function(a,b){return a+b*2816%7};
+var g6ftD2817=function(a,b){return a+b*2817%7};
+var gPS8y2818=function(a,b){return a+b*2818%7};
+var gj3AH2819=function(a,b){return a+b*2819%7};
+var gWxI62820=function(a,b){return a+b*2820%7};
+var gSaxL2821=function(a,b){return a+b*2821%7};
+var gDUIG2822=function(a,b){return a+b*2822%7};
+var gxyEk2823=function(a,b){return a+b*2823%7};
+var gkhFy2824=function(a,b){return a+b*2824%7};
+var gOOAf2825=function(a,b){return a+b*2825%7};
+var gj2P22826=function(a,b){return a+b*2826%7};
+var glypE2827=function(a,b){return a+b*2827%7};
+var g9jqZ2828=function(a,b){return a+b*2828%7};
+var g8fxx2829=function(a,b){return a+b*2829%7};
+var g1jUX2830=function(a,b){return a+b*2830%7};
+var grw0c2831=function(a,b){return a+b*2831%7};
+var g1FBk2832=function(a,b){return a+b*2832%7};
+var gCg472833=function(a,b){return a+b*2833%7};
+var g6drg2834=function(a,b){return a+b*2834%7};
+var geodx2835=function(a,b){return a+b*2835%7};
+var gXIxN2836=function(a,b){return a+b*2836%7};
+var gzUX82837=function(a,b){return a+b*2837%7};
+var gc1ZQ2838=function(a,b){return a+b*2838%7};
+var gWYI22839=function(a,b){return a+b*2839%7};
+var giSg12840=function(a,b){return a+b*2840%7};
+var gydxn2841=function(a,b){return a+b*2841%7};
+var gsUdr2842=function(a,b){return a+b*2842%7};
+var gQSAB2843=function(a,b){return a+b*2843%7};
+var gf6hq2844=function(a,b){return a+b*2844%7};
+var gXLFk2845=function(a,b){return a+b*2845%7};
+var gIkho2846=function(a,b){return a+b*2846%7};
+var gckyx2847=function(a,b){return a+b*2847%7};
+var gNFyj2848=function(a,b){return a+b*2848%7};
+var garpm2849=function(a,b){return a+b*2849%7};
+var gcV2N2850=function(a,b){return a+b*2850%7};
+var gkCFJ2851=function(a,b){return a+b*2851%7};
+var gwXxJ2852=function(a,b){return a+b*2852%7};
+var gTWPo2853=function(a,b){return a+b*2853%7};
+var gIhv42854=function(a,b){return a+b*2854%7};
+var gB1XV2855=function(a,b){return a+b*2855%7};
+var gQOMh2856=function(a,b){return a+b*2856%7};
+var gEiRL2857=function(a,b){return a+b*2857%7};
+var gRSPJ2858=function(a,b){return a+b*2858%7};
+var gHcqf2859=function(a,b){return a+b*2859%7};
+var gxPL12860=function(a,b){return a+b*2860%7};
+var gLN1P2861=function(a,b){return a+b*2861%7};
+var gbJy62862=function(a,b){return a+b*2862%7};
+var gECF42863=function(a,b){return a+b*2863%7};
+var gAyC42864=function(a,b){return a+b*2864%7};
+var gPws92865=function(a,b){return a+b*2865%7};
+var g7XyS2866=function(a,b){return a+b*2866%7};
+var gfm7g2867=function(a,b){return a+b*2867%7};
+var gkEiA2868=function(a,b){return a+b*2868%7};
+var gOJJb2869=function(a,b){return a+b*2869%7};
+var gyVoK2870=function(a,b){return a+b*2870%7};
+var gasJf2871=function(a,b){return a+b*2871%7};
+var gmvEv2872=function(a,b){return a+b*2872%7};
+var gM9Vs2873=function(a,b){return a+b*2873%7};
+var gHzIJ2874=function(a,b){return a+b*2874%7};
+var gyvUH2875=function(a,b){return a+b*2875%7};
+var gJ0si2876=function(a,b){return a+b*2876%7};
+var gUQfY2877=function(a,b){return a+b*2877%7};
+var gtTa92878=function(a,b){return a+b*2878%7};
+var geYi52879=function(a,b){return a+b*2879%7};
+var gyxnd2880=function(a,b){return a+b*2880%7};
+var grbit2881=function(a,b){return a+b*2881%7};
+var gqaZ12882=function(a,b){return a+b*2882%7};
+var gC2YC2883=function(a,b){return a+b*2883%7};
+var gGIo92884=function(a,b){return a+b*2884%7};
+var g6Rlp2885=function(a,b){return a+b*2885%7};
+var gluE62886=function(a,b){return a+b*2886%7};
+var gizHX2887=function(a,b){return a+b*2887%7};
+var gegBa2888=function(a,b){return a+b*2888%7};
+var gzFsE2889=function(a,b){return a+b*2889%7};
+var gczJw2890=function(a,b){return a+b*2890%7};
+var gfG9H2891=function(a,b){return a+b*2891%7};
+var gnPKW2892=function(a,b){return a+b*2892%7};
+var gvPiS2893=function(a,b){return a+b*2893%7};
+var guzK02894=function(a,b){return a+b*2894%7};
+var gDL3r2895=function(a,b){return a+b*2895%7};
+var g8FEM2896=function(a,b){return a+b*2896%7};
+var gzjmz2897=function(a,b){return a+b*2897%7};
+var g1Lni2898=function(a,b){return a+b*2898%7};
+var gLutC2899=function(a,b){return a+b*2899%7};
+var g4BgE2900=function(a,b){return a+b*2900%7};
+var gySnY2901=function(a,b){return a+b*2901%7};
+var gxNmD2902=function(a,b){return a+b*2902%7};
+var gy0gq2903=function(a,b){return a+b*2903%7};
+var gMTbD2904=function(a,b){return a+b*2904%7};
+var gaRyY2905=function(a,b){return a+b*2905%7};
+var gvLbi2906=function(a,b){return a+b*2906%7};
+var gS35I2907=function(a,b){return a+b*2907%7};
+var gvHUA2908=function(a,b){return a+b*2908%7};
+var gkIxH2909=function(a,b){return a+b*2909%7};
+var g9MWS2910=function(a,b){return a+b*2910%7};
+var gtYtB2911=function(a,b){return a+b*2911%7};
+var gezjc2912=function(a,b){return a+b*2912%7};
+var gWPh02913=function(a,b){return a+b*2913%7};
+var gk0xT2914=function(a,b){return a+b*2914%7};
+var gKy6y2915=function(a,b){return a+b*2915%7};
+var gHYtP2916=function(a,b){return a+b*2916%7};
+var goySr2917=function(a,b){return a+b*2917%7};
+var g3Ok72918=function(a,b){return a+b*2918%7};
+var gEF2y2919=function(a,b){return a+b*2919%7};
+var gLFsY2920=function(a,b){return a+b*2920%7};
+var gr5YB2921=function(a,b){return a+b*2921%7};
+var gyQH52922=function(a,b){return a+b*2922%7};
+var gyxrL2923=function(a,b){return a+b*2923%7};
+var guHjs2924=function(a,b){return a+b*2924%7};
+var g1Zce2925=function(a,b){return a+b*2925%7};
+var gpef32926=function(a,b){return a+b*2926%7};
+var gwsdD2927=function(a,b){return a+b*2927%7};
+var gisqG2928=function(a,b){return a+b*2928%7};
+var gECh02929=function(a,b){return a+b*2929%7};
+var g5LuS2930=function(a,b){return a+b*2930%7};
+var guxf22931=function(a,b){return a+b*2931%7};
+var gX0id2932=function(a,b){return a+b*2932%7};
+var grm1F2933=function(a,b){return a+b*2933%7};
+var gBWRg2934=function(a,b){return a+b*2934%7};
+var g2f582935=function(a,b){return a+b*2935%7};
+var ghM5Z2936=function(a,b){return a+b*2936%7};
+var gSgm32937=function(a,b){return a+b*2937%7};
+var g7jYW2938=function(a,b){return a+b*2938%7};
+var gPJGy2939=function(a,b){return a+b*2939%7};
+var gkLih2940=function(a,b){return a+b*2940%7};
+var gHATg2941=function(a,b){return a+b*2941%7};
+var gyXb42942=function(a,b){return a+b*2942%7};
+var gHlfr2943=function(a,b){return a+b*2943%7};
+var gA3Ig2944=function(a,b){return a+b*2944%7};
+var g1kGN2945=function(a,b){return a+b*2945%7};
+var gXp6A2946=function(a,b){return a+b*2946%7};
+var gDRyc2947=function(a,b){return a+b*2947%7};
+var gUnBi2948=function(a,b){return a+b*2948%7};
+var g1tgG2949=function(a,b){return a+b*2949%7};
+var gHywx2950=function(a,b){return a+b*2950%7};
+var giUQC2951=function(a,b){return a+b*2951%7};
+var gIGsN2952=function(a,b){return a+b*2952%7};
+var gG7Ba2953=function(a,b){return a+b*2953%7};
+var gxhdC2954=function(a,b){return a+b*2954%7};
+var gjQyl2955=function(a,b){return a+b*2955%7};
+var gPd0w2956=function(a,b){return a+b*2956%7};
+var g0rVU2957=function(a,b){return a+b*2957%7};
+var gpo422958=function(a,b){return a+b*2958%7};
+var gSx9D2959=function(a,b){return a+b*2959%7};
+var g9pCV2960=function(a,b){return a+b*2960%7};
+var gAkyg2961=function(a,b){return a+b*2961%7};
+var g1HcX2962=function(a,b){return a+b*2962%7};
+var gxHq92963=function(a,b){return a+b*2963%7};
+var gkCKk2964=function(a,b){return a+b*2964%7};
+var gqfPt2965=function(a,b){return a+b*2965%7};
+var gqY4c2966=function(a,b){return a+b*2966%7};
+var gAQ722967=function(a,b){return a+b*2967%7};
+var gt0rA2968=function(a,b){return a+b*2968%7};
+var gZQMR2969=function(a,b){return a+b*2969%7};
+var gAPqy2970=function(a,b){return a+b*2970%7};
+var gYKyD2971=function(a,b){return a+b*2971%7};
+var gGZ0M2972=function(a,b){return a+b*2972%7};
+var glyxb2973=function(a,b){return a+b*2973%7};
+var gyH8E2974=function(a,b){return a+b*2974%7};
+var g5EvW2975=function(a,b){return a+b*2975%7};
+var gxDSJ2976=function(a,b){return a+b*2976%7};
+var gNsex2977=function(a,b){return a+b*2977%7};
+var gTbuZ2978=function(a,b){return a+b*2978%7};
+var gCofJ2979=function(a,b){return a+b*2979%7};
+var gBMKJ2980=function(a,b){return a+b*2980%7};
+var gy4GD2981=function(a,b){return a+b*2981%7};
+var g2ZsX2982=function(a,b){return a+b*2982%7};
+var gBweM2983=function(a,b){return a+b*2983%7};
+var gRxju2984=function(a,b){return a+b*2984%7};
+var g5HsS2985=function(a,b){return a+b*2985%7};
+var gyCh22986=function(a,b){return a+b*2986%7};
+var gMFAf2987=function(a,b){return a+b*2987%7};
+var gPVBm2988=function(a,b){return a+b*2988%7};
+var gFky72989=function(a,b){return a+b*2989%7};
+var ga8Uj2990=function(a,b){return a+b*2990%7};
+var gA2jJ2991=function(a,b){return a+b*2991%7};
+var ga1dw2992=function(a,b){return a+b*2992%7};
+var gUtz82993=function(a,b){return a+b*2993%7};
+var gbDhc2994=function(a,b){return a+b*2994%7};
+var gNOsA2995=function(a,b){return a+b*2995%7};
+var g0YC12996=function(a,b){return a+b*2996%7};
+var gUHz62997=function(a,b){return a+b*2997%7};
+var gHRIu2998=function(a,b){return a+b*2998%7};
+var guzLa2999=function(a,b){return a+b*2999%7};
+var gpUWK3000=function(a,b){return a+b*3000%7};
+var gZFeX3001=function(a,b){return a+b*3001%7};
+var gdZ5l3002=function(a,b){return a+b*3002%7};
+var gOMhz3003=function(a,b){return a+b*3003%7};
+var gd89k3004=function(a,b){return a+b*3004%7};
+var gbZF93005=function(a,b){return a+b*3005%7};
+var gPyQS3006=function(a,b){return a+b*3006%7};
+var gGNLz3007=function(a,b){return a+b*3007%7};
+var gLftx3008=function(a,b){return a+b*3008%7};
+var g2o183009=function(a,b){return a+b*3009%7};
+var gvGgv3010=function(a,b){return a+b*3010%7};
+var gqSs63011=function(a,b){return a+b*3011%7};
+var gjjIe3012=function(a,b){return a+b*3012%7};
+var gDKPQ3013=function(a,b){return a+b*3013%7};
+var gSGSK3014=function(a,b){return a+b*3014%7};
+var gB8363015=function(a,b){return a+b*3015%7};
+var g2eKN3016=function(a,b){return a+b*3016%7};
+var gpgJp3017=function(a,b){return a+b*3017%7};
+var gUDhF3018=function(a,b){return a+b*3018%7};
+var gC4uD3019=function(a,b){return a+b*3019%7};
+var gBVON3020=function(a,b){return a+b*3020%7};
+var gyx7d3021=function(a,b){return a+b*3021%7};
+var gOd1C3022=function(a,b){return a+b*3022%7};
+var gAWlv3023=function(a,b){return a+b*3023%7};
+var g3Tnd3024=function(a,b){return a+b*3024%7};
+var gPgry3025=function(a,b){return a+b*3025%7};
+var gUpMk3026=function(a,b){return a+b*3026%7};
+var ggLkG3027=function(a,b){return a+b*3027%7};
+var gxFWx3028=function(a,b){return a+b*3028%7};
+var gVpQm3029=function(a,b){return a+b*3029%7};
+var goed03030=function(a,b){return a+b*3030%7};
+var gVbNf3031=function(a,b){return a+b*3031%7};
+var gfzQQ3032=function(a,b){return a+b*3032%7};
+var gM1Dk3033=function(a,b){return a+b*3033%7};
+var g0UyT3034=function(a,b){return a+b*3034%7};
+var gvPfj3035=function(a,b){return a+b*3035%7};
+var g6mVf3036=function(a,b){return a+b*3036%7};
+var gopMZ3037=function(a,b){return a+b*3037%7};
+var gyjv33038=function(a,b){return a+b*3038%7};
+var gWFAT3039=function(a,b){return a+b*3039%7};
+var gKE5m3040=function(a,b){return a+b*3040%7};
+var gLHTr3041=function(a,b){return a+b*3041%7};
+var gui4H3042=function(a,b){return a+b*3042%7};
+var gIOSz3043=function(a,b){return a+b*3043%7};
+var gBAEi3044=function(a,b){return a+b*3044%7};
+var gXnZN3045=function(a,b){return a+b*3045%7};
+var gweWo3046=function(a,b){return a+b*3046%7};
+var gShbN3047=function(a,b){return a+b*3047%7};
+var g7L163048=function(a,b){return a+b*3048%7};
+var gMIWy3049=function(a,b){return a+b*3049%7};
+var gHOzs3050=function(a,b){return a+b*3050%7};
+var g77xc3051=function(a,b){return a+b*3051%7};
+var gZy5i3052=function(a,b){return a+b*3052%7};
+var gw5ta3053=function(a,b){return a+b*3053%7};
+var g9x4M3054=function(a,b){return a+b*3054%7};
+var gxK823055=function(a,b){return a+b*3055%7};
+var g2n653056=function(a,b){return a+b*3056%7};
+var gNtb23057=function(a,b){return a+b*3057%7};
+var gt5Jp3058=function(a,b){return a+b*3058%7};
+var gk7yx3059=function(a,b){return a+b*3059%7};
+var g2vhO3060=function(a,b){return a+b*3060%7};
+var g6NX13061=function(a,b){return a+b*3061%7};
+var gBtoZ3062=function(a,b){return a+b*3062%7};
+var gTvdT3063=function(a,b){return a+b*3063%7};
+var g05x13064=function(a,b){return a+b*3064%7};
+var g5Bfi3065=function(a,b){return a+b*3065%7};
+var gelKr3066=function(a,b){return a+b*3066%7};
+var gowNF3067=function(a,b){return a+b*3067%7};
+var g4sy43068=function(a,b){return a+b*3068%7};
+var gwlFD3069=function(a,b){return a+b*3069%7};
+var gyNxf3070=function(a,b){return a+b*3070%7};
+var gXSel3071=function(a,b){return a+b*3071%7};
+var g78nl3072=function(a,b){return a+b*3072%7};
+var gxtRh3073=function(a,b){return a+b*3073%7};
+var gwgWi3074=function(a,b){return a+b*3074%7};
+var g7GKr3075=function(a,b){return a+b*3075%7};
+var g8px23076=function(a,b){return a+b*3076%7};
+var gtgHI3077=function(a,b){return a+b*3077%7};
+var g5xd53078=function(a,b){return a+b*3078%7};
+var gsoxU3079=function(a,b){return a+b*3079%7};
+var gHdZF3080=function(a,b){return a+b*3080%7};
+var g1Sbb3081=function(a,b){return a+b*3081%7};
+var g1SNy3082=function(a,b){return a+b*3082%7};
+var gOziB3083=function(a,b){return a+b*3083%7};
+var gtTXR3084=function(a,b){return a+b*3084%7};
+var gYSSZ3085=function(a,b){return a+b*3085%7};
+var g5o4r3086=function(a,b){return a+b*3086%7};
+var gr7Pf3087=function(a,b){return a+b*3087%7};
+var g5lOy3088=function(a,b){return a+b*3088%7};
+var gK6T63089=function(a,b){return a+b*3089%7};
+var gCwNO3090=function(a,b){return a+b*3090%7};
+var gCYFN3091=function(a,b){return a+b*3091%7};
+var g2ZgD3092=function(a,b){return a+b*3092%7};
+var gggTs3093=function(a,b){return a+b*3093%7};
+var gFq5C3094=function(a,b){return a+b*3094%7};
+var gpgN03095=function(a,b){return a+b*3095%7};
+var gyBLt3096=function(a,b){return a+b*3096%7};
+var gqZ5x3097=function(a,b){return a+b*3097%7};
+var gUJON3098=function(a,b){return a+b*3098%7};
+var gbMdh3099=function(a,b){return a+b*3099%7};
+var gIynj3100=function(a,b){return a+b*3100%7};
+var g2WlH3101=function(a,b){return a+b*3101%7};
+var gTOCo3102=function(a,b){return a+b*3102%7};
+var gZVS23103=function(a,b){return a+b*3103%7};
+var gzCxx3104=function(a,b){return a+b*3104%7};
+var gNq033105=function(a,b){return a+b*3105%7};
+var gAtNE3106=function(a,b){return a+b*3106%7};
+var gnNcy3107=function(a,b){return a+b*3107%7};
+var gxGkq3108=function(a,b){return a+b*3108%7};
+var gxEEm3109=function(a,b){return a+b*3109%7};
+var goync3110=function(a,b){return a+b*3110%7};
+var gtd4N3111=function(a,b){return a+b*3111%7};
+var guBVr3112=function(a,b){return a+b*3112%7};
+var g9XDY3113=function(a,b){return a+b*3113%7};
+var gt6zf3114=function(a,b){return a+b*3114%7};
+var gWJPo3115=function(a,b){return a+b*3115%7};
+var gJYna3116=function(a,b){return a+b*3116%7};
+var g8SiV3117=function(a,b){return a+b*3117%7};
+var g7gVb3118=function(a,b){return a+b*3118%7};
+var gGnlj3119=function(a,b){return a+b*3119%7};
+var gBQ013120=function(a,b){return a+b*3120%7};
+var gen6o3121=function(a,b){return a+b*3121%7};
+var gHXJz3122=function(a,b){return a+b*3122%7};
+var gnsTx3123=function(a,b){return a+b*3123%7};
+var gyXIy3124=function(a,b){return a+b*3124%7};
+var gROS63125=function(a,b){return a+b*3125%7};
+var gHQEq3126=function(a,b){return a+b*3126%7};
+var g6fvq3127=function(a,b){return a+b*3127%7};
+var gjEPv3128=function(a,b){return a+b*3128%7};
+var gzRkG3129=function(a,b){return a+b*3129%7};
+var giahK3130=function(a,b){return a+b*3130%7};
+var g5cKI3131=function(a,b){return a+b*3131%7};
+var g5LBf3132=function(a,b){return a+b*3132%7};
+var gdV4x3133=function(a,b){return a+b*3133%7};
+var ggby23134=function(a,b){return a+b*3134%7};
+var gcpqx3135=function(a,b){return a+b*3135%7};
+var gTs723136=function(a,b){return a+b*3136%7};
+var gEmxv3137=function(a,b){return a+b*3137%7};
+var gZMB23138=function(a,b){return a+b*3138%7};
+var gjnWM3139=function(a,b){return a+b*3139%7};
+var gDuJ03140=function(a,b){return a+b*3140%7};
+var gppF53141=function(a,b){return a+b*3141%7};
+var g3Eag3142=function(a,b){return a+b*3142%7};
+var gw1Ey3143=function(a,b){return a+b*3143%7};
+var gHrdf3144=function(a,b){return a+b*3144%7};
+var gqtmd3145=function(a,b){return a+b*3145%7};
+var gwwQk3146=function(a,b){return a+b*3146%7};
+var gxOIw3147=function(a,b){return a+b*3147%7};
+var gxwJj3148=function(a,b){return a+b*3148%7};
+var gJ1uf3149=function(a,b){return a+b*3149%7};
+var g9MaW3150=function(a,b){return a+b*3150%7};
+var gNgyt3151=function(a,b){return a+b*3151%7};
+var gy7Pd3152=function(a,b){return a+b*3152%7};
+var gPYjN3153=function(a,b){return a+b*3153%7};
+var g0Ypa3154=function(a,b){return a+b*3154%7};
+var gHrqY3155=function(a,b){return a+b*3155%7};
+var gJTiy3156=function(a,b){return a+b*3156%7};
+var gSFF03157=function(a,b){return a+b*3157%7};
+var g7A8P3158=function(a,b){return a+b*3158%7};
+var gIwAA3159=function(a,b){return a+b*3159%7};
+var g5Vy23160=function(a,b){return a+b*3160%7};
+var gs4ce3161=function(a,b){return a+b*3161%7};
+var gIJHU3162=function(a,b){return a+b*3162%7};
+var gtohy3163=function(a,b){return a+b*3163%7};
+var ggyBx3164=function(a,b){return a+b*3164%7};
+var g3CT13165=function(a,b){return a+b*3165%7};
+var gqU5o3166=function(a,b){return a+b*3166%7};
+var gKwNc3167=function(a,b){return a+b*3167%7};
+var gU8iu3168=function(a,b){return a+b*3168%7};
+var gxnGy3169=function(a,b){return a+b*3169%7};
+var gXAwi3170=function(a,b){return a+b*3170%7};
+var gzRyE3171=function(a,b){return a+b*3171%7};
+var gmbog3172=function(a,b){return a+b*3172%7};
+var gCn833173=function(a,b){return a+b*3173%7};
+var gYCqR3174=function(a,b){return a+b*3174%7};
+var gQDaa3175=function(a,b){return a+b*3175%7};
+var g4VTT3176=function(a,b){return a+b*3176%7};
+var gtT173177=function(a,b){return a+b*3177%7};
+var gjBc33178=function(a,b){return a+b*3178%7};
+var gyb0l3179=function(a,b){return a+b*3179%7};
+var gGQ0a3180=function(a,b){return a+b*3180%7};
+var gN3YL3181=function(a,b){return a+b*3181%7};
+var goxm23182=function(a,b){return a+b*3182%7};
+var gTZAw3183=function(a,b){return a+b*3183%7};
+var gmEl13184=function(a,b){return a+b*3184%7};
+var gyKLG3185=function(a,b){return a+b*3185%7};
+var gy0sc3186=function(a,b){return a+b*3186%7};
+var gM0lV3187=function(a,b){return a+b*3187%7};
+var giycE3188=function(a,b){return a+b*3188%7};
+var gYTuA3189=function(a,b){return a+b*3189%7};
+var gYP4w3190=function(a,b){return a+b*3190%7};
+var g7Mg53191=function(a,b){return a+b*3191%7};
+var gyoVd3192=function(a,b){return a+b*3192%7};
+var gzWxD3193=function(a,b){return a+b*3193%7};
+var gmhe73194=function(a,b){return a+b*3194%7};
+var gK10E3195=function(a,b){return a+b*3195%7};
+var gyOoC3196=function(a,b){return a+b*3196%7};
+var g90U23197=function(a,b){return a+b*3197%7};
+var ghv4y3198=function(a,b){return a+b*3198%7};
+var gzwuq3199=function(a,b){return a+b*3199%7};
+var g8vwW3200=function(a,b){return a+b*3200%7};
+var gU1p23201=function(a,b){return a+b*3201%7};
+var gbPu73202=function(a,b){return a+b*3202%7};
+var gUbl83203=function(a,b){return a+b*3203%7};
+var gbQus3204=function(a,b){return a+b*3204%7};
+var g1Q5Q3205=function(a,b){return a+b*3205%7};
+var gLlqT3206=function(a,b){return a+b*3206%7};
+var gEDGk3207=function(a,b){return a+b*3207%7};
+var gyXed3208=function(a,b){return a+b*3208%7};
+var gInGb3209=function(a,b){return a+b*3209%7};
+var gWKW23210=function(a,b){return a+b*3210%7};
+var gIKM13211=function(a,b){return a+b*3211%7};
+var gx5UE3212=function(a,b){return a+b*3212%7};
+var gvPEH3213=function(a,b){return a+b*3213%7};
+var gsYUp3214=function(a,b){return a+b*3214%7};
+var gP81W3215=function(a,b){return a+b*3215%7};
+var g43iy3216=function(a,b){return a+b*3216%7};
+var g7LHL3217=function(a,b){return a+b*3217%7};
+var gy7x73218=function(a,b){return a+b*3218%7};
+var gHPXv3219=function(a,b){return a+b*3219%7};
+var gLXXq3220=function(a,b){return a+b*3220%7};
+var g1gnI3221=function(a,b){return a+b*3221%7};
+var gjFNv3222=function(a,b){return a+b*3222%7};
+var gEyJh3223=function(a,b){return a+b*3223%7};
+var g0i9B3224=function(a,b){return a+b*3224%7};
+var gFShr3225=function(a,b){return a+b*3225%7};
+var gPtQb3226=function(a,b){return a+b*3226%7};
+var gLgru3227=function(a,b){return a+b*3227%7};
+var g2UoW3228=function(a,b){return a+b*3228%7};
+var gHW0N3229=function(a,b){return a+b*3229%7};
+var gt6oK3230=function(a,b){return a+b*3230%7};
+var g3XPd3231=function(a,b){return a+b*3231%7};
+var gVDWR3232=function(a,b){return a+b*3232%7};
+var giBLX3233=function(a,b){return a+b*3233%7};
+var g2xOf3234=function(a,b){return a+b*3234%7};
+var gtUvf3235=function(a,b){return a+b*3235%7};
+var gjAQ43236=function(a,b){return a+b*3236%7};
+var gOyaZ3237=function(a,b){return a+b*3237%7};
+var g0s3h3238=function(a,b){return a+b*3238%7};
+var g474y3239=function(a,b){return a+b*3239%7};
+var gyYnA3240=function(a,b){return a+b*3240%7};
+var ggnEm3241=function(a,b){return a+b*3241%7};
+var giRxe3242=function(a,b){return a+b*3242%7};
+var gw7vN3243=function(a,b){return a+b*3243%7};
+var gfxCT3244=function(a,b){return a+b*3244%7};
+var grVZO3245=function(a,b){return a+b*3245%7};
+var gmGEj3246=function(a,b){return a+b*3246%7};
+var gxZGi3247=function(a,b){return a+b*3247%7};
+var gFSYE3248=function(a,b){return a+b*3248%7};
+var grAzh3249=function(a,b){return a+b*3249%7};
+var gF3D33250=function(a,b){return a+b*3250%7};
+var gjwlC3251=function(a,b){return a+b*3251%7};
+var geNMD3252=function(a,b){return a+b*3252%7};
+var g8BhA3253=function(a,b){return a+b*3253%7};
+var gy9Ou3254=function(a,b){return a+b*3254%7};
+var gv0yg3255=function(a,b){return a+b*3255%7};
+var gOmfy3256=function(a,b){return a+b*3256%7};
+var gQoef3257=function(a,b){return a+b*3257%7};
+var gS1r53258=function(a,b){return a+b*3258%7};
+var g9W7w3259=function(a,b){return a+b*3259%7};
+var gBaSu3260=function(a,b){return a+b*3260%7};
+var guyzq3261=function(a,b){return a+b*3261%7};
+var gkrUV3262=function(a,b){return a+b*3262%7};
+var gQsID3263=function(a,b){return a+b*3263%7};
+var gijtQ3264=function(a,b){return a+b*3264%7};
+var glpjk3265=function(a,b){return a+b*3265%7};
+var gnzi93266=function(a,b){return a+b*3266%7};
+var g0cqQ3267=function(a,b){return a+b*3267%7};
+var gzXdS3268=function(a,b){return a+b*3268%7};
+var gmPq33269=function(a,b){return a+b*3269%7};
+var gxf913270=function(a,b){return a+b*3270%7};
+var gqxGu3271=function(a,b){return a+b*3271%7};
+var gmJGD3272=function(a,b){return a+b*3272%7};
+var ggzMF3273=function(a,b){return a+b*3273%7};
+var g3G8s3274=function(a,b){return a+b*3274%7};
+var gMieY3275=function(a,b){return a+b*3275%7};
+var guOC73276=function(a,b){return a+b*3276%7};
+var glmVO3277=function(a,b){return a+b*3277%7};
+var gUTkP3278=function(a,b){return a+b*3278%7};
+var gLGwz3279=function(a,b){return a+b*3279%7};
+var gQ2PG3280=function(a,b){return a+b*3280%7};
+var gqiWu3281=function(a,b){return a+b*3281%7};
+var g4nyq3282=function(a,b){return a+b*3282%7};
+var gUWN13283=function(a,b){return a+b*3283%7};
+var gawez3284=function(a,b){return a+b*3284%7};
+var gPz133285=function(a,b){return a+b*3285%7};
+var gO5wm3286=function(a,b){return a+b*3286%7};
+var gkfK33287=function(a,b){return a+b*3287%7};
+var g8qnZ3288=function(a,b){return a+b*3288%7};
+var gZ33z3289=function(a,b){return a+b*3289%7};
+var gFTxR3290=function(a,b){return a+b*3290%7};
+var gx3VE3291=function(a,b){return a+b*3291%7};
+var gI4II3292=function(a,b){return a+b*3292%7};
+var gbj0z3293=function(a,b){return a+b*3293%7};
+var giwbJ3294=function(a,b){return a+b*3294%7};
+var g2qfP3295=function(a,b){return a+b*3295%7};
+var gTx9A3296=function(a,b){return a+b*3296%7};
+var gxYLv3297=function(a,b){return a+b*3297%7};
+var g2CnZ3298=function(a,b){return a+b*3298%7};
+var gI5Ib3299=function(a,b){return a+b*3299%7};
+var g5Yzu3300=function(a,b){return a+b*3300%7};
+var gqplS3301=function(a,b){return a+b*3301%7};
+var gbw1m3302=function(a,b){return a+b*3302%7};
+var gyFSR3303=function(a,b){return a+b*3303%7};
+var gRSoG3304=function(a,b){return a+b*3304%7};
+var ghEgd3305=function(a,b){return a+b*3305%7};
+var gBUhm3306=function(a,b){return a+b*3306%7};
+var gnB9R3307=function(a,b){return a+b*3307%7};
+var gxadN3308=function(a,b){return a+b*3308%7};
+var gYxrp3309=function(a,b){return a+b*3309%7};
+var gRo5i3310=function(a,b){return a+b*3310%7};
+var gdIP73311=function(a,b){return a+b*3311%7};
+var gggJE3312=function(a,b){return a+b*3312%7};
+var gyFFd3313=function(a,b){return a+b*3313%7};
+var ggOiv3314=function(a,b){return a+b*3314%7};
+var gkwo93315=function(a,b){return a+b*3315%7};
+var gYjWv3316=function(a,b){return a+b*3316%7};
+var ghIQb3317=function(a,b){return a+b*3317%7};
+var gWG9x3318=function(a,b){return a+b*3318%7};
+var grgtm3319=function(a,b){return a+b*3319%7};
+var gTQdi3320=function(a,b){return a+b*3320%7};
+var g30qx3321=function(a,b){return a+b*3321%7};
+var gdJWi3322=function(a,b){return a+b*3322%7};
+var g14vX3323=function(a,b){return a+b*3323%7};
+var gzpCu3324=function(a,b){return a+b*3324%7};
+var gPtdW3325=function(a,b){return a+b*3325%7};
+var gZOFQ3326=function(a,b){return a+b*3326%7};
+var g4gWp3327=function(a,b){return a+b*3327%7};
+var gRq6E3328=function(a,b){return a+b*3328%7};
+var gy8yx3329=function(a,b){return a+b*3329%7};
+var gmydb3330=function(a,b){return a+b*3330%7};
+var gRk4G3331=function(a,b){return a+b*3331%7};
+var geFAc3332=function(a,b){return a+b*3332%7};
+var g0zM63333=function(a,b){return a+b*3333%7};
+var gw3l83334=function(a,b){return a+b*3334%7};
+var giykl3335=function(a,b){return a+b*3335%7};
+var gUUwa3336=function(a,b){return a+b*3336%7};
+var gqxa33337=function(a,b){return a+b*3337%7};
+var gB7KW3338=function(a,b){return a+b*3338%7};
+var gFcST3339=function(a,b){return a+b*3339%7};
+var gxQiT3340=function(a,b){return a+b*3340%7};
+var g6Y7e3341=function(a,b){return a+b*3341%7};
+var geTeB3342=function(a,b){return a+b*3342%7};
+var gGVsL3343=function(a,b){return a+b*3343%7};
+var gRHPm3344=function(a,b){return a+b*3344%7};
+var gSBKf3345=function(a,b){return a+b*3345%7};
+var gSURC3346=function(a,b){return a+b*3346%7};
+var gyzSh3347=function(a,b){return a+b*3347%7};
+var g5HLc3348=function(a,b){return a+b*3348%7};
+var gl2bN3349=function(a,b){return a+b*3349%7};
+var gZLWB3350=function(a,b){return a+b*3350%7};
+var gbYKx3351=function(a,b){return a+b*3351%7};
+var gfLu83352=function(a,b){return a+b*3352%7};
+var g3Txj3353=function(a,b){return a+b*3353%7};
+var g0e2X3354=function(a,b){return a+b*3354%7};
+var gKcBh3355=function(a,b){return a+b*3355%7};
+var gIAOg3356=function(a,b){return a+b*3356%7};
+var gIKdD3357=function(a,b){return a+b*3357%7};
+var gLgVX3358=function(a,b){return a+b*3358%7};
+var g4s4A3359=function(a,b){return a+b*3359%7};
+var gYitj3360=function(a,b){return a+b*3360%7};
+var gbCOI3361=function(a,b){return a+b*3361%7};
+var gEmwu3362=function(a,b){return a+b*3362%7};
+var gwyg53363=function(a,b){return a+b*3363%7};
+var gNfVI3364=function(a,b){return a+b*3364%7};
+var gSWTc3365=function(a,b){return a+b*3365%7};
+var gXt2E3366=function(a,b){return a+b*3366%7};
+var grn9T3367=function(a,b){return a+b*3367%7};
+var gBCeA3368=function(a,b){return a+b*3368%7};
+var gd67G3369=function(a,b){return a+b*3369%7};
+var g8Pwt3370=function(a,b){return a+b*3370%7};
+var gQVY83371=function(a,b){return a+b*3371%7};
+var g6x8U3372=function(a,b){return a+b*3372%7};
+var gmvUj3373=function(a,b){return a+b*3373%7};
+var gY87j3374=function(a,b){return a+b*3374%7};
+var gNWpg3375=function(a,b){return a+b*3375%7};
+var g3tR83376=function(a,b){return a+b*3376%7};
+var gHOYe3377=function(a,b){return a+b*3377%7};
+var g4E3n3378=function(a,b){return a+b*3378%7};
+var ghB9B3379=function(a,b){return a+b*3379%7};
+var gBZpz3380=function(a,b){return a+b*3380%7};
+var glRId3381=function(a,b){return a+b*3381%7};
+var gZcZh3382=function(a,b){return a+b*3382%7};
+var gvHrQ3383=function(a,b){return a+b*3383%7};
+var gNrOQ3384=function(a,b){return a+b*3384%7};
+var gvx9x3385=function(a,b){return a+b*3385%7};
+var gsaJA3386=function(a,b){return a+b*3386%7};
+var ggqyD3387=function(a,b){return a+b*3387%7};
+var g3iRS3388=function(a,b){return a+b*3388%7};
+var gAqI93389=function(a,b){return a+b*3389%7};
+var gFVsr3390=function(a,b){return a+b*3390%7};
+var goU0h3391=function(a,b){return a+b*3391%7};
+var gQrxz3392=function(a,b){return a+b*3392%7};
+var gw2wy3393=function(a,b){return a+b*3393%7};
+var gfUam3394=function(a,b){return a+b*3394%7};
+var gz4Nn3395=function(a,b){return a+b*3395%7};
+var giTcb3396=function(a,b){return a+b*3396%7};
+var gnVDs3397=function(a,b){return a+b*3397%7};
+var gPthq3398=function(a,b){return a+b*3398%7};
+var gkiUX3399=function(a,b){return a+b*3399%7};
+var gHsuy3400=function(a,b){return a+b*3400%7};
+var gyegy3401=function(a,b){return a+b*3401%7};
+var ghC643402=function(a,b){return a+b*3402%7};
+var gWogE3403=function(a,b){return a+b*3403%7};
+var gvtpV3404=function(a,b){return a+b*3404%7};
+var gQ0xs3405=function(a,b){return a+b*3405%7};
+var gkiXr3406=function(a,b){return a+b*3406%7};
+var gbCJt3407=function(a,b){return a+b*3407%7};
+var gvVv23408=function(a,b){return a+b*3408%7};
+var gYwIn3409=function(a,b){return a+b*3409%7};
+var gIjwi3410=function(a,b){return a+b*3410%7};
+var gKtRa3411=function(a,b){return a+b*3411%7};
+var goFGU3412=function(a,b){return a+b*3412%7};
+var gSnDC3413=function(a,b){return a+b*3413%7};
+var gyKs73414=function(a,b){return a+b*3414%7};
+var g1EZ03415=function(a,b){return a+b*3415%7};
+var gD3v23416=function(a,b){return a+b*3416%7};
+var gbPO33417=function(a,b){return a+b*3417%7};
+var g2Dg53418=function(a,b){return a+b*3418%7};
+var gpiCd3419=function(a,b){return a+b*3419%7};
+var gGArf3420=function(a,b){return a+b*3420%7};
+var gm6z03421=function(a,b){return a+b*3421%7};
+var gstLP3422=function(a,b){return a+b*3422%7};
+var gZxAx3423=function(a,b){return a+b*3423%7};
+var gplXK3424=function(a,b){return a+b*3424%7};
+var gqSS43425=function(a,b){return a+b*3425%7};
+var gpAKF3426=function(a,b){return a+b*3426%7};
+var gZoVt3427=function(a,b){return a+b*3427%7};
+var gGCFO3428=function(a,b){return a+b*3428%7};
+var gWtJ43429=function(a,b){return a+b*3429%7};
+var gyyxN3430=function(a,b){return a+b*3430%7};
+var gueAU3431=function(a,b){return a+b*3431%7};
+var gwxOf3432=function(a,b){return a+b*3432%7};
+var gGBUR3433=function(a,b){return a+b*3433%7};
+var gwhT63434=function(a,b){return a+b*3434%7};
+var gCuy03435=function(a,b){return a+b*3435%7};
+var gXzmP3436=function(a,b){return a+b*3436%7};
+var gwixo3437=function(a,b){return a+b*3437%7};
+var gioN53438=function(a,b){return a+b*3438%7};
+var gBhbK3439=function(a,b){return a+b*3439%7};
+var gzvrx3440=function(a,b){return a+b*3440%7};
+var gOzn53441=function(a,b){return a+b*3441%7};
+var gjX7L3442=function(a,b){return a+b*3442%7};
+var gjZcu3443=function(a,b){return a+b*3443%7};
+var g51wy3444=function(a,b){return a+b*3444%7};
+var gGyFY3445=function(a,b){return a+b*3445%7};
+var gDVuD3446=function(a,b){return a+b*3446%7};
+var g7Coz3447=function(a,b){return a+b*3447%7};
+var gDsWF3448=function(a,b){return a+b*3448%7};
+var gP0py3449=function(a,b){return a+b*3449%7};
+var gJRqR3450=function(a,b){return a+b*3450%7};
+var gsgqZ3451=function(a,b){return a+b*3451%7};
+var gVRoQ3452=function(a,b){return a+b*3452%7};
+var gxeDP3453=function(a,b){return a+b*3453%7};
+var gJ1fr3454=function(a,b){return a+b*3454%7};
+var gAQsx3455=function(a,b){return a+b*3455%7};
+var gMkCU3456=function(a,b){return a+b*3456%7};
+var g7SH73457=function(a,b){return a+b*3457%7};
+var gggjK3458=function(a,b){return a+b*3458%7};
+var g7ixC3459=function(a,b){return a+b*3459%7};
+var gay9p3460=function(a,b){return a+b*3460%7};
+var goNty3461=function(a,b){return a+b*3461%7};
+var gbO2g3462=function(a,b){return a+b*3462%7};
+var g7xXq3463=function(a,b){return a+b*3463%7};
+var grRqj3464=function(a,b){return a+b*3464%7};
+var gvRt03465=function(a,b){return a+b*3465%7};
+var gvUtq3466=function(a,b){return a+b*3466%7};
+var gBC4y3467=function(a,b){return a+b*3467%7};
+var gIYnH3468=function(a,b){return a+b*3468%7};
+var g6XOI3469=function(a,b){return a+b*3469%7};
+var g3aAN3470=function(a,b){return a+b*3470%7};
+var g1O9F3471=function(a,b){return a+b*3471%7};
+var gJe4X3472=function(a,b){return a+b*3472%7};
+var gUo7P3473=function(a,b){return a+b*3473%7};
+var gCJE93474=function(a,b){return a+b*3474%7};
+var g2iT83475=function(a,b){return a+b*3475%7};
+var gzqWR3476=function(a,b){return a+b*3476%7};
+var gIRPF3477=function(a,b){return a+b*3477%7};
+var g7jm43478=function(a,b){return a+b*3478%7};
+var gM9yD3479=function(a,b){return a+b*3479%7};
+var gvSxi3480=function(a,b){return a+b*3480%7};
+var gnM4f3481=function(a,b){return a+b*3481%7};
+var gzKUc3482=function(a,b){return a+b*3482%7};
+var gwV6r3483=function(a,b){return a+b*3483%7};
+var gDx1g3484=function(a,b){return a+b*3484%7};
+var gTQBk3485=function(a,b){return a+b*3485%7};
+var gvwFP3486=function(a,b){return a+b*3486%7};
+var gyrKz3487=function(a,b){return a+b*3487%7};
+var gr5zE3488=function(a,b){return a+b*3488%7};
+var goJ0d3489=function(a,b){return a+b*3489%7};
+var g7b2U3490=function(a,b){return a+b*3490%7};
+var gc57m3491=function(a,b){return a+b*3491%7};
+var gNTez3492=function(a,b){return a+b*3492%7};
+var gAYVg3493=function(a,b){return a+b*3493%7};
+var gCWaD3494=function(a,b){return a+b*3494%7};
+var gxHmq3495=function(a,b){return a+b*3495%7};
+var gJiIb3496=function(a,b){return a+b*3496%7};
+var gYyB83497=function(a,b){return a+b*3497%7};
+var gzvln3498=function(a,b){return a+b*3498%7};
+var gTiFT3499=function(a,b){return a+b*3499%7};
+var gdFAH3500=function(a,b){return a+b*3500%7};
+var gIlsg3501=function(a,b){return a+b*3501%7};
+var gE3nu3502=function(a,b){return a+b*3502%7};
+var gVamk3503=function(a,b){return a+b*3503%7};
+var gAXw93504=function(a,b){return a+b*3504%7};
+var gFJYQ3505=function(a,b){return a+b*3505%7};
+var gpVHH3506=function(a,b){return a+b*3506%7};
+var gA06L3507=function(a,b){return a+b*3507%7};
+var gfZuy3508=function(a,b){return a+b*3508%7};
+var g9nWH3509=function(a,b){return a+b*3509%7};
+var gVVQP3510=function(a,b){return a+b*3510%7};
+var gFK5h3511=function(a,b){return a+b*3511%7};
+var gjzBO3512=function(a,b){return a+b*3512%7};
+var gnvhG3513=function(a,b){return a+b*3513%7};
+var goqxB3514=function(a,b){return a+b*3514%7};
+var gxQUE3515=function(a,b){return a+b*3515%7};
+var gF1HD3516=function(a,b){return a+b*3516%7};
+var gmC073517=function(a,b){return a+b*3517%7};
+var g7n2C3518=function(a,b){return a+b*3518%7};
+var gRiD73519=function(a,b){return a+b*3519%7};
+var gggMj3520=function(a,b){return a+b*3520%7};
+var gVTSh3521=function(a,b){return a+b*3521%7};
+var geDWB3522=function(a,b){return a+b*3522%7};
+var g08wh3523=function(a,b){return a+b*3523%7};
+var g1pVB3524=function(a,b){return a+b*3524%7};
+var gBKa03525=function(a,b){return a+b*3525%7};
+var gM9An3526=function(a,b){return a+b*3526%7};
+var gZWCc3527=function(a,b){return a+b*3527%7};
+var gs5Jk3528=function(a,b){return a+b*3528%7};
+var gQJXf3529=function(a,b){return a+b*3529%7};
+var ga5uW3530=function(a,b){return a+b*3530%7};
+var gAzvR3531=function(a,b){return a+b*3531%7};
+var g2JmL3532=function(a,b){return a+b*3532%7};
+var gDCcy3533=function(a,b){return a+b*3533%7};
+var gWVHf3534=function(a,b){return a+b*3534%7};
+var guII63535=function(a,b){return a+b*3535%7};
+var gzu4S3536=function(a,b){return a+b*3536%7};
+var ggGxb3537=function(a,b){return a+b*3537%7};
+var g6zL73538=function(a,b){return a+b*3538%7};
+var gJPpY3539=function(a,b){return a+b*3539%7};
+var g1MB33540=function(a,b){return a+b*3540%7};
+var g2TnJ3541=function(a,b){return a+b*3541%7};
+var gzs6Z3542=function(a,b){return a+b*3542%7};
+var gMJ4Z3543=function(a,b){return a+b*3543%7};
+var gKQMY3544=function(a,b){return a+b*3544%7};
+var g7dIU3545=function(a,b){return a+b*3545%7};
+var gkxt03546=function(a,b){return a+b*3546%7};
+var gSQwS3547=function(a,b){return a+b*3547%7};
+var ger1a3548=function(a,b){return a+b*3548%7};
+var gPg3V3549=function(a,b){return a+b*3549%7};
+var gBZCx3550=function(a,b){return a+b*3550%7};
+var gO3y93551=function(a,b){return a+b*3551%7};
+var gQ5Eh3552=function(a,b){return a+b*3552%7};
+var gfAvc3553=function(a,b){return a+b*3553%7};
+var g052z3554=function(a,b){return a+b*3554%7};
+var gDeaD3555=function(a,b){return a+b*3555%7};
+var gJ6VL3556=function(a,b){return a+b*3556%7};
+var g0zbH3557=function(a,b){return a+b*3557%7};
+var gPd9B3558=function(a,b){return a+b*3558%7};
+var gZB683559=function(a,b){return a+b*3559%7};
+var gYY2K3560=function(a,b){return a+b*3560%7};
+var gYxLw3561=function(a,b){return a+b*3561%7};
+var giaTM3562=function(a,b){return a+b*3562%7};
+var gQcG23563=function(a,b){return a+b*3563%7};
+var gCFur3564=function(a,b){return a+b*3564%7};
+var gGczy3565=function(a,b){return a+b*3565%7};
+var gpMt73566=function(a,b){return a+b*3566%7};
+var gunL83567=function(a,b){return a+b*3567%7};
+var g5Jjv3568=function(a,b){return a+b*3568%7};
+var gdnTy3569=function(a,b){return a+b*3569%7};
+var goM8q3570=function(a,b){return a+b*3570%7};
+var grp2i3571=function(a,b){return a+b*3571%7};
+var gjtLw3572=function(a,b){return a+b*3572%7};
+var gOMeE3573=function(a,b){return a+b*3573%7};
+var gOI893574=function(a,b){return a+b*3574%7};
+var guwp03575=function(a,b){return a+b*3575%7};
+var gTflB3576=function(a,b){return a+b*3576%7};
+var gf1M33577=function(a,b){return a+b*3577%7};
+var gl8va3578=function(a,b){return a+b*3578%7};
+var gOnUE3579=function(a,b){return a+b*3579%7};
+var gtIqL3580=function(a,b){return a+b*3580%7};
+var gByxD3581=function(a,b){return a+b*3581%7};
+var gorhM3582=function(a,b){return a+b*3582%7};
+var gLq3M3583=function(a,b){return a+b*3583%7};
+var giuNH3584=function(a,b){return a+b*3584%7};
+var g227s3585=function(a,b){return a+b*3585%7};
+var gsFuh3586=function(a,b){return a+b*3586%7};
+var g6Wot3587=function(a,b){return a+b*3587%7};
+var gk2C83588=function(a,b){return a+b*3588%7};
+var gZ6Jh3589=function(a,b){return a+b*3589%7};
+var grkwq3590=function(a,b){return a+b*3590%7};
+var gg0p53591=function(a,b){return a+b*3591%7};
+var gfhsI3592=function(a,b){return a+b*3592%7};
+var gqGBf3593=function(a,b){return a+b*3593%7};
+var gFCER3594=function(a,b){return a+b*3594%7};
+var gHDLx3595=function(a,b){return a+b*3595%7};
+var gnTqW3596=function(a,b){return a+b*3596%7};
+var gxyjb3597=function(a,b){return a+b*3597%7};
+var gifRQ3598=function(a,b){return a+b*3598%7};
+var g1wa13599=function(a,b){return a+b*3599%7};
+var gkx9p3600=function(a,b){return a+b*3600%7};
+var gdRGe3601=function(a,b){return a+b*3601%7};
+var gSPpw3602=function(a,b){return a+b*3602%7};
+var gHcL13603=function(a,b){return a+b*3603%7};
+var gTL1X3604=function(a,b){return a+b*3604%7};
+var g00sg3605=function(a,b){return a+b*3605%7};
+var g6GPh3606=function(a,b){return a+b*3606%7};
+var gJ9ID3607=function(a,b){return a+b*3607%7};
+var gAaiz3608=function(a,b){return a+b*3608%7};
+var gy1O83609=function(a,b){return a+b*3609%7};
+var g0Xn13610=function(a,b){return a+b*3610%7};
+var gO17g3611=function(a,b){return a+b*3611%7};
+var gXdSj3612=function(a,b){return a+b*3612%7};
+var g4x743613=function(a,b){return a+b*3613%7};
+var gNzML3614=function(a,b){return a+b*3614%7};
+var giGXB3615=function(a,b){return a+b*3615%7};
+var ghtaq3616=function(a,b){return a+b*3616%7};
+var gmJBx3617=function(a,b){return a+b*3617%7};
+var gQ9pj3618=function(a,b){return a+b*3618%7};
+var gnJms3619=function(a,b){return a+b*3619%7};
+var gvOnb3620=function(a,b){return a+b*3620%7};
+var gLCiR3621=function(a,b){return a+b*3621%7};
+var gish23622=function(a,b){return a+b*3622%7};
+var gyS0J3623=function(a,b){return a+b*3623%7};
+var gJvhd3624=function(a,b){return a+b*3624%7};
+var gwzOV3625=function(a,b){return a+b*3625%7};
+var giDia3626=function(a,b){return a+b*3626%7};
+var gfO7L3627=function(a,b){return a+b*3627%7};
+var gVRJv3628=function(a,b){return a+b*3628%7};
+var gPDuY3629=function(a,b){return a+b*3629%7};
+var g5Olo3630=function(a,b){return a+b*3630%7};
+var gy6TU3631=function(a,b){return a+b*3631%7};
+var g06UY3632=function(a,b){return a+b*3632%7};
+var gNDGb3633=function(a,b){return a+b*3633%7};
+var gBIXP3634=function(a,b){return a+b*3634%7};
+var g1bQW3635=function(a,b){return a+b*3635%7};
+var gnWMP3636=function(a,b){return a+b*3636%7};
+var gy7cx3637=function(a,b){return a+b*3637%7};
+var gd0Fo3638=function(a,b){return a+b*3638%7};
+var gXJv13639=function(a,b){return a+b*3639%7};
+var gHeyC3640=function(a,b){return a+b*3640%7};
+var gryEc3641=function(a,b){return a+b*3641%7};
+var gQVjs3642=function(a,b){return a+b*3642%7};
+var gVmDp3643=function(a,b){return a+b*3643%7};
+var guztT3644=function(a,b){return a+b*3644%7};
+var g1jJD3645=function(a,b){return a+b*3645%7};
+var gWxDr3646=function(a,b){return a+b*3646%7};
+var g4gG03647=function(a,b){return a+b*3647%7};
+var gjBY23648=function(a,b){return a+b*3648%7};
+var gO8FU3649=function(a,b){return a+b*3649%7};
+var gk51y3650=function(a,b){return a+b*3650%7};
+var gDaEk3651=function(a,b){return a+b*3651%7};
+var g92KE3652=function(a,b){return a+b*3652%7};
+var goMA13653=function(a,b){return a+b*3653%7};
+var gegXj3654=function(a,b){return a+b*3654%7};
+var gQyxS3655=function(a,b){return a+b*3655%7};
+var gHVIJ3656=function(a,b){return a+b*3656%7};
+var gjH0D3657=function(a,b){return a+b*3657%7};
+var gyGzH3658=function(a,b){return a+b*3658%7};
+var gCTSD3659=function(a,b){return a+b*3659%7};
+var gXvtk3660=function(a,b){return a+b*3660%7};
+var gqVca3661=function(a,b){return a+b*3661%7};
+var gtcft3662=function(a,b){return a+b*3662%7};
+var gS6ih3663=function(a,b){return a+b*3663%7};
+var gaf5y3664=function(a,b){return a+b*3664%7};
+var gwNey3665=function(a,b){return a+b*3665%7};
+var gR5Z83666=function(a,b){return a+b*3666%7};
+var gyyWq3667=function(a,b){return a+b*3667%7};
+var gR9r23668=function(a,b){return a+b*3668%7};
+var geEmO3669=function(a,b){return a+b*3669%7};
+var g1FaX3670=function(a,b){return a+b*3670%7};
+var ggN9P3671=function(a,b){return a+b*3671%7};
+var gJdnR3672=function(a,b){return a+b*3672%7};
+var gIZ8z3673=function(a,b){return a+b*3673%7};
+var gBCcI3674=function(a,b){return a+b*3674%7};
+var gi9zp3675=function(a,b){return a+b*3675%7};
+var geQep3676=function(a,b){return a+b*3676%7};
+var g4wHi3677=function(a,b){return a+b*3677%7};
+var gj17h3678=function(a,b){return a+b*3678%7};
+var g9EmW3679=function(a,b){return a+b*3679%7};
+var gna983680=function(a,b){return a+b*3680%7};
+var gQXAN3681=function(a,b){return a+b*3681%7};
+var gx6093682=function(a,b){return a+b*3682%7};
+var gpI303683=function(a,b){return a+b*3683%7};
+var gf8QU3684=function(a,b){return a+b*3684%7};
+var gab8e3685=function(a,b){return a+b*3685%7};
+var gKX1C3686=function(a,b){return a+b*3686%7};
+var gWDud3687=function(a,b){return a+b*3687%7};
+var goGBc3688=function(a,b){return a+b*3688%7};
+var giKmC3689=function(a,b){return a+b*3689%7};
+var gUc8c3690=function(a,b){return a+b*3690%7};
+var gJgg23691=function(a,b){return a+b*3691%7};
+var gxY2t3692=function(a,b){return a+b*3692%7};
+var gMGXh3693=function(a,b){return a+b*3693%7};
+var gT6ei3694=function(a,b){return a+b*3694%7};
+var gk5xS3695=function(a,b){return a+b*3695%7};
+var gnfyt3696=function(a,b){return a+b*3696%7};
+var gOGtT3697=function(a,b){return a+b*3697%7};
+var gNT1U3698=function(a,b){return a+b*3698%7};
+var gp4Wd3699=function(a,b){return a+b*3699%7};
+var gCNPz3700=function(a,b){return a+b*3700%7};
+var gbfSc3701=function(a,b){return a+b*3701%7};
+var gB2043702=function(a,b){return a+b*3702%7};
+var gLsGz3703=function(a,b){return a+b*3703%7};
+var gBviA3704=function(a,b){return a+b*3704%7};
+var guSrU3705=function(a,b){return a+b*3705%7};
+var gRsYj3706=function(a,b){return a+b*3706%7};
+var gahMa3707=function(a,b){return a+b*3707%7};
+var glCd03708=function(a,b){return a+b*3708%7};
+var gRn0U3709=function(a,b){return a+b*3709%7};
+var giSbq3710=function(a,b){return a+b*3710%7};
+var gJAWc3711=function(a,b){return a+b*3711%7};
+var g05723712=function(a,b){return a+b*3712%7};
+var gJTnF3713=function(a,b){return a+b*3713%7};
+var g3Eot3714=function(a,b){return a+b*3714%7};
+var g37eJ3715=function(a,b){return a+b*3715%7};
+var gDRN93716=function(a,b){return a+b*3716%7};
+var gs5eU3717=function(a,b){return a+b*3717%7};
+var gQ9Ih3718=function(a,b){return a+b*3718%7};
+var gGadv3719=function(a,b){return a+b*3719%7};
+var g05XT3720=function(a,b){return a+b*3720%7};
+var g7TDx3721=function(a,b){return a+b*3721%7};
+var gJrNY3722=function(a,b){return a+b*3722%7};
+var gKxGs3723=function(a,b){return a+b*3723%7};
+var gFKMK3724=function(a,b){return a+b*3724%7};
+var gTFLn3725=function(a,b){return a+b*3725%7};
+var g1OM93726=function(a,b){return a+b*3726%7};
+var gRdnL3727=function(a,b){return a+b*3727%7};
+var g1PKK3728=function(a,b){return a+b*3728%7};
+var glg9V3729=function(a,b){return a+b*3729%7};
+var g8xaZ3730=function(a,b){return a+b*3730%7};
+var gyqOw3731=function(a,b){return a+b*3731%7};
+var gE3wZ3732=function(a,b){return a+b*3732%7};
+var gFKxg3733=function(a,b){return a+b*3733%7};
+var gtgJh3734=function(a,b){return a+b*3734%7};
+var gWy1C3735=function(a,b){return a+b*3735%7};
+var g7vOI3736=function(a,b){return a+b*3736%7};
+var gRNFB3737=function(a,b){return a+b*3737%7};
+var gvaHr3738=function(a,b){return a+b*3738%7};
+var geJAw3739=function(a,b){return a+b*3739%7};
+var g1PVZ3740=function(a,b){return a+b*3740%7};
+var gaHK23741=function(a,b){return a+b*3741%7};
+var gREaH3742=function(a,b){return a+b*3742%7};
+var gYqLB3743=function(a,b){return a+b*3743%7};
+var gPqHc3744=function(a,b){return a+b*3744%7};
+var gv4KD3745=function(a,b){return a+b*3745%7};
+var gwqFI3746=function(a,b){return a+b*3746%7};
+var g0VI73747=function(a,b){return a+b*3747%7};
+var gtJhG3748=function(a,b){return a+b*3748%7};
+var gcwEP3749=function(a,b){return a+b*3749%7};
+var g96em3750=function(a,b){return a+b*3750%7};
+var gP4jO3751=function(a,b){return a+b*3751%7};
+var gso9X3752=function(a,b){return a+b*3752%7};
+var gB3Fz3753=function(a,b){return a+b*3753%7};
+var g1oop3754=function(a,b){return a+b*3754%7};
+var groUa3755=function(a,b){return a+b*3755%7};
+var gvqx13756=function(a,b){return a+b*3756%7};
+var g5hZk3757=function(a,b){return a+b*3757%7};
+var gaZr23758=function(a,b){return a+b*3758%7};
+var gCEJk3759=function(a,b){return a+b*3759%7};
+var g6IGL3760=function(a,b){return a+b*3760%7};
+var gPYLp3761=function(a,b){return a+b*3761%7};
+var gHsj13762=function(a,b){return a+b*3762%7};
+var gdIEY3763=function(a,b){return a+b*3763%7};
+var gOxVl3764=function(a,b){return a+b*3764%7};
+var gbztY3765=function(a,b){return a+b*3765%7};
+var glK1F3766=function(a,b){return a+b*3766%7};
+var gnVbx3767=function(a,b){return a+b*3767%7};
+var gF45L3768=function(a,b){return a+b*3768%7};
+var gNWdG3769=function(a,b){return a+b*3769%7};
+var gb2GM3770=function(a,b){return a+b*3770%7};
+var gfu8e3771=function(a,b){return a+b*3771%7};
+var gnxTi3772=function(a,b){return a+b*3772%7};
+var gdQgl3773=function(a,b){return a+b*3773%7};
+var g9Du13774=function(a,b){return a+b*3774%7};
+var gKSou3775=function(a,b){return a+b*3775%7};
+var gzoe13776=function(a,b){return a+b*3776%7};
+var gdkzg3777=function(a,b){return a+b*3777%7};
+var gur8J3778=function(a,b){return a+b*3778%7};
+var gozbU3779=function(a,b){return a+b*3779%7};
+var gD1ac3780=function(a,b){return a+b*3780%7};
+var g70iY3781=function(a,b){return a+b*3781%7};
+var gx38C3782=function(a,b){return a+b*3782%7};
+var gBVMA3783=function(a,b){return a+b*3783%7};
+var gV6kg3784=function(a,b){return a+b*3784%7};
+var g1O9U3785=function(a,b){return a+b*3785%7};
+var gfupW3786=function(a,b){return a+b*3786%7};
+var gYDUG3787=function(a,b){return a+b*3787%7};
+var gZobZ3788=function(a,b){return a+b*3788%7};
+var gQWx53789=function(a,b){return a+b*3789%7};
+var ggaTy3790=function(a,b){return a+b*3790%7};
+var gxOQV3791=function(a,b){return a+b*3791%7};
+var g0SEG3792=function(a,b){return a+b*3792%7};
+var g134p3793=function(a,b){return a+b*3793%7};
+var gRUds3794=function(a,b){return a+b*3794%7};
+var gxwyb3795=function(a,b){return a+b*3795%7};
+var gd25S3796=function(a,b){return a+b*3796%7};
+var giFVV3797=function(a,b){return a+b*3797%7};
+var g9dtx3798=function(a,b){return a+b*3798%7};
+var gn1OS3799=function(a,b){return a+b*3799%7};
+var ghwcQ3800=function(a,b){return a+b*3800%7};
+var g6uxU3801=function(a,b){return a+b*3801%7};
+var gao7d3802=function(a,b){return a+b*3802%7};
+var gD5DC3803=function(a,b){return a+b*3803%7};
+var gTmhG3804=function(a,b){return a+b*3804%7};
+var g0UPy3805=function(a,b){return a+b*3805%7};
+var g3CN23806=function(a,b){return a+b*3806%7};
+var gWLLt3807=function(a,b){return a+b*3807%7};
+var gI9bG3808=function(a,b){return a+b*3808%7};
+var gONZQ3809=function(a,b){return a+b*3809%7};
+var glKqv3810=function(a,b){return a+b*3810%7};
+var gWtUJ3811=function(a,b){return a+b*3811%7};
+var grgaV3812=function(a,b){return a+b*3812%7};
+var gUAEt3813=function(a,b){return a+b*3813%7};
+var gJyXK3814=function(a,b){return a+b*3814%7};
+var g18C63815=function(a,b){return a+b*3815%7};
+var g88qy3816=function(a,b){return a+b*3816%7};
+var gmUlX3817=function(a,b){return a+b*3817%7};
+var gGiP83818=function(a,b){return a+b*3818%7};
+var gmrx93819=function(a,b){return a+b*3819%7};
+var gFNXY3820=function(a,b){return a+b*3820%7};
+var g94Ni3821=function(a,b){return a+b*3821%7};
+var gN3Hv3822=function(a,b){return a+b*3822%7};
+var ge9r53823=function(a,b){return a+b*3823%7};
+var gaOzx3824=function(a,b){return a+b*3824%7};
+var gyxtP3825=function(a,b){return a+b*3825%7};
+var gPPVQ3826=function(a,b){return a+b*3826%7};
+var gzTTZ3827=function(a,b){return a+b*3827%7};
+var gYfue3828=function(a,b){return a+b*3828%7};
+var gm9yS3829=function(a,b){return a+b*3829%7};
+var gFVVy3830=function(a,b){return a+b*3830%7};
+var gwLno3831=function(a,b){return a+b*3831%7};
+var gnbfR3832=function(a,b){return a+b*3832%7};
+var gxqiH3833=function(a,b){return a+b*3833%7};
+var g3Oor3834=function(a,b){return a+b*3834%7};
+var gspO03835=function(a,b){return a+b*3835%7};
+var gSKRv3836=function(a,b){return a+b*3836%7};
+var gSDfH3837=function(a,b){return a+b*3837%7};
+var g3azW3838=function(a,b){return a+b*3838%7};
+var gonBE3839=function(a,b){return a+b*3839%7};
+var gHBwT3840=function(a,b){return a+b*3840%7};
+var gxWGt3841=function(a,b){return a+b*3841%7};
+var gr2y03842=function(a,b){return a+b*3842%7};
+var g1hCb3843=function(a,b){return a+b*3843%7};
+var gw8dL3844=function(a,b){return a+b*3844%7};
+var g8TBr3845=function(a,b){return a+b*3845%7};
+var gHuus3846=function(a,b){return a+b*3846%7};
+var gKTKc3847=function(a,b){return a+b*3847%7};
+var gV3PR3848=function(a,b){return a+b*3848%7};
+var gz4jd3849=function(a,b){return a+b*3849%7};
+var gGySh3850=function(a,b){return a+b*3850%7};
+var gAMzm3851=function(a,b){return a+b*3851%7};
+var ghA2D3852=function(a,b){return a+b*3852%7};
+var g8Eqq3853=function(a,b){return a+b*3853%7};
+var gEMKk3854=function(a,b){return a+b*3854%7};
+var gKanS3855=function(a,b){return a+b*3855%7};
+var gMdxA3856=function(a,b){return a+b*3856%7};
+var gCTV53857=function(a,b){return a+b*3857%7};
+var g7uW13858=function(a,b){return a+b*3858%7};
+var gFXFz3859=function(a,b){return a+b*3859%7};
+var gVGW83860=function(a,b){return a+b*3860%7};
+var gXPpa3861=function(a,b){return a+b*3861%7};
+var gcSbz3862=function(a,b){return a+b*3862%7};
+var gWMxA3863=function(a,b){return a+b*3863%7};
+var gOQxh3864=function(a,b){return a+b*3864%7};
+var gyD5j3865=function(a,b){return a+b*3865%7};
+var gxyRX3866=function(a,b){return a+b*3866%7};
+var gLnXf3867=function(a,b){return a+b*3867%7};
+var gAKU53868=function(a,b){return a+b*3868%7};
+var gfJ0x3869=function(a,b){return a+b*3869%7};
+var gIjyN3870=function(a,b){return a+b*3870%7};
+var gsbTC3871=function(a,b){return a+b*3871%7};
+var gVyo03872=function(a,b){return a+b*3872%7};
+var gbbHq3873=function(a,b){return a+b*3873%7};
+var gay0S3874=function(a,b){return a+b*3874%7};
+var gA8bL3875=function(a,b){return a+b*3875%7};
+var gfcMx3876=function(a,b){return a+b*3876%7};
+var g3r6M3877=function(a,b){return a+b*3877%7};
+var gVrrs3878=function(a,b){return a+b*3878%7};
+var gAz473879=function(a,b){return a+b*3879%7};
+var gFc2w3880=function(a,b){return a+b*3880%7};
+var gg4US3881=function(a,b){return a+b*3881%7};
+var geCkh3882=function(a,b){return a+b*3882%7};
+var g6fYS3883=function(a,b){return a+b*3883%7};
+var gJ8RU3884=function(a,b){return a+b*3884%7};
+var guygn3885=function(a,b){return a+b*3885%7};
+var gz2vK3886=function(a,b){return a+b*3886%7};
+var gRo4J3887=function(a,b){return a+b*3887%7};
+var gZnKr3888=function(a,b){return a+b*3888%7};
+var goQGn3889=function(a,b){return a+b*3889%7};
+var gi9dK3890=function(a,b){return a+b*3890%7};
+var gtGcD3891=function(a,b){return a+b*3891%7};
+var g6A3x3892=function(a,b){return a+b*3892%7};
+var g57SD3893=function(a,b){return a+b*3893%7};
+var ggq1l3894=function(a,b){return a+b*3894%7};
+var gt7By3895=function(a,b){return a+b*3895%7};
+var gTqd53896=function(a,b){return a+b*3896%7};
+var g71793897=function(a,b){return a+b*3897%7};
+var gngEO3898=function(a,b){return a+b*3898%7};
+var gMT0J3899=function(a,b){return a+b*3899%7};
+var gyxe83900=function(a,b){return a+b*3900%7};
+var gZYJw3901=function(a,b){return a+b*3901%7};
+var gpsR63902=function(a,b){return a+b*3902%7};
+var gtmO43903=function(a,b){return a+b*3903%7};
+var gtzyE3904=function(a,b){return a+b*3904%7};
+var gy3Dx3905=function(a,b){return a+b*3905%7};
+var g0KXw3906=function(a,b){return a+b*3906%7};
+var g6euw3907=function(a,b){return a+b*3907%7};
+var gq6Jo3908=function(a,b){return a+b*3908%7};
+var gWe0z3909=function(a,b){return a+b*3909%7};
+var g5hzx3910=function(a,b){return a+b*3910%7};
+var g2dyr3911=function(a,b){return a+b*3911%7};
+var gY25i3912=function(a,b){return a+b*3912%7};
+var gV4IS3913=function(a,b){return a+b*3913%7};
+var g1e2o3914=function(a,b){return a+b*3914%7};
+var g27QF3915=function(a,b){return a+b*3915%7};
+var ggHue3916=function(a,b){return a+b*3916%7};
+var ggNM53917=function(a,b){return a+b*3917%7};
+var g5biO3918=function(a,b){return a+b*3918%7};
+var g2ici3919=function(a,b){return a+b*3919%7};
+var gJrhR3920=function(a,b){return a+b*3920%7};
+var gxsi63921=function(a,b){return a+b*3921%7};
+var g3FAz3922=function(a,b){return a+b*3922%7};
+var gHKQ13923=function(a,b){return a+b*3923%7};
+var gFvK33924=function(a,b){return a+b*3924%7};
+var guZsS3925=function(a,b){return a+b*3925%7};
+var gY6T93926=function(a,b){return a+b*3926%7};
+var gJ6DD3927=function(a,b){return a+b*3927%7};
+var gcyQU3928=function(a,b){return a+b*3928%7};
+var gefb73929=function(a,b){return a+b*3929%7};
+var gNvVz3930=function(a,b){return a+b*3930%7};
+var gnZCQ3931=function(a,b){return a+b*3931%7};
+var gsZvl3932=function(a,b){return a+b*3932%7};
+var gSa9z3933=function(a,b){return a+b*3933%7};
+var gbIQZ3934=function(a,b){return a+b*3934%7};
+var g6xzS3935=function(a,b){return a+b*3935%7};
+var gYAh53936=function(a,b){return a+b*3936%7};
+var ge23o3937=function(a,b){return a+b*3937%7};
+var g8rjV3938=function(a,b){return a+b*3938%7};
+var gzLJf3939=function(a,b){return a+b*3939%7};
+var gQPfH3940=function(a,b){return a+b*3940%7};
+var gtnzM3941=function(a,b){return a+b*3941%7};
+var g2Kux3942=function(a,b){return a+b*3942%7};
+var gNDqo3943=function(a,b){return a+b*3943%7};
+var gRPCN3944=function(a,b){return a+b*3944%7};
+var gVj2X3945=function(a,b){return a+b*3945%7};
+var gdiZa3946=function(a,b){return a+b*3946%7};
+var gG8VD3947=function(a,b){return a+b*3947%7};
+var gy3wr3948=function(a,b){return a+b*3948%7};
+var gNbTZ3949=function(a,b){return a+b*3949%7};
+var geaJb3950=function(a,b){return a+b*3950%7};
+var g1aVn3951=function(a,b){return a+b*3951%7};
+var gtECq3952=function(a,b){return a+b*3952%7};
+var gxxax3953=function(a,b){return a+b*3953%7};
+var gQoGL3954=function(a,b){return a+b*3954%7};
+var gWZ5W3955=function(a,b){return a+b*3955%7};
+var goHQF3956=function(a,b){return a+b*3956%7};
+var g6FoS3957=function(a,b){return a+b*3957%7};
+var g33Lw3958=function(a,b){return a+b*3958%7};
+var g6y673959=function(a,b){return a+b*3959%7};
+var gobQu3960=function(a,b){return a+b*3960%7};
+var gNiXc3961=function(a,b){return a+b*3961%7};
+var ghiVY3962=function(a,b){return a+b*3962%7};
+var g56Bm3963=function(a,b){return a+b*3963%7};
+var gqyca3964=function(a,b){return a+b*3964%7};
+var g1pW43965=function(a,b){return a+b*3965%7};
+var gyLY33966=function(a,b){return a+b*3966%7};
+var gUKU93967=function(a,b){return a+b*3967%7};
+var gGinC3968=function(a,b){return a+b*3968%7};
+var gamRF3969=function(a,b){return a+b*3969%7};
+var gc9mo3970=function(a,b){return a+b*3970%7};
+var gxZUs3971=function(a,b){return a+b*3971%7};
+var gYxnG3972=function(a,b){return a+b*3972%7};
+var gDTrW3973=function(a,b){return a+b*3973%7};
+var gZ7063974=function(a,b){return a+b*3974%7};
+var gG4qS3975=function(a,b){return a+b*3975%7};
+var gGhCy3976=function(a,b){return a+b*3976%7};
+var gZqyb3977=function(a,b){return a+b*3977%7};
+var g4TUd3978=function(a,b){return a+b*3978%7};
+var gVynZ3979=function(a,b){return a+b*3979%7};
+var g6bc43980=function(a,b){return a+b*3980%7};
+var gJ7j33981=function(a,b){return a+b*3981%7};
+var gNFxZ3982=function(a,b){return a+b*3982%7};
+var gSwIq3983=function(a,b){return a+b*3983%7};
+var gu6IA3984=function(a,b){return a+b*3984%7};
+var gWZVQ3985=function(a,b){return a+b*3985%7};
+var glLB03986=function(a,b){return a+b*3986%7};
+var g4Sax3987=function(a,b){return a+b*3987%7};
+var gy23n3988=function(a,b){return a+b*3988%7};
+var gYvv03989=function(a,b){return a+b*3989%7};
+var gX1Fy3990=function(a,b){return a+b*3990%7};
+var g3tYu3991=function(a,b){return a+b*3991%7};
+var gjBfe3992=function(a,b){return a+b*3992%7};
+var g7PKx3993=function(a,b){return a+b*3993%7};
+var giIId3994=function(a,b){return a+b*3994%7};
+var gCQw23995=function(a,b){return a+b*3995%7};
+var g6NDH3996=function(a,b){return a+b*3996%7};
+var gWyhM3997=function(a,b){return a+b*3997%7};
+var gFUGt3998=function(a,b){return a+b*3998%7};
+var gTBgp3999=function(a,b){return a+b*3999%7};
+g.Ud=function(a,b,c,d){c&&d.set(b,encodeURIComponent(Xy(decodeURIComponent(c))))};
+})(_yt_player);
\ No newline at end of file
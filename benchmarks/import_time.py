@@ -0,0 +1,80 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 23:50
+    File:    import_time.py
+    Description: Import time of the package in fresh interpreters
+
+    Usage:
+        python benchmarks/import_time.py                    Every statement, 20 runs each
+        python benchmarks/import_time.py --runs 50 -o import.json
+        python benchmarks/import_time.py --compare import.json
+
+    Each statement runs in a new interpreter, timed from inside so interpreter
+    startup isn't counted. ``python -X importtime -c "import livetube"`` shows
+    where the time goes.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import List
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+package_path = os.environ.get("LIVETUBE_PATH", repo_root)
+
+statements = [
+    "import livetube",
+    "from livetube.util.proto import browse_continuation",
+    "from livetube import Video",
+    "from livetube import Studio",
+    "import livetube; livetube.Membership",
+]
+
+child = """
+import sys, time
+sys.path.insert(1, {path!r})
+start = time.perf_counter()
+exec({statement!r})
+print(time.perf_counter() - start)
+"""
+
+
+def measure(statement: str, runs: int) -> List[float]:
+    code = child.format(path=package_path, statement=statement)
+    return sorted(float(subprocess.check_output([sys.executable, "-c", code]).decode().split()[-1])
+                  for _ in range(runs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="livetube import time")
+    parser.add_argument("--runs", type=int, default=20, help="Interpreters per statement")
+    parser.add_argument("-o", "--output", help="Write results as json")
+    parser.add_argument("--compare", help="Compare with a saved result file")
+    args = parser.parse_args()
+
+    base = {}
+    if args.compare:
+        with open(args.compare) as f:
+            base = json.load(f)['results']
+    # Compile .pyc first, a cold cache isn't what workers see
+    measure("import livetube, livetube.__main__", 1)
+    results = {}
+    print(f"{'statement':<56} {'median ms':>10} {'min ms':>10} {'base ms':>10}")
+    for statement in statements:
+        samples = measure(statement, args.runs)
+        results[statement] = {"median": samples[len(samples) // 2], "min": samples[0]}
+        old = base.get(statement)
+        print(f"{statement:<56} {results[statement]['median'] * 1e3:>10.1f} {samples[0] * 1e3:>10.1f} "
+              f"{old['median'] * 1e3 if old else float('nan'):>10.1f}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"meta": {"python": platform.python_version(), "time": time.time()}, "results": results},
+                      f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 15:05
+    File:    run.py
+    Description: Offline benchmark runner
+
+    Usage:
+        python benchmarks/run.py                        Run every case
+        python benchmarks/run.py -k Cipher              Run cases containing "Cipher"
+        python benchmarks/run.py -o base.json           Save results
+        python benchmarks/run.py --compare base.json    Compare with saved results
+        python benchmarks/run.py --against HEAD~1       Compare with another commit
+
+    ``--against`` checks the commit out in a temporary git worktree and runs the
+    current cases and fixtures against its livetube package.
+"""
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Package under test, overridden by --against
+sys.path.insert(1, os.environ.get("LIVETUBE_PATH", repo_root))
+
+
+def git_revision(path: str) -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=path,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def measure(func, min_time: float, repeat: int) -> dict:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    # Allocation of a single call
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "ops": 1 / best,
+        "seconds": best,
+        "alloc_kib": (peak - baseline) / 1024,
+    }
+
+
+def run(pattern: str, min_time: float, repeat: int, quiet: bool) -> dict:
+    from cases import cases
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    results = {}
+    for name, setup in cases.items():
+        if pattern and pattern.lower() not in name.lower():
+            continue
+
+        async def prepare():
+            return setup()
+
+        try:
+            func = loop.run_until_complete(prepare())
+            results[name] = measure(func, min_time, repeat)
+        except Exception as e:
+            results[name] = {"error": f"{type(e).__name__}: {e}"}
+        if not quiet:
+            print_row(name, results[name])
+    loop.close()
+    return {
+        "meta": {
+            "revision": git_revision(os.environ.get("LIVETUBE_PATH", repo_root)),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time": time.time(),
+        },
+        "results": results,
+    }
+
+
+def print_row(name: str, result: dict):
+    if "error" in result:
+        print(f"{name:<42} {result['error']}")
+    else:
+        print(f"{name:<42} {result['ops']:>12,.1f} ops/s {result['seconds'] * 1e6:>12,.1f} us "
+              f"{result['alloc_kib']:>10,.1f} KiB")
+
+
+def compare(base: dict, current: dict):
+    print(f"\n{'case':<42} {'base ops/s':>12} {'ops/s':>12} {'change':>8} {'KiB':>10} {'base KiB':>10}")
+    print(f"({base['meta']['revision']} -> {current['meta']['revision']})")
+    for name, result in current['results'].items():
+        old = base['results'].get(name)
+        if not old or "error" in old or "error" in result:
+            print(f"{name:<42} {'-':>12} {result.get('ops', 0):>12,.1f}")
+            continue
+        change = (result['ops'] / old['ops'] - 1) * 100
+        print(f"{name:<42} {old['ops']:>12,.1f} {result['ops']:>12,.1f} {change:>+7.1f}% "
+              f"{result['alloc_kib']:>10,.1f} {old['alloc_kib']:>10,.1f}")
+
+
+def run_against(revision: str, args) -> dict:
+    workdir = tempfile.mkdtemp(prefix="livetube-bench-")
+    tree = os.path.join(workdir, "tree")
+    output = os.path.join(workdir, "result.json")
+    subprocess.check_call(["git", "worktree", "add", "--detach", tree, revision], cwd=repo_root,
+                          stdout=subprocess.DEVNULL)
+    try:
+        command = [sys.executable, os.path.abspath(__file__), "--quiet", "-o", output,
+                   "--min-time", str(args.min_time), "--repeat", str(args.repeat)]
+        if args.k:
+            command += ["-k", args.k]
+        subprocess.check_call(command, env=dict(os.environ, LIVETUBE_PATH=tree))
+        with open(output) as f:
+            return json.load(f)
+    finally:
+        subprocess.call(["git", "worktree", "remove", "--force", tree], cwd=repo_root)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="livetube offline benchmarks")
+    parser.add_argument("-k", default="", help="Only run cases containing this text")
+    parser.add_argument("-o", "--output", help="Write results as json")
+    parser.add_argument("--compare", help="Compare with a saved result file")
+    parser.add_argument("--against", help="Compare with a git revision")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per timing round")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing rounds, best one is kept")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+
+    base = None
+    if args.against:
+        base = run_against(args.against, args)
+    elif args.compare:
+        with open(args.compare) as f:
+            base = json.load(f)
+    current = run(args.k, args.min_time, args.repeat, args.quiet)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+    if base:
+        compare(base, current)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 17:40
+    File:    scale.py
+    Description: How many live streams one core can monitor
+
+    Usage:
+        python benchmarks/scale.py                              100, 1000, 5000 videos
+        python benchmarks/scale.py --sizes 100,10000,50000 -o scale.json
+        python benchmarks/scale.py --server http://10.0.0.2:8080
+
+    Every video polls fetch_heartbeat + fetch_metadata on its own schedule
+    against the mock innertube server (started in a subprocess unless --server
+    is given, so its CPU isn't counted). Per size the report has achieved
+    polls/s, scheduling lateness percentiles, client CPU per poll, RSS per
+    video and event loop lag.
+
+    Large sizes open one connection per request, raise ``ulimit -n`` first.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import socket
+import subprocess
+import sys
+import time
+from typing import List, Optional
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, os.environ.get("LIVETUBE_PATH", repo_root))
+
+from livetube import Video  # noqa: E402
+from livetube.playerResponse import playerResponse  # noqa: E402
+from livetube.util.cache import yt_internal_api  # noqa: E402
+from livetube.util.mock_server import MockInnertube, MockConfig, use_mock_server  # noqa: E402
+
+
+def rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        # Peak instead of current outside linux
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage if sys.platform == "darwin" else usage * 1024
+
+
+def percentiles(samples: List[float]) -> dict:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def at(p):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+    return {"p50": at(50), "p90": at(90), "p99": at(99), "max": ordered[-1]}
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(poll_interval: float):
+    port = free_port()
+    process = subprocess.Popen([
+        sys.executable, "-m", "livetube.util.mock_server", "--port", str(port),
+        "--offline-seconds", "0", "--ended-seconds", "0", "--poll-delay-ms", str(int(poll_interval * 1000)),
+    ], env=dict(os.environ, PYTHONPATH=os.environ.get("LIVETUBE_PATH", repo_root)))
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process, f"http://127.0.0.1:{port}"
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Mock server didn't start")
+
+
+async def loop_lag(samples: List[float], interval=0.1):
+    loop = asyncio.get_event_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - start - interval))
+
+
+class Poller:
+    def __init__(self, video: Video, interval: float, offset: float):
+        self.video = video
+        self.interval = interval
+        self.offset = offset
+        self.polls = 0
+        self.errors = 0
+        self.lateness: List[float] = []
+
+    async def run(self, start: float, stop: float):
+        loop = asyncio.get_event_loop()
+        scheduled = start + self.offset
+        while scheduled < stop:
+            await asyncio.sleep(max(0.0, scheduled - loop.time()))
+            self.lateness.append(loop.time() - scheduled)
+            try:
+                await self.video.fetch_heartbeat()
+                await self.video.fetch_metadata()
+                self.polls += 1
+            except Exception:
+                self.errors += 1
+            # Keep the schedule, a late poll doesn't shift the next one
+            scheduled += self.interval
+
+
+async def run_size(size: int, duration: float, interval: float, warmup: float) -> dict:
+    loop = asyncio.get_event_loop()
+    template = MockInnertube(MockConfig(offline_seconds=0, ended_seconds=0, poll_delay_ms=int(interval * 1000)))
+    rss_before = rss_bytes()
+    videos = []
+    for index in range(size):
+        video = Video(f"v{index:010d}")
+        # Seed from the mock model directly, measuring polling and not 50k page loads
+        video.player_response = playerResponse(template.player(video.video_id), None)
+        videos.append(video)
+    rss_per_video = (rss_bytes() - rss_before) / size
+
+    pollers = [Poller(video, interval, interval * index / size) for index, video in enumerate(videos)]
+    lag: List[float] = []
+    lag_task = asyncio.ensure_future(loop_lag(lag))
+    start = loop.time()
+    stop = start + warmup + duration
+    tasks = [asyncio.ensure_future(poller.run(start, stop)) for poller in pollers]
+    # Warmup, then count from a clean state
+    await asyncio.sleep(warmup)
+    for poller in pollers:
+        poller.polls = poller.errors = 0
+        poller.lateness.clear()
+    lag.clear()
+    cpu_start, wall_start = time.process_time(), loop.time()
+    await asyncio.gather(*tasks)
+    cpu, wall = time.process_time() - cpu_start, loop.time() - wall_start
+    lag_task.cancel()
+
+    polls = sum(poller.polls for poller in pollers)
+    return {
+        "videos": size,
+        "duration": wall,
+        "target_polls_per_second": size / interval,
+        "polls_per_second": polls / wall,
+        "polls": polls,
+        "errors": sum(poller.errors for poller in pollers),
+        "lateness": percentiles([x for poller in pollers for x in poller.lateness]),
+        "cpu_per_poll_us": cpu / polls * 1e6 if polls else None,
+        "cpu_utilization": cpu / wall,
+        "rss_per_video_kib": rss_per_video / 1024,
+        "rss_mib": rss_bytes() / 1024 / 1024,
+        "loop_lag": percentiles(lag),
+    }
+
+
+def print_row(result: dict):
+    lateness, lag = result['lateness'], result['loop_lag']
+    cpu = result['cpu_per_poll_us']
+    print(f"{result['videos']:>8} {result['polls_per_second']:>10,.1f} {result['target_polls_per_second']:>10,.1f} "
+          f"{lateness.get('p50', 0) * 1000:>9.1f} {lateness.get('p99', 0) * 1000:>9.1f} "
+          f"{cpu or 0:>10,.0f} {result['cpu_utilization'] * 100:>6.1f}% "
+          f"{result['rss_per_video_kib']:>9.1f} {lag.get('p99', 0) * 1000:>9.1f} {result['errors']:>7}")
+
+
+async def main(args, server: str):
+    use_mock_server(server)
+    await yt_internal_api.fetch()
+    results = []
+    print(f"{'videos':>8} {'polls/s':>10} {'target':>10} {'late p50':>9} {'late p99':>9} "
+          f"{'cpu us/poll':>10} {'cpu':>7} {'KiB/video':>9} {'lag p99':>9} {'errors':>7}")
+    for size in args.sizes:
+        result = await run_size(size, args.duration, args.interval, args.warmup)
+        results.append(result)
+        print_row(result)
+    return results
+
+
+def parse_args(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description="livetube polling scale benchmark")
+    parser.add_argument("--sizes", type=lambda s: [int(x) for x in s.split(",")], default=[100, 1000, 5000])
+    parser.add_argument("--duration", type=float, default=20, help="Measured seconds per size")
+    parser.add_argument("--warmup", type=float, default=5, help="Unmeasured seconds per size")
+    parser.add_argument("--interval", type=float, default=5, help="Poll interval of every video")
+    parser.add_argument("--server", help="Use a running mock server instead of starting one")
+    parser.add_argument("-o", "--output", help="Write report as json")
+    return parser.parse_args(argv)
+
+
+def run():
+    args = parse_args()
+    process = None
+    server = args.server
+    if not server:
+        process, server = start_server(args.interval)
+    try:
+        results = asyncio.get_event_loop().run_until_complete(main(args, server))
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "meta": {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "cpu_count": os.cpu_count(),
+                    "interval": args.interval,
+                    "server": args.server or "subprocess",
+                    "time": time.time(),
+                },
+                "results": results,
+            }, f, indent=2)
+
+
+if __name__ == '__main__':
+    run()
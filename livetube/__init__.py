@@ -3,29 +3,73 @@
     Author: Sam
     Created: 2020/12/18 10:18
     File:    __init__.py
+
+    Objects are imported on first use (PEP 562), ``import livetube`` or a
+    livetube.util module alone doesn't load aiohttp. uvloop's event loop
+    policy is installed when the objects are first loaded.
 """
 __title__ = "livetube"
 __author__ = "Sam"
 
-import asyncio
+import importlib
+import sys
+from typing import TYPE_CHECKING
 
-try:
-    import uvloop  # noqa
+from livetube.util.exceptions import *
 
-    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-except ModuleNotFoundError:
-    pass
+if TYPE_CHECKING:
+    from livetube.__main__ import (Video, Membership, MembershipSweep, Community, CommunityWatcher, Studio,
+                                   UploadProgressMonitor, probe_many)
+    from livetube.util.identity import IdentityPool
 
-from livetube.__main__ import Video, Membership, Community, Studio
-from livetube.util.exceptions import *
+# Name -> module, loaded by __getattr__
+_lazy = {
+    "Video": "livetube.__main__",
+    "Membership": "livetube.__main__",
+    "MembershipSweep": "livetube.__main__",
+    "Community": "livetube.__main__",
+    "CommunityWatcher": "livetube.__main__",
+    "Studio": "livetube.__main__",
+    "UploadProgressMonitor": "livetube.__main__",
+    "probe_many": "livetube.__main__",
+    "IdentityPool": "livetube.util.identity",
+}
 
 __all__ = [
     # Objects
     "Video", "Membership", "Community", "Studio",
+    # Helpers
+    "probe_many", "IdentityPool", "MembershipSweep", "CommunityWatcher",
+    "UploadProgressMonitor",
     # Base error
     "LivetubeError", "ExtractError",
     # Errors
-    "NetworkError", "HTMLParseError", "RegexMatchError", "LiveStreamOffline",
+    "NetworkError", "HTTPError", "RateLimited", "HTMLParseError", "RegexMatchError", "LiveStreamOffline",
     "VideoUnavailable", "PaymentRequired", "VideoPrivate", "RecordingUnavailable",
     "MembersOnly", "LoginRequired", "AccountBanned", "VideoRegionBlocked"
 ]
+
+
+def _install_uvloop():
+    import asyncio
+
+    try:
+        import uvloop  # noqa
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ModuleNotFoundError:
+        pass
+
+
+def __getattr__(name: str):
+    module_name = _lazy.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'livetube' has no attribute '{name}'")
+    if module_name == "livetube.__main__" and module_name not in sys.modules:
+        _install_uvloop()
+    value = globals()[name] = getattr(importlib.import_module(module_name), name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
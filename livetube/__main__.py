@@ -8,41 +8,58 @@
 
 # General
 import asyncio
+import heapq
 import json
+import random
 import time
 
 # Parsing
 import re
 import warnings
 from asyncio import AbstractEventLoop
-from base64 import b64encode, b64decode
+from dataclasses import replace
+from functools import lru_cache, partial
 from io import BytesIO
-from typing import Optional, Dict, Union, List, BinaryIO
-from urllib.parse import parse_qsl, quote, unquote, quote_plus
+from typing import Optional, Dict, Union, List, BinaryIO, Iterable, AsyncIterator, Callable, Tuple
+from urllib.parse import parse_qsl, quote_plus
+from zlib import crc32
 
 # Networking
 import aiohttp
 import yarl
 
 # Models
-from livetube.memberShips import Member
-from livetube.membership_pb3 import ContinuationCommand, ContinuationCommandEntry
-from livetube.studio_pb3 import GoogleVisitorId
+from livetube.memberShips import Member, MembershipChanges
 from livetube.communityPosts import Post, SharedPost
-from livetube.playerResponse import playerResponse
+from livetube.playerResponse import playerResponse, playabilityStatus
+from livetube.videoStatus import VideoStatus
 # Utils
-from livetube.util import player
+from livetube.util import player, cache
 from livetube.util.cache import (shared_tcp_pool, js_cache_v2, yt_internal_api, user_agent,
-                                 get_yt_client_info, default_header, yt_root_url, studio_root_url)
+                                 get_yt_client_info, default_header)
 # Cache for YouTube
 from livetube.util.cipher import Cipher
-from livetube.util.exceptions import RegexMatchError, NetworkError, HTMLParseError, ExtractError
+from livetube.util.cursor import community_cursors
+from livetube.util.body import context_body, heartbeat_body
+from livetube.util.client import ClientProfile, client_selector, profiles
+from livetube.util.exceptions import (RegexMatchError, NetworkError, HTMLParseError, ExtractError, LivetubeError,
+                                      RateLimited)
+from livetube.util.hedge import hedge_policy
+from livetube.util.identity import Identity, IdentityPool, rotating, drawn_identity
+from livetube.util.memo import ParseMemo
+from livetube.util.metrics import poll_lateness, cipher_cache_total
+from livetube.util.trace import tracer, traced
+from livetube.util.transport import transport_selector
 from livetube.util.js import initial_data, video_info_url, query_selector, dict_search
 from livetube.util.parser import ScriptTaker
+from livetube.util.proto import browse_params, decode_browse_continuation, field_path, visitor_id
 from livetube.util.player import get_ytplayer_resp
 from livetube.util.regex import regex_search
+from livetube.util.seen import SeenStore
+from livetube.util.studio_config import StudioConfig, studio_config, invalidates_config
 from livetube.utils import (time_map, get_text, string_to_int, http_request, logger,
-                            calculate_SNAPPISH, gen_yt_upload_session_id)
+                            calculate_SNAPPISH, gen_yt_upload_session_id, read_json, read_text, make_header,
+                            read_body, load_json)
 
 """DO NOT USE "FORMAT IMPORT PACKAGE"""
 
@@ -54,13 +71,15 @@ class Video:
                  video_id: str,
                  cookie=None,
                  header: Optional[Dict[str, Union[str, bool, int]]] = None,
-                 loop: Optional[AbstractEventLoop] = None):
+                 loop: Optional[AbstractEventLoop] = None,
+                 identities: Optional[IdentityPool] = None):
         """
         Video object
 
         :param video_id: Video ID, can be url
         :param cookie:   Cookie
         :param header:   Extra header
+        :param identities: Draw the cookie from this pool on every request instead
         """
 
         # Not impl yet
@@ -84,13 +103,11 @@ class Video:
                 video_id = match.group(1)
         self.video_id = video_id
         self.short_url = f"https://youtu.be/{self.video_id}"
-        self.watch_url = f"{yt_root_url}/watch?v={self.video_id}"
+        self.watch_url = f"{cache.yt_root_url}/watch?v={self.video_id}"
         self.vid_info_url: Optional[str] = None
 
         # Header
-        self.header = default_header
-        if header:
-            self.header.update(header)
+        self.header = make_header(default_header, header)
 
         # Client setup
         self._loop = loop or asyncio.get_event_loop()
@@ -98,6 +115,7 @@ class Video:
             cookie = dict()
         cookie.update({"PREF": "hl=en"})
         self.cookie = cookie
+        self.identities = identities
 
         # http
         client_id = hash(self._loop)
@@ -114,6 +132,9 @@ class Video:
         """Key for next data requesting"""
         self._continue_id: str = ""
         self._heartbeat_seq_number: int = 0
+        self._last_heartbeat: Optional[float] = None
+        # Actions of the last updated_metadata, applied already
+        self._metadata_memo = ParseMemo("Video.fetch_metadata")
 
     # Logger
 
@@ -136,6 +157,20 @@ class Video:
         cookie.update({"PREF": "hl=en"})
         self.cookie = cookie
 
+    async def _draw_identity(self) -> Identity:
+        """Take an identity from the pool, members of the channel for members only videos"""
+        channel_id = self.player_response.videoDetails.channel_id if self.player_response else None
+        return await self.identities.acquire(channel_id, self.video_type == "Member")
+
+    def _auth(self) -> Tuple[dict, Optional[Identity]]:
+        """Cookie and identity of a request, the identity drawn for the running operation if any"""
+        identity = drawn_identity.get() if self.identities is not None else None
+        if identity is not None:
+            return identity.cookie, identity
+        return self.cookie, None
+
+    @traced("search", "video_id")
+    @rotating
     async def get_anim_thumbnail(self) -> str:
         """
         Get animated thumbnail (Like GIF)
@@ -146,29 +181,10 @@ class Video:
         self.debug("Fetching animation thumbnail link")
         pattern = ("contents/twoColumnSearchResultsRenderer/primaryContents/sectionListRenderer/contents/?/"
                    f"itemSectionRenderer/contents/?/videoRenderer/videoId:{self.video_id}")
-        endpoint = f"{yt_internal_api.endpoint}/{yt_internal_api.version}/search?key={yt_internal_api.key}"
-        if not yt_internal_api.key:
-            # Fallback to html mode
-            endpoint = f"{yt_root_url}/results?search_query={quote_plus(self.watch_url)}"
-            async with http_request(self._pool, url=endpoint, header=self.header, cookie=self.cookie) as response:
-                html_js = ScriptTaker(await response.text()).scripts
-                yt_internal_api.update_html(player.get_ytplayer_setconfig(html_js))
-                resp_json = initial_data(html_js)
-        else:
-            async with http_request(self._pool, "POST", url=endpoint, json_data={
-                "context": {
-                    "client": get_yt_client_info()
-                },
-                "query": self.watch_url
-            }, header=calculate_SNAPPISH(self.cookie, self.header), cookie=self.cookie) as response:
-                if response is False:
-                    # Fallback
-                    yt_internal_api.key = ""
-                    return await self.get_anim_thumbnail()
-                if response.content_type == "text/html":
-                    self.error("Failed to query video search")
-                    raise NetworkError
-                resp_json = await response.json()
+        handlers = {"html": self._search_html}
+        if yt_internal_api.key:
+            handlers["api"] = self._search_api
+        resp_json = await transport_selector.run("search", handlers)
         test = query_selector(resp_json, pattern)
         if test:
             video_info = test[0]
@@ -182,17 +198,37 @@ class Video:
             self.error("Failed to locate thumbnail location")
             raise NetworkError
 
-    def _create_metadata_body(self, force_video_id: bool = False) -> dict:
-        """Create a metadata body"""
-        param_cond = not force_video_id and self._continue_id
-        return {
+    async def _search_api(self) -> dict:
+        endpoint = f"{yt_internal_api.endpoint}/{yt_internal_api.version}/search?key={yt_internal_api.key}"
+        cookie, identity = self._auth()
+        async with http_request(self._pool, "POST", url=endpoint, json_data={
             "context": {
                 "client": get_yt_client_info()
             },
-            ("continuation" if param_cond else "videoId"): (
-                self._continue_id if param_cond else self.video_id
-            )
-        }
+            "query": self.watch_url
+        }, header=calculate_SNAPPISH(cookie, self.header), cookie=cookie, identity=identity,
+                                field_mask="Video.get_anim_thumbnail") as response:
+            if response.content_type == "text/html":
+                self.error("Failed to query video search")
+                raise NetworkError
+            return await read_json(response)
+
+    async def _search_html(self) -> dict:
+        endpoint = f"{cache.yt_root_url}/results?search_query={quote_plus(self.watch_url)}"
+        cookie, identity = self._auth()
+        async with http_request(self._pool, url=endpoint, header=self.header, cookie=cookie,
+                                identity=identity) as response:
+            html = await read_text(response)
+        with tracer.phase("html_parse"):
+            html_js = ScriptTaker(html).scripts
+            yt_internal_api.update_html(player.get_ytplayer_setconfig(html_js))
+            return initial_data(html_js)
+
+    def _create_metadata_body(self, force_video_id: bool = False) -> bytes:
+        """Create a metadata body, serialized"""
+        if not force_video_id and self._continue_id:
+            return context_body.render(profiles["WEB"], continuation=self._continue_id)
+        return context_body.render(profiles["WEB"], videoId=self.video_id)
 
     # metadata update
     def _update_actions(self, actions: list):
@@ -240,6 +276,8 @@ class Video:
                 if self.player_response.videoDetails.title != title:
                     self.player_response.videoDetails.title = title
 
+    @traced("updated_metadata", "video_id")
+    @rotating
     async def fetch_metadata(self):
         """Update livestream metadata"""
         if not self.player_response:
@@ -247,15 +285,15 @@ class Video:
         self.debug("Fetching metadata")
         endpoint = (f"{yt_internal_api.endpoint}/{yt_internal_api.version}/"
                     f"updated_metadata?key={yt_internal_api.key}")
+        cookie, identity = self._auth()
         async with http_request(self._pool, "POST", endpoint, json_data=self._create_metadata_body(),
-                                header=calculate_SNAPPISH(self.cookie, self.header), cookie=self.cookie) as response:
-            if response is False:
-                # Fallback
-                return await self._fetch_html()
+                                header=calculate_SNAPPISH(cookie, self.header), cookie=cookie,
+                                identity=identity, field_mask="Video.fetch_metadata") as response:
             if response.content_type == "text/html":
                 self.error("Failed to fetch metadata")
                 raise NetworkError
-            resp_json: dict = await response.json()
+            raw = await read_body(response)
+            resp_json: dict = load_json(raw)
             continue_id = query_selector(resp_json, "continuation/timedContinuationData/continuation")
             if continue_id and continue_id != self._continue_id:
                 self._continue_id = continue_id
@@ -263,79 +301,135 @@ class Video:
             if update:
                 self.player_response.responseContext.update(update)
             actions = resp_json.get("actions")
-            if actions:
-                self._update_actions(actions)
+            if actions and not self._metadata_memo.check(raw, b'"actions"'):
+                with tracer.phase("model_build"):
+                    self._update_actions(actions)
+                self._metadata_memo.store(True)
 
+    @traced("player/heartbeat", "video_id")
+    @rotating
     async def fetch_heartbeat(self):
         """Update livestream heartbeat"""
         if not self.player_response:
             return
         # Threat this like a dynamic update list object
         self.debug("Fetching heartbeat")
+        now = time.monotonic()
+        if self._last_heartbeat is not None:
+            lateness = now - self._last_heartbeat - self.player_response.playabilityStatus.pollDelayMs / 1000
+            poll_lateness.observe(max(0.0, lateness), endpoint="player/heartbeat")
+        self._last_heartbeat = now
         endpoint = (f"{yt_internal_api.endpoint}/{yt_internal_api.version}/"
                     f"player/heartbeat?alt=json&key={yt_internal_api.key}")
-        async with http_request(self._pool, "POST", endpoint, json_data={
-            "context": {
-                "client": get_yt_client_info()
-            },
-            "heartbeatRequestParams": {
-                "heartbeatChecks": [
-                    "HEARTBEAT_CHECK_TYPE_LIVE_STREAM_STATUS"
-                ]
-            },
-            "sequenceNumber": self._heartbeat_seq_number,
-            "videoId": self.video_id
-        }, header=calculate_SNAPPISH(self.cookie, self.header), cookie=self.cookie) as response:
-            if response is False:
-                # Fallback
-                return await self._fetch_html()
+        profile = client_selector.candidates("heartbeat", self._authenticated())[0]
+        cookie, identity = self._auth() if profile.supports_cookies else ({}, None)
+        try:
+            async with http_request(self._pool, "POST", endpoint, json_data=heartbeat_body.render(
+                profile, sequenceNumber=self._heartbeat_seq_number, videoId=self.video_id
+            ), header=calculate_SNAPPISH(cookie, profile.headers(self.header)), cookie=cookie, identity=identity,
+                    hedge=hedge_policy, field_mask="Video.fetch_heartbeat") as response:
+                if response.content_type == "text/html":
+                    self.error("Failed to fetch heartbeat")
+                    raise NetworkError
+                resp_json = await read_json(response)
+        except RateLimited:
+            # The identity is throttled, not the client profile
+            raise
+        except NetworkError:
+            client_selector.report(profile, False)
+            raise
+        client_selector.report(profile, True)
+        self._heartbeat_seq_number += 1
+        last_status = self.player_response.playabilityStatus.status
+        with tracer.phase("model_build"):
+            self.player_response.update(resp_json)
+        if (
+                last_status == "OK" and self.player_response.playabilityStatus.status != last_status or
+                last_status != "OK" and self.player_response.playabilityStatus.status == "OK"
+        ):
+            """Refreshing whole page is better than only player"""
+            # await self.fetch_player()
+            await self._fetch_json()
+
+    def _authenticated(self) -> bool:
+        return bool(self._auth()[0].get("SAPISID"))
+
+    async def _post_player(self, profile: ClientProfile, field_mask="Video.fetch_player") -> dict:
+        """Player request as a client profile"""
+        endpoint = f"{yt_internal_api.endpoint}/{yt_internal_api.version}/player?key={yt_internal_api.key}"
+        header = profile.headers(self.header)
+        cookie, identity = self._auth() if profile.supports_cookies else ({}, None)
+        async with http_request(self._pool, "POST", endpoint, json_data=context_body.render(
+            profile, videoId=self.video_id
+        ), header=calculate_SNAPPISH(cookie, header), cookie=cookie, identity=identity, hedge=hedge_policy,
+                                field_mask=field_mask) as response:
             if response.content_type == "text/html":
-                self.error("Failed to fetch heartbeat")
+                self.error(f"Failed to download player as {profile.name}")
                 raise NetworkError
-            self._heartbeat_seq_number += 1
-            last_status = self.player_response.playabilityStatus.status
-            self.player_response.update(await response.json())
-            if (
-                    last_status == "OK" and self.player_response.playabilityStatus.status != last_status or
-                    last_status != "OK" and self.player_response.playabilityStatus.status == "OK"
-            ):
-                """Refreshing whole page is better than only player"""
-                # await self.fetch_player()
-                await self._fetch_json()
+            return await read_json(response)
+
+    @staticmethod
+    def _has_cipher(resp: dict) -> bool:
+        streaming_data = resp.get('streamingData') or {}
+        return any(formats.get('signatureCipher')
+                   for key in ("formats", "adaptiveFormats") for formats in streaming_data.get(key, ()))
 
+    @traced("player", "video_id")
+    @rotating
     async def fetch_player(self):
         """
         Use player to update video data
 
+        Tries client profiles of client_selector in order, one that returns direct urls skips base.js
+
         :raise NetworkError: Network problem
         """
         if not self.player_response:
             return
         self.debug("Downloading player")
-        endpoint = f"{yt_internal_api.endpoint}/{yt_internal_api.version}/player?key={yt_internal_api.key}"
-        async with http_request(self._pool, "POST", endpoint, json_data=self._create_metadata_body(True),
-                                header=calculate_SNAPPISH(self.cookie, self.header), cookie=self.cookie) as response:
-            if response is False:
-                # Fallback
-                return await self._fetch_html()
-            if response.content_type == "text/html":
-                self.error("Failed to download player")
-                raise NetworkError
-            _player = self.player_response
-            if _player:
-                await self._check_cipher()
-                _player.update(await response.json())
+        candidates = client_selector.candidates("player", self._authenticated())
+        failed: List[ClientProfile] = []
+        resp_json, profile = {}, candidates[-1]
+        for profile in candidates:
+            last = profile is candidates[-1]
+            try:
+                resp_json = await self._post_player(profile)
+            except RateLimited:
+                raise
+            except NetworkError:
+                if last:
+                    raise
+                failed.append(profile)
+                continue
+            usable = query_selector(resp_json, "playabilityStatus/status") in ("OK", "LIVE_STREAM_OFFLINE")
+            if last or usable and not (profile.direct_urls and self._has_cipher(resp_json)):
+                break
+            failed.append(profile)
+        if query_selector(resp_json, "playabilityStatus/status") in ("OK", "LIVE_STREAM_OFFLINE"):
+            # Video is fine, so profiles before it are broken
+            for failed_profile in failed:
+                client_selector.report(failed_profile, False)
+            client_selector.report(profile, True)
+        if self._has_cipher(resp_json):
+            await self._check_cipher()
+        with tracer.phase("model_build"):
+            self.player_response.update(resp_json)
+        # Video details are back to the player values, apply the next actions again
+        self._metadata_memo.reset()
 
     async def _check_cipher(self):
         """Update cipher to prevent being removed by cache"""
         if not self.js_url:
             self.warn("js_url not found")
             return
-        elif not js_cache_v2[self.js_url]:
+        elif js_cache_v2[self.js_url]:
+            cipher_cache_total.inc(result="hit")
+        else:
+            cipher_cache_total.inc(result="miss")
             self.info("Downloading base js")
             async with http_request(self._pool, url=self.js_url, header=self.header) as response:
                 if response.status == 200:
-                    js_cache_v2[self.js_url] = Cipher(js=await response.text())
+                    js_cache_v2[self.js_url] = Cipher(js=await read_text(response))
                 else:
                     raise HTMLParseError("Cipher parse failed")
 
@@ -355,7 +449,7 @@ class Video:
             if response.content_type == "text/html":
                 self.error(f"Failed to fetch video info | Wrong Content-Type {response.content_type}")
                 raise NetworkError
-            vid_info = dict(parse_qsl(await response.text()))
+            vid_info = dict(parse_qsl(await read_text(response)))
             yt_internal_api.update({
                 "key": vid_info['innertube_api_key'],
                 "version": vid_info['innertube_api_version'],
@@ -418,27 +512,32 @@ class Video:
     async def _parse_resp_data(self, player_response: dict, _initial_data: dict):
         """Parse response data"""
         await self._check_cipher()
-        if self.player_response:
-            self.player_response.update(player_response)
-        else:
-            self.player_response = playerResponse(player_response, self.js_url)
-        self._check_video_type(_initial_data)
-        self._check_premiere(_initial_data)
-        self._add_like_count(_initial_data)
+        with tracer.phase("model_build"):
+            if self.player_response:
+                self.player_response.update(player_response)
+            else:
+                self.player_response = playerResponse(player_response, self.js_url)
+        self._metadata_memo.reset()
+        with tracer.phase("query_selector"):
+            self._check_video_type(_initial_data)
+            self._check_premiere(_initial_data)
+            self._add_like_count(_initial_data)
 
     async def _fetch_json(self):
         # Fetch json type webpage
         endpoint = f"{self.watch_url}&pbj=1"
+        cookie, identity = self._auth()
         async with http_request(self._pool, "POST", url=endpoint,
-                                header=self.header, cookie=self.cookie) as response:
+                                header=self.header, cookie=cookie, identity=identity) as response:
             if response.content_type == "text/html":
                 self.error(f"Failed to fetch video info")
                 raise NetworkError
-            json_resp = await response.json()
-            player_response, _initial_data = (
-                query_selector(json_resp, "?/playerResponse"),
-                query_selector(json_resp, "?/response")
-            )
+            json_resp = await read_json(response)
+            with tracer.phase("query_selector"):
+                player_response, _initial_data = (
+                    query_selector(json_resp, "?/playerResponse"),
+                    query_selector(json_resp, "?/response")
+                )
             if not player_response or not _initial_data:
                 self.error("One of the data failed to query path")
                 raise ExtractError
@@ -446,17 +545,22 @@ class Video:
 
     async def _fetch_html(self):
         # Fetch html type webpage
+        cookie, identity = self._auth()
         async with http_request(self._pool, url=self.watch_url,
-                                header=self.header, cookie=self.cookie) as response:
-            html_js = ScriptTaker(await response.text()).scripts
-        self.vid_info_url = video_info_url(self.video_id, self.watch_url)
-        player_config_args = player.get_ytplayer_setconfig(html_js)
-        yt_internal_api.update_html(player_config_args)
-        self.js_url = yt_root_url + player_config_args['PLAYER_JS_URL']
-        _initial_data = initial_data(html_js)
-        player_response = get_ytplayer_resp(html_js)
+                                header=self.header, cookie=cookie, identity=identity) as response:
+            html = await read_text(response)
+        with tracer.phase("html_parse"):
+            html_js = ScriptTaker(html).scripts
+            self.vid_info_url = video_info_url(self.video_id, self.watch_url)
+            player_config_args = player.get_ytplayer_setconfig(html_js)
+            yt_internal_api.update_html(player_config_args)
+            self.js_url = cache.yt_root_url + player_config_args['PLAYER_JS_URL']
+            _initial_data = initial_data(html_js)
+            player_response = get_ytplayer_resp(html_js)
         return player_response, _initial_data
 
+    @traced("watch", "video_id")
+    @rotating
     async def fetch(self):
         """
         Download and extract Youtube video
@@ -465,32 +569,103 @@ class Video:
         :raises NetworkError: Problem fetching data
         """
         self.info("Downloading webpage")
-        player_response, _initial_data = await (self._fetch_json() if self.js_url else self._fetch_html())
+        # pbj needs js_url from a html page first
+        handlers = {"html": self._fetch_html}
+        if self.js_url:
+            handlers["pbj"] = self._fetch_json
+        player_response, _initial_data = await transport_selector.run("watch", handlers)
         await self._parse_resp_data(player_response, _initial_data)
 
+    @staticmethod
+    def _make_status(video_id: str, resp: dict) -> VideoStatus:
+        playability = playabilityStatus(resp.get('playabilityStatus') or {})
+        details = resp.get('videoDetails') or {}
+        live_details = query_selector(resp, "microformat/playerMicroformatRenderer/liveBroadcastDetails") or {}
+        return VideoStatus(
+            video_id,
+            playability.status,
+            playability.reason,
+            playability.subreason,
+            details.get('isLive', live_details.get('isLiveNow', False)),
+            details.get('isUpcoming', False),
+            details.get('isLiveContent', False),
+            playability.scheduled_start_time,
+            playability.pollDelayMs if query_selector(
+                resp, "playabilityStatus/liveStreamability/liveStreamabilityRenderer/pollDelayMs") else None
+        )
+
+    @traced("probe", "video_id")
+    @rotating
+    async def probe(self) -> VideoStatus:
+        """
+        Check availability and live state with a single player request
+
+        Skips the watch page, formats and base.js, player_response is left untouched
+
+        :raise NetworkError: Network problem
+        :return: VideoStatus
+        """
+        self.debug("Probing player")
+        await yt_internal_api.fetch()
+        profile = client_selector.candidates("probe", self._authenticated())[0]
+        try:
+            resp_json = await self._post_player(profile, "Video.probe")
+        except RateLimited:
+            raise
+        except NetworkError:
+            client_selector.report(profile, False)
+            raise
+        client_selector.report(profile, True)
+        with tracer.phase("model_build"):
+            return self._make_status(self.video_id, resp_json)
+
+
+async def probe_many(video_ids: Iterable[str], concurrency: int = 50, cookie: Optional[dict] = None,
+                     loop: Optional[AbstractEventLoop] = None, identities: Optional[IdentityPool] = None
+                     ) -> Dict[str, Union[VideoStatus, LivetubeError]]:
+    """
+    Probe many videos with bounded concurrency, see Video.probe
+
+    :param video_ids: Video IDs or urls, consumed lazily
+    :param concurrency: Requests in flight
+    :param cookie: Cookie shared by every request
+    :param identities: Spread the requests over this pool instead of one cookie
+    :return: Video ID (as given) -> VideoStatus, or the error raised for it
+    """
+    results: Dict[str, Union[VideoStatus, LivetubeError]] = {}
+    iterator = iter(video_ids)
+    await yt_internal_api.fetch()
+
+    async def worker():
+        for video_id in iterator:
+            try:
+                video = Video(video_id, cookie=dict(cookie) if cookie else None, loop=loop, identities=identities)
+                results[video_id] = await video.probe()
+            except LivetubeError as e:
+                results[video_id] = e
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return results
+
 
 class Community:
     def __init__(self, channel_id: str, cookie=None,
                  header: Optional[Dict[str, Union[str, bool, int]]] = None,
-                 loop: Optional[AbstractEventLoop] = None):
-        """Community init"""
+                 loop: Optional[AbstractEventLoop] = None, raise_429=False):
+        """
+        Community init
+
+        :param raise_429: Raise RateLimited on the first 429 instead of retrying
+        """
 
         # Channel ID
-        if channel_id.startswith("http"):
-            channel_id = regex_search(r"(?:v=|\/)(UC[\w-]{21}[AQgw]).*", channel_id, group=1)
-        else:
-            match = re.match(r"(UC[\w-]{21}[AQgw])", channel_id)
-            if not match:
-                raise ExtractError("Invalid channel id")
-            else:
-                channel_id = match.group(1)
-        self.channel_id = channel_id
+        self.channel_id = self._parse_channel_id(channel_id)
         self.subscribers: int = -1
+        # Posts of the last unchanged first page
+        self._posts_memo = ParseMemo("Community.fetch")
 
         # Header
-        self.header = default_header
-        if header:
-            self.header.update(header)
+        self.header = make_header(default_header, header)
 
         # Client setup
         self._loop = loop or asyncio.get_event_loop()
@@ -505,6 +680,17 @@ class Community:
             shared_tcp_pool[client_id] = aiohttp.TCPConnector(loop=self._loop, ttl_dns_cache=60,
                                                               force_close=True, enable_cleanup_closed=True, limit=0)
         self._pool = shared_tcp_pool[client_id]
+        self.raise_429 = raise_429
+
+    @staticmethod
+    def _parse_channel_id(channel_id: str) -> str:
+        """Channel ID from an ID or url"""
+        if channel_id.startswith("http"):
+            return regex_search(r"(?:v=|\/)(UC[\w-]{21}[AQgw]).*", channel_id, group=1)
+        match = re.match(r"(UC[\w-]{21}[AQgw])", channel_id)
+        if not match:
+            raise ExtractError("Invalid channel id")
+        return match.group(1)
 
     # Logger
 
@@ -607,7 +793,7 @@ class Community:
     def _make_normal_post(self, post_data: dict):
         post_id = post_data['postId']
         attach: Optional[Post.Attachment] = None
-        author_channel = yt_root_url
+        author_channel = cache.yt_root_url
         author_channel += post_data['authorEndpoint']['commandMetadata']['webCommandMetadata']['url']
         author = Post.Author(
             get_text(post_data['authorText']),
@@ -627,8 +813,8 @@ class Community:
             (post_data.get('sponsorsOnlyBadge') is not None)
         )
 
-    def _parse_posts(self, json_data: dict):
-        comm_posts = []
+    def _post_contents(self, json_data: dict) -> list:
+        """Post threads of the first page, including the continuation item"""
         community_enter_point = "contents/twoColumnBrowseResultsRenderer/tabs/?/tabRenderer/title:Community"
         community_content_path = "content/sectionListRenderer/contents/0/itemSectionRenderer/contents"
         community_tab = query_selector(json_data, community_enter_point)
@@ -636,77 +822,129 @@ class Community:
             community_tab = community_tab[0]
             if not community_tab['selected']:
                 self.warn("Expected tab as community.")
-                return comm_posts
+                return []
             contents = query_selector(community_tab, community_content_path)
             if contents:
                 if len(contents) == 1 and contents[0].get("messageRenderer"):
-                    return comm_posts
+                    return []
             else:
                 self.warn("Failed to query post contents")
-                return comm_posts
-            for post_thread in contents:
-                next_page_thread = post_thread.get('continuationItemRenderer')
-                if next_page_thread:
-                    # TODO Community continue token
-                    # next_page_thread['continuationEndpoint']['continuationCommand']['token']
-                    continue
-                post_thread = post_thread['backstagePostThreadRenderer']['post']
-                normal_post = post_thread.get("backstagePostRenderer")
-                shared_post = post_thread.get("sharedPostRenderer")
-                if normal_post:
-                    comm_posts.append(self._make_normal_post(normal_post))
-                elif shared_post:
-                    post_id = shared_post['postId']
-                    author_channel = yt_root_url
-                    author_channel += shared_post['endpoint']['commandMetadata']['webCommandMetadata']['url']
-                    author = Post.Author(
-                        get_text(shared_post['displayName']),
-                        self._get_image_from_elem(shared_post['thumbnail']),
-                        author_channel
-                    )
-                    original_post = shared_post['originalPost'].get('backstagePostRenderer')
-                    if not original_post:
-                        self.warn(f"Unknown post type in post {post_id}")
-                        continue
-                    comm_posts.append(SharedPost(
-                        post_id,
-                        author,
-                        re.match("shared (.+)", get_text(shared_post['publishedTimeText'])).group(1),
-                        self._make_normal_post(original_post),
-                        get_text(shared_post['content']),
-                        (shared_post.get('sponsorsOnlyBadge') is not None)
-                    ))
-            return comm_posts
+                return []
+            return contents
         else:
             self.info("This channel hasn't enable community post feature")
-            return comm_posts
+            return []
+
+    @staticmethod
+    def _continuation_of(contents: list) -> Optional[str]:
+        """Token of the next page, None on the last page"""
+        if contents:
+            return query_selector(contents[-1],
+                                  "continuationItemRenderer/continuationEndpoint/continuationCommand/token")
+        return None
+
+    @staticmethod
+    def _attachment_identity(attachment: Optional[dict]) -> Optional[list]:
+        """What an attachment is, without counters (views, votes) changing between polls"""
+        if not attachment:
+            return None
+        def image_url(image: dict) -> Optional[str]:
+            thumbnails = query_selector(image, "backstageImageRenderer/image/thumbnails") or [{}]
+            return thumbnails[-1].get("url")
+
+        if attachment.get("videoRenderer"):
+            return ["video", attachment['videoRenderer'].get("videoId")]
+        if attachment.get("backstageImageRenderer"):
+            return ["image", image_url(attachment)]
+        if attachment.get("postMultiImageRenderer"):
+            return ["images"] + [image_url(image) for image in attachment['postMultiImageRenderer'].get("images", [])]
+        if attachment.get("pollRenderer"):
+            return ["poll"] + [get_text(choice['text']) for choice in attachment['pollRenderer'].get("choices", [])]
+        if attachment.get("playlistRenderer"):
+            return ["playlist", attachment['playlistRenderer'].get("playlistId")]
+        return sorted(attachment)
+
+    @classmethod
+    def _thread_key(cls, post_thread: dict) -> Optional[Tuple[str, str]]:
+        """Post ID and content fingerprint of a post thread, without parsing it"""
+        post = (post_thread.get('backstagePostThreadRenderer') or {}).get('post') or {}
+        renderer = post.get("backstagePostRenderer") or post.get("sharedPostRenderer")
+        if not renderer:
+            return None
+        text = renderer.get('contentText') or renderer.get('content')
+        original = (renderer.get('originalPost') or {}).get('backstagePostRenderer') or {}
+        content = (get_text(text) if text else "", cls._attachment_identity(renderer.get('backstageAttachment')),
+                   original.get('postId'))
+        return renderer['postId'], "%08x" % crc32(json.dumps(content).encode())
 
-    async def _api_fetch(self):
+    def _parse_posts(self, json_data: dict):
+        return self._parse_post_threads(self._post_contents(json_data))
+
+    def _parse_post_threads(self, contents: list) -> List[Post]:
+        comm_posts = []
+        for post_thread in contents:
+            if post_thread.get('continuationItemRenderer'):
+                # Followed by iter_posts
+                continue
+            post_thread = post_thread['backstagePostThreadRenderer']['post']
+            normal_post = post_thread.get("backstagePostRenderer")
+            shared_post = post_thread.get("sharedPostRenderer")
+            if normal_post:
+                comm_posts.append(self._make_normal_post(normal_post))
+            elif shared_post:
+                post_id = shared_post['postId']
+                author_channel = cache.yt_root_url
+                author_channel += shared_post['endpoint']['commandMetadata']['webCommandMetadata']['url']
+                author = Post.Author(
+                    get_text(shared_post['displayName']),
+                    self._get_image_from_elem(shared_post['thumbnail']),
+                    author_channel
+                )
+                original_post = shared_post['originalPost'].get('backstagePostRenderer')
+                if not original_post:
+                    self.warn(f"Unknown post type in post {post_id}")
+                    continue
+                comm_posts.append(SharedPost(
+                    post_id,
+                    author,
+                    re.match("shared (.+)", get_text(shared_post['publishedTimeText'])).group(1),
+                    self._make_normal_post(original_post),
+                    get_text(shared_post['content']),
+                    (shared_post.get('sponsorsOnlyBadge') is not None)
+                ))
+        return comm_posts
+
+    async def _api_fetch(self, memo: Optional[ParseMemo] = None) -> Optional[dict]:
+        """First page, None when it matches memo"""
         endpoint = f"{yt_internal_api.endpoint}/{yt_internal_api.version}/browse?key={yt_internal_api.key}"
         async with http_request(self._pool, "POST", url=endpoint, json_data={
             "context": {
                 "client": get_yt_client_info()
             },
             "browseId": self.channel_id,
-            "params": quote(b64encode(b"\x12\tcommunity"))
+            "params": browse_params("community")
         },
-                                header=calculate_SNAPPISH(self.cookie, self.header), cookie=self.cookie) as response:
-            if response is False:
-                # Fallback
-                return await self._html_fetch()
+                                header=calculate_SNAPPISH(self.cookie, self.header), cookie=self.cookie,
+                                field_mask="Community.fetch", raise_429=self.raise_429) as response:
             if response.content_type == "text/html":
                 self.error(f"Failed to fetch community posts")
                 raise NetworkError
-            return await response.json()
+            raw = await read_body(response)
+        if memo is not None and memo.check(raw):
+            return None
+        return load_json(raw)
 
     async def _html_fetch(self):
-        async with http_request(self._pool, url=f"{yt_root_url}/channel/{self.channel_id}/community",
-                                header=self.header, cookie=self.cookie) as response:
-            html_js = ScriptTaker(await response.text()).scripts
+        async with http_request(self._pool, url=f"{cache.yt_root_url}/channel/{self.channel_id}/community",
+                                header=self.header, cookie=self.cookie, raise_429=self.raise_429) as response:
+            html = await read_text(response)
+        with tracer.phase("html_parse"):
+            html_js = ScriptTaker(html).scripts
             yt_internal_api.update_html(player.get_ytplayer_setconfig(html_js))
             resp_json = initial_data(html_js)
-            return resp_json
+        return resp_json
 
+    @traced("browse", "channel_id")
     async def fetch(self) -> List[Post]:
         """
         Fetch community posts
@@ -714,32 +952,346 @@ class Community:
         :raise NetworkError: Fetching problems
         :return: A list of Posts
         """
-        # Fallback to html if no api key
-        js_data = await (self._api_fetch() if yt_internal_api.key else self._html_fetch())
-        self._update_subscriber_count(js_data)
-        return self._parse_posts(js_data)
+        js_data = await self._first_page(self._posts_memo)
+        if js_data is None:
+            return list(self._posts_memo.value)
+        with tracer.phase("model_build"):
+            posts = self._parse_posts(js_data)
+        self._posts_memo.store(posts)
+        return list(posts)
+
+    async def _first_page(self, memo: Optional[ParseMemo] = None) -> Optional[dict]:
+        """First page json, None when the api response matches memo"""
+        if memo is not None:
+            memo.pending = None
+        # Api needs a key from a html page first
+        handlers = {"html": self._html_fetch}
+        if yt_internal_api.key:
+            handlers["api"] = partial(self._api_fetch, memo)
+        js_data = await transport_selector.run("community", handlers)
+        if js_data is not None:
+            with tracer.phase("model_build"):
+                self._update_subscriber_count(js_data)
+        return js_data
+
+    async def _api_continuation(self, continuation: str) -> list:
+        """Post threads of a continuation page"""
+        endpoint = f"{yt_internal_api.endpoint}/{yt_internal_api.version}/browse?key={yt_internal_api.key}"
+        async with http_request(self._pool, "POST", url=endpoint, json_data={
+            "context": {
+                "client": get_yt_client_info()
+            },
+            "continuation": continuation
+        }, header=calculate_SNAPPISH(self.cookie, self.header), cookie=self.cookie,
+                                field_mask="Community.iter_posts", raise_429=self.raise_429) as response:
+            if response.content_type == "text/html":
+                self.error(f"Failed to fetch community posts")
+                raise NetworkError
+            resp_json = await read_json(response)
+        return query_selector(resp_json, "onResponseReceivedEndpoints/0/appendContinuationItemsAction/"
+                                         "continuationItems") or []
+
+    async def iter_posts(self, stop: Optional[Callable[[Post], bool]] = None,
+                         continuation: Optional[str] = None) -> AsyncIterator[Post]:
+        """
+        Stream posts of every page, newest first
+
+        The next page is requested while the current one is consumed, unless stop
+        matched a post of the current page.
+
+        :param stop: Called with each post, True ends the iteration before that post,
+                     e.g. ``lambda post: post.post_id == last_seen``
+        :param continuation: Start from this page instead of the first one, e.g. a token
+                             built with livetube.util.proto.browse_continuation
+        :raise NetworkError: Fetching problems
+        """
+        if continuation:
+            contents = await self._api_continuation(continuation)
+        else:
+            js_data = await self._first_page()
+            with tracer.phase("model_build"):
+                contents = self._post_contents(js_data)
+        while contents:
+            with tracer.phase("model_build"):
+                posts = self._parse_post_threads(contents)
+            if stop is not None:
+                for index, post in enumerate(posts):
+                    if stop(post):
+                        posts, contents = posts[:index], None
+                        break
+            continuation = self._continuation_of(contents) if contents else None
+            next_page = asyncio.ensure_future(self._api_continuation(continuation)) if continuation else None
+            try:
+                for post in posts:
+                    yield post
+                contents = await next_page if next_page else None
+            finally:
+                if next_page and not next_page.done():
+                    next_page.cancel()
+
+    @traced("browse", "channel_id")
+    async def fetch_new(self, max_pages: int = 5) -> List[Post]:
+        """
+        Posts newer than the cursor of this channel in community_cursors, and the cursor post when edited
+
+        Post threads are parsed only up to the first known post. On the first poll of a channel
+        every post of the first page is new. When no known post is found in max_pages (all of them
+        deleted or hidden), nothing is returned and the cursor starts again from the newest post.
+
+        :param max_pages: Pages followed while no known post is found
+        :raise NetworkError: Fetching problems
+        :return: New posts, newest first
+        """
+        known = dict(community_cursors.get(self.channel_id) or ())
+        js_data = await self._first_page()
+        contents = self._post_contents(js_data)
+        threads, keys, found, page = [], [], not known, 1
+        while contents:
+            for post_thread in contents:
+                key = self._thread_key(post_thread)
+                if key is None:
+                    continue
+                if key[0] in known:
+                    if key[1] != known[key[0]]:
+                        # Edited
+                        threads.append(post_thread)
+                    keys.append(key)
+                    found = True
+                    break
+                threads.append(post_thread)
+                keys.append(key)
+            continuation = self._continuation_of(contents)
+            if found or page >= max_pages or not continuation:
+                break
+            contents = await self._api_continuation(continuation)
+            page += 1
+        if not found:
+            self.warn(f"None of {len(known)} known posts found in {page} pages, skipping posts behind the cursor")
+            threads = []
+        with tracer.phase("model_build"):
+            posts = self._parse_post_threads(threads)
+        if keys:
+            community_cursors.set(self.channel_id, keys)
+        return posts
+
+
+class CommunityWatcher:
+    class _Channel:
+        __slots__ = ("interval", "due", "polled")
+
+        def __init__(self, interval: float, due: float):
+            self.interval = interval
+            self.due = due
+            self.polled = False
+
+    def __init__(self, channel_ids: Iterable[str] = (), concurrency: int = 20, rate: float = 10,
+                 interval: float = 300, min_interval: float = 60, max_interval: float = 3600,
+                 backfill: bool = False, seen: Optional[SeenStore] = None, cookie: Optional[dict] = None,
+                 header: Optional[Dict[str, Union[str, bool, int]]] = None,
+                 loop: Optional[AbstractEventLoop] = None):
+        """
+        Poll community posts of many channels, new posts are emitted once
+
+        Usage:
+            watcher = CommunityWatcher(channel_ids)
+            async for channel_id, post in watcher:
+                ...
+
+        Channels are polled with Community.fetch_new in order of due time, the interval of
+        a channel halves when it posted and grows by half when it didn't. A post is emitted
+        once even if several channels share it, reposts are keyed by their original post.
+
+        :param channel_ids: Channel IDs or urls, more with add()
+        :param concurrency: Requests in flight
+        :param rate: Requests per second over every channel
+        :param interval: First interval of a channel, in seconds
+        :param min_interval: Shortest interval of a channel
+        :param max_interval: Longest interval of a channel, also after errors
+        :param backfill: Emit posts already there on the first poll of a channel without cursor
+        :param seen: Seen post IDs, e.g. a SeenStore with a path to keep them across restarts
+        :param cookie: Cookie shared by every request
+        :param header: Additional header
+        :param loop: Event loop
+        """
+        self.concurrency = concurrency
+        self.rate = rate
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backfill = backfill
+        self.seen = seen if seen is not None else SeenStore()
+        self.cookie = cookie
+        self.header = header
+        self.loop = loop
+        self.channels: Dict[str, CommunityWatcher._Channel] = {}
+        self._stats = {"polls": 0, "posts": 0, "duplicates": 0, "errors": 0}
+
+        # (due, channel ID), entries of removed / rescheduled channels are skipped
+        self._heap: List[Tuple[float, str]] = []
+        # Created by start(), in the running loop
+        self._wakeup: Optional[asyncio.Event] = None
+        self._next_slot = 0.0
+        self._due: Optional[asyncio.Queue] = None
+        self._posts: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        for channel_id in channel_ids:
+            self.add(channel_id)
+
+    def __len__(self):
+        return len(self.channels)
+
+    def add(self, channel_id: str, interval: Optional[float] = None):
+        """
+        Watch a channel, first polled right away
+
+        :raise ExtractError: Invalid channel ID
+        """
+        channel_id = Community._parse_channel_id(channel_id)
+        if channel_id in self.channels:
+            return
+        self.channels[channel_id] = self._Channel(interval or self.interval, time.monotonic())
+        self._schedule(channel_id, 0)
+
+    def remove(self, channel_id: str):
+        self.channels.pop(channel_id, None)
+
+    def _schedule(self, channel_id: str, delay: float):
+        channel = self.channels.get(channel_id)
+        if channel is None:
+            return
+        # Jitter keeps channels added together from staying in step
+        channel.due = time.monotonic() + delay * random.uniform(0.9, 1.1)
+        heapq.heappush(self._heap, (channel.due, channel_id))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _pace(self):
+        """Wait for the next request slot of rate"""
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + 1 / self.rate
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def _scheduler(self):
+        """Hand due channels to the workers"""
+        while True:
+            if self._heap:
+                due, channel_id = self._heap[0]
+                wait = due - time.monotonic()
+                if wait <= 0:
+                    heapq.heappop(self._heap)
+                    channel = self.channels.get(channel_id)
+                    if channel is None or channel.due != due:
+                        continue
+                    await self._pace()
+                    poll_lateness.observe(max(0.0, time.monotonic() - due), endpoint="browse/community")
+                    await self._due.put(channel_id)
+                    continue
+            else:
+                wait = None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll(self, channel_id: str):
+        channel = self.channels.get(channel_id)
+        if channel is None:
+            return
+        first_poll = not channel.polled and community_cursors.get(channel_id) is None
+        try:
+            community = Community(channel_id, dict(self.cookie) if self.cookie else None, self.header, self.loop,
+                                  raise_429=True)
+            posts = await community.fetch_new()
+        except RateLimited as e:
+            self._stats['errors'] += 1
+            logger.warning(f"[{channel_id}] Community watcher rate limited, pausing for {e.retry_after or 60:.0f}s")
+            self._next_slot = max(self._next_slot, time.monotonic() + (e.retry_after or 60))
+            self._schedule(channel_id, channel.interval)
+            return
+        except Exception as e:
+            # Keeps the worker alive, the channel is tried again later
+            self._stats['errors'] += 1
+            logger.warning(f"[{channel_id}] Failed to fetch community posts: {e!r}")
+            channel.interval = min(self.max_interval, channel.interval * 2)
+            self._schedule(channel_id, channel.interval)
+            return
+        self._stats['polls'] += 1
+        channel.polled = True
+        new_posts = 0
+        # Oldest first
+        for post in reversed(posts):
+            key = post.shared_post.post_id if isinstance(post, SharedPost) else post.post_id
+            if not self.seen.add(key):
+                self._stats['duplicates'] += 1
+                continue
+            new_posts += 1
+            if not first_poll or self.backfill:
+                self._stats['posts'] += 1
+                await self._posts.put((channel_id, post))
+        if new_posts and not first_poll:
+            channel.interval = max(self.min_interval, channel.interval / 2)
+        else:
+            channel.interval = min(self.max_interval, channel.interval * 1.5)
+        self._schedule(channel_id, channel.interval)
+
+    async def _worker(self):
+        while True:
+            channel_id = await self._due.get()
+            await self._poll(channel_id)
+
+    def start(self):
+        """Start polling, done by iterating too"""
+        if self._tasks:
+            return
+        self._wakeup = asyncio.Event()
+        self._due = asyncio.Queue(self.concurrency)
+        self._posts = asyncio.Queue(self.concurrency * 100)
+        self._tasks = [asyncio.ensure_future(self._scheduler())]
+        self._tasks += [asyncio.ensure_future(self._worker()) for _ in range(max(1, self.concurrency))]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def __aiter__(self) -> AsyncIterator[Tuple[str, Post]]:
+        """Channel ID and post, oldest first per channel"""
+        await yt_internal_api.fetch()
+        self.start()
+        while True:
+            yield await self._posts.get()
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        now = time.monotonic()
+        return dict(self._stats, channels=len(self.channels), seen=len(self.seen),
+                    behind=sum(1 for channel in self.channels.values() if channel.due < now))
 
 
 class Membership:
-    def __init__(self, cookie: dict,
+    def __init__(self, cookie: Union[dict, Identity],
                  header: Optional[Dict[str, Union[str, bool, int]]] = None,
                  loop: Optional[AbstractEventLoop] = None):
         """
         Membership list init
 
-        :param cookie: Cookie
+        :param cookie: Cookie, or an identity of an IdentityPool to use its rate budget and cookie jar
         :param header: Additional header
         :param loop: Event loop
         :raise ValueError: Cookie doesn't contain SAPISID
         """
 
         # Header
-        self.header = default_header
-        if header:
-            self.header.update(header)
+        self.header = make_header(default_header, header)
 
         # Client setup
         self.loop = loop or asyncio.get_event_loop()
+        self.identity: Optional[Identity] = None
+        if isinstance(cookie, Identity):
+            self.identity, cookie = cookie, cookie.cookie
         if cookie is None:
             cookie = dict()
         cookie.update({"PREF": "hl=en"})
@@ -754,7 +1306,9 @@ class Membership:
                                                               force_close=True, enable_cleanup_closed=True, limit=0)
         self.http = shared_tcp_pool[client_id]
 
-        self.endpoint = f"{yt_root_url}/paid_memberships"
+        self.endpoint = f"{cache.yt_root_url}/paid_memberships"
+        # Members of the last unchanged single page list
+        self._members_memo = ParseMemo("Membership.fetch")
 
     # Logger
 
@@ -782,6 +1336,7 @@ class Membership:
         if not cookie.get("SAPISID"):
             raise ValueError("SAPISID not found, please check your cookie.")
         self.cookie = cookie
+        self.identity = None
 
     async def _api_membership_status(self, continuation: str):
         endpoint = f"{yt_internal_api.endpoint}/{yt_internal_api.version}/browse?key={yt_internal_api.key}"
@@ -792,20 +1347,50 @@ class Membership:
                 "client": get_yt_client_info()
             },
             "continuation": continuation
-        }, header=calculate_SNAPPISH(self.cookie, self.header), cookie=self.cookie) as response:
+        }, header=calculate_SNAPPISH(self.cookie, self.header), cookie=self.cookie, identity=self.identity,
+                                field_mask="Membership._api_membership_status") as response:
             if response.content_type == "text/html":
                 self.error(f"Failed to fetch membership status")
                 raise NetworkError
-            member_data = query_selector(await response.json(), content_path)
+            member_data = query_selector(await read_json(response), content_path)
             if member_data:
                 return member_data
             else:
                 self.error("Failed to query membership status path")
                 raise NetworkError
 
-    async def _parse_membership_list(self, membership_list: Union[list, tuple]):
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _decode_channel_id(token: str) -> str:
+        """Channel ID of a membership card token, the same tokens come back on every fetch"""
+        _, details, _ = decode_browse_continuation(token)
+        return field_path(details, 50, 12, 3, 2).decode()
+
+    @staticmethod
+    def _section_of(membership_list: Union[list, tuple], item_index: str = "") -> str:
+        """Heading in effect after a page, carried over to the next one"""
+        for membership_data in membership_list:  # type: dict
+            index_data = membership_data.get("cardItemRenderer")
+            if index_data:
+                item_index = get_text(
+                    index_data['headingRenderer']['cardItemTextCollectionRenderer']['textRenderers'][0]
+                    ['cardItemTextRenderer']['text']
+                )
+        return item_index
+
+    @staticmethod
+    def _continuation_of(membership_list: Union[list, tuple]) -> Optional[str]:
+        """Token of the next page, None on the last page"""
+        if membership_list:
+            return query_selector(membership_list[-1],
+                                  "continuationItemRenderer/continuationEndpoint/continuationCommand/token")
+        return None
+
+    async def _parse_membership_list(self, membership_list: Union[list, tuple], item_index: str = ""):
+        """
+        :param item_index: Heading of the previous page, Memberships | Inactive Memberships
+        """
         memberships = []
-        item_index = ""  # Memberships | Inactive Memberships
         member_status_path = ("baseRenderer/cardItemRenderer/headingRenderer/cardItemTextWithImageRenderer/"
                               "textCollectionRenderer/?/cardItemTextCollectionRenderer/textRenderers/?/"
                               "cardItemTextRenderer/style:")
@@ -822,16 +1407,13 @@ class Membership:
                 if not item_index:
                     self.error("Unknown member type")
                     raise ExtractError
-                token = unquote(member_data['onClickCommand']['continuationCommand']['token'])
-                entry = (ContinuationCommandEntry.FromString(b64decode(token)))
-                details = ContinuationCommand.FromString(b64decode(unquote(entry.entry.details)))
-                channel_id = details.entry.details.channelDetails.channelId
+                channel_id = self._decode_channel_id(member_data['onClickCommand']['continuationCommand']['token'])
                 name = query_selector(member_data, member_status_path + "CARD_ITEM_TEXT_STYLE_TITLE_2")
                 if name:
                     name = get_text(name[0]['text'])
-                elif details.entry.details.channelDetails.channelId == "unlimited-B-music":
+                elif channel_id == "unlimited-B-music":
                     name = "Youtube Music"
-                elif details.entry.details.channelDetails.channelId == "unlimited":
+                elif channel_id == "unlimited":
                     name = "Youtube Premium"
                 else:
                     name = "Unknown"
@@ -887,74 +1469,207 @@ class Membership:
             self.error("Cannot query entry point of items")
         raise ExtractError
 
-    async def _json_fetch(self):
+    async def _json_fetch(self, memo: Optional[ParseMemo] = None) -> Optional[dict]:
+        """First page, None when it matches memo"""
         async with http_request(self.http, "POST", url=self.endpoint + "?pbj=1",
-                                header=self.header, cookie=self.cookie) as response:
-            if response is False:
-                # Fallback
-                return await self._html_fetch()
+                                header=self.header, cookie=self.cookie, identity=self.identity) as response:
             if response.content_type == "text/html":
                 self.error(f"Failed to fetch membership list")
                 raise NetworkError
-            scripts = await response.json()
+            raw = await read_body(response)
+            if memo is not None and memo.check(raw, b'"contents"'):
+                return None
+            scripts = load_json(raw)
             for script in scripts:
                 resp_json = script.get("response")
                 if resp_json:
                     return resp_json
+            self.error("Membership list not found in pbj response")
+            raise ExtractError
 
     async def _html_fetch(self):
         async with http_request(self.http, url=self.endpoint,
-                                header=self.header, cookie=self.cookie, allow_redirects=False) as response:
+                                header=self.header, cookie=self.cookie, identity=self.identity,
+                                allow_redirects=False) as response:
             if response.status != 200:
                 self.error(f"Failed to fetch membership list")
                 raise NetworkError
-            html_js = ScriptTaker(await response.text()).scripts
+            html = await read_text(response)
+        with tracer.phase("html_parse"):
+            html_js = ScriptTaker(html).scripts
             yt_internal_api.update_html(player.get_ytplayer_setconfig(html_js))
             resp_json = initial_data(html_js)
-            return resp_json
+        return resp_json
+
+    async def _first_page(self, memo: Optional[ParseMemo] = None) -> Optional[dict]:
+        """First page json, None when the pbj response matches memo"""
+        self.info("Downloading webpage")
+        if memo is not None:
+            memo.pending = None
+        handlers = {"html": self._html_fetch}
+        if yt_internal_api.key:
+            handlers["pbj"] = partial(self._json_fetch, memo)
+        return await transport_selector.run("memberships", handlers)
+
+    async def iter_members(self) -> AsyncIterator[Member]:
+        """
+        Stream members of every page, the next page is requested before the current one is parsed
 
+        :raise ExtractError: Cannot extract field(s)
+        :raise NetworkError: Fetching problems
+        """
+        async for memberships in self._iter_pages(await self._first_page()):
+            for member in memberships:
+                yield member
+
+    async def _iter_pages(self, resp_json: dict) -> AsyncIterator[List[Member]]:
+        """Members per page, starting from the first page json"""
+        with tracer.phase("model_build"):
+            membership_data = await self._parse_item_path(resp_json)
+        item_index = ""
+        while membership_data:
+            continuation = self._continuation_of(membership_data)
+            next_page = asyncio.ensure_future(self._api_membership_status(continuation)) if continuation else None
+            try:
+                with tracer.phase("model_build"):
+                    memberships = await self._parse_membership_list(membership_data, item_index)
+                    item_index = self._section_of(membership_data, item_index)
+                yield memberships
+                membership_data = await next_page if next_page else ()
+            finally:
+                if next_page and not next_page.done():
+                    next_page.cancel()
+
+    @traced("paid_memberships")
     async def fetch(self) -> list:
         """
-        Fetch membership infomation
+        Fetch membership infomation of every page, also the memberships of the identity when given one
 
         :raise ExtractError: Cannot extract field(s)
         :raise NetworkError: Fetching problems
         :return: Membership details
         """
-        self.info("Downloading webpage")
-        resp_json = await (self._json_fetch() if yt_internal_api.key else self._html_fetch())
-        membership_data = await self._parse_item_path(resp_json)
-        if membership_data:
-            memberships = await self._parse_membership_list(membership_data)
-            return memberships
-        return []
+        resp_json = await self._first_page(self._members_memo)
+        if resp_json is None:
+            memberships = list(self._members_memo.value)
+        else:
+            memberships, pages = [], 0
+            async for page in self._iter_pages(resp_json):
+                memberships.extend(page)
+                pages += 1
+            if pages <= 1:
+                self._members_memo.store(list(memberships))
+            else:
+                # Only the first page is checked, later pages may have changed
+                self._members_memo.reset()
+        if self.identity is not None:
+            # Lets the pool pick members for members only videos
+            self.identity.memberships = {member.channel_id for member in memberships if not member.expired}
+        return memberships
+
+
+class MembershipSweep:
+    def __init__(self, identities: Union[IdentityPool, Dict[str, dict]], concurrency: int = 10,
+                 header: Optional[Dict[str, Union[str, bool, int]]] = None,
+                 loop: Optional[AbstractEventLoop] = None):
+        """
+        Membership lists of many accounts, reported as changes between sweeps
+
+        :param identities: Identity pool, or account name -> cookie
+        :param concurrency: Accounts fetched at once
+        :param header: Additional header
+        :param loop: Event loop
+        """
+        self.identities = identities
+        self.concurrency = concurrency
+        self.header = header
+        self.loop = loop
+        # Account name -> channel ID -> Member, from the last sweep
+        self.members: Dict[str, Dict[str, Member]] = {}
+        # Account name -> (cookie / identity given, Membership), kept for unchanged responses to skip parsing
+        self._objects: Dict[str, tuple] = {}
+
+    def _diff(self, name: str, memberships: List[Member]) -> MembershipChanges:
+        previous = self.members.get(name, {})
+        current = {member.channel_id: member for member in memberships}
+        changes = MembershipChanges()
+        for channel_id, member in current.items():
+            last = previous.get(channel_id)
+            if not member.expired:
+                if last is None:
+                    changes.new.append(member)
+                elif last.expired:
+                    changes.renewed.append(member)
+            elif last is not None and not last.expired:
+                changes.expired.append(member)
+        for channel_id, last in previous.items():
+            if channel_id not in current and not last.expired:
+                # Dropped from the list entirely
+                changes.expired.append(replace(last, expired=True))
+        self.members[name] = current
+        return changes
+
+    async def run(self) -> Dict[str, Union[MembershipChanges, LivetubeError]]:
+        """
+        Fetch every account, the first sweep reports all active memberships as new
+
+        :return: Account name -> changes since the last sweep, or the error raised for it.
+                 Accounts without changes are left out
+        """
+        if isinstance(self.identities, IdentityPool):
+            accounts = list(self.identities.identities.items())
+        else:
+            accounts = list(self.identities.items())
+        results: Dict[str, Union[MembershipChanges, LivetubeError]] = {}
+        iterator = iter(accounts)
+        await yt_internal_api.fetch()
+
+        async def worker():
+            for name, cookie in iterator:
+                source, membership = self._objects.get(name, (None, None))
+                if source is not cookie:
+                    membership = Membership(cookie if isinstance(cookie, Identity) else dict(cookie),
+                                            self.header, self.loop)
+                    self._objects[name] = (cookie, membership)
+                try:
+                    memberships = await membership.fetch()
+                except LivetubeError as e:
+                    results[name] = e
+                    continue
+                changes = self._diff(name, memberships)
+                if changes.changed:
+                    results[name] = changes
+
+        await asyncio.gather(*(worker() for _ in range(max(1, self.concurrency))))
+        return results
 
 
 class Studio:
-    def __init__(self, cookie: dict,
+    def __init__(self, cookie: Union[dict, Identity],
                  header: Optional[Dict[str, Union[str, bool, int]]] = None,
                  loop: Optional[AbstractEventLoop] = None):
         """
         Youtube studio object
 
-        :param cookie: Cookie
+        :param cookie: Cookie, or an identity of an IdentityPool to use its rate budget and cookie jar
         :param header: Additional header
         :param loop: Event loop
         :raise ValueError: Cookie doesn't contain SAPISID
         """
 
         # Header
-        self.header = {
+        self.header = make_header({
             "User-Agent": user_agent,
             "X-Origin": "https://studio.youtube.com",
             "Origin": "https://studio.youtube.com",
             "Referer": "https://studio.youtube.com",
-        }
-        if header:
-            self.header.update(header)
+        }, header)
 
         # Client setup
         self.loop = loop or asyncio.get_event_loop()
+        self.identity: Optional[Identity] = None
+        if isinstance(cookie, Identity):
+            self.identity, cookie = cookie, cookie.cookie
         if cookie is None:
             cookie = dict()
         cookie.update({"PREF": "hl=en"})
@@ -972,7 +1687,7 @@ class Studio:
         self.http = shared_tcp_pool[client_id]
 
         # endpoint
-        self.upload_ep = "https://upload.youtube.com"
+        self.upload_ep = cache.upload_url
 
     # Logger
 
@@ -1000,6 +1715,12 @@ class Studio:
         if not cookie.get("SAPISID"):
             raise ValueError("SAPISID not found, please check your cookie.")
         self.cookie = cookie
+        self.identity = None
+
+    @property
+    def _account(self) -> str:
+        """Key of the studio config"""
+        return self.identity.name if self.identity else self.cookie['SAPISID']
 
     async def _upload_video(self, Created: BytesIO, session_id: str):
         """
@@ -1028,7 +1749,8 @@ class Studio:
                     "X-Goog-Upload-Command": ", ".join(upload_cmd),
                 })
                 async with http_request(self.http, "POST", url=data['upload-url'],
-                                        header=header, cookie=self.cookie, data=chunk) as response:
+                                        header=header, cookie=self.cookie, identity=self.identity,
+                                        data=chunk) as response:
                     if response.status == 200:
                         last_end_offset += len(chunk)
                         if response.headers.get("X-Goog-Upload-Status") == "final":
@@ -1062,7 +1784,7 @@ class Studio:
         })
         upload_session_id = gen_yt_upload_session_id()
         async with http_request(self.http, "POST", url=self.upload_ep + "/upload/studio",
-                                header=header, cookie=self.cookie,
+                                header=header, cookie=self.cookie, identity=self.identity,
                                 json_data={"frontendUploadId": upload_session_id}) as response:
             if response.status == 200:
                 self.upload_cache[upload_session_id] = {
@@ -1076,56 +1798,51 @@ class Studio:
             else:
                 raise RuntimeError("Failed to start upload session")
 
-    async def _get_challenge(self):
-        await yt_internal_api.fetch()
-        endpoint = studio_root_url + f"/youtubei/{yt_internal_api.version}/att/get"
-        endpoint += "?alt=json&key=" + yt_internal_api.key
+    async def _get_challenge(self, config: Optional[StudioConfig] = None):
+        if config is None:
+            config = await studio_config.ensure(self._account, self.cookie)
+        endpoint = cache.studio_root_url + f"/youtubei/{config.version}/att/get"
+        endpoint += "?alt=json&key=" + config.key
         header = self.header.copy()
-        visitor_id = self.cookie.get("VISITOR_INFO1_LIVE")
-        if not visitor_id:
+        visitor_info_live = self.cookie.get("VISITOR_INFO1_LIVE")
+        if not visitor_info_live:
             raise ValueError("VISITOR_INFO1_LIVE is required to get session challenge")
-        visitor_proto = GoogleVisitorId(
-            visitor_info_live=visitor_id,
-            timestamp=int(time.time())
-        )
-        header['X-Goog-Visitor-Id'] = quote(b64encode(visitor_proto.SerializeToString()))
+        header['X-Goog-Visitor-Id'] = visitor_id(visitor_info_live)
         async with http_request(self.http, "POST", url=endpoint, header=calculate_SNAPPISH(self.cookie, header),
-                                cookie=self.cookie, json_data={
+                                cookie=self.cookie, identity=self.identity, json_data={
                     "context": {
-                        "client": get_yt_client_info()
+                        "client": config.client_info()
                     }
                 }) as response:
             if response.status == 200:
-                js_resp = await response.json()
+                js_resp = await read_json(response)
                 return js_resp.get("challenge")
 
-    async def _get_session_token(self, bg_token=""):
+    async def _get_session_token(self, bg_token="", config: Optional[StudioConfig] = None):
         if self.session_cache.get("ts") and time.time() - self.session_cache['ts'] <= 8 * 60 * 60:
             return self.session_cache['token']
         elif not bg_token:
             raise ValueError("botGuard token is required to get session token")
-        challenge_data = await self._get_challenge()
-        endpoint = studio_root_url + f"/youtubei/{yt_internal_api.version}/att/esr"
-        endpoint += "?alt=json&key=" + yt_internal_api.key
+        if config is None:
+            config = await studio_config.ensure(self._account, self.cookie)
+        challenge_data = await self._get_challenge(config)
+        endpoint = cache.studio_root_url + f"/youtubei/{config.version}/att/esr"
+        endpoint += "?alt=json&key=" + config.key
         header = self.header.copy()
-        visitor_id = self.cookie.get("VISITOR_INFO1_LIVE")
-        if not visitor_id:
+        visitor_info_live = self.cookie.get("VISITOR_INFO1_LIVE")
+        if not visitor_info_live:
             raise ValueError("VISITOR_INFO1_LIVE is required to get session id")
-        visitor_proto = GoogleVisitorId(
-            visitor_info_live=visitor_id,
-            timestamp=int(time.time())
-        )
-        header['X-Goog-Visitor-Id'] = quote(b64encode(visitor_proto.SerializeToString()))
+        header['X-Goog-Visitor-Id'] = visitor_id(visitor_info_live)
         async with http_request(self.http, "POST", url=endpoint, header=calculate_SNAPPISH(self.cookie, header),
-                                cookie=self.cookie, json_data={
+                                cookie=self.cookie, identity=self.identity, json_data={
                     "context": {
-                        "client": get_yt_client_info(studio=True)
+                        "client": config.client_info()
                     },
                     "challenge": challenge_data,
                     "botguardResponse": bg_token
                 }) as response:
             if response.status == 200:
-                js_resp = await response.json()
+                js_resp = await read_json(response)
                 if js_resp.get("vint", 1) != 0:
                     self.warn("botGuard token check failed!")
                     return ""
@@ -1145,7 +1862,14 @@ class Studio:
             response['video_id'] = video_id
         contents = data.get("contents") or data.get("continuationContents", [None])[0]
         if contents:
-            contents = contents.get("uploadFeedbackItemRenderer") or contents.get("uploadFeedbackItemContinuation")
+            Studio._parse_feedback_item(contents, response)
+        return response
+
+    @staticmethod
+    def _parse_feedback_item(contents: dict, response: dict) -> dict:
+        """Fill response from one feedback item"""
+        contents = contents.get("uploadFeedbackItemRenderer") or contents.get("uploadFeedbackItemContinuation")
+        if contents:
             response['continue_token'] = (contents['continuations'][1]
                 ['uploadFeedbackRefreshContinuation'][ 'continuation'])
             id_content = contents.get("id")
@@ -1168,19 +1892,33 @@ class Studio:
         return response
 
     async def get_video_progress(self, continue_token: str):
-        await yt_internal_api.fetch(studio=True, cookie=self.cookie)
-        endpoint = studio_root_url + f"/youtubei/{yt_internal_api.version}/upload/feedback"
-        endpoint += f"?alt=json&key=" + yt_internal_api.key
+        progress = await self.get_videos_progress([continue_token])
+        if progress is not None:
+            return progress[0] if progress else {}
+
+    @invalidates_config
+    async def get_videos_progress(self, continue_tokens: List[str]) -> Optional[List[dict]]:
+        """
+        Progress of many uploads in one feedback request, see UploadProgressMonitor
+
+        :param continue_tokens: continue_token of each upload, from create_video or the last progress
+        :return: Progress of each upload, in order of continue_tokens. None when the request failed
+        """
+        config = await studio_config.ensure(self._account, self.cookie)
+        endpoint = cache.studio_root_url + f"/youtubei/{config.version}/upload/feedback"
+        endpoint += f"?alt=json&key=" + config.key
         async with http_request(self.http, "POST", url=endpoint, header=calculate_SNAPPISH(self.cookie, self.header),
-                                cookie=self.cookie, json_data={
+                                cookie=self.cookie, identity=self.identity, json_data={
                     "context": {
-                        "client": get_yt_client_info(studio=True)
+                        "client": config.client_info()
                     },
-                    "continuations": [continue_token]
+                    "continuations": list(continue_tokens)
                 }) as response:
             if response.status == 200:
-                return self._handle_feedback(await response.json())
+                data = await read_json(response)
+                return [self._parse_feedback_item(contents, {}) for contents in data.get("continuationContents", [])]
 
+    @invalidates_config
     async def create_video(self, upload_session: str, bg_token: str,
                            title="", description="", is_draft: bool = None,
                            privacy="UNLISTED", sponsors_only: bool = None,
@@ -1204,11 +1942,12 @@ class Studio:
         :raise NetworkError: Network error
         :raise ValueError: Failed to get session token
         """
-        session_token = await self._get_session_token(bg_token)
+        config = await studio_config.ensure(self._account, self.cookie)
+        session_token = await self._get_session_token(bg_token, config)
         if not session_token:
             raise ValueError("Failed to get session token")
         context = {
-            "client": get_yt_client_info(studio=True),
+            "client": config.client_info(),
             "request": {
                 "sessionInfo": {
                     "token": session_token
@@ -1267,12 +2006,11 @@ class Studio:
                 playlist['deleteFromPlaylistIds'] = del_from_playlist_ids
             if len(playlist):
                 metadata['addToPlaylist'] = playlist
-        await yt_internal_api.fetch(studio=True, cookie=self.cookie)
-        endpoint = studio_root_url + f"/youtubei/{yt_internal_api.version}/upload/createvideo"
-        endpoint += "?alt=json&key=" + yt_internal_api.key
+        endpoint = cache.studio_root_url + f"/youtubei/{config.version}/upload/createvideo"
+        endpoint += "?alt=json&key=" + config.key
         video_id = None
         async with http_request(self.http, "POST", url=endpoint, header=calculate_SNAPPISH(self.cookie, self.header),
-                                cookie=self.cookie, json_data={
+                                cookie=self.cookie, identity=self.identity, json_data={
                     "context": context,
                     "botguardClientResponse": bg_token,
                     "frontendUploadId": upload_session,
@@ -1284,19 +2022,20 @@ class Studio:
                     "initialMetadata": {}
                 }) as response:
             if response.status == 200:
-                js_resp = await response.json()
+                js_resp = await read_json(response)
                 feedback = self._handle_feedback(js_resp)
                 video_id = feedback.get("video_id")
                 if not video_id:
                     return feedback
         metadata['encryptedVideoId'] = video_id
-        endpoint = studio_root_url + f"/youtubei/{yt_internal_api.version}/video_manager/metadata_update"
-        endpoint += "?alt=json&key=" + yt_internal_api.key
+        endpoint = cache.studio_root_url + f"/youtubei/{config.version}/video_manager/metadata_update"
+        endpoint += "?alt=json&key=" + config.key
         async with http_request(self.http, "POST", url=endpoint, header=calculate_SNAPPISH(self.cookie, self.header),
-                                cookie=self.cookie, json_data=metadata) as _:
+                                cookie=self.cookie, identity=self.identity, json_data=metadata) as _:
             pass
         return feedback
 
+    @invalidates_config
     async def create_playlist(self, title: str, description="",
                               privacy="UNLSITED", source_playlist_id: str = None,
                               add_to_top: bool = None) -> str:
@@ -1312,9 +2051,10 @@ class Studio:
         :return: Created playlist id
         """
         playlist_id = ""
+        config = await studio_config.ensure(self._account, self.cookie)
         payload = {
             "context": {
-                "client": get_yt_client_info(studio=True)
+                "client": config.client_info()
             },
             "title": title,
         }
@@ -1325,22 +2065,21 @@ class Studio:
             payload['description'] = description
         if source_playlist_id:
             payload['sourcePlaylistId'] = source_playlist_id
-        await yt_internal_api.fetch(studio=True, cookie=self.cookie)
-        endpoint = studio_root_url + f"/youtubei/{yt_internal_api.version}/playlist/create"
-        endpoint += "?alt=json&key=" + yt_internal_api.key
+        endpoint = cache.studio_root_url + f"/youtubei/{config.version}/playlist/create"
+        endpoint += "?alt=json&key=" + config.key
         async with http_request(self.http, "POST", url=endpoint, header=calculate_SNAPPISH(self.cookie, self.header),
-                                cookie=self.cookie, json_data=payload) as response:
+                                cookie=self.cookie, identity=self.identity, json_data=payload) as response:
             if response.status == 200:
-                js_resp = await response.json()
+                js_resp = await read_json(response)
                 playlist_id = js_resp['playlistId']
         if playlist_id and type(add_to_top) is bool:
             endpoint = (f"{yt_internal_api.endpoint}/{yt_internal_api.version}/browse/edit_playlist"
                         f"?key={yt_internal_api.key}")
             async with http_request(self.http, "POST", url=endpoint,
                                     header=calculate_SNAPPISH(self.cookie, default_header),
-                                    cookie=self.cookie,
+                                    cookie=self.cookie, identity=self.identity,
                                     json_data={"context": {
-                                        "client": get_yt_client_info(studio=True)
+                                        "client": config.client_info()
                                     },
                                         "actions": [
                                             {
@@ -1351,7 +2090,113 @@ class Studio:
                                         "playlistId": playlist_id
                                     }) as response:
                 if response.status == 200:
-                    js_resp = await response.json()
+                    js_resp = await read_json(response)
                     if js_resp['status'] != "STATUS_SUCCEEDED":
                         self.warn("Faield to edit playlist")
         return playlist_id
+
+
+class UploadProgressMonitor:
+    # Last status of an upload, it's dropped from the monitor after
+    finished_statuses = ("UPLOAD_STATUS_PROCESSED", "UPLOAD_STATUS_FAILED", "UPLOAD_STATUS_REJECTED",
+                         "UPLOAD_STATUS_DELETED")
+
+    def __init__(self, studio: Studio, batch_size: int = 50, interval: float = 5,
+                 min_interval: float = 1, max_interval: float = 60):
+        """
+        Progress of many uploads, polled in batched feedback requests
+
+        Usage:
+            monitor = UploadProgressMonitor(studio)
+            monitor.add(await studio.create_video(...))
+            async for video_id, progress in monitor:
+                ...
+
+        A poll sends the tokens of every upload in flight, batch_size per request. An event
+        is emitted when the progress of an upload changed, a finished upload emits its last
+        progress and leaves the monitor. The interval halves after a poll with changes and
+        grows by half after one without. Iteration ends when no upload is left.
+
+        :param studio: Studio of the uploads
+        :param batch_size: Tokens per feedback request
+        :param interval: First interval between polls, in seconds
+        :param min_interval: Shortest interval
+        :param max_interval: Longest interval
+        """
+        self.studio = studio
+        self.batch_size = batch_size
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        # Video ID -> last progress, with continue_token
+        self.uploads: Dict[str, dict] = {}
+
+    def __len__(self):
+        return len(self.uploads)
+
+    def add(self, progress: dict):
+        """
+        Monitor an upload
+
+        :param progress: Result of Studio.create_video / get_video_progress
+        :raise ValueError: Progress without video_id or continue_token
+        """
+        if not progress.get("video_id") or not progress.get("continue_token"):
+            raise ValueError("video_id and continue_token are required to monitor an upload")
+        self.uploads[progress['video_id']] = progress
+
+    def remove(self, video_id: str):
+        self.uploads.pop(video_id, None)
+
+    @staticmethod
+    def _changed(last: dict, progress: dict) -> bool:
+        return any(last.get(key) != progress.get(key) for key in ("status", "upload", "process"))
+
+    async def poll(self) -> List[Tuple[str, dict]]:
+        """
+        Poll every upload once
+
+        :return: Video ID and progress of uploads that changed
+        """
+        video_ids = list(self.uploads)
+        batches = [video_ids[index:index + self.batch_size] for index in range(0, len(video_ids), self.batch_size)]
+        results = await asyncio.gather(*(
+            self.studio.get_videos_progress([self.uploads[video_id]['continue_token'] for video_id in batch])
+            for batch in batches
+        ), return_exceptions=True)
+        events = []
+        for batch, result in zip(batches, results):
+            if isinstance(result, BaseException) and not isinstance(result, LivetubeError):
+                raise result
+            if not isinstance(result, list):
+                self.studio.warn(f"Failed to poll progress of {len(batch)} uploads: {result!r}")
+                continue
+            for video_id, progress in zip(batch, result):
+                # Items carry the video ID, trusted over the order unless missing / None
+                video_id = progress['video_id'] = progress.get("video_id") or video_id
+                last = self.uploads.get(video_id)
+                if last is None:
+                    continue
+                progress.setdefault("continue_token", last['continue_token'])
+                finished = progress.get("status") in self.finished_statuses
+                if finished:
+                    del self.uploads[video_id]
+                else:
+                    self.uploads[video_id] = progress
+                if finished or self._changed(last, progress):
+                    events.append((video_id, progress))
+        return events
+
+    async def __aiter__(self) -> AsyncIterator[Tuple[str, dict]]:
+        """Video ID and progress, until every upload finished or was removed"""
+        while self.uploads:
+            events = await self.poll()
+            for event in events:
+                yield event
+            if not self.uploads:
+                break
+            if events:
+                self.interval = max(self.min_interval, self.interval / 2)
+            else:
+                self.interval = min(self.max_interval, self.interval * 1.5)
+            await asyncio.sleep(self.interval)
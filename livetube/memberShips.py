@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Optional, List
 
 
 @dataclass
@@ -7,4 +7,16 @@ class Member:
     name: str
     channel_id: str
     expired: bool
-    expire_time: Optional[str]
+    expire_time: Optional[str] = None
+
+
+@dataclass
+class MembershipChanges:
+    """Difference of a membership list to the previous sweep"""
+    new: List[Member] = field(default_factory=list)
+    expired: List[Member] = field(default_factory=list)
+    renewed: List[Member] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.new or self.expired or self.renewed)
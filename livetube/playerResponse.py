@@ -366,7 +366,7 @@ class playerResponse:
             self.responseContext.update(update)
         if update_items.get('streamingData'):
             if self.streamData:
-                self.streamData.update(update, self.js_url)
+                self.streamData.update(update_items['streamingData'], self.js_url)
             else:
                 self.streamData = streamingData(update_items['streamingData'], self.js_url)
             update = update_items.get("microformat")
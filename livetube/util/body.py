@@ -0,0 +1,58 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 20:40
+    File:    body.py
+    Description: Pre-serialized request bodies of hot innertube calls
+
+    The context part of a body only changes with the client profile and
+    yt_internal_api (tracked by ``yt_internal_api.revision``), so it's
+    serialized once and the per call fields (videoId, continuation,
+    sequenceNumber) are appended as bytes. http_request sends bytes given as
+    ``json_data`` as application/json.
+"""
+import json
+from typing import Callable, Dict, Tuple
+
+from livetube.util.cache import yt_internal_api
+from livetube.util.client import ClientProfile
+
+
+class BodyTemplate:
+    def __init__(self, build: Callable[[ClientProfile], dict]):
+        """
+        :param build: Invariant part of the body for a profile
+        """
+        self.build = build
+        # profile name -> (revision, serialized body without the closing brace)
+        self._prefix: Dict[str, Tuple[int, bytes]] = {}
+
+    def prefix(self, profile: ClientProfile) -> bytes:
+        cached = self._prefix.get(profile.name)
+        if cached is None or cached[0] != yt_internal_api.revision:
+            raw = json.dumps(self.build(profile), separators=(",", ":")).encode()
+            cached = self._prefix[profile.name] = (yt_internal_api.revision, raw[:-1])
+        return cached[1]
+
+    def render(self, profile: ClientProfile, **fields) -> bytes:
+        """Body with fields appended in the given order"""
+        body = self.prefix(profile)
+        parts = [body]
+        separator = b"," if len(body) > 1 else b""
+        for name, value in fields.items():
+            parts.append(b'%s"%s":%s' % (separator, name.encode(), json.dumps(value).encode()))
+            separator = b","
+        parts.append(b"}")
+        return b"".join(parts)
+
+
+# player / updated_metadata
+context_body = BodyTemplate(lambda profile: {"context": profile.context()})
+heartbeat_body = BodyTemplate(lambda profile: {
+    "context": profile.context(),
+    "heartbeatRequestParams": {
+        "heartbeatChecks": [
+            "HEARTBEAT_CHECK_TYPE_LIVE_STREAM_STATUS"
+        ]
+    },
+})
@@ -7,30 +7,58 @@
 """
 import asyncio
 from dataclasses import dataclass
-from functools import lru_cache
-from typing import Union, Any, Optional, Dict
+from typing import Union, Any, Optional, Dict, Tuple
 
 import aiohttp
 
 from livetube.util import player
+from livetube.util.metrics import open_connections
 from livetube.util.parser import ScriptTaker
-from livetube.utils import http_request
+from livetube.util.transport import transport_selector
+from livetube.utils import http_request, read_text, make_header
 
 yt_root_url = "https://www.youtube.com"
 studio_root_url = "https://studio.youtube.com"
+upload_url = "https://upload.youtube.com"
 user_agent = " ".join([
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
     "AppleWebKit/537.36 (KHTML, like Gecko)",
     "Chrome/90.0.4430.72",
     "Safari/537.36"
 ])
-default_header = {
+# Immutable, merge with make_header
+default_header = make_header({
     "User-Agent": user_agent,
     "X-Origin": yt_root_url
-}
+})
 
 # Shared tcp pool to reduce extra memory usage
 shared_tcp_pool: Dict[int, "aiohttp.TCPConnector"] = {}
+# (loop, identity name) -> cookie jar of livetube.util.identity
+shared_cookie_jars: Dict[Tuple[int, str], "aiohttp.CookieJar"] = {}
+open_connections.set_function(
+    lambda: {(): sum(len(getattr(pool, "_acquired", ())) for pool in shared_tcp_pool.values())}
+)
+
+
+def set_root_url(yt: Optional[str] = None, studio: Optional[str] = None, upload: Optional[str] = None):
+    """
+    Point livetube to other hosts, e.g. a local mock server
+
+    Objects created before this call keep their urls (watch_url, upload_ep...)
+
+    :param yt: Replacement of https://www.youtube.com
+    :param studio: Replacement of https://studio.youtube.com
+    :param upload: Replacement of https://upload.youtube.com
+    """
+    global yt_root_url, studio_root_url, upload_url
+    if yt:
+        yt_root_url = yt.rstrip("/")
+        yt_internal_api.endpoint = "%s/youtubei" % yt_root_url
+    if studio:
+        studio_root_url = studio.rstrip("/")
+    if upload:
+        upload_url = upload.rstrip("/")
 
 
 def get_yt_client_info(studio=False):
@@ -62,6 +90,7 @@ class InternalAPI:
     studio_client_name = 62
     studio_client_version = "1.20770101.00.00"
     endpoint = "%s/youtubei" % yt_root_url
+    revision = 0
 
     def __getitem__(self, item):
         return getattr(self, item, None)
@@ -71,12 +100,22 @@ class InternalAPI:
 
     def update(self, key: Union[str, dict], value: Optional[Any] = None):
         if type(key) == str:
-            if self[key] != value:
-                self[key] = value
-        elif type(key) == dict:
-            for k, v in key.items():
-                if self[k] != v:
-                    self[k] = v
+            key = {key: value}
+        changed = False
+        for k, v in key.items():
+            if self[k] != v:
+                self[k] = v
+                changed = True
+        if changed:
+            # Invalidates request body templates
+            self.revision += 1
+
+    def to_state(self) -> dict:
+        """Values from the web pages, restored with update()"""
+        return {name: self[name] for name in (
+            "key", "version", "client_version", "client_name", "client_browser_name", "client_browser_version",
+            "yt_client_name", "yt_client_version", "studio_client_name", "studio_client_version",
+        )}
 
     def update_html(self, script: dict, studio=False):
         """Update data from html's js"""
@@ -110,20 +149,32 @@ class InternalAPI:
         :raise NetworkError: Network error
         :raise ValueError: Studio mode but no cookie
         """
-        loop = asyncio.get_event_loop()
-        client_id = hash(loop)
-        pool = shared_tcp_pool.get(client_id)
-        if not pool:
-            shared_tcp_pool[client_id] = aiohttp.TCPConnector(loop=loop, ttl_dns_cache=60,
-                                                              force_close=True, enable_cleanup_closed=True, limit=0)
         if self.key and not studio and not force:
             return
-        if studio and not cookie:
-            raise ValueError("Cookie required to fetch studio client")
-        async with http_request(shared_tcp_pool[client_id],
-                                url=studio_root_url if studio else yt_root_url,
-                                header=default_header, cookie=cookie if studio else {}) as response:
-            self.update_html(player.get_ytplayer_setconfig(ScriptTaker(await response.text()).scripts), studio)
+        self.update_html(await fetch_page_config(studio, cookie), studio)
+
+
+async def fetch_page_config(studio=False, cookie: dict = None) -> dict:
+    """
+    ytcfg of the youtube / studio home page
+
+    :param studio: Studio dashboard, needs cookie
+    :param cookie: Cookie for fetching studio
+    :raise NetworkError: Network error
+    :raise ValueError: Studio mode but no cookie
+    """
+    loop = asyncio.get_event_loop()
+    client_id = hash(loop)
+    pool = shared_tcp_pool.get(client_id)
+    if not pool:
+        shared_tcp_pool[client_id] = aiohttp.TCPConnector(loop=loop, ttl_dns_cache=60,
+                                                          force_close=True, enable_cleanup_closed=True, limit=0)
+    if studio and not cookie:
+        raise ValueError("Cookie required to fetch studio client")
+    async with http_request(shared_tcp_pool[client_id],
+                            url=studio_root_url if studio else yt_root_url,
+                            header=default_header, cookie=cookie if studio else {}) as response:
+        return player.get_ytplayer_setconfig(ScriptTaker(await read_text(response)).scripts)
 
 
 class JSCache:
@@ -141,10 +192,11 @@ class JSCache:
                     pass
             self.cache[key] = value
 
-    @lru_cache(maxsize=50)
     def __getitem__(self, item):
         return self.cache.get(item)
 
 
 yt_internal_api = InternalAPI()
 js_cache_v2 = JSCache()
+# A broken api path is usually a stale key, refresh it in the background
+transport_selector.set_probe("api", lambda: yt_internal_api.fetch(force=True))
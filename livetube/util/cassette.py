@@ -0,0 +1,242 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 17:02
+    File:    cassette.py
+    Description: Record / replay of http_request traffic
+
+    Usage:
+        from livetube.util.cassette import cassette
+
+        cassette.record("traffic.cassette.gz")      # Capture real traffic
+        cassette.replay("traffic.cassette.gz")      # Serve it back, no network
+        cassette.replay("traffic.cassette.gz", recorded_latency=True)
+        cassette.off()
+
+    A cassette is a gzip file of json lines, one request / response pair per
+    line. Cookies are never written; auth headers and the api key are dropped.
+    Recorded pairs are written in batches by a background thread, off() (or
+    flush()) writes the rest, and so does interpreter exit.
+    Requests are matched by method, url and a few identifying body fields
+    (videoId, browseId, continuation...), answers of the same request are
+    replayed in recorded order and the last one repeats.
+"""
+import asyncio
+import atexit
+import gzip
+import json
+from base64 import b64encode, b64decode
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Optional, Dict, Deque, List, Union
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from livetube.util.exceptions import CassetteMiss
+
+# Request headers never written to disk
+redacted_headers = {"cookie", "authorization", "x-goog-visitor-id", "x-goog-authuser", "x-youtube-identity-token"}
+# Response headers never written to disk
+redacted_response_headers = {"set-cookie"}
+# Url query / json body fields that identify a request
+match_query_ignore = {"key"}
+match_body_fields = ("videoId", "browseId", "continuation", "params", "playlistId", "encryptedVideoId",
+                     "continuations", "frontendUploadId")
+# Recorded pairs buffered before a write
+flush_every = 50
+
+
+def match_key(method: str, url, json_data: Union[dict, list, bytes, None]) -> str:
+    parts = urlsplit(str(url))
+    if isinstance(json_data, (bytes, bytearray)):
+        # Pre-serialized body
+        try:
+            json_data = json.loads(json_data)
+        except ValueError:
+            json_data = None
+    query = urlencode(sorted((k, v) for k, v in parse_qsl(parts.query) if k not in match_query_ignore))
+    key = f"{method.upper()} {parts.path}?{query}"
+    if isinstance(json_data, dict):
+        fields = {name: json_data[name] for name in match_body_fields if name in json_data}
+        if fields:
+            key += " " + json.dumps(fields, sort_keys=True)
+    return key
+
+
+def redact_url(url) -> str:
+    """Url without match_query_ignore params, e.g. the api key"""
+    parts = urlsplit(str(url))
+    if not parts.query:
+        return str(url)
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                       if k not in match_query_ignore])
+    return parts._replace(query=query).geturl()
+
+
+class CassetteResponse:
+    """Replayed response, covers the part of aiohttp.ClientResponse livetube uses"""
+
+    def __init__(self, entry: dict):
+        self.url = entry['url']
+        self.method = entry['method']
+        self.status: int = entry['status']
+        self.headers = CIMultiDictProxy(CIMultiDict(entry['headers']))
+        if entry.get('encoding') == "base64":
+            self._body = b64decode(entry['body'])
+        else:
+            self._body = entry['body'].encode()
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("Content-Type", "application/octet-stream").split(";")[0].strip().lower()
+
+    @property
+    def charset(self) -> str:
+        for param in self.headers.get("Content-Type", "").split(";")[1:]:
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "charset":
+                return value.strip('"')
+        return "utf-8"
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: Optional[str] = None) -> str:
+        return self._body.decode(encoding or self.charset)
+
+    async def json(self, content_type: Optional[str] = "application/json", loads=json.loads):
+        return loads(self._body.decode(self.charset))
+
+    def release(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class Cassette:
+    def __init__(self):
+        self.mode: Optional[str] = None
+        self.path: Optional[str] = None
+        self.latency: float = 0.0
+        self.recorded_latency = False
+
+        self._entries: Dict[str, Deque[dict]] = {}
+        # Lines not written yet, and the single writer keeping them in order
+        self._buffer: List[str] = []
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[Future] = None
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def record(self, path: str):
+        """
+        Append every response from now on to a cassette
+
+        :param path: Cassette file, created when not exist
+        """
+        self.off()
+        self.mode, self.path = "record", path
+
+    def replay(self, path: str, latency: float = 0.0, recorded_latency=False):
+        """
+        Serve responses from a cassette instead of the network
+
+        :param path: Cassette file
+        :param latency: Extra delay of every response, in seconds
+        :param recorded_latency: Also wait as long as the recorded request took
+        """
+        self.off()
+        entries: Dict[str, Deque[dict]] = {}
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    entries.setdefault(entry['match'], deque()).append(entry)
+        self._entries = entries
+        self.mode, self.path = "replay", path
+        self.latency, self.recorded_latency = latency, recorded_latency
+
+    def off(self):
+        """Back to network, buffered responses of a recording are written first"""
+        self.flush()
+        self.mode, self.path = None, None
+        self._entries = {}
+
+    def flush(self):
+        """Write buffered responses of a recording, blocks until written"""
+        self._write_buffer()
+        if self._pending is not None:
+            self._pending.result()
+            self._pending = None
+
+    def _write_buffer(self):
+        if not self._buffer or not self.recording:
+            return
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="livetube-cassette")
+        lines, self._buffer = "".join(self._buffer), []
+        self._pending = self._writer.submit(_append, self.path, lines)
+
+    def _flush_at_exit(self):
+        # The writer thread is already shut down by now, the rest is written here
+        if self._pending is not None:
+            self._pending.result()
+            self._pending = None
+        if self._buffer and self.recording:
+            lines, self._buffer = "".join(self._buffer), []
+            _append(self.path, lines)
+
+    async def save(self, method: str, url, json_data, headers: dict, response, elapsed: float):
+        """Write a real response into the cassette"""
+        body = await response.read()
+        entry = {
+            "match": match_key(method, url, json_data),
+            "method": method.upper(),
+            "url": redact_url(url),
+            "request_headers": {k: v for k, v in (headers or {}).items() if k.lower() not in redacted_headers},
+            "status": response.status,
+            "headers": [(k, v) for k, v in response.headers.items() if k.lower() not in redacted_response_headers],
+            "elapsed": elapsed,
+        }
+        try:
+            entry['body'] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            entry['body'], entry['encoding'] = b64encode(body).decode(), "base64"
+        self._buffer.append(json.dumps(entry, ensure_ascii=False) + "\n")
+        if len(self._buffer) >= flush_every:
+            self._write_buffer()
+
+    async def play(self, method: str, url, json_data) -> CassetteResponse:
+        """Replayed response of a request"""
+        key = match_key(method, url, json_data)
+        queue = self._entries.get(key)
+        if not queue:
+            raise CassetteMiss(f"No recorded response for {key}")
+        entry = queue.popleft() if len(queue) > 1 else queue[0]
+        delay = self.latency + (entry.get('elapsed', 0) if self.recorded_latency else 0)
+        if delay:
+            await asyncio.sleep(delay)
+        return CassetteResponse(entry)
+
+    def remaining(self) -> Dict[str, int]:
+        """Responses not yet replayed, per request"""
+        return {key: len(queue) - 1 for key, queue in self._entries.items() if len(queue) > 1}
+
+
+def _append(path: str, lines: str):
+    # Each write is a gzip member of its own, readable as one stream
+    with gzip.open(path, "at", encoding="utf-8") as f:
+        f.write(lines)
+
+
+# Shared cassette used by http_request, off until record() / replay()
+cassette = Cassette()
+atexit.register(cassette._flush_at_exit)
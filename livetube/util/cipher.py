@@ -18,6 +18,12 @@ from typing import Tuple
 from livetube.util.regex import regex_search
 from livetube.util.exceptions import RegexMatchError
 
+# Transform calls of the plan, e.g. DE.AJ(a,15)
+js_func_patterns = [
+    r"\w+\.(\w+)\(\w,(\d+)\)",
+    r"\w+\[(\"\w+\")\]\(\w,(\d+)\)"
+]
+
 
 class Cipher:
     def __init__(self, js: str):
@@ -30,10 +36,30 @@ class Cipher:
             )
         var = var_match.group(0)[:-1]
         self.transform_map = get_transform_map(js, var)
-        self.js_func_patterns = [
-            r"\w+\.(\w+)\(\w,(\d+)\)",
-            r"\w+\[(\"\w+\")\]\(\w,(\d+)\)"
-        ]
+        self.js_func_patterns = list(js_func_patterns)
+
+    def to_state(self) -> dict:
+        """Transform plan and function names, see from_state"""
+        return {
+            "plan": self.transform_plan,
+            "map": {name: fn.__name__ for name, fn in self.transform_map.items()},
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "Cipher":
+        """
+        Cipher from to_state(), without base.js
+
+        :raise ValueError: State of an unknown transform function
+        """
+        cipher = cls.__new__(cls)
+        cipher.transform_plan = list(state['plan'])
+        try:
+            cipher.transform_map = {name: transform_functions[fn] for name, fn in state['map'].items()}
+        except KeyError as e:
+            raise ValueError(f"Unknown transform function {e}") from None
+        cipher.js_func_patterns = list(js_func_patterns)
+        return cipher
 
     def get_signature(self, ciphered_signature: str) -> str:
         """Decipher the signature.
@@ -220,6 +246,10 @@ def swap(arr: List, b: int):
     return list(chain([arr[r]], arr[1:r], [arr[0]], arr[r + 1:]))
 
 
+# Name -> transform function, for Cipher.from_state
+transform_functions = {fn.__name__: fn for fn in (reverse, splice, swap)}
+
+
 def map_functions(js_func: str) -> Callable:
     """For a given JavaScript transform function, return the Python equivalent.
     :param str js_func:
@@ -0,0 +1,148 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 18:40
+    File:    client.py
+    Description: Innertube client profiles
+
+    The WEB client gets formats with signatureCipher, which needs base.js and
+    Cipher. Mobile clients get direct urls, so the player can skip both.
+    Each request type has an ordered list of profiles, a profile failing
+    ``failure_threshold`` times in a row is skipped for ``cooldown`` seconds.
+"""
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Any, Mapping
+
+from livetube.util import cache
+from livetube.utils import make_header
+
+
+@dataclass(frozen=True)
+class ClientProfile:
+    name: str
+    # clientName in context, X-YouTube-Client-Name
+    client_name: str
+    client_id: int
+    # None = version scraped from the web page
+    client_version: Optional[str] = None
+    user_agent: Optional[str] = None
+    # Formats come with plain url, no cipher needed
+    direct_urls: bool = False
+    # Works with cookie / SAPISIDHASH, needed by members only or private videos
+    supports_cookies: bool = True
+    client_extra: Dict[str, Any] = field(default_factory=dict)
+    context_extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def is_web(self) -> bool:
+        return self.client_version is None
+
+    def client_info(self, studio=False) -> dict:
+        if self.is_web:
+            return cache.get_yt_client_info(studio)
+        data = {
+            "hl": "en_US",
+            "clientName": self.client_name,
+            "clientVersion": self.client_version,
+        }
+        data.update(self.client_extra)
+        return data
+
+    def context(self) -> dict:
+        context = {"client": self.client_info()}
+        context.update(self.context_extra)
+        return context
+
+    def headers(self, header: Mapping) -> Mapping:
+        """Header profile of this client"""
+        if self.is_web:
+            return header
+        extra = {
+            "X-YouTube-Client-Name": str(self.client_id),
+            "X-YouTube-Client-Version": self.client_version,
+        }
+        if self.user_agent:
+            extra['User-Agent'] = self.user_agent
+        return make_header(header, extra)
+
+
+profiles: Dict[str, ClientProfile] = {profile.name: profile for profile in (
+    ClientProfile("WEB", "WEB", 1),
+    ClientProfile("WEB_EMBEDDED", "WEB_EMBEDDED_PLAYER", 56, "1.20211019.01.00", supports_cookies=False,
+                  context_extra={"thirdParty": {"embedUrl": "https://www.youtube.com/"}}),
+    ClientProfile("ANDROID", "ANDROID", 3, "16.20", direct_urls=True, supports_cookies=False,
+                  user_agent="com.google.android.youtube/16.20 (Linux; U; Android 11) gzip",
+                  client_extra={"androidSdkVersion": 30, "osName": "Android", "osVersion": "11"}),
+    ClientProfile("IOS", "IOS", 5, "16.20", direct_urls=True, supports_cookies=False,
+                  user_agent="com.google.ios.youtube/16.20 (iPhone14,3; U; CPU iOS 15_0 like Mac OS X)",
+                  client_extra={"deviceModel": "iPhone14,3", "osName": "iOS", "osVersion": "15.0"}),
+    ClientProfile("TV", "TVHTML5_SIMPLY_EMBEDDED_PLAYER", 85, "2.0", supports_cookies=False,
+                  context_extra={"thirdParty": {"embedUrl": "https://www.youtube.com/"}}),
+)}
+
+
+class ClientSelector:
+    def __init__(self, order: Dict[str, List[str]], failure_threshold: int = 3, cooldown: float = 600):
+        self.order = order
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        self._failures: Dict[str, int] = {}
+        self._disabled_until: Dict[str, float] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def set_order(self, request_type: str, names: List[str]):
+        """
+        Set profiles tried for a request type, first one preferred
+
+        :param request_type: player / probe / heartbeat
+        :param names: Names in ``profiles``, WEB is appended when missing
+        """
+        for name in names:
+            if name not in profiles:
+                raise ValueError(f"Unknown client profile {name}")
+        self.order[request_type] = list(names) + ([] if "WEB" in names else ["WEB"])
+
+    def candidates(self, request_type: str, authenticated=False) -> List[ClientProfile]:
+        """Usable profiles of a request type, in order, the last one is always WEB"""
+        now = time.monotonic()
+        result = []
+        for name in self.order.get(request_type, ["WEB"]):
+            profile = profiles[name]
+            if profile.is_web:
+                continue
+            if authenticated and not profile.supports_cookies:
+                continue
+            if self._disabled_until.get(name, 0) > now:
+                continue
+            result.append(profile)
+        result.append(profiles["WEB"])
+        return result
+
+    def report(self, profile: ClientProfile, ok: bool):
+        """Result of a profile, disables it after too many failures in a row"""
+        stat = self._stats.setdefault(profile.name, {"ok": 0, "failed": 0, "disabled": 0})
+        if ok:
+            stat['ok'] += 1
+            self._failures[profile.name] = 0
+            return
+        stat['failed'] += 1
+        failures = self._failures[profile.name] = self._failures.get(profile.name, 0) + 1
+        if failures >= self.failure_threshold and not profile.is_web:
+            stat['disabled'] += 1
+            self._failures[profile.name] = 0
+            self._disabled_until[profile.name] = time.monotonic() + self.cooldown
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic()
+        return {name: dict(stat, disabled_for=max(0.0, self._disabled_until.get(name, 0) - now))
+                for name, stat in self._stats.items()}
+
+
+# Player prefers a direct url client, everything else stays on WEB
+client_selector = ClientSelector({
+    "player": ["ANDROID", "WEB"],
+    "probe": ["WEB"],
+    "heartbeat": ["WEB"],
+})
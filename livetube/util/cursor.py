@@ -0,0 +1,94 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 21:50
+    File:    cursor.py
+    Description: Newest seen community posts per channel
+
+    Usage:
+        from livetube.util.cursor import community_cursors
+
+        community_cursors.load("cursors.json")     # Optional, keep cursors across restarts
+        posts = await community.fetch_new()         # Only posts newer than the cursor
+        community_cursors.save()
+
+    A cursor is the last few post IDs seen on a channel, newest first, each
+    with a fingerprint of its content so an edit is noticed too. fetch_new
+    stops at the first known post, the cursor survives the newest ones being
+    deleted or hidden.
+"""
+import json
+import os
+from typing import Optional, Dict, Tuple, List
+
+Cursor = List[Tuple[str, str]]
+
+
+class CursorStore:
+    def __init__(self, path: Optional[str] = None, keep: int = 10):
+        """
+        :param path: Json file of the cursors, see load()
+        :param keep: Post IDs kept per channel
+        """
+        self.path = path
+        self.keep = keep
+        # Channel ID -> [(post ID, content fingerprint)], newest first
+        self._cursors: Dict[str, Cursor] = {}
+        self._dirty = False
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self):
+        return len(self._cursors)
+
+    def get(self, channel_id: str) -> Optional[Cursor]:
+        return self._cursors.get(channel_id)
+
+    def set(self, channel_id: str, posts: Cursor):
+        """
+        Put seen posts in front of the cursor
+
+        :param channel_id: Channel of the posts
+        :param posts: (post ID, fingerprint) of the posts, newest first
+        """
+        ids = {post_id for post_id, _ in posts}
+        cursor = list(posts) + [post for post in self._cursors.get(channel_id, ()) if post[0] not in ids]
+        cursor = cursor[:self.keep]
+        if self._cursors.get(channel_id) != cursor:
+            self._cursors[channel_id] = cursor
+            self._dirty = True
+
+    def reset(self, channel_id: Optional[str] = None):
+        """Forget the cursor of a channel, or every cursor"""
+        if channel_id is None:
+            self._cursors.clear()
+        else:
+            self._cursors.pop(channel_id, None)
+        self._dirty = True
+
+    def load(self, path: str):
+        """
+        Read cursors from a json file, later saves go to the same file
+
+        :param path: File written by save(), created on save when not exist
+        """
+        self.path = path
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self._cursors = {channel_id: [tuple(post) for post in cursor]
+                                 for channel_id, cursor in json.load(f).items()}
+        self._dirty = False
+
+    def save(self):
+        """Write cursors when changed, the file is replaced atomically"""
+        if not self.path or not self._dirty:
+            return
+        temp = f"{self.path}.tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump(self._cursors, f)
+        os.replace(temp, self.path)
+        self._dirty = False
+
+
+# Used by Community.fetch_new, in memory until load()
+community_cursors = CursorStore()
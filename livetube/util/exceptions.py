@@ -6,7 +6,7 @@
     Description: 
 """
 from re import Pattern
-from typing import Union
+from typing import Union, Optional
 
 
 class LivetubeError(Exception):
@@ -26,6 +26,37 @@ class NetworkError(LivetubeError):
     """Network based exception."""
 
 
+class HTTPError(NetworkError):
+    """Server answered with an error status, 4xx ones aren't retried."""
+
+    def __init__(self, message: str, status: int, error_status: Optional[str] = None,
+                 error_message: Optional[str] = None):
+        """
+        :param status: HTTP status
+        :param error_status: Status of the api error, e.g. INVALID_ARGUMENT
+        :param error_message: Message of the api error
+        """
+        super().__init__(message)
+        self.status = status
+        self.error_status = error_status
+        self.error_message = error_message
+
+
+class CassetteMiss(NetworkError):
+    """Replayed cassette has no response for the request."""
+
+
+class RateLimited(NetworkError):
+    """Server answered 429 Too Many Requests."""
+
+    def __init__(self, message: str = "Too many requests", retry_after: Optional[float] = None):
+        """
+        :param retry_after: Seconds from Retry-After, None when not given
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class HTMLParseError(ExtractError):
     """HTML could not be parsed"""
 
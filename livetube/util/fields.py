@@ -0,0 +1,99 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 20:05
+    File:    fields.py
+    Description: Partial responses with X-Goog-FieldMask
+
+    Each innertube call site names the fields it reads, http_request sends them
+    as ``X-Goog-FieldMask``. When the front end rejects the mask (400 about the
+    field mask) the mask of that call site is disabled and the request is sent
+    again in full, so a rejected mask costs one extra round trip once.
+"""
+from typing import Dict, Optional, Tuple, Set, Any
+
+header_name = "X-Goog-FieldMask"
+
+# Call site -> fields read from its response, dotted paths
+declared_fields: Dict[str, Tuple[str, ...]] = {
+    "Video.fetch_player": ("responseContext", "playabilityStatus", "streamingData", "videoDetails", "microformat"),
+    "Video.probe": ("playabilityStatus", "videoDetails.isLive", "videoDetails.isUpcoming",
+                    "videoDetails.isLiveContent", "microformat.playerMicroformatRenderer.liveBroadcastDetails"),
+    "Video.fetch_heartbeat": ("responseContext", "playabilityStatus"),
+    "Video.fetch_metadata": ("responseContext", "continuation", "actions"),
+    "Video.get_anim_thumbnail": ("contents.twoColumnSearchResultsRenderer",),
+    "Community.fetch": ("header", "contents.twoColumnBrowseResultsRenderer.tabs"),
+    "Community.iter_posts": ("onResponseReceivedEndpoints",),
+    "Membership._api_membership_status": ("onResponseReceivedActions",),
+}
+
+
+class FieldMasks:
+    def __init__(self, fields: Dict[str, Tuple[str, ...]], enabled=True):
+        self.fields = fields
+        self.enabled = enabled
+
+        self._rejected: Set[str] = set()
+        self._masks: Dict[str, str] = {}
+
+    def mask(self, name: Optional[str]) -> Optional[str]:
+        """Field mask of a call site, None when disabled / rejected / not declared"""
+        if not self.enabled or not name or name in self._rejected:
+            return None
+        mask = self._masks.get(name)
+        if mask is None:
+            fields = self.fields.get(name)
+            if not fields:
+                return None
+            mask = self._masks[name] = ",".join(fields)
+        return mask
+
+    def declare(self, name: str, *fields: str):
+        """Replace the fields of a call site, no fields to always fetch in full"""
+        self.fields[name] = tuple(fields)
+        self._masks.pop(name, None)
+        self._rejected.discard(name)
+
+    def reject(self, name: str):
+        self._rejected.add(name)
+
+    @property
+    def rejected(self) -> Set[str]:
+        return set(self._rejected)
+
+    @staticmethod
+    def is_rejection(status: int, body: Any) -> bool:
+        """Whether an error response is about the field mask"""
+        if status != 400 or not isinstance(body, dict):
+            return False
+        message = str((body.get("error") or {}).get("message", "")).lower()
+        return "fieldmask" in message or "field mask" in message
+
+
+def apply_field_mask(data: Any, mask: str) -> Any:
+    """Keep only the masked paths of a json object"""
+    tree: Dict[str, Any] = {}
+    for path in mask.split(","):
+        node = tree
+        parts = path.strip().split(".")
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+            if node is None:
+                break
+        else:
+            node[parts[-1]] = None
+
+    def walk(value, node):
+        if node is None:
+            return value
+        if isinstance(value, list):
+            return [walk(item, node) for item in value]
+        if not isinstance(value, dict):
+            return value
+        return {key: walk(value[key], child) for key, child in node.items() if key in value}
+
+    return walk(data, tree)
+
+
+# Shared by http_request
+field_masks = FieldMasks(declared_fields)
@@ -0,0 +1,150 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 10:12
+    File:    hedge.py
+    Description: Hedged requests for idempotent innertube calls
+"""
+import asyncio
+from collections import deque
+from typing import Callable, Awaitable, Dict, Deque, Optional, Any
+
+from livetube.util.metrics import registry
+
+
+class HedgePolicy:
+    """
+    Send a duplicate request when the first one is slower than usual
+
+    A hedge is fired when no response arrived within ``percentile`` of the recent
+    latency of the same endpoint, the first successful answer wins and the other
+    one is cancelled. Extra load is capped by a token bucket: every request earns
+    ``max_extra_ratio`` token, every hedge costs one.
+    """
+
+    def __init__(self, enabled=False, percentile: float = 95, window: int = 200, min_samples: int = 20,
+                 min_delay: float = 0.05, max_extra_ratio: float = 0.1, burst: float = 10):
+        self.enabled = enabled
+        self.percentile = percentile
+        self.window = window
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_extra_ratio = max_extra_ratio
+        self.burst = burst
+
+        self._tokens: float = burst
+        self._latency: Dict[str, Deque[float]] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def configure(self, **kwargs):
+        """Update policy settings, e.g. ``configure(enabled=True, percentile=90)``"""
+        for key, value in kwargs.items():
+            if key.startswith("_") or not hasattr(self, key):
+                raise ValueError(f"Unknown hedge option {key}")
+            setattr(self, key, value)
+
+    def _stat(self, family: str) -> Dict[str, int]:
+        stat = self._stats.get(family)
+        if stat is None:
+            stat = self._stats[family] = {"requests": 0, "fired": 0, "won": 0, "budget_skipped": 0}
+        return stat
+
+    def observe(self, family: str, latency: float):
+        """Record latency of a finished request"""
+        samples = self._latency.get(family)
+        if samples is None:
+            samples = self._latency[family] = deque(maxlen=self.window)
+        samples.append(latency)
+
+    def delay(self, family: str) -> Optional[float]:
+        """Time to wait before hedging, None when there's not enough samples"""
+        samples = self._latency.get(family)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[index])
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hedge counters per endpoint family"""
+        result = {}
+        for family, stat in self._stats.items():
+            result[family] = dict(stat, delay=self.delay(family))
+        return result
+
+    async def run(self, request: Callable[[], Awaitable[Any]], family: str):
+        """
+        Run a request with hedging
+
+        :param request: Factory of the request coroutine, called once per attempt
+        :param family: Endpoint family used for latency tracking
+        :return: Result of the first successful attempt
+        """
+        loop = asyncio.get_event_loop()
+        stat = self._stat(family)
+        stat['requests'] += 1
+        self._tokens = min(self.burst, self._tokens + self.max_extra_ratio)
+        start = loop.time()
+        primary = asyncio.ensure_future(request())
+        delay = self.delay(family)
+        if delay is not None:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if not done:
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    stat['fired'] += 1
+                    hedge_start = loop.time()
+                    hedge = asyncio.ensure_future(request())
+                    winner = await self._first_success(primary, hedge)
+                    # Latency of the winner since it was sent, the hedge wait would inflate the delay
+                    if winner is hedge:
+                        stat['won'] += 1
+                        self.observe(family, loop.time() - hedge_start)
+                    else:
+                        self.observe(family, loop.time() - start)
+                    return winner.result()
+                stat['budget_skipped'] += 1
+        result = await primary
+        self.observe(family, loop.time() - start)
+        return result
+
+    @staticmethod
+    async def _first_success(*tasks: "asyncio.Future") -> "asyncio.Future":
+        pending, winner, error = set(tasks), None, None
+        while pending and not winner:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    winner = task
+                    break
+                error = task.exception()
+        for task in tasks:
+            if task is winner:
+                continue
+            if task.done():
+                _close_loser(task)
+            else:
+                task.cancel()
+                task.add_done_callback(_close_loser)
+        if winner is None:
+            raise error
+        return winner
+
+
+def _close_loser(task: "asyncio.Future"):
+    """Release the connection of a request that lost the race"""
+    if task.cancelled() or task.exception() is not None:
+        return
+    close = getattr(task.result(), "close", None)
+    if close:
+        close()
+
+
+# Shared policy for player / heartbeat, disabled until configured
+hedge_policy = HedgePolicy()
+
+registry.counter("livetube_hedge_requests_total", "Hedge counters of hedge_policy",
+                 ("endpoint", "event")).set_function(
+    lambda: {(family, event): count
+             for family, stat in hedge_policy._stats.items() for event, count in stat.items()}
+)
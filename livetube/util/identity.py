@@ -0,0 +1,226 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 21:10
+    File:    identity.py
+    Description: Pool of logged in accounts with rate budgets
+
+    Usage:
+        pool = IdentityPool()
+        pool.add("main", cookie, memberships={"UC..."}, rate=0.5)
+        video = Video("...", identities=pool)       # Identity drawn per request
+        membership = Membership(pool["main"])       # Bound to one identity
+
+    Every identity has a token bucket of ``rate`` requests per second, the
+    request waits when it's empty. A 429 puts the identity on cooldown
+    (``Retry-After`` or an exponential backoff), objects drawing from the pool
+    move on to another identity. Each identity keeps its cookie jar in
+    ``cache.shared_cookie_jars``, so cookies set by responses stick to it.
+"""
+import asyncio
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Optional, Dict, Iterable, Set, List, Any
+
+import aiohttp
+
+from livetube.util import cache
+from livetube.util.exceptions import RateLimited, MembersOnly
+from livetube.util.metrics import registry
+from livetube.utils import logger
+
+# Identity drawn by @rotating for the running operation, per task
+drawn_identity: "ContextVar[Optional[Identity]]" = ContextVar("livetube_drawn_identity", default=None)
+identity_requests_total = registry.counter("livetube_identity_requests_total", "Requests per identity",
+                                           ("identity", "result"))
+
+
+class Identity:
+    def __init__(self, name: str, cookie: dict, memberships: Iterable[str] = (), rate: float = 1.0,
+                 burst: int = 5, cooldown: float = 60, max_cooldown: float = 1800):
+        """
+        :param name: Name used in logs / metrics
+        :param cookie: Cookie of the account, needs SAPISID
+        :param memberships: Channel IDs the account is a member of
+        :param rate: Requests per second
+        :param burst: Requests allowed at once
+        :param cooldown: First cooldown after a 429 without Retry-After, doubles on each 429 in a row
+        :param max_cooldown: Longest cooldown
+        :raise ValueError: Cookie doesn't contain SAPISID
+        """
+        if not cookie.get("SAPISID"):
+            raise ValueError(f"SAPISID not found in cookie of {name}")
+        cookie.update({"PREF": "hl=en"})
+        self.name = name
+        self.cookie = cookie
+        self.memberships: Set[str] = set(memberships)
+        self.rate = rate
+        self.burst = burst
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+
+        self.tokens = float(burst)
+        self.cooldown_until = 0.0
+        self.strikes = 0
+        self._updated = time.monotonic()
+
+    def __repr__(self):
+        return f"<Identity {self.name}>"
+
+    @property
+    def cooling(self) -> bool:
+        return self.cooldown_until > time.monotonic()
+
+    def budget(self) -> float:
+        """Requests available right now"""
+        now = time.monotonic()
+        self.tokens = min(float(self.burst), self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        return self.tokens
+
+    def ready_in(self) -> float:
+        """Seconds until a request can be made"""
+        budget = self.budget()
+        wait = 0.0 if budget >= 1 else (1 - budget) / self.rate
+        return max(wait, self.cooldown_until - time.monotonic())
+
+    async def take(self):
+        """Wait for cooldown and rate budget, then spend one request"""
+        while True:
+            wait = self.ready_in()
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+        self.tokens -= 1
+
+    def throttled(self, retry_after: Optional[float] = None):
+        """Got a 429, cool down"""
+        self.strikes += 1
+        delay = retry_after or min(self.max_cooldown, self.cooldown * 2 ** (self.strikes - 1))
+        self.cooldown_until = time.monotonic() + delay
+        identity_requests_total.inc(identity=self.name, result="throttled")
+        logger.warning(f"Identity {self.name} throttled, cooling down for {delay:.0f}s")
+
+    def succeeded(self):
+        self.strikes = 0
+        identity_requests_total.inc(identity=self.name, result="ok")
+
+    def cookie_jar(self) -> "aiohttp.CookieJar":
+        """Cookie jar of this identity on the running loop"""
+        key = (hash(asyncio.get_running_loop()), self.name)
+        jar = cache.shared_cookie_jars.get(key)
+        if jar is None:
+            jar = cache.shared_cookie_jars[key] = aiohttp.CookieJar(quote_cookie=False)
+            jar.update_cookies(cookies=self.cookie)
+        return jar
+
+
+class IdentityPool:
+    def __init__(self, max_wait: float = 30):
+        """
+        :param max_wait: Longest wait for an identity to come off cooldown before raising RateLimited
+        """
+        self.max_wait = max_wait
+        self.identities: Dict[str, Identity] = {}
+
+    def __len__(self):
+        return len(self.identities)
+
+    def __getitem__(self, name: str) -> Identity:
+        return self.identities[name]
+
+    def add(self, name: str, cookie: dict, memberships: Iterable[str] = (), **kwargs) -> Identity:
+        """
+        Add an account, see Identity for the options
+
+        :return: The added identity
+        """
+        identity = self.identities[name] = Identity(name, cookie, memberships, **kwargs)
+        return identity
+
+    def remove(self, name: str):
+        self.identities.pop(name, None)
+        for key in [key for key in cache.shared_cookie_jars if key[1] == name]:
+            del cache.shared_cookie_jars[key]
+
+    def set_memberships(self, name: str, channel_ids: Iterable[str]):
+        """Replace the memberships of an identity, e.g. from Membership.fetch"""
+        self.identities[name].memberships = set(channel_ids)
+
+    def candidates(self, channel_id: Optional[str] = None, members_only=False) -> List[Identity]:
+        """
+        Identities allowed for a request, members of channel_id first
+
+        :raise MembersOnly: members_only and no identity is a member of channel_id
+        """
+        identities = list(self.identities.values())
+        if channel_id:
+            members = [identity for identity in identities if channel_id in identity.memberships]
+            if members_only:
+                if not members:
+                    raise MembersOnly(f"No identity is a member of {channel_id}")
+                identities = members
+            else:
+                identities = members + [identity for identity in identities if identity not in members]
+        return identities
+
+    async def acquire(self, channel_id: Optional[str] = None, members_only=False) -> Identity:
+        """
+        Identity with the most spare budget
+
+        Budget is spent by http_request, not here
+
+        :param channel_id: Channel of the content, its members are preferred
+        :param members_only: Only members of channel_id
+        :raise MembersOnly: No identity is a member of channel_id
+        :raise RateLimited: Every identity is cooling down for longer than max_wait
+        """
+        if not self.identities:
+            raise ValueError("Identity pool is empty")
+        candidates = self.candidates(channel_id, members_only)
+        while True:
+            ready = [identity for identity in candidates if not identity.cooling]
+            if ready:
+                return max(ready, key=lambda identity: identity.budget())
+            wait = min(identity.cooldown_until for identity in candidates) - time.monotonic()
+            if wait > self.max_wait:
+                raise RateLimited(f"Every identity is rate limited for {wait:.0f}s", wait)
+            await asyncio.sleep(max(0.0, wait))
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic()
+        return {name: {
+            "budget": identity.budget(),
+            "cooldown": max(0.0, identity.cooldown_until - now),
+            "strikes": identity.strikes,
+            "memberships": len(identity.memberships),
+        } for name, identity in self.identities.items()}
+
+
+def rotating(func):
+    """
+    Draw an identity before an operation of an object with ``identities``,
+    and run it again on another identity after a 429
+
+    The identity is kept in drawn_identity, not on the object, so operations
+    running at once on the same object each use their own.
+    """
+
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        if self.identities is None:
+            return await func(self, *args, **kwargs)
+        for attempt in range(len(self.identities)):
+            identity = await self._draw_identity()
+            token = drawn_identity.set(identity)
+            try:
+                return await func(self, *args, **kwargs)
+            except RateLimited:
+                if attempt == len(self.identities) - 1:
+                    raise
+                self.debug(f"Identity {identity.name} rate limited, switching")
+            finally:
+                drawn_identity.reset(token)
+
+    return wrapper
@@ -8,7 +8,7 @@
 from typing import Union, Optional
 from urllib.parse import quote, urlencode
 
-from livetube.util.cache import yt_root_url
+from livetube.util import cache
 from livetube.util.exceptions import RegexMatchError, HTMLParseError
 from livetube.util.parser import parse_for_object
 
@@ -55,7 +55,7 @@ def video_info_url(video_id: str, watch_url: str) -> str:
             ("hl", "en_US")
         ]
     )
-    return "%s/get_video_info?" % yt_root_url + urlencode(params)
+    return "%s/get_video_info?" % cache.yt_root_url + urlencode(params)
 
 
 def dict_search(data: dict, key: str, depth: int = 3):
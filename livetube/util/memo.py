@@ -0,0 +1,78 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 22:20
+    File:    memo.py
+    Description: Skip parsing of responses that didn't change
+
+    A poller sees the same response again and again. Each object keeps a
+    ParseMemo per call site with a digest of the last raw body and the model
+    built from it; when the next body has the same digest both json.loads and
+    model building are skipped. trackingParams / clickTrackingParams differ on
+    every response, so they are left out of the digest, and ``start`` limits it
+    to the part of the body from a key on (e.g. ``b'"actions"'``).
+
+    Only json responses (api / pbj) are checked, html pages carry per request
+    nonces. Hit rates: ``memo_stats()`` or livetube_parse_memo_total.
+"""
+import re
+from hashlib import sha1
+from typing import Optional, Any, Dict, List
+
+from livetube.util.metrics import registry
+
+# Values of trackingParams / clickTrackingParams, unique per response
+volatile_regex = re.compile(rb'rackingParams":"[^"]*')
+
+parse_memo_total = registry.counter("livetube_parse_memo_total", "Responses parsed (miss) or reused (hit)",
+                                    ("operation", "result"))
+# Operation -> [hits, misses]
+_stats: Dict[str, List[int]] = {}
+
+
+def body_digest(raw: bytes, start: Optional[bytes] = None) -> bytes:
+    """
+    Digest of a response body without tracking params
+
+    :param start: Only digest from the first occurrence of this on, the whole body when not found
+    """
+    if start is not None:
+        index = raw.find(start)
+        if index > 0:
+            raw = raw[index:]
+    return sha1(volatile_regex.sub(b"", raw)).digest()
+
+
+class ParseMemo:
+    def __init__(self, operation: str):
+        """
+        :param operation: Name in stats, e.g. Community.fetch
+        """
+        self.operation = operation
+        self.digest: Optional[bytes] = None
+        self.value: Any = None
+        # Digest of the body being parsed, stored with its value
+        self.pending: Optional[bytes] = None
+
+    def check(self, raw: bytes, start: Optional[bytes] = None) -> bool:
+        """Whether raw matches the body of the stored value"""
+        self.pending = body_digest(raw, start)
+        hit = self.digest is not None and self.pending == self.digest
+        stat = _stats.setdefault(self.operation, [0, 0])
+        stat[0 if hit else 1] += 1
+        parse_memo_total.inc(operation=self.operation, result="hit" if hit else "miss")
+        return hit
+
+    def store(self, value: Any):
+        """Value built from the last checked body, never reused when no body was checked"""
+        self.digest, self.value = self.pending, value
+        self.pending = None
+
+    def reset(self):
+        self.digest = self.value = self.pending = None
+
+
+def memo_stats() -> Dict[str, Dict[str, float]]:
+    """Operation -> hits, misses and hit rate"""
+    return {operation: {"hits": hits, "misses": misses, "hit_rate": hits / (hits + misses)}
+            for operation, (hits, misses) in _stats.items() if hits + misses}
@@ -0,0 +1,527 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 16:10
+    File:    mock_server.py
+    Description: Local innertube stand-in for load testing
+
+    Usage:
+        python -m livetube.util.mock_server --port 8080
+
+    Then point livetube at it before creating any object:
+
+        from livetube.util.mock_server import use_mock_server
+        use_mock_server("http://127.0.0.1:8080")
+
+    Every video ID cycles through offline -> live -> ended, with a per video
+    offset derived from the ID. The player version rotates, and 429 bursts and
+    slow responses can be switched on with MockConfig.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import time
+from base64 import urlsafe_b64encode, urlsafe_b64decode
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any
+from urllib.parse import urlencode
+from zlib import crc32
+
+from aiohttp import web
+
+from livetube.util.cache import set_root_url
+from livetube.util.fields import apply_field_mask, header_name as field_mask_header
+from livetube.util.proto import decode, browse_continuation, decode_browse_continuation
+
+
+@dataclass
+class MockConfig:
+    # Lifecycle of every video, in seconds
+    offline_seconds: float = 60
+    live_seconds: float = 600
+    ended_seconds: float = 60
+    poll_delay_ms: int = 5000
+    # Player version changes every N seconds, 0 to disable
+    player_rotation_seconds: float = 3600
+    # Serve formats with signatureCipher (needs base.js)
+    cipher: bool = False
+    # Every burst_every seconds, answer 429 for burst_seconds, 0 to disable
+    burst_every: float = 0
+    burst_seconds: float = 5
+    # Ratio of responses delayed by slow_delay seconds
+    slow_ratio: float = 0.0
+    slow_delay: float = 2.0
+    # Community posts per page and number of pages per channel
+    posts_per_page: int = 10
+    post_pages: int = 3
+    # Membership cards per page and number of pages per account
+    memberships_per_page: int = 5
+    membership_pages: int = 1
+    # X-Goog-FieldMask handling: apply / reject / ignore
+    field_mask: str = "apply"
+    # Directory with captured responses used as templates (player.json, heartbeat.json...)
+    fixtures_dir: Optional[str] = None
+    seed: int = 0
+    api_key: str = "AIzaSyMockMockMockMockMockMockMockMockMo"
+    studio_api_key: str = "AIzaSyMockStudioMockStudioMockStudioMo"
+    client_version: str = "2.20211019.00.00"
+    studio_client_version: str = "1.20211019.00.00"
+
+
+@dataclass
+class MockStats:
+    started: float = field(default_factory=time.time)
+    requests: Dict[str, int] = field(default_factory=dict)
+    throttled: int = 0
+    slowed: int = 0
+
+    def to_json(self):
+        return {
+            "uptime": time.time() - self.started,
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "slowed": self.slowed,
+        }
+
+
+# Field of the page number in continuation details
+page_field = 7
+
+
+def _text(text: str) -> dict:
+    return {"runs": [{"text": text}]}
+
+
+class MockInnertube:
+    def __init__(self, config: Optional[MockConfig] = None):
+        self.config = config or MockConfig()
+        self.stats = MockStats()
+        self.random = random.Random(self.config.seed)
+        self.started = time.time()
+        self.templates: Dict[str, Any] = {}
+        if self.config.fixtures_dir:
+            for name in ("player.json", "heartbeat.json", "updated_metadata.json", "browse_community.json"):
+                path = os.path.join(self.config.fixtures_dir, name)
+                if os.path.exists(path):
+                    with open(path, encoding="utf-8") as f:
+                        self.templates[name] = json.load(f)
+
+    # State
+
+    def video_state(self, video_id: str) -> str:
+        """offline / live / ended"""
+        cfg = self.config
+        cycle = cfg.offline_seconds + cfg.live_seconds + cfg.ended_seconds
+        offset = crc32(video_id.encode()) % 1000 / 1000 * cycle
+        position = (time.time() - self.started + offset) % cycle
+        if position < cfg.offline_seconds:
+            return "offline"
+        if position < cfg.offline_seconds + cfg.live_seconds:
+            return "live"
+        return "ended"
+
+    def player_version(self) -> str:
+        rotation = self.config.player_rotation_seconds
+        index = int((time.time() - self.started) // rotation) if rotation else 0
+        return "%08x" % (crc32(f"player{index}".encode()) & 0xFFFFFFFF)
+
+    def js_url(self) -> str:
+        return f"/s/player/{self.player_version()}/player_ias.vflset/en_US/base.js"
+
+    # Responses
+
+    def ytcfg(self, studio=False) -> dict:
+        cfg = self.config
+        client_version = cfg.studio_client_version if studio else cfg.client_version
+        return {
+            "INNERTUBE_API_KEY": cfg.studio_api_key if studio else cfg.api_key,
+            "INNERTUBE_API_VERSION": "v1",
+            "INNERTUBE_CLIENT_NAME": "CREATOR_STUDIO" if studio else "WEB",
+            "INNERTUBE_CLIENT_VERSION": client_version,
+            "INNERTUBE_CONTEXT": {"client": {"browserName": "Chrome", "browserVersion": "94.0.4606.81",
+                                             "clientVersion": client_version}},
+            "INNERTUBE_CONTEXT_CLIENT_NAME": 62 if studio else 1,
+            "INNERTUBE_CONTEXT_CLIENT_VERSION": client_version,
+            "PLAYER_JS_URL": self.js_url(),
+        }
+
+    def html(self, player: Optional[dict] = None, data: Optional[dict] = None, studio=False) -> str:
+        scripts = [f"<script>ytcfg.set({json.dumps(self.ytcfg(studio))});window.ytcfg.setMessage({{}});</script>"]
+        if player is not None:
+            scripts.append(f"<script>var ytInitialPlayerResponse = {json.dumps(player)};</script>")
+        if data is not None:
+            scripts.append(f"<script>var ytInitialData = {json.dumps(data)};</script>")
+        return "<!DOCTYPE html><html><head></head><body>" + "".join(scripts) + "</body></html>"
+
+    def playability(self, video_id: str, state: str) -> dict:
+        renderer = {"videoId": video_id, "pollDelayMs": str(self.config.poll_delay_ms)}
+        if state == "offline":
+            renderer["offlineSlate"] = {"liveStreamOfflineSlateRenderer": {
+                "scheduledStartTime": str(int(time.time()) + 60), "canShowCountdown": True,
+                "mainText": _text("Live in 1 minute")}}
+            return {"status": "LIVE_STREAM_OFFLINE", "reason": "This live event will begin in a few moments.",
+                    "playableInEmbed": True, "liveStreamability": {"liveStreamabilityRenderer": renderer}}
+        if state == "live":
+            return {"status": "OK", "playableInEmbed": True,
+                    "liveStreamability": {"liveStreamabilityRenderer": renderer}}
+        return {"status": "OK", "playableInEmbed": True}
+
+    def formats(self, video_id: str, cipher: bool) -> list:
+        formats = []
+        for itag, mime, height in ((134, "video/mp4", 360), (136, "video/mp4", 720), (140, "audio/mp4", 0)):
+            url = f"https://rr1---sn-mock.googlevideo.com/videoplayback/expire/{int(time.time()) + 21540}/" \
+                  f"id/{video_id}.1/itag/{itag}"
+            fmt = {"itag": itag, "mimeType": f'{mime}; codecs="avc1.4d401e"', "bitrate": 128000 + height * 1000}
+            if height:
+                fmt.update({"width": height * 16 // 9, "height": height, "fps": 30})
+            if cipher:
+                fmt["signatureCipher"] = urlencode({"s": "S" * 103, "sp": "sig", "url": url})
+            else:
+                fmt["url"] = url
+            formats.append(fmt)
+        return formats
+
+    def player(self, video_id: str, client_name: str = "WEB") -> dict:
+        state = self.video_state(video_id)
+        template = self.templates.get("player.json")
+        response = json.loads(json.dumps(template)) if template else {"responseContext": {}}
+        response["playabilityStatus"] = self.playability(video_id, state)
+        details = response.setdefault("videoDetails", {})
+        details.update({"videoId": video_id, "channelId": "UC" + video_id * 2, "author": "Mock",
+                        "title": f"Mock stream {video_id}", "isLiveContent": True,
+                        "isLive": state == "live", "isUpcoming": state == "offline"})
+        microformat = response.setdefault("microformat", {}).setdefault("playerMicroformatRenderer", {})
+        microformat.update({"title": {"simpleText": f"Mock stream {video_id}"}, "lengthSeconds": "0",
+                            "isUnlisted": False, "viewCount": "1000",
+                            "liveBroadcastDetails": {"isLiveNow": state == "live",
+                                                     "startTimestamp": "2021-10-19T00:00:00+00:00"}})
+        if state == "live":
+            cipher = self.config.cipher and client_name not in ("ANDROID", "IOS")
+            response["streamingData"] = {
+                "expiresInSeconds": "21540",
+                # Mobile clients get plain urls
+                "adaptiveFormats": self.formats(video_id, cipher),
+                "hlsManifestUrl": f"https://manifest.googlevideo.com/api/manifest/hls_variant/id/{video_id}",
+            }
+        else:
+            response.pop("streamingData", None)
+        return response
+
+    def heartbeat(self, video_id: str) -> dict:
+        response = json.loads(json.dumps(self.templates.get("heartbeat.json", {"responseContext": {}})))
+        response["playabilityStatus"] = self.playability(video_id, self.video_state(video_id))
+        return response
+
+    def updated_metadata(self, video_id: str) -> dict:
+        viewers = 1000 + crc32(video_id.encode()) % 5000 + self.random.randint(0, 100)
+        return {
+            "responseContext": {},
+            "continuation": {"timedContinuationData": {
+                "timeoutMs": 10000, "continuation": urlsafe_b64encode(video_id.encode()).decode()}},
+            "actions": [
+                {"updateViewershipAction": {"viewCount": {"videoViewCountRenderer": {
+                    "viewCount": _text(f"{viewers:,} watching now"),
+                    "extraShortViewCount": {"simpleText": str(viewers)}}}}},
+                {"updateDateTextAction": {"dateText": {"simpleText": "Started streaming 5 minutes ago"}}},
+                {"updateTitleAction": {"title": _text(f"Mock stream {video_id}")}},
+            ]
+        }
+
+    def initial_data(self, video_id: str) -> dict:
+        return {"contents": {"twoColumnWatchNextResults": {"results": {"results": {"contents": [
+            {"videoPrimaryInfoRenderer": {"title": _text(f"Mock stream {video_id}"),
+                                          "dateText": {"simpleText": "Started streaming 5 minutes ago"}}}
+        ]}}}}}
+
+    def post(self, channel_id: str, index: int) -> dict:
+        return {"backstagePostThreadRenderer": {"post": {"backstagePostRenderer": {
+            "postId": "Ugk" + "%033d" % (crc32(channel_id.encode()) * 1000 + index),
+            "authorText": _text("Mock"),
+            "authorEndpoint": {"commandMetadata": {"webCommandMetadata": {"url": f"/channel/{channel_id}"}}},
+            "authorThumbnail": {"thumbnails": [{"url": "https://yt3.ggpht.com/ytc/mock=s76-c-k"}]},
+            "contentText": _text(f"Mock post {index}"),
+            "publishedTimeText": _text(f"{index + 1} days ago"),
+            "voteCount": {"simpleText": "10"},
+        }}}}
+
+    def posts_page(self, channel_id: str, page: int) -> list:
+        cfg = self.config
+        contents = [self.post(channel_id, page * cfg.posts_per_page + index) for index in range(cfg.posts_per_page)]
+        if page + 1 < cfg.post_pages:
+            token = browse_continuation(channel_id, {1: "community", page_field: page + 1})
+            contents.append({"continuationItemRenderer": {"continuationEndpoint": {
+                "continuationCommand": {"token": token, "request": "CONTINUATION_REQUEST_TYPE_BROWSE"}}}})
+        return contents
+
+    def community(self, channel_id: str) -> dict:
+        return {
+            "responseContext": {},
+            "header": {"c4TabbedHeaderRenderer": {"channelId": channel_id,
+                                                  "subscriberCountText": {"simpleText": "1.2K subscribers"}}},
+            "contents": {"twoColumnBrowseResultsRenderer": {"tabs": [
+                {"tabRenderer": {"title": "Home", "selected": False}},
+                {"tabRenderer": {"title": "Community", "selected": True, "content": {"sectionListRenderer": {
+                    "contents": [{"itemSectionRenderer": {"contents": self.posts_page(channel_id, 0)}}]}}}},
+            ]}}
+        }
+
+    def membership_page(self, page: int) -> list:
+        def card(channel_id: str, name: str):
+            token = browse_continuation("FEmembership_details", {50: {12: {
+                1: "FEmemberships_and_purchases", 2: 1, 3: {1: 1, 2: channel_id}}}})
+            return {"cardItemContainerRenderer": {
+                "baseRenderer": {"cardItemRenderer": {"headingRenderer": {"cardItemTextWithImageRenderer": {
+                    "textCollectionRenderer": [{"cardItemTextCollectionRenderer": {"textRenderers": [
+                        {"cardItemTextRenderer": {"text": _text(name), "style": "CARD_ITEM_TEXT_STYLE_TITLE_2"}}
+                    ]}}]}}}},
+                "onClickCommand": {"continuationCommand": {"token": token}}
+            }}
+
+        cfg = self.config
+        contents = [card("UC%022d" % index, f"Mock channel {index}")
+                    for index in range(page * cfg.memberships_per_page, (page + 1) * cfg.memberships_per_page)]
+        if page == 0:
+            contents.insert(0, {"cardItemRenderer": {"headingRenderer": {"cardItemTextCollectionRenderer": {
+                "textRenderers": [{"cardItemTextRenderer": {"text": _text("Memberships")}}]}}}})
+        if page + 1 < cfg.membership_pages:
+            token = browse_continuation("FEmemberships_and_purchases", {page_field: page + 1})
+            contents.append({"continuationItemRenderer": {"continuationEndpoint": {
+                "continuationCommand": {"token": token, "request": "CONTINUATION_REQUEST_TYPE_BROWSE"}}}})
+        return contents
+
+    def memberships(self) -> dict:
+        return {"contents": {"twoColumnBrowseResultsRenderer": {"tabs": [{"tabRenderer": {
+            "tabIdentifier": "FEmemberships_and_purchases", "selected": True,
+            "content": {"sectionListRenderer": {"contents": [
+                {"itemSectionRenderer": {"contents": self.membership_page(0)}}]}}}}]}}}
+
+    def base_js(self) -> str:
+        plan = ";".join(("DE.AJ(a,15)", "DE.VR(a,3)", "DE.kT(a,51)"))
+        return "\n".join([
+            "var _yt_player={};(function(g){var window=this;",
+            "var DE={AJ:function(a){a.reverse()},\nVR:function(a,b){a.splice(0,b)},\n"
+            "kT:function(a,b){var c=a[0];a[0]=a[b%a.length];a[b]=c}};",
+            'Xy=function(a){a=a.split("");' + plan + ';return a.join("")};',
+            "g.Ud=function(a,b,c,d){c&&d.set(b,encodeURIComponent(Xy(decodeURIComponent(c))))};",
+            "})(_yt_player);",
+        ])
+
+    # Studio
+
+    def feedback_item(self, token: str) -> dict:
+        data = json.loads(urlsafe_b64decode(token.encode()))
+        elapsed = time.time() - data["t"]
+        upload = min(1.0, elapsed / 10)
+        process = min(1.0, max(0.0, elapsed - 10) / 20)
+        status = "UPLOAD_STATUS_PROCESSED" if process >= 1 else "UPLOAD_STATUS_UPLOADED"
+        return {
+            "id": {"video_id": data["v"]},
+            "uploadStatus": {"uploadStatus": status},
+            "transferProgressBar": {"fractionCompleted": upload, "remainingTimeSeconds": str(int(10 * (1 - upload)))},
+            "processingProgressBar": {"fractionCompleted": process},
+            "continuations": [{}, {"uploadFeedbackRefreshContinuation": {"continuation": token}}],
+        }
+
+    # aiohttp
+
+    @web.middleware
+    async def middleware(self, request: web.Request, handler):
+        cfg = self.config
+        key = request.match_info.route.resource.canonical if request.match_info.route.resource else request.path
+        self.stats.requests[key] = self.stats.requests.get(key, 0) + 1
+        if not request.path.startswith("/_mock"):
+            if cfg.burst_every and (time.time() - self.started) % cfg.burst_every < cfg.burst_seconds:
+                self.stats.throttled += 1
+                retry_after = cfg.burst_seconds - (time.time() - self.started) % cfg.burst_every
+                return web.json_response({"error": {"code": 429, "message": "Too many requests",
+                                                    "status": "RESOURCE_EXHAUSTED"}}, status=429,
+                                         headers={"Retry-After": str(math.ceil(retry_after))})
+            if cfg.slow_ratio and self.random.random() < cfg.slow_ratio:
+                self.stats.slowed += 1
+                await asyncio.sleep(cfg.slow_delay)
+        mask = request.headers.get(field_mask_header)
+        if mask and cfg.field_mask == "reject":
+            return web.json_response({"error": {"code": 400, "message": "Invalid FieldMask",
+                                                "status": "INVALID_ARGUMENT"}}, status=400)
+        response = await handler(request)
+        if mask and cfg.field_mask == "apply" and response.content_type == "application/json":
+            response.text = json.dumps(apply_field_mask(json.loads(response.text), mask))
+        return response
+
+    async def handle_root(self, request: web.Request):
+        return web.Response(text=self.html(studio=request.path.startswith("/studio")), content_type="text/html")
+
+    async def handle_watch(self, request: web.Request):
+        video_id = request.query.get("v", "")
+        if request.query.get("pbj") == "1":
+            return web.json_response([
+                {"page": "watch"},
+                {"playerResponse": self.player(video_id)},
+                {"response": self.initial_data(video_id)},
+            ])
+        return web.Response(text=self.html(self.player(video_id), self.initial_data(video_id)),
+                            content_type="text/html")
+
+    async def handle_player(self, request: web.Request):
+        body = await request.json()
+        client_name = body.get("context", {}).get("client", {}).get("clientName", "WEB")
+        return web.json_response(self.player(body.get("videoId", ""), client_name))
+
+    async def handle_heartbeat(self, request: web.Request):
+        body = await request.json()
+        return web.json_response(self.heartbeat(body.get("videoId", "")))
+
+    async def handle_metadata(self, request: web.Request):
+        body = await request.json()
+        video_id = body.get("videoId") or urlsafe_b64decode(body.get("continuation", "").encode()).decode()
+        return web.json_response(self.updated_metadata(video_id))
+
+    async def handle_browse(self, request: web.Request):
+        body = await request.json()
+        continuation = body.get("continuation")
+        if continuation:
+            # Channel ID -> community page, other browse IDs are membership pages
+            try:
+                browse_id, details, _ = decode_browse_continuation(continuation)
+                page = decode(details).get(page_field, 0)
+            except ValueError:
+                raise web.HTTPBadRequest(text="Invalid continuation")
+            if browse_id.startswith("UC"):
+                return web.json_response({"onResponseReceivedEndpoints": [{"appendContinuationItemsAction": {
+                    "continuationItems": self.posts_page(browse_id, page)}}]})
+            return web.json_response({"onResponseReceivedActions": [{"appendContinuationItemsAction": {
+                "continuationItems": [{"itemSectionRenderer": {"contents": self.membership_page(page)}}]}}]})
+        return web.json_response(self.community(body.get("browseId", "")))
+
+    async def handle_community(self, request: web.Request):
+        return web.Response(text=self.html(data=self.community(request.match_info["channel_id"])),
+                            content_type="text/html")
+
+    async def handle_memberships(self, request: web.Request):
+        if request.query.get("pbj") == "1":
+            return web.json_response([{"page": "browse"}, {"response": self.memberships()}])
+        return web.Response(text=self.html(data=self.memberships()), content_type="text/html")
+
+    async def handle_base_js(self, _):
+        return web.Response(text=self.base_js(), content_type="text/javascript")
+
+    async def handle_upload_start(self, request: web.Request):
+        session = "%016x" % self.random.getrandbits(64)
+        return web.json_response({}, headers={
+            "X-Goog-Upload-URL": f"{request.scheme}://{request.host}/upload/studio/session/{session}",
+            "X-Goog-Upload-Header-Scotty-Resource-Id": session,
+            "X-Goog-Upload-Status": "active",
+        })
+
+    async def handle_upload_chunk(self, request: web.Request):
+        await request.read()
+        final = "finalize" in request.headers.get("X-Goog-Upload-Command", "")
+        return web.json_response({}, headers={"X-Goog-Upload-Status": "final" if final else "active"})
+
+    async def handle_studio(self, request: web.Request):
+        action = request.match_info["action"]
+        body = await request.json()
+        client = body.get("context", {}).get("client", {})
+        if request.query.get("key") != self.config.studio_api_key:
+            return web.json_response({"error": {"code": 400, "status": "INVALID_ARGUMENT",
+                                                "message": "API key not valid. Please pass a valid API key."}},
+                                     status=400)
+        if (client.get("clientName"), client.get("clientVersion")) != ("CREATOR_STUDIO",
+                                                                       self.config.studio_client_version):
+            return web.json_response({"error": {"code": 400, "status": "FAILED_PRECONDITION",
+                                                "message": "Precondition check failed."}}, status=400)
+        if action == "att/get":
+            return web.json_response({"challenge": "mock-challenge"})
+        if action == "att/esr":
+            return web.json_response({"vint": 0, "sessionToken": "mock-session-token"})
+        if action == "upload/createvideo":
+            video_id = "%011x" % self.random.getrandbits(44)
+            token = urlsafe_b64encode(json.dumps({"v": video_id, "t": time.time()}).encode()).decode()
+            return web.json_response({"videoId": video_id,
+                                      "contents": {"uploadFeedbackItemRenderer": self.feedback_item(token)}})
+        if action == "upload/feedback":
+            return web.json_response({"continuationContents": [
+                {"uploadFeedbackItemContinuation": self.feedback_item(token)}
+                for token in body.get("continuations", [])
+            ]})
+        if action == "playlist/create":
+            return web.json_response({"playlistId": "PL%032x" % self.random.getrandbits(128)})
+        return web.json_response({"status": "STATUS_SUCCEEDED"})
+
+    async def handle_edit_playlist(self, _):
+        return web.json_response({"status": "STATUS_SUCCEEDED"})
+
+    async def handle_stats(self, _):
+        return web.json_response(self.stats.to_json())
+
+    def create_app(self) -> web.Application:
+        app = web.Application(middlewares=[self.middleware], client_max_size=1024 ** 3)
+        app.router.add_get("/", self.handle_root)
+        app.router.add_get("/studio", self.handle_root)
+        app.router.add_route("*", "/watch", self.handle_watch)
+        app.router.add_post("/youtubei/{version}/player", self.handle_player)
+        app.router.add_post("/youtubei/{version}/player/heartbeat", self.handle_heartbeat)
+        app.router.add_post("/youtubei/{version}/updated_metadata", self.handle_metadata)
+        app.router.add_post("/youtubei/{version}/browse", self.handle_browse)
+        app.router.add_post("/youtubei/{version}/browse/edit_playlist", self.handle_edit_playlist)
+        app.router.add_get("/channel/{channel_id}/community", self.handle_community)
+        app.router.add_route("*", "/paid_memberships", self.handle_memberships)
+        app.router.add_get("/s/player/{version}/{path:.+}", self.handle_base_js)
+        app.router.add_post("/upload/studio", self.handle_upload_start)
+        app.router.add_post("/upload/studio/session/{session}", self.handle_upload_chunk)
+        app.router.add_post("/studio/youtubei/{version}/{action:.+}", self.handle_studio)
+        app.router.add_get("/_mock/stats", self.handle_stats)
+        return app
+
+
+async def start_mock_server(host="127.0.0.1", port=8080, config: Optional[MockConfig] = None):
+    """
+    Start the mock server in the running event loop
+
+    :return: (aiohttp AppRunner, base url)
+    """
+    server = MockInnertube(config)
+    runner = web.AppRunner(server.create_app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    if not port:
+        port = runner.addresses[0][1]
+    return runner, f"http://{host}:{port}"
+
+
+def use_mock_server(base_url: str):
+    """Point www / studio / upload endpoints at a mock server"""
+    set_root_url(yt=base_url, studio=f"{base_url}/studio", upload=base_url)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="livetube innertube mock server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--fixtures", help="Directory with captured responses used as templates")
+    parser.add_argument("--cipher", action="store_true", help="Serve formats with signatureCipher")
+    parser.add_argument("--burst-every", type=float, default=0, help="Seconds between 429 bursts")
+    parser.add_argument("--burst-seconds", type=float, default=5)
+    parser.add_argument("--slow-ratio", type=float, default=0.0)
+    parser.add_argument("--slow-delay", type=float, default=2.0)
+    parser.add_argument("--rotation", type=float, default=3600, help="Player version rotation in seconds")
+    parser.add_argument("--offline-seconds", type=float, default=60)
+    parser.add_argument("--live-seconds", type=float, default=600)
+    parser.add_argument("--ended-seconds", type=float, default=60)
+    parser.add_argument("--poll-delay-ms", type=int, default=5000)
+    parser.add_argument("--field-mask", choices=("apply", "reject", "ignore"), default="apply")
+    args = parser.parse_args()
+    config = MockConfig(fixtures_dir=args.fixtures, cipher=args.cipher, burst_every=args.burst_every,
+                        burst_seconds=args.burst_seconds, slow_ratio=args.slow_ratio, slow_delay=args.slow_delay,
+                        player_rotation_seconds=args.rotation, offline_seconds=args.offline_seconds,
+                        live_seconds=args.live_seconds, ended_seconds=args.ended_seconds,
+                        poll_delay_ms=args.poll_delay_ms, field_mask=args.field_mask)
+    web.run_app(MockInnertube(config).create_app(), host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == '__main__':
+    main()
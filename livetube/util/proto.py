@@ -0,0 +1,198 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 23:20
+    File:    proto.py
+    Description: Protobuf wire codec for browse params and continuation tokens
+
+    Usage:
+        params = browse_params("videos", sort="oldest")
+        token = browse_continuation("FEmembership_details", {50: {12: {1: "FEmemberships_and_purchases"}}})
+        browse_id, details, target_id = decode_browse_continuation(token)
+
+    Messages are dicts of field number -> value: int for varints, str / bytes for
+    length-delimited fields, a dict for a nested message and a list for a
+    repeated field. decode() returns length-delimited fields as bytes, decode
+    them again to read a nested message (``field_path`` does it for a path).
+
+    Tokens are base64 of a message. Continuation layouts other than the
+    membership card aren't fixed by YouTube, a harvested token can be decoded,
+    edited and encoded again to ask for another page directly.
+"""
+import time
+from base64 import b64decode, b64encode, urlsafe_b64encode
+from typing import Any, Dict, Union, Tuple, Optional, Iterable
+from urllib.parse import quote, unquote
+
+Message = Union[Dict[int, Any], Iterable[Tuple[int, Any]]]
+
+# Field 80226972 of a continuation token, the browse request it continues
+browse_command = 80226972
+channel_tabs = ("featured", "videos", "streams", "shorts", "playlists", "community", "channels", "about")
+# Sort orders of the videos / streams tab
+sort_orders = {"popular": 1, "oldest": 2, "newest": 3}
+
+
+def encode_varint(value: int) -> bytes:
+    if value < 0:
+        value += 1 << 64
+    if value < 0x80:
+        return bytes((value,))
+    out = bytearray()
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def decode_varint(data: bytes, pos: int = 0) -> Tuple[int, int]:
+    """Value and the position after it"""
+    byte = data[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    value, shift = 0, 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def encode(message: Message) -> bytes:
+    out = bytearray()
+    for number, value in (message.items() if isinstance(message, dict) else message):
+        if value is None:
+            continue
+        for value in (value if isinstance(value, list) else (value,)):
+            if isinstance(value, int):
+                out += encode_varint(number << 3)
+                out += encode_varint(int(value))
+                continue
+            if isinstance(value, str):
+                value = value.encode()
+            elif not isinstance(value, (bytes, bytearray)):
+                value = encode(value)
+            out += encode_varint(number << 3 | 2)
+            out += encode_varint(len(value))
+            out += value
+    return bytes(out)
+
+
+def decode(data: bytes) -> Dict[int, Any]:
+    """
+    Fields of a message, a field seen more than once becomes a list
+
+    :raise ValueError: Not a protobuf message
+    """
+    message: Dict[int, Any] = {}
+    pos, end = 0, len(data)
+    try:
+        while pos < end:
+            key, pos = decode_varint(data, pos)
+            number, wire_type = key >> 3, key & 7
+            if wire_type == 0:
+                value, pos = decode_varint(data, pos)
+            elif wire_type == 2:
+                length, pos = decode_varint(data, pos)
+                value = data[pos:pos + length]
+                pos += length
+            elif wire_type == 1:
+                value = int.from_bytes(data[pos:pos + 8], "little")
+                pos += 8
+            elif wire_type == 5:
+                value = int.from_bytes(data[pos:pos + 4], "little")
+                pos += 4
+            else:
+                raise ValueError(f"Unsupported wire type {wire_type} of field {number}")
+            if number in message:
+                previous = message[number]
+                if isinstance(previous, list):
+                    previous.append(value)
+                else:
+                    message[number] = [previous, value]
+            else:
+                message[number] = value
+    except IndexError:
+        raise ValueError("Truncated protobuf message") from None
+    if pos > end:
+        raise ValueError("Truncated protobuf message")
+    return message
+
+
+def field_path(data: bytes, *numbers: int) -> Any:
+    """
+    Value at a path of nested messages, e.g. ``field_path(data, 50, 12, 3, 2)``
+
+    :raise KeyError: A field of the path is missing
+    """
+    value: Any = data
+    for number in numbers:
+        value = decode(value)[number]
+    return value
+
+
+def to_base64(data: bytes) -> str:
+    """Url safe base64, quoted like YouTube sends it"""
+    return quote(urlsafe_b64encode(data).decode())
+
+
+def from_base64(token: str) -> bytes:
+    """Bytes of a token, in either base64 alphabet, quoted or not"""
+    token = unquote(token).replace("-", "+").replace("_", "/")
+    return b64decode(token + "=" * (-len(token) % 4))
+
+
+def browse_params(tab: str, sort: Optional[str] = None) -> str:
+    """
+    params of a browse request opening a channel tab
+
+    :param tab: One of channel_tabs
+    :param sort: One of sort_orders, for the videos / streams tab
+    """
+    message: Dict[int, Any] = {2: tab}
+    if sort is not None:
+        message.update({3: sort_orders[sort], 4: 0, 6: 1})
+    return to_base64(encode(message))
+
+
+def decode_browse_params(params: str) -> Tuple[str, Optional[str]]:
+    """Tab and sort order of browse params"""
+    message = decode(from_base64(params))
+    sort = next((name for name, value in sort_orders.items() if value == message.get(3)), None)
+    return message[2].decode(), sort
+
+
+def browse_continuation(browse_id: str, details: Union[Message, bytes] = b"", target_id: Optional[str] = None) -> str:
+    """
+    Continuation token of a browse request
+
+    :param browse_id: Browse ID, e.g. a channel ID or FEmembership_details
+    :param details: Page details, carried as base64 inside the token
+    :param target_id: Element the new items are appended to
+    """
+    if not isinstance(details, (bytes, bytearray)):
+        details = encode(details)
+    return to_base64(encode({browse_command: {2: browse_id, 3: b64encode(details), 35: target_id}}))
+
+
+def decode_browse_continuation(token: str) -> Tuple[str, bytes, Optional[str]]:
+    """
+    Browse ID, details and target ID of a continuation token
+
+    :raise ValueError: Not a browse continuation
+    """
+    try:
+        command = decode(decode(from_base64(token))[browse_command])
+    except (KeyError, TypeError):
+        raise ValueError("Not a browse continuation token") from None
+    target_id = command.get(35)
+    return (command.get(2, b"").decode(), from_base64(command.get(3, b"").decode()),
+            target_id.decode() if target_id is not None else None)
+
+
+def visitor_id(visitor_info_live: str, timestamp: Optional[int] = None) -> str:
+    """X-Goog-Visitor-Id of a VISITOR_INFO1_LIVE cookie"""
+    return quote(b64encode(encode({1: visitor_info_live, 5: timestamp or int(time.time())})))
@@ -0,0 +1,81 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 22:50
+    File:    seen.py
+    Description: Compact store of seen post IDs
+
+    Usage:
+        seen = SeenStore(capacity=500_000)
+        if seen.add(post.post_id):      # True the first time
+            ...
+
+    IDs are kept as 64 bit hashes in two generations of sets. When the newer
+    one holds half of ``capacity`` the older one is dropped, so memory stays
+    bounded and the IDs forgotten first are the ones not seen for longest.
+"""
+import os
+from array import array
+from hashlib import blake2b
+from typing import Optional
+
+
+def id_hash(value: str) -> int:
+    return int.from_bytes(blake2b(value.encode(), digest_size=8).digest(), "little")
+
+
+class SeenStore:
+    def __init__(self, capacity: int = 500_000, path: Optional[str] = None):
+        """
+        :param capacity: IDs remembered at most
+        :param path: Binary file of load() / save(), loaded when exists
+        """
+        self.capacity = capacity
+        self.path = path
+        self._current = set()
+        self._previous = set()
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self):
+        return len(self._current) + len(self._previous)
+
+    def __contains__(self, value: str):
+        key = id_hash(value)
+        return key in self._current or key in self._previous
+
+    def add(self, value: str) -> bool:
+        """Remember an ID, True when it wasn't seen before"""
+        key = id_hash(value)
+        if key in self._current:
+            return False
+        self._current.add(key)
+        if key in self._previous:
+            # Seen again, moved to the newer generation
+            self._previous.discard(key)
+            return False
+        if len(self._current) >= self.capacity // 2:
+            self._previous, self._current = self._current, set()
+        return True
+
+    def clear(self):
+        self._current.clear()
+        self._previous.clear()
+
+    def load(self, path: str):
+        """Read IDs written by save(), later saves go to the same file"""
+        self.path = path
+        hashes = array("Q")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                hashes.frombytes(f.read())
+        self._previous, self._current = set(), set(hashes)
+
+    def save(self):
+        """Write every remembered ID, the file is replaced atomically"""
+        if not self.path:
+            return
+        temp = f"{self.path}.tmp"
+        with open(temp, "wb") as f:
+            array("Q", self._previous | self._current).tofile(f)
+        os.replace(temp, self.path)
@@ -0,0 +1,188 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/20 00:10
+    File:    snapshot.py
+    Description: Warm start from saved api keys, ciphers and video cursors
+
+    Usage:
+        snapshot = Snapshot("livetube.json")        # or livetube.db for SQLite
+        snapshot.restore()                          # On boot, before the first request
+        snapshot.track(video)                       # Cursors of a video, restored when saved before
+        ...
+        snapshot.save()                             # Periodically and on shutdown
+
+    Without a snapshot every process starts with an empty api key and no
+    known player, so the first requests all load html pages and base.js.
+    A snapshot keeps:
+      - yt_internal_api (api key and client versions)
+      - Ciphers of known player js urls, as transform plans
+      - js_url, metadata continuation and heartbeat sequence of tracked videos
+
+    Entries older than ``max_age`` / ``cursor_max_age`` are ignored, and so is
+    everything saved for another yt_root_url (e.g. the mock server). An api
+    key that stopped working is refreshed by the transport probe as usual.
+"""
+import json
+import os
+import sqlite3
+import time
+import weakref
+from typing import Optional, Dict, Any, Tuple
+
+from livetube.util import cache
+from livetube.util.cipher import Cipher
+from livetube.utils import logger
+
+# Section -> key -> (value, saved at)
+Entries = Dict[str, Dict[str, Tuple[Any, float]]]
+
+
+class _JsonBackend:
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Entries:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, encoding="utf-8") as f:
+            return {section: {key: tuple(entry) for key, entry in entries.items()}
+                    for section, entries in json.load(f).items()}
+
+    def save(self, entries: Entries):
+        temp = f"{self.path}.tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(temp, self.path)
+
+
+class _SqliteBackend:
+    def __init__(self, path: str):
+        self.path = path
+        with sqlite3.connect(path) as db:
+            db.execute("CREATE TABLE IF NOT EXISTS snapshot (section TEXT, key TEXT, value TEXT, saved_at REAL, "
+                       "PRIMARY KEY (section, key))")
+
+    def load(self) -> Entries:
+        entries: Entries = {}
+        with sqlite3.connect(self.path) as db:
+            for section, key, value, saved_at in db.execute("SELECT section, key, value, saved_at FROM snapshot"):
+                entries.setdefault(section, {})[key] = (json.loads(value), saved_at)
+        return entries
+
+    def save(self, entries: Entries):
+        with sqlite3.connect(self.path) as db:
+            db.execute("DELETE FROM snapshot")
+            db.executemany("INSERT INTO snapshot VALUES (?, ?, ?, ?)", [
+                (section, key, json.dumps(value), saved_at)
+                for section, section_entries in entries.items()
+                for key, (value, saved_at) in section_entries.items()
+            ])
+
+
+class Snapshot:
+    def __init__(self, path: str, max_age: float = 86400, cursor_max_age: float = 1800,
+                 backend: Optional[str] = None):
+        """
+        :param path: Snapshot file, created on save
+        :param max_age: Seconds an api key / cipher stays usable
+        :param cursor_max_age: Seconds a video cursor stays usable
+        :param backend: json or sqlite, by default sqlite for .db / .sqlite / .sqlite3 paths
+        """
+        if backend is None:
+            backend = "sqlite" if os.path.splitext(path)[1] in (".db", ".sqlite", ".sqlite3") else "json"
+        if backend not in ("json", "sqlite"):
+            raise ValueError(f"Unknown snapshot backend {backend}")
+        self.path = path
+        self.max_age = max_age
+        self.cursor_max_age = cursor_max_age
+        self._backend = _SqliteBackend(path) if backend == "sqlite" else _JsonBackend(path)
+        self.entries: Entries = {}
+        # Video ID -> Video, saved with the snapshot while alive
+        self._videos = weakref.WeakValueDictionary()
+
+    def _fresh(self, section: str, key: str, max_age: float) -> Optional[Any]:
+        entry = self.entries.get(section, {}).get(key)
+        if entry is None or time.time() - entry[1] > max_age:
+            return None
+        return entry[0]
+
+    def restore(self) -> Dict[str, int]:
+        """
+        Load the snapshot, stale entries are dropped
+
+        :return: Section -> entries restored
+        """
+        try:
+            self.entries = self._backend.load()
+        except (OSError, ValueError, sqlite3.Error) as e:
+            logger.warning(f"Failed to read snapshot {self.path}: {e!r}")
+            self.entries = {}
+        restored = {"api": 0, "player": 0, "video": 0}
+        if self._fresh("meta", "root_url", float("inf")) != cache.yt_root_url:
+            # Saved against other hosts
+            self.entries = {}
+            return restored
+
+        api = self._fresh("api", "internal_api", self.max_age)
+        if api and api.get("key") and not cache.yt_internal_api.key:
+            cache.yt_internal_api.update(api)
+            restored['api'] = 1
+        for js_url in list(self.entries.get("player", {})):
+            state = self._fresh("player", js_url, self.max_age)
+            if state is None or cache.js_cache_v2[js_url]:
+                continue
+            try:
+                cache.js_cache_v2[js_url] = Cipher.from_state(state)
+                restored['player'] += 1
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignored cipher of {js_url} in snapshot: {e!r}")
+        for section, max_age in (("api", self.max_age), ("player", self.max_age), ("video", self.cursor_max_age)):
+            entries = self.entries.get(section, {})
+            for key in [key for key, (_, saved_at) in entries.items() if time.time() - saved_at > max_age]:
+                del entries[key]
+        restored['video'] = len(self.entries.get("video", {}))
+        for video in self._videos.values():
+            self._restore_video(video)
+        return restored
+
+    def _restore_video(self, video) -> bool:
+        state = self._fresh("video", video.video_id, self.cursor_max_age)
+        if not state:
+            return False
+        if not video.js_url:
+            video.js_url = state['js_url']
+        if not video._continue_id:
+            video._continue_id = state['continue_id']
+        video._heartbeat_seq_number = max(video._heartbeat_seq_number, state['heartbeat_seq'])
+        return True
+
+    def track(self, video) -> bool:
+        """
+        Save the cursors of a video with the snapshot, until it's garbage collected
+
+        :return: Whether cursors of the video were restored
+        """
+        self._videos[video.video_id] = video
+        return self._restore_video(video)
+
+    def save(self):
+        """Write the current state, the file is replaced atomically (json) or in a transaction (sqlite)"""
+        now = time.time()
+        api = cache.yt_internal_api.to_state()
+        self.entries['meta'] = {"root_url": (cache.yt_root_url, now)}
+        if api['key']:
+            self.entries['api'] = {"internal_api": (api, now)}
+        player = self.entries.setdefault("player", {})
+        for js_url, cipher in list(cache.js_cache_v2.cache.items()):
+            if cipher:
+                player[js_url] = (cipher.to_state(), now)
+        videos = self.entries.setdefault("video", {})
+        for video_id, video in list(self._videos.items()):
+            if video.js_url or video._continue_id:
+                videos[video_id] = ({
+                    "js_url": video.js_url,
+                    "continue_id": video._continue_id,
+                    "heartbeat_seq": video._heartbeat_seq_number,
+                }, now)
+        self._backend.save(self.entries)
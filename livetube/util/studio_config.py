@@ -0,0 +1,173 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/20 00:40
+    File:    studio_config.py
+    Description: Studio page config, loaded once per account and TTL
+
+    Studio calls need the api key and CREATOR_STUDIO client version from the
+    studio.youtube.com page. Every account loads it once, then again after
+    ``ttl``; in the last ``refresh_ahead`` seconds the page is reloaded in the
+    background while calls go on with the current config. Calls of the same
+    account waiting for a load share it. A studio call failing with a config
+    error (bad key / client version) drops the account's config.
+
+    The config is kept per account and handed to the Studio request, so www
+    page loads, the api probe or a snapshot restore changing yt_internal_api
+    don't change what studio calls send.
+
+    Usage:
+        from livetube.util.studio_config import studio_config
+
+        studio_config.configure(ttl=6 * 3600)
+        config = await studio_config.ensure(account, cookie)
+        config.key, config.client_info()
+        studio_config.invalidate()      # Every account
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from functools import wraps
+from typing import Optional, Dict, Tuple
+
+from livetube.util.cache import fetch_page_config
+from livetube.util.exceptions import HTTPError
+from livetube.util.metrics import registry
+from livetube.utils import logger
+
+studio_config_total = registry.counter("livetube_studio_config_total", "Studio config lookups", ("result",))
+# Api errors of a request sent with a stale key / client version
+config_error_statuses = ("INVALID_ARGUMENT", "FAILED_PRECONDITION", "UNAUTHENTICATED")
+
+
+@dataclass(frozen=True)
+class StudioConfig:
+    key: str
+    version: str
+    client_name: str
+    client_version: str
+    browser_name: str
+    browser_version: str
+    # Number of the load, tells two configs of an account apart
+    revision: int = 0
+
+    @classmethod
+    def from_page(cls, script: dict, revision: int = 0) -> "StudioConfig":
+        """Config of the studio page's ytcfg"""
+        client = script['INNERTUBE_CONTEXT']['client']
+        return cls(
+            key=script['INNERTUBE_API_KEY'],
+            version=script['INNERTUBE_API_VERSION'],
+            client_name=script['INNERTUBE_CLIENT_NAME'],
+            client_version=script['INNERTUBE_CLIENT_VERSION'],
+            browser_name=client.get("browserName", ""),
+            browser_version=client.get("browserVersion", ""),
+            revision=revision,
+        )
+
+    def client_info(self) -> dict:
+        """context.client of studio requests"""
+        return {
+            "hl": "en_US",
+            "browserName": self.browser_name,
+            "browserVersion": self.browser_version,
+            "clientName": self.client_name,
+            "clientVersion": self.client_version,
+        }
+
+
+class StudioConfigCache:
+    def __init__(self, ttl: float = 3600, refresh_ahead: float = 300):
+        """
+        :param ttl: Seconds a loaded config is used
+        :param refresh_ahead: Reload in the background this many seconds before ttl
+        """
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        # Account -> (config, monotonic time of the load)
+        self._configs: Dict[str, Tuple[StudioConfig, float]] = {}
+        self._loading: Dict[str, asyncio.Future] = {}
+        self._revision = 0
+
+    def configure(self, ttl: Optional[float] = None, refresh_ahead: Optional[float] = None):
+        if ttl is not None:
+            self.ttl = ttl
+        if refresh_ahead is not None:
+            self.refresh_ahead = refresh_ahead
+
+    async def _load(self, account: str, cookie: dict) -> StudioConfig:
+        script = await fetch_page_config(studio=True, cookie=cookie)
+        self._revision += 1
+        config = StudioConfig.from_page(script, self._revision)
+        self._configs[account] = (config, time.monotonic())
+        return config
+
+    def _load_once(self, account: str, cookie: dict) -> asyncio.Future:
+        """Load of the account, started when none is running"""
+        task = self._loading.get(account)
+        if task is None:
+            task = self._loading[account] = asyncio.ensure_future(self._load(account, cookie))
+            task.add_done_callback(lambda done: self._loaded_callback(account, done))
+        return task
+
+    def _loaded_callback(self, account: str, task: asyncio.Future):
+        self._loading.pop(account, None)
+        if not task.cancelled() and task.exception():
+            logger.warning(f"Failed to load studio config: {task.exception()!r}")
+
+    async def ensure(self, account: str, cookie: dict) -> StudioConfig:
+        """
+        Studio config of the account, loaded when missing or expired
+
+        :param account: Identity name / SAPISID
+        :param cookie: Cookie of the account, used when loading
+        :raise NetworkError: Loading failed and no config is usable
+        """
+        cached = self._configs.get(account)
+        if cached is not None:
+            config, loaded = cached
+            age = time.monotonic() - loaded
+            if age < self.ttl:
+                if age >= self.ttl - self.refresh_ahead:
+                    studio_config_total.inc(result="refresh")
+                    self._load_once(account, cookie)
+                else:
+                    studio_config_total.inc(result="hit")
+                return config
+        studio_config_total.inc(result="load")
+        # Shielded, a cancelled caller doesn't cancel the others' load
+        return await asyncio.shield(self._load_once(account, cookie))
+
+    def invalidate(self, account: Optional[str] = None):
+        """Load the config again on next use, of an account or every account"""
+        studio_config_total.inc(result="invalidated")
+        if account is None:
+            self._configs.clear()
+        else:
+            self._configs.pop(account, None)
+
+
+def is_config_error(error: BaseException) -> bool:
+    """Whether a failed studio call was rejected because of its key / client version"""
+    if not isinstance(error, HTTPError) or not 400 <= error.status < 500 or error.status == 429:
+        return False
+    return error.error_status in config_error_statuses or "API key" in (error.error_message or "")
+
+
+def invalidates_config(func):
+    """Drop the studio config of the account when a Studio call fails because of it"""
+
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await func(self, *args, **kwargs)
+        except HTTPError as e:
+            if is_config_error(e):
+                self.warn(f"Studio config rejected, reloading on next call: {e}")
+                studio_config.invalidate(self._account)
+            raise
+
+    return wrapper
+
+
+studio_config = StudioConfigCache()
@@ -0,0 +1,263 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 11:05
+    File:    trace.py
+    Description: Per request phase timing
+"""
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Callable, Dict, List, Optional
+
+import aiohttp
+
+
+@dataclass
+class TraceRecord:
+    """
+    Timing of one traced operation (in seconds)
+
+    Phases:
+        - dns: Host resolving
+        - connect: TCP connect and TLS handshake (aiohttp reports them as one step)
+        - ttfb: Request sent until response headers received
+        - body: Body download
+        - json: JSON decode
+        - html_parse / model_build / query_selector: Parsing the response
+    """
+    endpoint: str
+    tag: str = ""
+    start: float = field(default_factory=time.time)
+    duration: float = 0.0
+    phases: Dict[str, float] = field(default_factory=dict)
+    requests: int = 0
+    status: Optional[int] = None
+    error: Optional[str] = None
+
+    def add(self, phase: str, duration: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + duration
+
+    def to_json(self):
+        return {
+            "endpoint": self.endpoint,
+            "tag": self.tag,
+            "start": self.start,
+            "duration": self.duration,
+            "phases": self.phases,
+            "requests": self.requests,
+            "status": self.status,
+            "error": self.error
+        }
+
+
+_current_record: ContextVar[Optional[TraceRecord]] = ContextVar("livetube_trace", default=None)
+
+
+class Tracer:
+    def __init__(self):
+        self.sinks: List[Callable[[TraceRecord], None]] = []
+        self._trace_config: Optional["aiohttp.TraceConfig"] = None
+
+    @property
+    def enabled(self) -> bool:
+        return len(self.sinks) > 0
+
+    def add_sink(self, sink: Callable[[TraceRecord], None]):
+        """Add a sink, any callable that takes a TraceRecord"""
+        self.sinks.append(sink)
+        return sink
+
+    def remove_sink(self, sink: Callable[[TraceRecord], None]):
+        self.sinks.remove(sink)
+
+    @staticmethod
+    def current() -> Optional[TraceRecord]:
+        return _current_record.get()
+
+    def emit(self, record: TraceRecord):
+        for sink in self.sinks:
+            # noinspection PyBroadException
+            try:
+                sink(record)
+            except Exception:
+                pass
+
+    @contextmanager
+    def span(self, endpoint: str, tag: str = ""):
+        """
+        Trace an operation, nested spans and requests join the outer one
+
+        :param endpoint: Endpoint family
+        :param tag: Video / channel ID
+        """
+        if not self.sinks or _current_record.get() is not None:
+            yield _current_record.get()
+            return
+        record = TraceRecord(endpoint, tag)
+        token = _current_record.set(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        except BaseException as e:
+            record.error = type(e).__name__
+            raise
+        finally:
+            record.duration = time.perf_counter() - start
+            _current_record.reset(token)
+            self.emit(record)
+
+    @contextmanager
+    def phase(self, name: str):
+        """Add time spent in this block to the current record"""
+        record = _current_record.get()
+        if record is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record.add(name, time.perf_counter() - start)
+
+    @property
+    def trace_config(self) -> "aiohttp.TraceConfig":
+        """aiohttp hooks, expects the TraceRecord as ``trace_request_ctx``"""
+        if self._trace_config is None:
+            config = aiohttp.TraceConfig()
+            config.on_request_start.append(_on_request_start)
+            config.on_dns_resolvehost_start.append(_on_dns_start)
+            config.on_dns_resolvehost_end.append(_on_dns_end)
+            config.on_connection_create_start.append(_on_connect_start)
+            config.on_connection_create_end.append(_on_connect_end)
+            config.on_request_end.append(_on_request_end)
+            config.on_request_exception.append(_on_request_exception)
+            config.freeze()
+            self._trace_config = config
+        return self._trace_config
+
+
+# aiohttp signal handlers, ctx is a SimpleNamespace per request
+
+async def _on_request_start(_, ctx, __):
+    ctx.request_start = time.perf_counter()
+    ctx.dns = 0.0
+    ctx.connect = 0.0
+
+
+async def _on_dns_start(_, ctx, __):
+    ctx.dns_start = time.perf_counter()
+
+
+async def _on_dns_end(_, ctx, __):
+    ctx.dns += time.perf_counter() - ctx.dns_start
+    if isinstance(ctx.trace_request_ctx, TraceRecord):
+        ctx.trace_request_ctx.add("dns", ctx.dns)
+
+
+async def _on_connect_start(_, ctx, __):
+    ctx.connect_start = time.perf_counter()
+
+
+async def _on_connect_end(_, ctx, __):
+    # Host resolving happens inside connection creation
+    ctx.connect = time.perf_counter() - ctx.connect_start
+    if isinstance(ctx.trace_request_ctx, TraceRecord):
+        ctx.trace_request_ctx.add("connect", max(0.0, ctx.connect - ctx.dns))
+
+
+async def _on_request_end(_, ctx, params):
+    record = ctx.trace_request_ctx
+    if isinstance(record, TraceRecord):
+        record.add("ttfb", time.perf_counter() - ctx.request_start - max(ctx.connect, ctx.dns))
+        record.status = params.response.status
+
+
+async def _on_request_exception(_, ctx, params):
+    record = ctx.trace_request_ctx
+    if isinstance(record, TraceRecord):
+        record.error = type(params.exception).__name__
+
+
+def traced(endpoint: str, tag_attr: str = ""):
+    """
+    Trace an async method as one operation
+
+    :param endpoint: Endpoint family
+    :param tag_attr: Attribute of the object used as tag, e.g. ``video_id``
+    """
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            if not tracer.sinks:
+                return await func(self, *args, **kwargs)
+            with tracer.span(endpoint, getattr(self, tag_attr, "") if tag_attr else ""):
+                return await func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class CallbackSink:
+    """Call a function for every record"""
+
+    def __init__(self, callback: Callable[[TraceRecord], None]):
+        self.callback = callback
+
+    def __call__(self, record: TraceRecord):
+        self.callback(record)
+
+
+class RingBufferSink:
+    """Keep the latest records in memory"""
+
+    def __init__(self, size: int = 1000):
+        self.buffer = deque(maxlen=size)
+
+    def __call__(self, record: TraceRecord):
+        self.buffer.append(record)
+
+    def records(self) -> List[TraceRecord]:
+        return list(self.buffer)
+
+    def clear(self):
+        self.buffer.clear()
+
+
+class OpenTelemetrySink:
+    """
+    Export records as OpenTelemetry spans
+
+    Each phase becomes a ``livetube.phase.<name>`` attribute in milliseconds.
+    Requires ``opentelemetry-api``.
+
+    :param tracer_provider: Optional tracer provider, global one by default
+    """
+
+    def __init__(self, tracer_provider=None):
+        from opentelemetry import trace as otel_trace  # Optional
+
+        self._otel_trace = otel_trace
+        self.tracer = otel_trace.get_tracer("livetube", tracer_provider=tracer_provider)
+
+    def __call__(self, record: TraceRecord):
+        start_ns = int(record.start * 1e9)
+        span = self.tracer.start_span(f"livetube {record.endpoint}", start_time=start_ns)
+        span.set_attribute("livetube.endpoint", record.endpoint)
+        span.set_attribute("livetube.tag", record.tag)
+        span.set_attribute("livetube.requests", record.requests)
+        if record.status is not None:
+            span.set_attribute("http.status_code", record.status)
+        for phase, duration in record.phases.items():
+            span.set_attribute(f"livetube.phase.{phase}", duration * 1000)
+        if record.error:
+            span.set_status(self._otel_trace.Status(self._otel_trace.StatusCode.ERROR, record.error))
+        span.end(end_time=start_ns + int(record.duration * 1e9))
+
+
+tracer = Tracer()
@@ -0,0 +1,230 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 19:20
+    File:    transport.py
+    Description: Choosing between innertube api, pbj json and html pages
+
+    Every fetch that can be served more than one way hands its handlers to
+    ``transport_selector.run(operation, {"api": ..., "pbj": ..., "html": ...})``.
+    The cheapest healthy path is used and the next one on failure. Health is
+    kept per (operation, path) and only transport failures (network errors,
+    timeouts, 5xx, a rejected api key) count against it; an extract error of one video or post
+    falls back to the next path for that call alone. A path with a low success
+    rate is skipped for ``cooldown`` seconds, then gets a trial request, or
+    when it has a probe (the api key refresh) the probe runs in the background
+    and brings it back.
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Awaitable, Dict, Deque, Optional, Any, List, Tuple, Type
+
+from livetube.util.exceptions import NetworkError, ExtractError, HTTPError, RateLimited
+from livetube.util.metrics import registry
+from livetube.utils import logger
+
+transport_requests_total = registry.counter("livetube_transport_requests_total", "Requests per transport path",
+                                            ("operation", "path", "result"))
+# (operation, path)
+HealthKey = Tuple[str, str]
+
+
+class PathHealth:
+    def __init__(self, window: int):
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.latency: Optional[float] = None
+        self.healthy = True
+        self.failures = 0
+        self.retry_at = 0.0
+        self.cooldown = 0.0
+        self.trial = False
+
+    @property
+    def success_rate(self) -> float:
+        return sum(self.outcomes) / len(self.outcomes) if self.outcomes else 1.0
+
+
+class TransportSelector:
+    # Errors that mean the path, not the request or its content, is broken
+    path_errors: Tuple[Type[BaseException], ...] = (NetworkError, asyncio.TimeoutError)
+
+    def __init__(self, costs: Optional[Dict[str, int]] = None, window: int = 50, min_samples: int = 5,
+                 min_success_rate: float = 0.5, max_failures: int = 3, cooldown: float = 30,
+                 max_cooldown: float = 600):
+        self.costs = costs or {"api": 1, "pbj": 2, "html": 3}
+        self.window = window
+        self.min_samples = min_samples
+        self.min_success_rate = min_success_rate
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+
+        self._health: Dict[HealthKey, PathHealth] = {}
+        self._probes: Dict[str, Callable[[], Awaitable[Any]]] = {}
+        self._recovering: Dict[HealthKey, "asyncio.Future"] = {}
+        self._choice: Dict[str, str] = {}
+
+    def health(self, operation: str, path: str) -> PathHealth:
+        key = (operation, path)
+        health = self._health.get(key)
+        if health is None:
+            health = self._health[key] = PathHealth(self.window)
+        return health
+
+    def set_probe(self, path: str, probe: Callable[[], Awaitable[Any]]):
+        """
+        Set the background recovery check of a path
+
+        :param probe: Coroutine factory, raising means still broken
+        """
+        self._probes[path] = probe
+
+    def _usable(self, operation: str, path: str) -> bool:
+        health = self.health(operation, path)
+        if health.healthy:
+            return True
+        # Probed paths only come back through their probe
+        return path not in self._probes and not health.trial and time.monotonic() >= health.retry_at
+
+    def order(self, operation: str, paths) -> List[str]:
+        """Paths of an operation by preference, unusable ones are kept as last resort"""
+        by_cost = sorted(paths, key=lambda path: self.costs.get(path, len(self.costs) + 1))
+        usable = [path for path in by_cost if self._usable(operation, path)]
+        return usable + [path for path in by_cost if path not in usable]
+
+    def report(self, operation: str, path: str, ok: bool, latency: Optional[float] = None):
+        health = self.health(operation, path)
+        health.outcomes.append(ok)
+        health.trial = False
+        if ok:
+            health.failures = 0
+            if latency is not None:
+                health.latency = latency if health.latency is None else health.latency * 0.8 + latency * 0.2
+            if not health.healthy:
+                self._mark_healthy(operation, path)
+            return
+        health.failures += 1
+        if health.healthy and (
+                health.failures >= self.max_failures or
+                len(health.outcomes) >= self.min_samples and health.success_rate < self.min_success_rate
+        ):
+            self._mark_unhealthy(operation, path, self.cooldown)
+        elif not health.healthy:
+            # Failed trial, wait longer
+            self._mark_unhealthy(operation, path, min(self.max_cooldown, health.cooldown * 2))
+
+    def _mark_unhealthy(self, operation: str, path: str, cooldown: float):
+        health = self.health(operation, path)
+        if health.healthy:
+            logger.warning(f"Transport {path} of {operation} unhealthy ({health.success_rate:.0%} success), "
+                           f"skipped for {cooldown:.0f}s")
+        health.healthy = False
+        health.cooldown = cooldown
+        health.retry_at = time.monotonic() + cooldown
+        key = (operation, path)
+        if path in self._probes and key not in self._recovering:
+            try:
+                self._recovering[key] = asyncio.ensure_future(self._recover(operation, path))
+            except RuntimeError:
+                # No running loop
+                pass
+
+    def _mark_healthy(self, operation: str, path: str):
+        health = self.health(operation, path)
+        health.healthy = True
+        health.failures = 0
+        health.outcomes.clear()
+        logger.info(f"Transport {path} of {operation} recovered")
+
+    async def _recover(self, operation: str, path: str):
+        delay = self.cooldown
+        try:
+            while not self.health(operation, path).healthy:
+                await asyncio.sleep(delay)
+                try:
+                    await self._probes[path]()
+                except Exception as e:
+                    logger.debug(f"Transport {path} probe failed: {e}")
+                    delay = min(self.max_cooldown, delay * 2)
+                    continue
+                self._mark_healthy(operation, path)
+        finally:
+            self._recovering.pop((operation, path), None)
+
+    def is_path_error(self, error: BaseException) -> bool:
+        """Whether an error means the path is broken, not the request or its content"""
+        if isinstance(error, RateLimited):
+            return False
+        if isinstance(error, HTTPError) and error.status < 500:
+            # A rejected api key breaks the api path, other 4xx are about the request
+            return "API key" in (error.error_message or "")
+        return isinstance(error, self.path_errors)
+
+    def _log_choice(self, operation: str, path: str):
+        last = self._choice.get(operation)
+        if last != path:
+            self._choice[operation] = path
+            if last is not None:
+                logger.info(f"Transport of {operation} switched {last} -> {path}")
+
+    async def run(self, operation: str, handlers: Dict[str, Callable[[], Awaitable[Any]]]):
+        """
+        Run an operation on the best path, falling back to the others
+
+        :param operation: Name used in logs / metrics, e.g. watch
+        :param handlers: Path name -> coroutine factory, only available paths
+        :return: Result of the first path that worked
+        """
+        error: Optional[BaseException] = None
+        for index, path in enumerate(self.order(operation, handlers)):
+            health = self.health(operation, path)
+            if not health.healthy:
+                health.trial = True
+            if index == 0:
+                self._log_choice(operation, path)
+            start = time.perf_counter()
+            try:
+                result = await handlers[path]()
+            except RateLimited:
+                # The account is throttled, not the path
+                health.trial = False
+                raise
+            except (NetworkError, ExtractError) as e:
+                transport_requests_total.inc(operation=operation, path=path, result="error")
+                if self.is_path_error(e):
+                    self.report(operation, path, False)
+                else:
+                    # This call only, e.g. one video the path can't extract
+                    health.trial = False
+                error = e
+                continue
+            except BaseException:
+                health.trial = False
+                raise
+            transport_requests_total.inc(operation=operation, path=path, result="ok")
+            self.report(operation, path, True, time.perf_counter() - start)
+            return result
+        raise error
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Operation -> path -> health"""
+        now = time.monotonic()
+        stats: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (operation, path), health in self._health.items():
+            stats.setdefault(operation, {})[path] = {
+                "healthy": health.healthy,
+                "success_rate": health.success_rate,
+                "latency": health.latency,
+                "retry_in": max(0.0, health.retry_at - now) if not health.healthy else 0.0,
+            }
+        return stats
+
+
+# Shared by Video / Community / Membership
+transport_selector = TransportSelector()
+
+registry.gauge("livetube_transport_healthy", "1 when a transport path is healthy",
+               ("operation", "path")).set_function(
+    lambda: {key: int(health.healthy) for key, health in transport_selector._health.items()}
+)
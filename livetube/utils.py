@@ -9,15 +9,22 @@ import asyncio
 import json
 import logging
 import re
+import sys
 from hashlib import sha1
 from random import random
-from time import time
-from typing import Union
-from urllib.parse import unquote
+from time import time, perf_counter
+from types import MappingProxyType
+from typing import Union, Optional, Mapping, Dict, Tuple
+from urllib.parse import unquote, urlsplit
 
 import aiohttp
 
-from livetube.util.exceptions import NetworkError
+from livetube.util.cassette import cassette
+from livetube.util.exceptions import NetworkError, HTTPError, CassetteMiss, RateLimited
+from livetube.util.fields import field_masks, FieldMasks, header_name as field_mask_header
+from livetube.util.hedge import HedgePolicy
+from livetube.util.metrics import requests_total, request_errors_total, request_retries_total, request_duration
+from livetube.util.trace import tracer, TraceRecord
 
 logger = logging.getLogger("livetube")
 
@@ -31,6 +38,12 @@ time_map = {
     "days": "天",
     "years": "年",
 }
+# Header profile content -> profile
+_header_profiles: Dict[tuple, Mapping] = {}
+# (SAPISID, origin) -> (second, Authorization)
+_sapisid_hashes: Dict[Tuple[str, str], Tuple[int, str]] = {}
+# (id of header profile, SAPISID) -> (header profile, second, header with Authorization)
+_authorized_headers: Dict[Tuple[int, str], Tuple[Mapping, int, Mapping]] = {}
 
 
 def get_text(item: dict) -> str:
@@ -66,29 +79,106 @@ def string_escape(s, encoding='utf-8') -> str:
             .decode(encoding))  # Decode original encoding
 
 
-def calculate_SNAPPISH(cookie: dict, header: dict) -> dict:
+def make_header(*parts: Optional[Mapping[str, Union[str, bool, int]]]) -> Mapping[str, Union[str, bool, int]]:
+    """
+    Merge headers into an immutable header profile
+
+    Profiles with the same content are the same object, so objects created with
+    the same headers share the SAPISIDHASH cache of calculate_SNAPPISH.
+    """
+    merged = {}
+    for part in parts:
+        if part:
+            merged.update(part)
+    key = tuple(sorted(merged.items()))
+    profile = _header_profiles.get(key)
+    if profile is None:
+        profile = _header_profiles[key] = MappingProxyType(merged)
+    return profile
+
+
+def sapisid_hash(s_api_id: str, origin: str, timestamp: Optional[int] = None) -> str:
+    """Authorization value, cached per (SAPISID, origin, second)"""
+    if timestamp is None:
+        timestamp = int(time())
+    key = (s_api_id, origin)
+    cached = _sapisid_hashes.get(key)
+    if cached is not None and cached[0] == timestamp:
+        return cached[1]
+    raw = " ".join([str(timestamp), s_api_id, origin])
+    _hash = sha1(raw.encode()).hexdigest()
+    value = f"SAPISIDHASH {timestamp}_{_hash}"
+    _sapisid_hashes[key] = (timestamp, value)
+    return value
+
+
+def calculate_SNAPPISH(cookie: dict, header: Mapping) -> Mapping:
     """
     Algorithm: SHA1(Timestamp + " " + SAPISID + " " + Origin)
     Header: Authorization: SAPISIDHASH timestamp_<SAPISIDHASH>
+
+    Returned headers are shared, don't modify them
     """
     if not cookie or len(cookie) == 1:
         return header
-    timestamp = str(int(time()))
+    timestamp = int(time())
     s_api_id = cookie['SAPISID']
     Origin = header['X-Origin']
-    raw = " ".join([timestamp, s_api_id, Origin])
-    _hash = sha1(raw.encode()).hexdigest()
-    new_header = header.copy()
-    new_header["Authorization"] = f"SAPISIDHASH {timestamp}_{_hash}"
+    if type(header) is not MappingProxyType:
+        new_header = dict(header)
+        new_header["Authorization"] = sapisid_hash(s_api_id, Origin, timestamp)
+        return new_header
+    # Header profile: reuse the merged header within the same second
+    key = (id(header), s_api_id)
+    cached = _authorized_headers.get(key)
+    if cached is not None and cached[0] is header and cached[1] == timestamp:
+        return cached[2]
+    if len(_authorized_headers) > 4096:
+        _authorized_headers.clear()
+    new_header = dict(header)
+    new_header["Authorization"] = sapisid_hash(s_api_id, Origin, timestamp)
+    new_header = MappingProxyType(new_header)
+    _authorized_headers[key] = (header, timestamp, new_header)
     return new_header
 
 
+# Innertube calls, labelled by their path after the api version
+innertube_families = frozenset((
+    "player", "player/heartbeat", "updated_metadata", "next", "browse", "browse/edit_playlist", "search",
+    "att/get", "att/esr", "upload/feedback", "upload/createvideo", "video_manager/metadata_update",
+    "playlist/create",
+))
+# First path segment of a page -> family
+page_families = {
+    "": "home", "watch": "watch", "results": "results", "get_video_info": "get_video_info",
+    "paid_memberships": "paid_memberships", "channel": "community", "upload": "upload", "studio": "studio",
+}
+
+
+def endpoint_family(url) -> str:
+    """
+    Short name of the endpoint, e.g. ``player/heartbeat`` or ``watch``
+
+    One of a fixed set of names (``other`` for the rest), so metric labels stay
+    bounded whatever channel or upload session the url is for.
+    """
+    path = urlsplit(str(url)).path
+    if path.endswith(".js"):
+        return "js"
+    if "/youtubei/" in path:
+        # Strip api version
+        path = path.split("/youtubei/", 1)[1].split("/", 1)[-1].strip("/")
+        return path if path in innertube_families else "other"
+    return page_families.get(path.strip("/").split("/", 1)[0], "other")
+
+
 # wrapper in wrapper (LOL)
 class http_request:
     def __init__(self, client: "aiohttp.TCPConnector", method="GET",
                  url="", header: dict = None, cookie: dict = None,
-                 data: bytes = None, json_data: Union[dict, list] = None,
-                 max_retries=3, raise_error=True, **kwargs):
+                 data: bytes = None, json_data: Union[dict, list, bytes] = None,
+                 max_retries=3, raise_error=True, hedge: Optional[HedgePolicy] = None,
+                 field_mask: Optional[str] = None, identity=None, raise_429=False, **kwargs):
         if cookie is None:
             cookie = {}
         if header is None:
@@ -102,46 +192,172 @@ class http_request:
 
         self.data = data
         self.json = json_data
+        if isinstance(json_data, (bytes, bytearray)):
+            # Pre-serialized json, e.g. from livetube.util.body
+            self.data, self.json = json_data, None
+            self.header = dict(header, **{"Content-Type": "application/json"})
         self.extra = kwargs
 
         self.resp = None
         self.max_retries = max_retries
         self.raise_error = raise_error
+        # Only set for idempotent requests
+        self.hedge = hedge
+        # Call site name in livetube.util.fields, for partial responses
+        self.field_mask = field_mask
+        # livetube.util.identity, spends its budget and uses its cookie jar
+        self.identity = identity
+        # Raise RateLimited on the first 429, for callers pacing requests themselves
+        self.raise_429 = raise_429
+        # Record created by this request when not inside a traced operation
+        self._trace: Optional[TraceRecord] = None
+        self._trace_span = None
+
+    async def _request(self):
+        if self.identity is not None:
+            await self.identity.take()
+            cookie_jar = self.identity.cookie_jar()
+        else:
+            cookie_jar = aiohttp.CookieJar(quote_cookie=False)
+            cookie_jar.update_cookies(cookies=self.cookie)
+        record = tracer.current()
+        if record is not None:
+            record.requests += 1
+        mask = field_masks.mask(self.field_mask)
+        header = dict(self.header, **{field_mask_header: mask}) if mask else self.header
+        body = self.json if self.json is not None else self.data
+        if cassette.replaying:
+            response = await cassette.play(self.method, self.url, body)
+        else:
+            async with aiohttp.ClientSession(connector=self.pool, connector_owner=False, cookie_jar=cookie_jar,
+                                             trace_configs=[tracer.trace_config] if record else None) as client:
+                start = perf_counter()
+                response = await client.request(self.method, self.url,
+                                                data=self.data, json=self.json,
+                                                headers=header,
+                                                trace_request_ctx=record,
+                                                **self.extra)
+                if cassette.recording:
+                    await cassette.save(self.method, self.url, body, header, response, perf_counter() - start)
+        if mask and response.status == 400 and await self._mask_rejected(response):
+            # Same request in full, the mask of this call site stays off
+            return await self._request()
+        return await self._check_status(response)
+
+    async def _mask_rejected(self, response) -> bool:
+        try:
+            body = await response.json(content_type=None)
+        except ValueError:
+            return False
+        if FieldMasks.is_rejection(response.status, body):
+            logger.warning(f"Field mask of {self.field_mask} rejected, using full responses")
+            field_masks.reject(self.field_mask)
+            response.close()
+            return True
+        return False
+
+    async def _check_status(self, response):
+        if response.status == 429 and self.raise_error:
+            retry_after = response.headers.get("Retry-After", "")
+            response.close()
+            raise RateLimited(f"Too many requests: {self.url}",
+                              float(retry_after) if retry_after.isdigit() else None)
+        if response.status > 399 and self.raise_error:
+            try:
+                text = await response.text()
+            except Exception as e:
+                raise HTTPError(f"Unknown error: {str(e)}", response.status)
+            finally:
+                response.close()
+            try:
+                error = json.loads(text).get("error")
+            except (ValueError, AttributeError):
+                error = None
+            if not isinstance(error, dict):
+                raise HTTPError(f"{response.status} {text}", response.status)
+            raise HTTPError(f"{error.get('status')} {error.get('message')}", response.status,
+                            error.get("status"), error.get("message"))
+        return response
 
     async def __aenter__(self):
-        for _ in range(self.max_retries):
+        if tracer.enabled and tracer.current() is None:
+            self._trace_span = tracer.span(endpoint_family(self.url))
+            self._trace = self._trace_span.__enter__()
+        try:
+            self.resp = await self._send(endpoint_family(self.url))
+        except BaseException:
+            # Cancellation included, the span must not stay current for the task
+            self._close_trace(*sys.exc_info())
+            raise
+        return self.resp
+
+    async def _send(self, family: str):
+        """Response of the first attempt that worked"""
+        for attempt in range(self.max_retries):
+            if attempt:
+                request_retries_total.inc(endpoint=family)
+            requests_total.inc(endpoint=family)
+            start = perf_counter()
             # noinspection PyBroadException
             try:
-                cookie_jar = aiohttp.CookieJar(quote_cookie=False)
-                cookie_jar.update_cookies(cookies=self.cookie)
-                async with aiohttp.ClientSession(connector=self.pool, connector_owner=False,
-                                                 cookie_jar=cookie_jar) as client:
-                    response = await client.request(self.method, self.url,
-                                                    data=self.data, json=self.json,
-                                                    headers=self.header,
-                                                    **self.extra)
-                    if response.status > 399 and self.raise_error:
-                        try:
-                            r: dict = await response.json(content_type=None)
-                            response.close()
-                            error = r.get("error")
-                            if error:
-                                raise NetworkError(f"{error['status']} {error['message']}")
-                        except json.JSONDecodeError:
-                            raise NetworkError(f"{await response.text()}")
-                        except Exception as e:
-                            raise NetworkError(f"Unknown error: {str(e)}")
-                    self.resp = response
-                    return response
+                if self.hedge is not None and self.hedge.enabled:
+                    response = await self.hedge.run(self._request, family)
+                else:
+                    response = await self._request()
+                request_duration.observe(perf_counter() - start, endpoint=family)
+                if self.identity is not None:
+                    self.identity.succeeded()
+                return response
+            except CassetteMiss:
+                # Retrying won't change the cassette
+                raise
             except Exception as e:
+                request_errors_total.inc(endpoint=family, error=type(e).__name__)
+                if isinstance(e, RateLimited) and (self.identity is not None or self.raise_429):
+                    # Up to the identity pool / caller, retrying right away makes it worse
+                    if self.identity is not None:
+                        self.identity.throttled(e.retry_after)
+                    raise
+                if isinstance(e, HTTPError) and e.status < 500:
+                    # The request itself is rejected, sending it again won't help
+                    raise
                 logger.warning(f"Critical network error: {e}")
                 await asyncio.sleep(3)
                 continue
         raise NetworkError("Max retries reached")
 
-    async def __aexit__(self, _, __, ___):
+    def _close_trace(self, exc_type, exc, tb):
+        if self._trace_span is not None:
+            span, self._trace_span = self._trace_span, None
+            span.__exit__(exc_type, exc, tb)
+
+    async def __aexit__(self, exc_type, exc, tb):
         if self.resp:
             self.resp.close()
+        self._close_trace(exc_type, exc, tb)
+
+
+async def read_json(response: "aiohttp.ClientResponse"):
+    """Read and decode a json response, timed as ``body`` and ``json`` phases"""
+    return load_json(await read_body(response))
+
+
+async def read_body(response: "aiohttp.ClientResponse") -> bytes:
+    """Read a raw response, timed as ``body`` phase"""
+    with tracer.phase("body"):
+        return await response.read()
+
+
+def load_json(raw: bytes):
+    """Decode a raw json response, timed as ``json`` phase"""
+    with tracer.phase("json"):
+        return json.loads(raw)
+
+
+async def read_text(response: "aiohttp.ClientResponse") -> str:
+    """Read a text response, timed as ``body`` phase"""
+    with tracer.phase("body"):
+        return await response.text()
 
 
 def gen_yt_upload_session_id():
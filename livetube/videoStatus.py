@@ -0,0 +1,27 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/19 18:05
+    File:    videoStatus.py
+    Description: Result of Video.probe
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class VideoStatus:
+    video_id: str
+    # playabilityStatus/status, e.g. OK, LIVE_STREAM_OFFLINE, LOGIN_REQUIRED, ERROR
+    status: str
+    reason: str = ""
+    subreason: str = ""
+    is_live: bool = False
+    is_upcoming: bool = False
+    is_live_content: bool = False
+    scheduled_start_time: Optional[int] = None
+    poll_delay_ms: Optional[int] = None
+
+    @property
+    def available(self) -> bool:
+        return self.status in ("OK", "LIVE_STREAM_OFFLINE")
@@ -8,7 +8,7 @@ setup(
    author='Sam',
    author_email='sam@vtr.ac',
    packages=find_packages(),
-   install_requires=['aiohttp', 'yarl', 'protobuf'],
+   install_requires=['aiohttp', 'yarl'],
 
 )
 
@@ -0,0 +1,76 @@
+"""
+    livetube - A API for youtube streaming
+    Author: Sam
+    Created: 2026/10/20 02:10
+    File:    test_proto.py
+    Description: Tokens of livetube.util.proto against the ones the generated
+                 protobuf modules (membership_pb3 / studio_pb3) produced
+
+    Run with ``python -m pytest tests``
+"""
+import re
+from base64 import b64decode
+from pathlib import Path
+
+import pytest
+
+from livetube.util.proto import (browse_params, decode_browse_params, browse_continuation, decode_browse_continuation,
+                                 field_path, visitor_id, encode, decode)
+
+fixtures = Path(__file__).resolve().parent.parent / "benchmarks" / "fixtures"
+
+membership_details = {50: {12: {1: "FEmemberships_and_purchases", 2: 1, 3: {1: 2, 2: "UCSJ4gkVC6NrvII8umztf0Ow"}}}}
+# ContinuationCommand of membership_pb3 with the same fields
+membership_details_bytes = (b'\x92\x03?b=\n\x1bFEmemberships_and_purchases\x10\x01'
+                            b'\x1a\x1c\x08\x02\x12\x18UCSJ4gkVC6NrvII8umztf0Ow')
+# ContinuationCommandEntry of membership_pb3 carrying it
+membership_token = ("4qmFsgJwEhRGRW1lbWJlcnNoaXBfZGV0YWlscxpYa2dNL1lqMEtHMFpGYldWdFltVnljMmhwY0hOZllXNWtYM0IxY21O"
+                    "b1lYTmxjeEFCR2h3SUFoSVlWVU5UU2pSbmExWkROazV5ZGtsSk9IVnRlblJtTUU5Mw%3D%3D")
+
+
+def test_browse_params():
+    # quote(b64encode(b"\x12\tcommunity")), sent by Community before the codec
+    assert browse_params("community") == "Egljb21tdW5pdHk%3D"
+    assert decode_browse_params("Egljb21tdW5pdHk%3D") == ("community", None)
+
+
+def test_browse_params_sort():
+    params = browse_params("videos", sort="oldest")
+    assert b64decode(params.replace("%3D", "=")) == b"\x12\x06videos\x18\x02\x20\x00\x30\x01"
+    assert decode_browse_params(params) == ("videos", "oldest")
+
+
+def test_visitor_id():
+    # GoogleVisitorId(visitor_info_live="CgtUZXN0VmlzaXRvcg", timestamp=1760000000)
+    assert visitor_id("CgtUZXN0VmlzaXRvcg", timestamp=1760000000) == "ChJDZ3RVWlhOMFZtbHphWFJ2Y2cogPCdxwY%3D"
+
+
+def test_membership_continuation():
+    assert encode(membership_details) == membership_details_bytes
+    token = browse_continuation("FEmembership_details", membership_details)
+    assert token == membership_token
+    browse_id, details, target_id = decode_browse_continuation(token)
+    assert (browse_id, details, target_id) == ("FEmembership_details", membership_details_bytes, None)
+    assert field_path(details, 50, 12, 1) == b"FEmemberships_and_purchases"
+    assert field_path(details, 50, 12, 3, 2) == b"UCSJ4gkVC6NrvII8umztf0Ow"
+
+
+def test_membership_card_fixture():
+    # Channel ID membership_pb3 decoded from the first card of the fixture
+    token = re.search(r'"token":"(4qmFsg[^"]+)"', (fixtures / "memberships_pbj.json").read_text("utf-8")).group(1)
+    browse_id, details, _ = decode_browse_continuation(token)
+    assert browse_id == "FEmembership_details"
+    assert field_path(details, 50, 12, 3, 2) == b"UCyyOaFlp8ocfuszqa1clpw_"
+
+
+def test_repeated_and_nested():
+    data = encode({1: [1, 300], 2: {3: "x"}})
+    assert decode(data) == {1: [1, 300], 2: b"\x1a\x01x"}
+    assert field_path(data, 2, 3) == b"x"
+
+
+def test_not_a_continuation():
+    with pytest.raises(ValueError):
+        decode_browse_continuation(browse_params("community"))
+    with pytest.raises(ValueError):
+        decode(b"\x0a\x05ab")